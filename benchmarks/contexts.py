@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Microbenchmarks for the construction cost of the standard contexts.
+
+These build `tanjun.MessageContext` and `tanjun.SlashContext` instances from
+real Hikari entities (deserialised from fake gateway payloads) and report the
+time taken and memory allocated per context.
+
+Run this with `python -m benchmarks.contexts -o results.json` and pass
+`--compare` with a previous run's output to compare the construction cost
+across commits.
+"""
+from __future__ import annotations
+
+__all__: list[str] = ["Result", "Workload", "main", "run_workload"]
+
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import gc
+import itertools
+import json
+import logging
+import pathlib
+import platform
+import sys
+import time
+import tracemalloc
+import typing
+from collections import abc as collections
+
+import hikari
+
+import tanjun
+
+from . import dispatch
+
+
+@dataclasses.dataclass(frozen=True)
+class Workload:
+    """Description of a context construction workload."""
+
+    kind: typing.Literal["message", "slash"]
+    """Which context type this workload builds."""
+
+    options: int
+    """How many options the slash command interactions have.
+
+    This is ignored for message contexts.
+    """
+
+    access_options: bool
+    """Whether every option is looked up on each slash context after it's built.
+
+    This mirrors how slash commands read their tracked options and is ignored
+    for message contexts.
+    """
+
+    @property
+    def name(self) -> str:
+        """Human readable name for this workload."""
+        if self.kind == "message":
+            return "message"
+
+        return f"slash[options={self.options},access_options={self.access_options}]"
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """The results of a benchmarked workload."""
+
+    workload: Workload
+    """The workload which was benchmarked."""
+
+    contexts: int
+    """How many contexts were built per round."""
+
+    duration: float
+    """How long the fastest round of building the contexts took in seconds."""
+
+    allocated: int
+    """How many bytes were still allocated for the built contexts."""
+
+    @property
+    def ns_per_context(self) -> float:
+        """The mean time taken to build a context in nanoseconds."""
+        return self.duration / self.contexts * 1_000_000_000 if self.contexts else 0.0
+
+    @property
+    def bytes_per_context(self) -> float:
+        """The mean memory allocated per context in bytes."""
+        return self.allocated / self.contexts if self.contexts else 0.0
+
+    def to_json(self) -> dict[str, typing.Any]:
+        """Get a JSON serialisable representation of this result."""
+        return {
+            "name": self.workload.name,
+            "workload": dataclasses.asdict(self.workload),
+            "contexts": self.contexts,
+            "duration": self.duration,
+            "ns_per_context": self.ns_per_context,
+            "bytes_per_context": self.bytes_per_context,
+        }
+
+
+def _make_interaction_payload(interaction_id: int, options: int, /) -> dict[str, typing.Any]:
+    payload = dispatch._make_interaction_payload(interaction_id, "command", author_id=1, value=None)
+    if options:
+        payload["data"]["options"] = [
+            {"name": f"option-{index}", "type": 4, "value": index} for index in range(options)
+        ]
+
+    return payload
+
+
+def _make_builder(
+    workload: Workload, client: tanjun.Client, app: dispatch._StubApp, /
+) -> collections.Callable[[], tanjun.abc.Context]:
+    entity_factory = hikari.impl.EntityFactoryImpl(typing.cast("hikari.traits.RESTAware", app))
+    if workload.kind == "message":
+        message = entity_factory.deserialize_message(dispatch._make_message_payload(1, "!command", author_id=1))
+
+        def build_message() -> tanjun.abc.Context:
+            return tanjun.context.MessageContext(
+                client, client, "command", message, triggering_name="command", triggering_prefix="!"
+            )
+
+        return build_message
+
+    interaction = entity_factory.deserialize_command_interaction(_make_interaction_payload(1, workload.options))
+    names = [f"option-{index}" for index in range(workload.options)]
+
+    if workload.access_options:
+
+        def build_and_access_slash() -> tanjun.abc.Context:
+            ctx = tanjun.context.SlashContext(client, client, interaction)
+            for name in names:
+                ctx.options.get(name)
+
+            return ctx
+
+        return build_and_access_slash
+
+    def build_slash() -> tanjun.abc.Context:
+        return tanjun.context.SlashContext(client, client, interaction)
+
+    return build_slash
+
+
+async def run_workload(workload: Workload, /, *, contexts: int = 20_000, rounds: int = 5) -> Result:
+    """Benchmark a workload.
+
+    Parameters
+    ----------
+    workload : Workload
+        The workload to benchmark.
+
+    Other Parameters
+    ----------------
+    contexts : int
+        How many contexts to build per round.
+    rounds : int
+        How many rounds to time.
+
+        The fastest round is used to reduce the noise from other processes.
+
+    Returns
+    -------
+    Result
+        The workload's results.
+    """
+    rest = dispatch._StubREST()
+    app = dispatch._StubApp(rest)
+    client = tanjun.Client(typing.cast("hikari.api.RESTClient", rest))
+    build = _make_builder(workload, client, app)
+    build()  # Warm up any class-level caches.
+
+    durations: list[float] = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(contexts):
+            build()
+
+        durations.append(time.perf_counter() - start)
+
+    # The contexts are kept alive here so the memory they hold is still allocated when it's measured.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = [build() for _ in range(contexts)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+
+    finally:
+        tracemalloc.stop()
+
+    # The list holding the contexts isn't part of their cost.
+    allocated -= sys.getsizeof(built)
+    return Result(workload=workload, contexts=contexts, duration=min(durations), allocated=allocated)
+
+
+def _parse_args(argv: typing.Optional[collections.Sequence[str]], /) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="Path to save the results to as JSON.")
+    parser.add_argument("--compare", type=pathlib.Path, help="Path to previous results to compare against.")
+    parser.add_argument("-n", "--contexts", type=int, default=20_000, help="How many contexts to build per round.")
+    parser.add_argument("-r", "--rounds", type=int, default=5, help="How many rounds to time per workload.")
+    parser.add_argument("--options", type=int, nargs="+", default=[0, 5])
+    parser.add_argument("--access-options", choices=("false", "true"), nargs="+", default=["false", "true"])
+    return parser.parse_args(argv)
+
+
+def main(argv: typing.Optional[collections.Sequence[str]] = None, /) -> None:
+    """Entry point for running the context construction benchmarks."""
+    args = _parse_args(argv)
+    logging.getLogger("hikari.tanjun.clients").setLevel(logging.ERROR)
+    previous = dispatch._load_previous(args.compare) if args.compare else {}
+    workloads = [Workload("message", 0, False)] + [
+        Workload("slash", options, access_options == "true")
+        for options, access_options in itertools.product(args.options, args.access_options)
+    ]
+
+    results: list[Result] = []
+    for workload in workloads:
+        result = asyncio.run(run_workload(workload, contexts=args.contexts, rounds=args.rounds))
+        results.append(result)
+        line = f"{workload.name}: {result.ns_per_context:,.0f}ns/context, {result.bytes_per_context:,.0f}B/context"
+        if old := previous.get(workload.name):
+            time_change = (result.ns_per_context / old["ns_per_context"] - 1) * 100
+            memory_change = (result.bytes_per_context / old["bytes_per_context"] - 1) * 100
+            line += f" ({time_change:+.1f}% time, {memory_change:+.1f}% memory)"
+
+        print(line)  # noqa: T001 - this is a CLI.
+
+    if args.output:
+        data = {
+            "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "commit": dispatch._git_commit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "hikari": hikari.__version__,
+            "tanjun": tanjun.__version__,
+            "results": [result.to_json() for result in results],
+        }
+        with args.output.open("w") as file:
+            json.dump(data, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""End-to-end throughput benchmarks for the standard client's command dispatch.
+
+These drive `tanjun.Client.on_message_create_event` and
+`tanjun.Client.on_interaction_create_request` with synthetic workloads built
+from real Hikari entities (deserialised from fake gateway payloads) and a stub
+REST client, then report the events per second and p50/p99 latencies of each
+workload.
+
+Run this with `python -m benchmarks.dispatch -o results.json` (or
+`nox -s benchmark`) and pass `--compare` with a previous run's output to
+compare the dispatch path's performance across commits.
+"""
+from __future__ import annotations
+
+__all__: list[str] = ["Result", "Workload", "main", "run_workload"]
+
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import itertools
+import json
+import logging
+import pathlib
+import platform
+import random
+import subprocess  # noqa: S404 - only used to get the current git commit.
+import sys
+import time
+import typing
+from collections import abc as collections
+
+import hikari
+
+import tanjun
+
+_PREFIX: typing.Final[str] = "!"
+_APPLICATION_ID: typing.Final[int] = 4321
+_CHANNEL_ID: typing.Final[int] = 5432
+_GUILD_ID: typing.Final[int] = 6543
+_BOT_ID: typing.Final[int] = 7654
+
+
+class _StubREST:
+    """Stub of the parts of `hikari.api.RESTClient` which command dispatch uses.
+
+    This returns pre-made responses without making any requests so the
+    benchmarks only measure Tanjun's dispatch path.
+    """
+
+    __slots__ = ("_response", "created")
+
+    def __init__(self) -> None:
+        self._response: typing.Optional[hikari.Message] = None
+        self.created = 0
+
+    def set_response(self, message: hikari.Message, /) -> None:
+        self._response = message
+
+    async def create_message(self, *args: typing.Any, **kwargs: typing.Any) -> hikari.Message:
+        assert self._response is not None
+        self.created += 1
+        return self._response
+
+
+class _StubApp:
+    """Stub `hikari.traits.RESTAware` used to deserialise the fake entities."""
+
+    __slots__ = ("_rest",)
+
+    def __init__(self, rest: _StubREST, /) -> None:
+        self._rest = rest
+
+    @property
+    def rest(self) -> _StubREST:
+        return self._rest
+
+
+def _make_user_payload(user_id: int, /, *, is_bot: bool = False) -> dict[str, typing.Any]:
+    return {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0001", "avatar": None, "bot": is_bot}
+
+
+def _make_message_payload(message_id: int, content: str, /, *, author_id: int) -> dict[str, typing.Any]:
+    return {
+        "id": str(message_id),
+        "channel_id": str(_CHANNEL_ID),
+        "guild_id": str(_GUILD_ID),
+        "author": _make_user_payload(author_id),
+        "content": content,
+        "timestamp": "2022-01-01T00:00:00+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+    }
+
+
+def _make_interaction_payload(
+    interaction_id: int, name: str, /, *, author_id: int, value: typing.Optional[int]
+) -> dict[str, typing.Any]:
+    data: dict[str, typing.Any] = {"id": str(interaction_id + 1), "name": name, "type": 1}
+    if value is not None:
+        data["options"] = [{"name": "value", "type": 4, "value": value}]
+
+    return {
+        "id": str(interaction_id),
+        "application_id": str(_APPLICATION_ID),
+        "type": 2,
+        "token": f"token{interaction_id}",
+        "version": 1,
+        "channel_id": str(_CHANNEL_ID),
+        "user": _make_user_payload(author_id),
+        "data": data,
+    }
+
+
+@dataclasses.dataclass(frozen=True)
+class Workload:
+    """Description of a synthetic dispatch workload."""
+
+    kind: typing.Literal["message", "slash"]
+    """Whether this workload dispatches message commands or slash commands over REST."""
+
+    components: int
+    """How many components the client has."""
+
+    commands: int
+    """How many commands each component has."""
+
+    strict: bool
+    """Whether the components are strict."""
+
+    parser: bool
+    """Whether the commands take an integer argument.
+
+    For message commands this is parsed with `tanjun.ShlexParser` and for
+    slash commands this is an integer option.
+    """
+
+    di_depth: int
+    """How deep the chain of injected dependencies each command callback takes is.
+
+    0 means the callbacks take no injected dependencies.
+    """
+
+    @property
+    def name(self) -> str:
+        """Human readable name for this workload."""
+        return (
+            f"{self.kind}[components={self.components},commands={self.commands},strict={self.strict},"
+            f"parser={self.parser},di_depth={self.di_depth}]"
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """The results of a benchmarked workload."""
+
+    workload: Workload
+    """The workload which was benchmarked."""
+
+    events: int
+    """How many events were dispatched."""
+
+    duration: float
+    """How long dispatching the events took in seconds."""
+
+    p50: float
+    """The median latency of an event's dispatch in seconds."""
+
+    p99: float
+    """The 99th percentile latency of an event's dispatch in seconds."""
+
+    @property
+    def events_per_second(self) -> float:
+        """How many events were dispatched per second."""
+        return self.events / self.duration if self.duration else 0.0
+
+    def to_json(self) -> dict[str, typing.Any]:
+        """Get a JSON serialisable representation of this result."""
+        return {
+            "name": self.workload.name,
+            "workload": dataclasses.asdict(self.workload),
+            "events": self.events,
+            "duration": self.duration,
+            "events_per_second": self.events_per_second,
+            "p50_ms": self.p50 * 1_000,
+            "p99_ms": self.p99 * 1_000,
+        }
+
+
+def _make_dependency(depth: int, /) -> typing.Optional[collections.Callable[..., collections.Awaitable[int]]]:
+    if depth < 1:
+        return None
+
+    async def leaf() -> int:
+        return 1
+
+    dependency: collections.Callable[..., collections.Awaitable[int]] = leaf
+    for _ in range(depth - 1):
+
+        def wrap(
+            inner: collections.Callable[..., collections.Awaitable[int]], /
+        ) -> collections.Callable[..., collections.Awaitable[int]]:
+            async def node(value: int = tanjun.inject(callback=inner)) -> int:
+                return value + 1
+
+            return node
+
+        dependency = wrap(dependency)
+
+    return dependency
+
+
+def _make_callback(
+    dependency: typing.Optional[collections.Callable[..., collections.Awaitable[int]]], /
+) -> collections.Callable[..., collections.Awaitable[None]]:
+    if dependency is None:
+
+        async def callback(ctx: tanjun.abc.Context, **kwargs: typing.Any) -> None:
+            await ctx.respond("pong")
+
+        return callback
+
+    async def injected_callback(
+        ctx: tanjun.abc.Context, _dependency: int = tanjun.inject(callback=dependency), **kwargs: typing.Any
+    ) -> None:
+        await ctx.respond("pong")
+
+    return injected_callback
+
+
+def _command_name(component: int, command: int, /) -> str:
+    return f"command-{component}-{command}"
+
+
+def _build_client(workload: Workload, rest: _StubREST, /) -> tanjun.Client:
+    client = tanjun.Client(typing.cast("hikari.api.RESTClient", rest)).add_prefix(_PREFIX)
+    callback = _make_callback(_make_dependency(workload.di_depth))
+
+    for component_index in range(workload.components):
+        component = tanjun.Component(name=f"component-{component_index}", strict=workload.strict)
+        for command_index in range(workload.commands):
+            name = _command_name(component_index, command_index)
+            if workload.kind == "message":
+                message_command = tanjun.MessageCommand(callback, name)
+                if workload.parser:
+                    # This also sets a ShlexParser on the command.
+                    tanjun.with_argument("value", converters=int)(message_command)
+
+                component.add_command(message_command)
+
+            else:
+                slash_command = tanjun.SlashCommand(callback, name, "Benchmark command")
+                if workload.parser:
+                    tanjun.with_int_slash_option("value", "An integer")(slash_command)
+
+                component.add_command(slash_command)
+
+        client.add_component(component)
+
+    return client
+
+
+def _build_events(
+    workload: Workload, app: _StubApp, count: int, /, *, seed: int
+) -> list[typing.Union[hikari.MessageCreateEvent, hikari.CommandInteraction]]:
+    entity_factory = hikari.impl.EntityFactoryImpl(typing.cast("hikari.traits.RESTAware", app))
+    rng = random.Random(seed)
+    shard = typing.cast("hikari.api.GatewayShard", None)
+    events: list[typing.Union[hikari.MessageCreateEvent, hikari.CommandInteraction]] = []
+
+    for index in range(count):
+        name = _command_name(rng.randrange(workload.components), rng.randrange(workload.commands))
+        author_id = rng.randrange(1, 1_000)
+        value = rng.randrange(1_000) if workload.parser else None
+        entity_id = 100_000 + index * 2
+        if workload.kind == "message":
+            content = f"{_PREFIX}{name} {value}" if value is not None else f"{_PREFIX}{name}"
+            message = entity_factory.deserialize_message(_make_message_payload(entity_id, content, author_id=author_id))
+            events.append(hikari.GuildMessageCreateEvent(message=message, shard=shard))
+
+        else:
+            events.append(
+                entity_factory.deserialize_command_interaction(
+                    _make_interaction_payload(entity_id, name, author_id=author_id, value=value)
+                )
+            )
+
+    return events
+
+
+def _quantile(sorted_values: collections.Sequence[float], quantile: float, /) -> float:
+    if not sorted_values:
+        return 0.0
+
+    return sorted_values[min(len(sorted_values) - 1, int(quantile * len(sorted_values)))]
+
+
+async def run_workload(workload: Workload, /, *, events: int = 2_000, warmup: int = 200, seed: int = 0) -> Result:
+    """Benchmark a workload.
+
+    Parameters
+    ----------
+    workload : Workload
+        The workload to benchmark.
+
+    Other Parameters
+    ----------------
+    events : int
+        How many events to time the dispatch of.
+    warmup : int
+        How many events to dispatch before timing starts.
+    seed : int
+        Seed used to pick which commands the events trigger.
+
+    Returns
+    -------
+    Result
+        The workload's results.
+    """
+    rest = _StubREST()
+    app = _StubApp(rest)
+    rest.set_response(
+        hikari.impl.EntityFactoryImpl(typing.cast("hikari.traits.RESTAware", app)).deserialize_message(
+            _make_message_payload(1, "pong", author_id=_BOT_ID)
+        )
+    )
+    client = _build_client(workload, rest)
+    built = _build_events(workload, app, warmup + events, seed=seed)
+
+    if workload.kind == "message":
+
+        async def dispatch(event: typing.Any, /) -> None:
+            await client.on_message_create_event(event)
+
+    else:
+
+        async def dispatch(event: typing.Any, /) -> None:
+            response = await client.on_interaction_create_request(event)
+            assert isinstance(response, hikari.api.InteractionMessageBuilder)
+            if response.content == "pong":
+                rest.created += 1
+
+    for event in built[:warmup]:
+        await dispatch(event)
+
+    responses = rest.created
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for event in built[warmup:]:
+        event_start = time.perf_counter()
+        await dispatch(event)
+        latencies.append(time.perf_counter() - event_start)
+
+    duration = time.perf_counter() - start
+    if rest.created - responses != events:
+        # Make sure the commands were actually found rather than this benchmarking the not found path.
+        raise RuntimeError(f"Only {rest.created - responses} of {events} events triggered a command")
+
+    latencies.sort()
+    return Result(
+        workload=workload,
+        events=events,
+        duration=duration,
+        p50=_quantile(latencies, 0.5),
+        p99=_quantile(latencies, 0.99),
+    )
+
+
+def _git_commit() -> typing.Optional[str]:
+    try:
+        result = subprocess.run(  # noqa: S603, S607 - this is a fixed command.
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        )
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return result.stdout.strip()
+
+
+def _parse_args(argv: typing.Optional[collections.Sequence[str]], /) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="Path to save the results to as JSON.")
+    parser.add_argument("--compare", type=pathlib.Path, help="Path to previous results to compare against.")
+    parser.add_argument("-n", "--events", type=int, default=2_000, help="How many events to time per workload.")
+    parser.add_argument("--warmup", type=int, default=200, help="How many events to dispatch before timing.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed used to pick which commands are triggered.")
+    parser.add_argument("--kind", choices=("message", "slash"), nargs="+", default=["message", "slash"])
+    parser.add_argument("--components", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--commands", type=int, nargs="+", default=[10])
+    parser.add_argument("--strict", choices=("false", "true"), nargs="+", default=["false", "true"])
+    parser.add_argument("--parser", choices=("false", "true"), nargs="+", default=["false", "true"])
+    parser.add_argument("--di-depth", type=int, nargs="+", default=[0, 4])
+    return parser.parse_args(argv)
+
+
+def _load_previous(path: pathlib.Path, /) -> dict[str, dict[str, typing.Any]]:
+    with path.open() as file:
+        data = json.load(file)
+
+    return {result["name"]: result for result in data["results"]}
+
+
+def main(argv: typing.Optional[collections.Sequence[str]] = None, /) -> None:
+    """Entry point for running the dispatch benchmarks."""
+    args = _parse_args(argv)
+    # Events are dispatched to the clients directly so the warning about them
+    # not having an event manager or interaction server doesn't apply here.
+    logging.getLogger("hikari.tanjun.clients").setLevel(logging.ERROR)
+    previous = _load_previous(args.compare) if args.compare else {}
+    workloads = [
+        Workload(kind, components, commands, strict == "true", parser == "true", di_depth)
+        for kind, components, commands, strict, parser, di_depth in itertools.product(
+            args.kind, args.components, args.commands, args.strict, args.parser, args.di_depth
+        )
+    ]
+
+    results: list[Result] = []
+    for workload in workloads:
+        result = asyncio.run(run_workload(workload, events=args.events, warmup=args.warmup, seed=args.seed))
+        results.append(result)
+        line = (
+            f"{workload.name}: {result.events_per_second:,.0f} events/s, "
+            f"p50 {result.p50 * 1_000:.3f}ms, p99 {result.p99 * 1_000:.3f}ms"
+        )
+        if old := previous.get(workload.name):
+            change = (result.events_per_second / old["events_per_second"] - 1) * 100
+            line += f" ({change:+.1f}% events/s)"
+
+        print(line)  # noqa: T001 - this is a CLI.
+
+    if args.output:
+        data = {
+            "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "hikari": hikari.__version__,
+            "tanjun": tanjun.__version__,
+            "results": [result.to_json() for result in results],
+        }
+        with args.output.open("w") as file:
+            json.dump(data, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
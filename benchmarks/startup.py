@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Microbenchmarks for the cost of declaring and loading a bot's commands.
+
+These declare components full of commands which each have their own injected
+callback, checks, converters and hooks (as a large bot would at startup) and
+then load them into a client with `tanjun.Component.make_loader`, reporting
+the time taken by each stage per declared callback.
+
+Run this with `python -m benchmarks.startup -o results.json` and pass
+`--compare` with a previous run's output to compare the startup cost across
+commits.
+"""
+from __future__ import annotations
+
+__all__: list[str] = ["Result", "Workload", "main", "run_workload"]
+
+import argparse
+import dataclasses
+import datetime
+import gc
+import itertools
+import json
+import logging
+import pathlib
+import platform
+import sys
+import time
+import typing
+from collections import abc as collections
+
+import hikari
+
+import tanjun
+
+from . import dispatch
+
+# The command's own callback, its function check, its guild check, its
+# option's converter and its post-execution hook.
+_CALLBACKS_PER_COMMAND: typing.Final[int] = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class Workload:
+    """Description of a startup workload."""
+
+    kind: typing.Literal["message", "slash"]
+    """Which type of commands this workload declares."""
+
+    commands: int
+    """How many commands are declared."""
+
+    components: int
+    """How many components the commands are split between."""
+
+    @property
+    def callbacks(self) -> int:
+        """How many callbacks are declared by this workload."""
+        return self.commands * _CALLBACKS_PER_COMMAND
+
+    @property
+    def name(self) -> str:
+        """Human readable name for this workload."""
+        return f"{self.kind}[commands={self.commands},components={self.components}]"
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """The results of a benchmarked workload."""
+
+    workload: Workload
+    """The workload which was benchmarked."""
+
+    declare_duration: float
+    """How long the fastest round of declaring the components took in seconds."""
+
+    load_duration: float
+    """How long the fastest round of loading the components into a client took in seconds."""
+
+    @property
+    def duration(self) -> float:
+        """How long the fastest rounds of both stages took in seconds."""
+        return self.declare_duration + self.load_duration
+
+    @property
+    def us_per_callback(self) -> float:
+        """The mean time taken to declare and load a callback in microseconds."""
+        return self.duration / self.workload.callbacks * 1_000_000 if self.workload.callbacks else 0.0
+
+    def to_json(self) -> dict[str, typing.Any]:
+        """Get a JSON serialisable representation of this result."""
+        return {
+            "name": self.workload.name,
+            "workload": dataclasses.asdict(self.workload),
+            "callbacks": self.workload.callbacks,
+            "declare_duration": self.declare_duration,
+            "load_duration": self.load_duration,
+            "duration": self.duration,
+            "us_per_callback": self.us_per_callback,
+        }
+
+
+def _declare(workload: Workload, /) -> list[tanjun.Component]:
+    # Every callback is redefined on each call so each round parses them from
+    # scratch, like a bot does when it first starts.
+    async def fetch_database(client: tanjun.abc.Client = tanjun.inject(type=tanjun.abc.Client)) -> object:
+        raise NotImplementedError
+
+    async def check(ctx: tanjun.abc.Context, database: object = tanjun.inject(callback=fetch_database)) -> bool:
+        raise NotImplementedError
+
+    async def post_execution(
+        ctx: tanjun.abc.Context, client: tanjun.abc.Client = tanjun.inject(type=tanjun.abc.Client)
+    ) -> None:
+        raise NotImplementedError
+
+    components = [tanjun.Component(name=f"component-{index}") for index in range(workload.components)]
+    for index in range(workload.commands):
+
+        async def callback(
+            ctx: tanjun.abc.Context,
+            value: hikari.PartialChannel,
+            database: object = tanjun.inject(callback=fetch_database),
+            client: tanjun.abc.Client = tanjun.inject(type=tanjun.abc.Client),
+        ) -> None:
+            raise NotImplementedError
+
+        command: typing.Union[tanjun.MessageCommand[typing.Any], tanjun.SlashCommand[typing.Any]]
+        if workload.kind == "message":
+            command = tanjun.MessageCommand(callback, f"command-{index}").set_parser(
+                tanjun.ShlexParser().add_argument("value", converters=tanjun.conversion.to_channel)
+            )
+
+        else:
+            command = tanjun.SlashCommand(callback, f"command-{index}", "description").add_str_option(
+                "value", "description", converters=tanjun.conversion.to_channel
+            )
+
+        command.add_check(check).set_hooks(tanjun.AnyHooks().add_post_execution(post_execution))
+        components[index % workload.components].add_command(tanjun.with_guild_check(command))
+
+    return components
+
+
+def _load(client: tanjun.Client, components: collections.Iterable[tanjun.Component], /) -> None:
+    for component in components:
+        component.make_loader(copy=True).load(client)
+
+
+def run_workload(workload: Workload, /, *, rounds: int = 5) -> Result:
+    """Benchmark a workload.
+
+    Parameters
+    ----------
+    workload : Workload
+        The workload to benchmark.
+
+    Other Parameters
+    ----------------
+    rounds : int
+        How many rounds to time.
+
+        The fastest round of each stage is used to reduce the noise from
+        other processes.
+
+    Returns
+    -------
+    Result
+        The workload's results.
+    """
+    rest = typing.cast("hikari.api.RESTClient", dispatch._StubREST())
+    declare_durations: list[float] = []
+    load_durations: list[float] = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        components = _declare(workload)
+        declare_durations.append(time.perf_counter() - start)
+
+        client = tanjun.Client(rest)
+        start = time.perf_counter()
+        _load(client, components)
+        load_durations.append(time.perf_counter() - start)
+
+    return Result(workload=workload, declare_duration=min(declare_durations), load_duration=min(load_durations))
+
+
+def _parse_args(argv: typing.Optional[collections.Sequence[str]], /) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="Path to save the results to as JSON.")
+    parser.add_argument("--compare", type=pathlib.Path, help="Path to previous results to compare against.")
+    parser.add_argument("-r", "--rounds", type=int, default=5, help="How many rounds to time per workload.")
+    parser.add_argument("--kind", choices=("message", "slash"), nargs="+", default=["message", "slash"])
+    parser.add_argument("--commands", type=int, nargs="+", default=[200])
+    parser.add_argument("--components", type=int, nargs="+", default=[10])
+    return parser.parse_args(argv)
+
+
+def main(argv: typing.Optional[collections.Sequence[str]] = None, /) -> None:
+    """Entry point for running the startup benchmarks."""
+    args = _parse_args(argv)
+    logging.getLogger("hikari.tanjun.clients").setLevel(logging.ERROR)
+    # The stub client doesn't have a cache so the converters warn about this when they're loaded.
+    logging.getLogger("hikari.tanjun.conversion").setLevel(logging.ERROR)
+    previous = dispatch._load_previous(args.compare) if args.compare else {}
+    workloads = [
+        Workload(kind, commands, components)
+        for kind, commands, components in itertools.product(args.kind, args.commands, args.components)
+    ]
+
+    results: list[Result] = []
+    for workload in workloads:
+        result = run_workload(workload, rounds=args.rounds)
+        results.append(result)
+        line = (
+            f"{workload.name}: {workload.callbacks:,} callbacks in {result.duration * 1_000:,.1f}ms "
+            f"(declare {result.declare_duration * 1_000:,.1f}ms, load {result.load_duration * 1_000:,.1f}ms, "
+            f"{result.us_per_callback:,.1f}us/callback)"
+        )
+        if old := previous.get(workload.name):
+            line += f" ({(result.duration / old['duration'] - 1) * 100:+.1f}% time)"
+
+        print(line)  # noqa: T001 - this is a CLI.
+
+    if args.output:
+        data = {
+            "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "commit": dispatch._git_commit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "hikari": hikari.__version__,
+            "tanjun": tanjun.__version__,
+            "results": [result.to_json() for result in results],
+        }
+        with args.output.open("w") as file:
+            json.dump(data, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
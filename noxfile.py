@@ -37,7 +37,7 @@ import tempfile
 import nox
 
 nox.options.sessions = ["reformat", "lint", "spell-check", "type-check", "test", "verify-types"]  # type: ignore
-GENERAL_TARGETS = ["./examples", "./noxfile.py", "./tanjun", "./tests"]
+GENERAL_TARGETS = ["./benchmarks", "./examples", "./noxfile.py", "./tanjun", "./tests"]
 PYTHON_VERSIONS = ["3.9", "3.10"]  # TODO: @nox.session(python=["3.6", "3.7", "3.8"])?
 
 
@@ -55,6 +55,13 @@ def _try_find_option(session: nox.Session, name: str, *other_names: str, when_em
             return next(args_iter, when_empty)
 
 
+@nox.session(reuse_venv=True)
+def benchmark(session: nox.Session) -> None:
+    """Run this project's command dispatch benchmarks."""
+    install_requirements(session, ".", "--use-feature=in-tree-build")
+    session.run("python", "-m", "benchmarks.dispatch", *session.posargs)
+
+
 @nox.session(name="check-versions")
 def check_versions(session: nox.Session) -> None:
     """Check that the version numbers declared for this project all match up."""
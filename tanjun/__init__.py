@@ -127,6 +127,7 @@ __all__: list[str] = [
     "as_unloader",
     "Client",
     "MessageAcceptsEnum",
+    "ShedPolicyEnum",
     # commands.py
     "commands",
     "as_message_command",
@@ -238,6 +239,7 @@ from .checks import with_owner_check
 from .checks import with_sfw_check
 from .clients import Client
 from .clients import MessageAcceptsEnum
+from .clients import ShedPolicyEnum
 from .clients import as_loader
 from .clients import as_unloader
 from .commands import MessageCommand
@@ -388,6 +388,44 @@ class Context(abc.ABC):
             `None` will be returned if the guild was not found.
         """
 
+    async def memoise_fetch(
+        self, key: collections.Hashable, callback: collections.Callable[[], collections.Awaitable[_T]], /
+    ) -> _T:
+        """Fetch an entity at most once for this context.
+
+        The first call for a key awaits the callback and memoises its result
+        for the context's lifetime, with calls made while it's still being
+        fetched waiting for and sharing its result.
+
+        If the callback raises then nothing is memoised (so the next call will
+        try again) and any waiting calls will raise the same error.
+
+        .. note::
+            The default implementation doesn't memoise anything and just
+            awaits the callback.
+
+        .. note::
+            Tanjun's standard checks, converters and limiters key entities as
+            `(hikari.PartialChannel, channel_id)`, `(hikari.Guild, guild_id)`,
+            `(hikari.Member, guild_id, user_id)`, `(hikari.Role, guild_id)`
+            (for the sequence of a guild's roles) and
+            `(hikari.Permissions, guild_id, user_id | None, channel_id | None)`
+            (where `user_id` is `None` for the guild's @everyone role).
+
+        Parameters
+        ----------
+        key : collections.abc.Hashable
+            Key which identifies the entity being fetched.
+        callback : collections.abc.Callable[[], collections.abc.Awaitable[T]]
+            Callback used to fetch the entity if it hasn't been fetched yet.
+
+        Returns
+        -------
+        T
+            The memoised entity.
+        """
+        return await callback()
+
     @abc.abstractmethod
     async def delete_initial_response(self) -> None:
         """Delete the initial response after invoking this context.
@@ -2242,7 +2280,7 @@ class BaseSlashCommand(ExecutableCommand[SlashContext], abc.ABC):
         /,
         option: typing.Optional[hikari.CommandInteractionOption] = None,
         *,
-        hooks: typing.Optional[collections.MutableSet[SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[SlashHooks]] = None,
     ) -> None:
         raise NotImplementedError
 
@@ -2472,7 +2510,7 @@ class MessageCommand(ExecutableCommand[MessageContext], abc.ABC, typing.Generic[
 
     @abc.abstractmethod
     async def execute(
-        self, ctx: MessageContext, /, *, hooks: typing.Optional[collections.MutableSet[Hooks[MessageContext]]] = None
+        self, ctx: MessageContext, /, *, hooks: typing.Optional[collections.Set[Hooks[MessageContext]]] = None
     ) -> None:
         raise NotImplementedError
 
@@ -2882,7 +2920,7 @@ class Component(abc.ABC):
         ctx: SlashContext,
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[SlashHooks]] = None,
     ) -> typing.Optional[collections.Awaitable[None]]:
         """Execute a slash context.
 
@@ -2897,9 +2935,12 @@ class Component(abc.ABC):
 
         Other Parameters
         ----------------
-        hooks : collections.abc.MutableSet[SlashHooks] | None
+        hooks : collections.abc.Set[SlashHooks] | None
             Set of hooks to include in this command execution.
 
+            This may be immutable and shouldn't be modified; implementations
+            which add hooks should do so to a copy of this.
+
         Returns
         -------
         collections.abc.Awaitable[None] | None
@@ -2913,7 +2954,7 @@ class Component(abc.ABC):
 
     @abc.abstractmethod
     async def execute_message(
-        self, ctx: MessageContext, /, *, hooks: typing.Optional[collections.MutableSet[MessageHooks]] = None
+        self, ctx: MessageContext, /, *, hooks: typing.Optional[collections.Set[MessageHooks]] = None
     ) -> bool:
         """Execute a message context.
 
@@ -2924,9 +2965,12 @@ class Component(abc.ABC):
 
         Other Parameters
         ----------------
-        hooks : collections.abc.MutableSet[MessageHooks] | None
+        hooks : collections.abc.Set[MessageHooks] | None
             Set of hooks to include in this command execution.
 
+            This may be immutable and shouldn't be modified; implementations
+            which add hooks should do so to a copy of this.
+
         Returns
         -------
         bool
@@ -2992,6 +3036,17 @@ class ClientCallbackNames(str, enum.Enum):
     No positional arguments are provided for this event.
     """
 
+    COMMAND_SHED = "command_shed"
+    """Called when a command execution is shed by the client's admission control.
+
+    .. note::
+        This is only dispatched by clients which implement admission control
+        (e.g. the standard `tanjun.Client`).
+
+    The `tanjun.abc.Context` of the shed execution is provided as the first
+    positional argument.
+    """
+
     COMPONENT_ADDED = "component_added"
     """Called when a component is added to an active client.
 
@@ -3018,6 +3073,21 @@ class ClientCallbackNames(str, enum.Enum):
     `tanjun.abc.MessageContext` is provided as the first positional argument.
     """
 
+    MODULES_RELOADED = "modules_reloaded"
+    """Called when changed modules are reloaded by the client's module watcher.
+
+    .. note::
+        This is only dispatched by clients which implement hot reloading
+        (e.g. the standard `tanjun.Client`).
+
+    The first positional argument is a mapping of the paths of the successfully
+    reloaded modules to how long each reload took in seconds, the second
+    positional argument is a mapping of the paths of the modules which failed
+    to reload to the raised exceptions and the third positional argument is
+    how long it took in seconds to reload every changed module after the first
+    change was detected.
+    """
+
     SLASH_COMMAND_NOT_FOUND = "slash_command_not_found"
     """Called when a slash command is not found.
 
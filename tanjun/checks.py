@@ -57,6 +57,7 @@ __all__: list[str] = [
     "OwnPermissionCheck",
 ]
 
+import functools
 import typing
 from collections import abc as collections
 
@@ -185,6 +186,22 @@ class OwnerCheck(_Check):
 _GuildChannelCacheT = typing.Optional[dependencies.SfCache[hikari.GuildChannel]]
 
 
+async def _fetch_channel(
+    ctx: tanjun_abc.Context, channel_id: hikari.Snowflake, /, *, channel_cache: _GuildChannelCacheT
+) -> hikari.PartialChannel:
+    if channel_cache:
+        try:
+            return await channel_cache.get(channel_id)
+
+        except dependencies.EntryNotFound:
+            raise
+
+        except dependencies.CacheMissError:
+            pass
+
+    return await ctx.rest.fetch_channel(channel_id)
+
+
 async def _get_is_nsfw(
     ctx: tanjun_abc.Context,
     /,
@@ -195,21 +212,13 @@ async def _get_is_nsfw(
     if ctx.guild_id is None:
         return dm_default
 
-    channel: typing.Optional[hikari.PartialChannel] = None
-    if ctx.cache and (channel := ctx.cache.get_guild_channel(ctx.channel_id)):
-        return channel.is_nsfw or False
+    if ctx.cache and (cached_channel := ctx.cache.get_guild_channel(ctx.channel_id)):
+        return cached_channel.is_nsfw or False
 
-    if channel_cache:
-        try:
-            return (await channel_cache.get(ctx.channel_id)).is_nsfw or False
-
-        except dependencies.EntryNotFound:
-            raise
-
-        except dependencies.CacheMissError:
-            pass
-
-    channel = await ctx.rest.fetch_channel(ctx.channel_id)
+    channel = await ctx.memoise_fetch(
+        (hikari.PartialChannel, ctx.channel_id),
+        functools.partial(_fetch_channel, ctx, ctx.channel_id, channel_cache=channel_cache),
+    )
     assert isinstance(channel, hikari.GuildChannel)
     return channel.is_nsfw or False
 
@@ -425,7 +434,7 @@ class AuthorPermissionCheck(_Check):
             # outside of some basic set of send messages.
             if ctx.guild_id:
                 permissions = await utilities.fetch_everyone_permissions(
-                    ctx.client, ctx.guild_id, channel=ctx.channel_id
+                    ctx.client, ctx.guild_id, channel=ctx.channel_id, context=ctx
                 )
 
             else:
@@ -435,7 +444,7 @@ class AuthorPermissionCheck(_Check):
             permissions = ctx.member.permissions
 
         else:
-            permissions = await utilities.fetch_permissions(ctx.client, ctx.member, channel=ctx.channel_id)
+            permissions = await utilities.fetch_permissions(ctx.client, ctx.member, channel=ctx.channel_id, context=ctx)
 
         return self._handle_result((self._permissions & permissions) == self._permissions)
 
@@ -492,11 +501,14 @@ class OwnPermissionCheck(_Check):
             permissions = utilities.DM_PERMISSIONS
 
         elif ctx.cache and (member := ctx.cache.get_member(ctx.guild_id, my_user)):
-            permissions = await utilities.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+            permissions = await utilities.fetch_permissions(ctx.client, member, channel=ctx.channel_id, context=ctx)
 
         else:
             try:
-                member = await ctx.rest.fetch_member(ctx.guild_id, my_user.id)
+                member = await ctx.memoise_fetch(
+                    (hikari.Member, ctx.guild_id, my_user.id),
+                    functools.partial(ctx.rest.fetch_member, ctx.guild_id, my_user.id),
+                )
 
             except hikari.NotFoundError:
                 # If we're not in the Guild then we have to assume the application
@@ -504,7 +516,7 @@ class OwnPermissionCheck(_Check):
                 # TODO: re-visit this later.
                 return self._handle_result(False)
 
-            permissions = await utilities.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+            permissions = await utilities.fetch_permissions(ctx.client, member, channel=ctx.channel_id, context=ctx)
 
         return self._handle_result((permissions & self._permissions) == self._permissions)
 
@@ -40,18 +40,24 @@ __all__: list[str] = [
     "MessageAcceptsEnum",
     "PrefixGetterSig",
     "PrefixGetterSigT",
+    "ShedPolicyEnum",
 ]
 
 import asyncio
+import collections as collections_
 import enum
 import functools
+import hashlib
 import importlib
 import importlib.abc as importlib_abc
 import importlib.util as importlib_util
 import inspect
 import itertools
+import json
 import logging
+import os
 import pathlib
+import time
 import typing
 import warnings
 from collections import abc as collections
@@ -61,12 +67,16 @@ from hikari import traits as hikari_traits
 
 from . import abc as tanjun_abc
 from . import checks
+from . import commands
+from . import components
 from . import context
 from . import dependencies
 from . import errors
 from . import hooks
 from . import injecting
 from . import utilities
+from .dependencies import declarations
+from .dependencies import metrics
 
 if typing.TYPE_CHECKING:
     import types
@@ -117,6 +127,9 @@ This should be an asynchronous callable which returns an iterable of strings.
 
 PrefixGetterSigT = typing.TypeVar("PrefixGetterSigT", bound="PrefixGetterSig")
 
+_T = typing.TypeVar("_T")
+_OtherT = typing.TypeVar("_OtherT")
+
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.tanjun.clients")
 
 
@@ -238,7 +251,9 @@ def as_loader(
     collections.abc.Callable[[tanjun.abc.Client], None]]
         The decorated load callback.
     """
-    return _LoaderDescriptor(callback, standard_impl)
+    loader = _LoaderDescriptor(callback, standard_impl)
+    components._register_loader(loader, (frame := inspect.currentframe()) and frame.f_back)
+    return loader
 
 
 @typing.overload
@@ -287,7 +302,9 @@ def as_unloader(
     collections.abc.Callable[[tanjun.Client], None]]
         The decorated unload callback.
     """
-    return _UnloaderDescriptor(callback, standard_impl)
+    unloader = _UnloaderDescriptor(callback, standard_impl)
+    components._register_loader(unloader, (frame := inspect.currentframe()) and frame.f_back)
+    return unloader
 
 
 ClientCallbackNames = tanjun_abc.ClientCallbackNames
@@ -332,6 +349,553 @@ _ACCEPTS_EVENT_TYPE_MAPPING: dict[MessageAcceptsEnum, typing.Optional[type[hikar
 }
 
 
+class ShedPolicyEnum(str, enum.Enum):
+    """The possible policies for shedding command executions when `Client`'s admission queue is full."""
+
+    DROP_OLDEST = "DROP_OLDEST"
+    """Drop the execution which has been waiting the longest to make room for the new one."""
+
+    DROP_NEWEST = "DROP_NEWEST"
+    """Silently drop the new execution."""
+
+    REJECT = "REJECT"
+    """Drop the new execution and respond to it with the configured rejection message."""
+
+
+class _AdmissionController:
+    """Bounds the amount of command executions which run at once with a bounded wait queue."""
+
+    __slots__ = ("_in_flight", "_limit", "_policy", "_queue_size", "_waiters", "reject_message")
+
+    def __init__(self, limit: int, queue_size: int, policy: ShedPolicyEnum, reject_message: str, /) -> None:
+        self._in_flight = 0
+        self._limit = limit
+        self._policy = policy
+        self._queue_size = queue_size
+        self._waiters: collections_.deque[asyncio.Future[bool]] = collections_.deque()
+        self.reject_message = reject_message
+
+    @property
+    def should_reject(self) -> bool:
+        return self._policy is ShedPolicyEnum.REJECT
+
+    async def acquire(self) -> bool:
+        """Wait for an execution slot.
+
+        Returns
+        -------
+        bool
+            Whether a slot was acquired.
+
+            If this is `False` then the execution was shed and
+            `_AdmissionController.release` shouldn't be called.
+        """
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return True
+
+        if len(self._waiters) >= self._queue_size:
+            if self._policy is not ShedPolicyEnum.DROP_OLDEST or not self._pop_waiter(False):
+                return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            return await future
+
+        except asyncio.CancelledError:
+            try:
+                self._waiters.remove(future)
+
+            except ValueError:
+                # A slot may've been handed over to us just before we were cancelled.
+                if not future.cancelled() and future.result():
+                    self.release()
+
+            raise
+
+    def release(self) -> None:
+        """Release an execution slot, handing it over to the next waiting execution if there is one."""
+        if not self._pop_waiter(True):
+            self._in_flight -= 1
+
+    def _pop_waiter(self, result: bool, /) -> bool:
+        # Waiters are only removed from the queue once their task handles being
+        # cancelled so cancelled waiters have to be skipped here.
+        while self._waiters:
+            if not (waiter := self._waiters.popleft()).done():
+                waiter.set_result(result)
+                return True
+
+        return False
+
+
+_FairKey = tuple[typing.Optional[hikari.Snowflake], typing.Optional[hikari.Snowflake]]
+
+
+def _get_fair_key(ctx: tanjun_abc.Context, /) -> _FairKey:
+    # DMs are grouped per-user rather than all being treated as one "guild".
+    if ctx.guild_id is None:
+        return (None, ctx.author.id)
+
+    return (ctx.guild_id, None)
+
+
+class _FairScheduler:
+    """Bounds the amount of command executions which run at once while fairly sharing slots between guilds.
+
+    Waiting executions are queued per-guild (with DMs being queued per-user)
+    and these queues are served using deficit round robin, with each queue
+    being given up to `quantum` execution slots in a row before the next
+    queue is served.
+    """
+
+    __slots__ = ("_deficits", "_in_flight", "_limit", "_quantum", "_queues", "_ring")
+
+    def __init__(self, limit: int, quantum: int, /) -> None:
+        self._deficits: dict[_FairKey, int] = {}
+        self._in_flight = 0
+        self._limit = limit
+        self._quantum = quantum
+        self._queues: dict[_FairKey, collections_.deque[asyncio.Future[None]]] = {}
+        self._ring: collections_.deque[_FairKey] = collections_.deque()
+
+    async def acquire(self, key: _FairKey, /) -> None:
+        """Wait for an execution slot.
+
+        Parameters
+        ----------
+        key : tuple[hikari.Snowflake | None, hikari.Snowflake | None]
+            Key of the queue the execution should wait in.
+        """
+        if self._in_flight < self._limit and not self._ring:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queues[key].append(future)
+
+        except KeyError:
+            self._queues[key] = collections_.deque((future,))
+            self._deficits[key] = 0
+            self._ring.append(key)
+
+        try:
+            await future
+
+        except asyncio.CancelledError:
+            # A slot may've been handed over to us just before we were cancelled.
+            if not future.cancelled():
+                self.release()
+
+            raise
+
+    def release(self) -> None:
+        """Release an execution slot, handing it over to the next waiting execution if there is one."""
+        while self._ring:
+            key = self._ring[0]
+            queue = self._queues[key]
+            waiter = queue.popleft()
+            if queue:
+                if waiter.done():
+                    continue
+
+                if self._deficits[key] < 1:
+                    self._deficits[key] += self._quantum
+
+                self._deficits[key] -= 1
+                if self._deficits[key] < 1:
+                    self._ring.rotate(-1)
+
+            else:
+                # A queue's deficit is reset once it's been emptied.
+                self._ring.popleft()
+                del self._queues[key]
+                del self._deficits[key]
+                if waiter.done():
+                    continue
+
+            waiter.set_result(None)
+            return
+
+        self._in_flight -= 1
+
+
+def _release_slots(
+    admission: typing.Optional[_AdmissionController], scheduler: typing.Optional[_FairScheduler], /
+) -> None:
+    if scheduler:
+        scheduler.release()
+
+    if admission:
+        admission.release()
+
+
+async def _release_dependencies(ctx: tanjun_abc.Context, /) -> None:
+    # Commands release the dependencies they acquire when they finish executing
+    # so this releases any acquired while a command wasn't executing (e.g. by checks).
+    if isinstance(ctx, injecting.AbstractInjectionContext):
+        try:
+            await ctx.release_dependencies()
+
+        except Exception:
+            _LOGGER.exception("Failed to release a context's dependencies")
+
+
+async def _release_after(ctx: tanjun_abc.Context, awaitable: collections.Awaitable[typing.Any], /) -> None:
+    try:
+        await awaitable
+
+    finally:
+        await _release_dependencies(ctx)
+
+
+def _find_routes(
+    collector: typing.Optional[metrics.AbstractTimingCollector],
+    find: collections.Callable[[_T], _OtherT],
+    value: _T,
+    /,
+) -> _OtherT:
+    if not collector:
+        return find(value)
+
+    start = time.perf_counter()
+    result = find(value)
+    collector.record(metrics.DispatchStage.ROUTING, time.perf_counter() - start)
+    return result
+
+
+_DEFAULT_REJECT_MESSAGE: typing.Final[str] = "The bot is currently too busy to handle this command"
+
+
+def _make_admission_controller(
+    limit: typing.Optional[int], queue_size: int, policy: ShedPolicyEnum, reject_message: str, /
+) -> typing.Optional[_AdmissionController]:
+    if limit is None:
+        return None
+
+    if limit < 1:
+        raise ValueError("limit must be greater than or equal to 1")
+
+    if queue_size < 0:
+        raise ValueError("queue_size must be greater than or equal to 0")
+
+    return _AdmissionController(limit, queue_size, policy, reject_message)
+
+
+class _PrefixNode:
+    __slots__ = ("children", "prefix")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.prefix: typing.Optional[str] = None
+
+
+class _PrefixTrie:
+    """Character trie used to find the longest prefix a message starts with in one pass."""
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root = _PrefixNode()
+
+    @property
+    def first_characters(self) -> collections.KeysView[str]:
+        return self._root.children.keys()
+
+    @property
+    def has_empty_prefix(self) -> bool:
+        return self._root.prefix is not None
+
+    def add(self, prefix: str, /) -> None:
+        node = self._root
+        for char in prefix:
+            try:
+                node = node.children[char]
+
+            except KeyError:
+                node.children[char] = node = _PrefixNode()
+
+        node.prefix = prefix
+
+    def remove(self, prefix: str, /) -> None:
+        path: list[tuple[_PrefixNode, str]] = []
+        node = self._root
+        for char in prefix:
+            path.append((node, char))
+            node = node.children[char]
+
+        if node.prefix is None:
+            raise KeyError(prefix)
+
+        node.prefix = None
+        # Prune any branches which no-longer lead to a prefix.
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.children or child.prefix is not None:
+                break
+
+            del parent.children[char]
+
+    def longest_match(
+        self, content: str, /, *, extra: typing.Optional[collections.Iterable[str]] = None
+    ) -> typing.Optional[str]:
+        """Find the longest prefix which `content` starts with.
+
+        Parameters
+        ----------
+        content : str
+            The content to match against.
+
+        Other Parameters
+        ----------------
+        extra : collections.abc.Iterable[str] | None
+            Additional prefixes to consider alongside the ones stored in this
+            trie (e.g. the results of a per-guild prefix getter).
+
+        Returns
+        -------
+        str | None
+            The longest matching prefix if found, else `None`.
+        """
+        node = self._root
+        result = node.prefix
+        for char in content:
+            if (next_node := node.children.get(char)) is None:
+                break
+
+            node = next_node
+            if node.prefix is not None:
+                result = node.prefix
+
+        if extra:
+            best_length = -1 if result is None else len(result)
+            for prefix in extra:
+                if len(prefix) > best_length and content.startswith(prefix):
+                    result = prefix
+                    best_length = len(prefix)
+
+        return result
+
+
+_MessageCandidates = list[tuple[str, tanjun_abc.MessageCommand[typing.Any]]]
+
+
+def _uses_standard_routing(component: tanjun_abc.Component, method_names: tuple[str, ...], /) -> bool:
+    # Component subclasses which override how commands are matched or executed
+    # have to be left to route commands themselves.
+    if not isinstance(component, components.Component):
+        return False
+
+    cls = type(component)
+    return cls is components.Component or all(
+        getattr(cls, name) is getattr(components.Component, name) for name in method_names
+    )
+
+
+class _MessageCommandIndex:
+    """Client-wide index of the message commands in a client's components.
+
+    This maps the first word of each command name to the commands it may
+    route to, letting the client find candidate commands for a message without
+    iterating over every component and command.
+    """
+
+    __slots__ = ("_names", "_opaque")
+
+    def __init__(self, components_: collections.Iterable[tanjun_abc.Component], /) -> None:
+        self._names: dict[str, list[tuple[int, components.Component, tanjun_abc.MessageCommand[typing.Any], str]]] = {}
+        # Components which don't implement the standard component (and therefore
+        # can't execute pre-matched commands) are left to do their own matching.
+        self._opaque: list[tuple[int, tanjun_abc.Component]] = []
+
+        for position, component in enumerate(components_):
+            if not _uses_standard_routing(component, ("check_message_name", "execute_message")):
+                self._opaque.append((position, component))
+                continue
+
+            assert isinstance(component, components.Component)
+            for command in component.message_commands:
+                for name in command.names:
+                    key = name.split(" ", 1)[0]
+                    entry = (position, component, command, name)
+                    try:
+                        self._names[key].append(entry)
+
+                    except KeyError:
+                        self._names[key] = [entry]
+
+    def find(
+        self, content: str, /
+    ) -> collections.Iterator[tuple[tanjun_abc.Component, typing.Optional[_MessageCandidates]]]:
+        """Find the components and commands which may match a message's content.
+
+        Parameters
+        ----------
+        content : str
+            The message content to match against (with the prefix removed).
+
+        Returns
+        -------
+        collections.abc.Iterator[tuple[tanjun.abc.Component, list[tuple[str, tanjun.abc.MessageCommand]] | None]]
+            Iterator of components to the names and commands they matched, in
+            the same order the client's components and their commands are in.
+
+            The candidates will be `None` for components which have to
+            match the content themselves.
+        """
+        key = content.split(" ", 1)[0]
+        groups: list[tuple[int, tanjun_abc.Component, typing.Optional[_MessageCandidates]]] = []
+        last_command: typing.Optional[tanjun_abc.MessageCommand[typing.Any]] = None
+        for position, component, command, name in self._names.get(key, ()):
+            # Only the first of a command's names which matches is used and
+            # these entries are grouped by command.
+            if command is last_command:
+                continue
+
+            # Names with spaces in them need to be checked against the full content.
+            if name != key and not (content == name or content.startswith(name) and content[len(name)] == " "):
+                continue
+
+            last_command = command
+            if groups and groups[-1][0] == position:
+                candidates = groups[-1][2]
+                assert candidates is not None
+                candidates.append((name, command))
+
+            else:
+                groups.append((position, component, [(name, command)]))
+
+        if self._opaque:
+            groups.extend((position, component, None) for position, component in self._opaque)
+            groups.sort(key=lambda group: group[0])
+
+        return ((component, candidates) for _, component, candidates in groups)
+
+
+_SlashRoute = tuple[tanjun_abc.BaseSlashCommand, ...]
+_COMMAND_OPTION_TYPES: typing.Final[frozenset[hikari.OptionType]] = frozenset(
+    [hikari.OptionType.SUB_COMMAND, hikari.OptionType.SUB_COMMAND_GROUP]
+)
+
+
+def _has_standard_routing(command: tanjun_abc.BaseSlashCommand, /) -> bool:
+    # Routes skip the execute method of the groups they pass through so groups
+    # which don't use the standard group's execute have to route for themselves.
+    if not isinstance(command, tanjun_abc.SlashCommandGroup):
+        return True
+
+    return type(command).execute is commands.SlashCommandGroup.execute and all(
+        map(_has_standard_routing, command.commands)
+    )
+
+
+def _iter_slash_routes(
+    command: tanjun_abc.BaseSlashCommand, path: str, route: _SlashRoute, /
+) -> collections.Iterator[tuple[str, _SlashRoute]]:
+    route = (*route, command)
+    if isinstance(command, tanjun_abc.SlashCommandGroup):
+        for sub_command in command.commands:
+            yield from _iter_slash_routes(sub_command, f"{path} {sub_command.name}", route)
+
+    else:
+        yield path, route
+
+
+def _get_slash_path(
+    interaction: hikari.CommandInteraction, /
+) -> tuple[str, typing.Optional[hikari.CommandInteractionOption]]:
+    path = interaction.command_name
+    option: typing.Optional[hikari.CommandInteractionOption] = None
+    options = interaction.options
+    while options and (first_option := options[0]).type in _COMMAND_OPTION_TYPES:
+        path = f"{path} {first_option.name}"
+        option = first_option
+        options = first_option.options
+
+    return path, option
+
+
+class _SlashCommandIndex:
+    """Client-wide routing table of full slash command paths (e.g. `"group sub"`) to the commands they target."""
+
+    __slots__ = ("_opaque", "_paths", "_self_routed")
+
+    def __init__(self, components_: collections.Iterable[tanjun_abc.Component], /) -> None:
+        self._paths: dict[str, list[tuple[int, components.Component, _SlashRoute]]] = {}
+        # Components which don't implement the standard component are left to
+        # find the command themselves.
+        self._opaque: list[tuple[int, tanjun_abc.Component]] = []
+        # Top-level commands (by name) which have to be executed through the
+        # component since they contain groups with custom routing.
+        self._self_routed: dict[str, list[tuple[int, components.Component]]] = {}
+
+        for position, component in enumerate(components_):
+            if not _uses_standard_routing(component, ("execute_interaction", "execute_interaction_route")):
+                self._opaque.append((position, component))
+                continue
+
+            assert isinstance(component, components.Component)
+            for command in component.slash_commands:
+                # This matches how the standard component normalises the names of its top-level commands.
+                name = command.name.casefold()
+                if not _has_standard_routing(command):
+                    self._self_routed.setdefault(name, []).append((position, component))
+                    continue
+
+                for path, route in _iter_slash_routes(command, name, ()):
+                    entry = (position, component, route)
+                    try:
+                        self._paths[path].append(entry)
+
+                    except KeyError:
+                        self._paths[path] = [entry]
+
+    def find(
+        self, interaction: hikari.CommandInteraction, /
+    ) -> collections.Iterator[
+        tuple[tanjun_abc.Component, typing.Optional[_SlashRoute], typing.Optional[hikari.CommandInteractionOption]]
+    ]:
+        """Find the components and commands which a slash command interaction routes to.
+
+        Parameters
+        ----------
+        interaction : hikari.CommandInteraction
+            The command interaction to route.
+
+        Returns
+        -------
+        collections.abc.Iterator[tuple[tanjun.abc.Component, tuple[tanjun.abc.BaseSlashCommand, ...] | None, hikari.CommandInteractionOption | None]]
+            Iterator of components to the chain of commands (from the top-level
+            command to the called command) they matched and the interaction
+            option of the called sub-command (if applicable) in the same order
+            the client's components are in.
+
+            The route will be `None` for components which have to find the
+            command themselves.
+        """  # noqa: E501 - line too long
+        routes: list[tuple[int, tanjun_abc.Component, typing.Optional[_SlashRoute]]] = []
+        option: typing.Optional[hikari.CommandInteractionOption] = None
+        if self._paths:
+            path, option = _get_slash_path(interaction)
+            routes.extend(self._paths.get(path, ()))
+
+        needs_sort = False
+        if self._self_routed and (self_routed := self._self_routed.get(interaction.command_name)):
+            routes.extend((position, component, None) for position, component in self_routed)
+            needs_sort = True
+
+        if self._opaque:
+            routes.extend((position, component, None) for position, component in self._opaque)
+            needs_sort = True
+
+        if needs_sort:
+            routes.sort(key=lambda route: route[0])
+
+        return ((component, route, option) for _, component, route in routes)
+
+
 def _check_human(ctx: tanjun_abc.Context, /) -> bool:
     return ctx.is_human
 
@@ -371,6 +935,126 @@ def _cmp_command(builder: typing.Optional[hikari.api.CommandBuilder], command: h
     return all(builder_option == option for builder_option, option in zip(builder.options, command_options))
 
 
+def _fingerprint_builders(
+    builders: collections.Iterable[hikari.api.CommandBuilder], entity_factory: hikari.api.EntityFactory, /
+) -> str:
+    payloads = sorted((builder.build(entity_factory) for builder in builders), key=lambda payload: payload["name"])
+    return hashlib.sha256(json.dumps(payloads, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _collect_builders(
+    commands: collections.Iterable[tanjun_abc.BaseSlashCommand],
+    command_ids: collections.Mapping[str, hikari.SnowflakeishOr[hikari.Command]],
+    /,
+    *,
+    built: typing.Optional[dict[tanjun_abc.BaseSlashCommand, hikari.api.CommandBuilder]] = None,
+) -> tuple[dict[str, tanjun_abc.BaseSlashCommand], dict[str, hikari.api.CommandBuilder]]:
+    names_to_commands: dict[str, tanjun_abc.BaseSlashCommand] = {}
+    conflicts: set[str] = set()
+    builders: dict[str, hikari.api.CommandBuilder] = {}
+
+    for command in commands:
+        names_to_commands[command.name] = command
+        if command.name in builders:
+            conflicts.add(command.name)
+
+        if built is None:
+            builder = command.build()
+
+        elif (builder := built.get(command)) is None:
+            builder = built[command] = command.build()
+
+        if command_id := command_ids.get(command.name):
+            builder.set_id(hikari.Snowflake(command_id))
+
+        builders[command.name] = builder
+
+    if conflicts:
+        raise ValueError(
+            "Couldn't declare commands due to conflicts. The following command names have more than one command "
+            "registered for them " + ", ".join(conflicts)
+        )
+
+    if len(builders) > 100:
+        raise ValueError("You can only declare up to 100 top level commands in a guild or globally")
+
+    return names_to_commands, builders
+
+
+def _make_declaration_record(
+    fingerprint: str, commands: collections.Iterable[hikari.Command], /
+) -> declarations.DeclarationRecord:
+    return declarations.DeclarationRecord(
+        fingerprint, {command.name: (command.id, command.version) for command in commands}
+    )
+
+
+_DeclarationRecordEntry = tuple[hikari.Snowflake, typing.Optional[hikari.Snowflake], declarations.DeclarationRecord]
+
+
+async def _store_declaration_record(
+    store: declarations.AbstractDeclarationStore,
+    records: typing.Optional[list[_DeclarationRecordEntry]],
+    application_id: hikari.Snowflake,
+    guild_id: typing.Optional[hikari.Snowflake],
+    record: declarations.DeclarationRecord,
+    /,
+) -> None:
+    if records is None:
+        await store.set_record(application_id, guild_id, record)
+
+    else:
+        records.append((application_id, guild_id, record))
+
+
+def _rebuild_commands(
+    builders: collections.Mapping[str, hikari.api.CommandBuilder],
+    record: declarations.DeclarationRecord,
+    entity_factory: hikari.api.EntityFactory,
+    application_id: hikari.Snowflake,
+    guild_id: typing.Optional[hikari.Snowflake],
+    /,
+) -> list[hikari.Command]:
+    commands: list[hikari.Command] = []
+    stored = record.commands
+    for name, builder in builders.items():
+        command_id, version = stored[name]
+        payload = dict(builder.build(entity_factory))
+        payload.update(id=str(command_id), application_id=str(application_id), version=str(version))
+        commands.append(entity_factory.deserialize_command(payload, guild_id=guild_id))
+
+    return commands
+
+
+_MANIFEST_VERSION: typing.Final[int] = 1
+
+
+class _LazyModule:
+    __slots__ = ("global_commands", "message_names", "path", "slash_names", "task")
+
+    def __init__(self, path: str, /) -> None:
+        self.global_commands: list[dict[str, typing.Any]] = []
+        self.message_names: list[str] = []
+        self.path = path
+        self.slash_names: list[str] = []
+        self.task: typing.Optional[asyncio.Task[None]] = None
+
+
+def _builder_from_payload(
+    payload: collections.Mapping[str, typing.Any], entity_factory: hikari.api.EntityFactory, /
+) -> hikari.api.CommandBuilder:
+    # This goes through a command object to deserialise the payload's options.
+    command = entity_factory.deserialize_command(
+        {**payload, "id": "0", "application_id": "0", "version": "0", "guild_id": None}
+    )
+    builder = hikari.impl.CommandBuilder(command.name, command.description)  # type: ignore
+    builder.set_default_permission(command.default_permission)
+    for option in command.options or ():
+        builder.add_option(option)
+
+    return builder
+
+
 class _StartDeclarer:
     __slots__ = ("client", "command_ids", "guild_id")
 
@@ -391,7 +1075,121 @@ class _StartDeclarer:
             self.client.remove_client_callback(ClientCallbackNames.STARTING, self)
 
 
-class Client(injecting.InjectorClient, tanjun_abc.Client):
+def _stat_modules(
+    files: collections.Mapping[typing.Union[str, pathlib.Path], str], /
+) -> dict[typing.Union[str, pathlib.Path], int]:
+    mtimes: dict[typing.Union[str, pathlib.Path], int] = {}
+    for module_path, file in files.items():
+        try:
+            mtimes[module_path] = os.stat(file).st_mtime_ns
+
+        except OSError:
+            pass
+
+    return mtimes
+
+
+class _ModuleWatcher:
+    __slots__ = ("_client", "_debounce", "_interval", "_modules", "_mtimes", "_path_modules", "_reload", "_task")
+
+    def __init__(
+        self,
+        client: Client,
+        modules: collections.Mapping[str, types.ModuleType],
+        path_modules: collections.Mapping[pathlib.Path, types.ModuleType],
+        reload: collections.Callable[
+            [typing.Union[str, pathlib.Path], asyncio.AbstractEventLoop], collections.Awaitable[None]
+        ],
+        /,
+        *,
+        debounce: float,
+        interval: float,
+    ) -> None:
+        self._client = client
+        self._debounce = debounce
+        self._interval = interval
+        self._modules = modules
+        self._mtimes: dict[typing.Union[str, pathlib.Path], int] = {}
+        self._path_modules = path_modules
+        self._reload = reload
+        self._task: typing.Optional[asyncio.Task[None]] = None
+
+    def start(self, loop: asyncio.AbstractEventLoop, /) -> None:
+        if not self._task:
+            self._task = loop.create_task(self._watch())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _poll(self, loop: asyncio.AbstractEventLoop, /) -> list[typing.Union[str, pathlib.Path]]:
+        # The module dicts are only read on the event loop as they may be changed
+        # while the files are being stat-ed.
+        files: dict[typing.Union[str, pathlib.Path], str] = {
+            name: file for name, module in self._modules.items() if (file := getattr(module, "__file__", None))
+        }
+        files.update((module_path, str(module_path)) for module_path in self._path_modules)
+        mtimes = await loop.run_in_executor(None, _stat_modules, files)
+
+        # Modules which weren't being tracked yet are just recorded.
+        changed = [
+            module_path for module_path, mtime in mtimes.items() if self._mtimes.get(module_path, mtime) != mtime
+        ]
+        self._mtimes = mtimes
+        return changed
+
+    async def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await self._poll(loop)
+
+        except Exception as exc:
+            _LOGGER.error("Failed to poll modules for changes", exc_info=exc)
+
+        while True:
+            await asyncio.sleep(self._interval)
+            # This has to keep running after unexpected errors as nothing awaits
+            # the watcher's task to surface them.
+            try:
+                await self._check_for_changes(loop)
+
+            except Exception as exc:
+                _LOGGER.error("Failed to hot reload changed modules", exc_info=exc)
+
+    async def _check_for_changes(self, loop: asyncio.AbstractEventLoop, /) -> None:
+        if not (changed := await self._poll(loop)):
+            return
+
+        detected_at = time.perf_counter()
+        # Bursts of changes (e.g. a branch being checked out) are batched into
+        # one reload by waiting for the modules to stop changing.
+        while True:
+            await asyncio.sleep(self._debounce)
+            if not (more := await self._poll(loop)):
+                break
+
+            changed.extend(module_path for module_path in more if module_path not in changed)
+
+        durations: dict[typing.Union[str, pathlib.Path], float] = {}
+        failures: dict[typing.Union[str, pathlib.Path], Exception] = {}
+        for module_path in changed:
+            start = time.perf_counter()
+            try:
+                await self._reload(module_path, loop)
+
+            except Exception as exc:
+                _LOGGER.error("Failed to hot reload %s", module_path, exc_info=exc)
+                failures[module_path] = exc
+
+            else:
+                durations[module_path] = time.perf_counter() - start
+
+        latency = time.perf_counter() - detected_at
+        await self._client.dispatch_client_callback(ClientCallbackNames.MODULES_RELOADED, durations, failures, latency)
+
+
+class Client(injecting.InjectorClient, tanjun_abc.Client, components._RoutingCacheClient):
     """Tanjun's standard `tanjun.abc.Client` implementation.
 
     This implementation supports dependency injection for checks, command
@@ -411,26 +1209,40 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         "_checks",
         "_client_callbacks",
         "_components",
+        "_declaration_store",
         "_defaults_to_ephemeral",
-        "_make_message_context",
-        "_make_slash_context",
         "_events",
+        "_fair_scheduler",
         "_grab_mention_prefix",
         "_hooks",
+        "_interaction_admission",
         "_interaction_not_found",
-        "_slash_hooks",
         "_is_closing",
+        "_lazy_message_names",
+        "_lazy_modules",
+        "_lazy_slash_names",
         "_listeners",
         "_loop",
+        "_make_message_context",
+        "_make_slash_context",
+        "_message_admission",
+        "_message_hook_chain",
         "_message_hooks",
+        "_message_index",
         "_metadata",
+        "_module_watcher",
         "_modules",
         "_path_modules",
         "_prefix_getter",
+        "_prefix_trie",
         "_prefixes",
         "_rest",
         "_server",
         "_shards",
+        "_slash_hook_chain",
+        "_slash_hooks",
+        "_slash_index",
+        "_timing_collector",
         "_voice",
     )
 
@@ -560,26 +1372,40 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         self._checks: list[checks.InjectableCheck] = []
         self._client_callbacks: dict[str, list[injecting.CallbackDescriptor[None]]] = {}
         self._components: dict[str, tanjun_abc.Component] = {}
+        self._declaration_store: typing.Optional[declarations.AbstractDeclarationStore] = None
         self._defaults_to_ephemeral: bool = False
         self._make_message_context: _MessageContextMakerProto = context.MessageContext
         self._make_slash_context: _SlashContextMakerProto = context.SlashContext
         self._events = events
+        self._fair_scheduler: typing.Optional[_FairScheduler] = None
         self._grab_mention_prefix = mention_prefix
         self._hooks: typing.Optional[tanjun_abc.AnyHooks] = hooks.AnyHooks().set_on_parser_error(on_parser_error)
+        self._interaction_admission: typing.Optional[_AdmissionController] = None
         self._interaction_not_found: typing.Optional[str] = "Command not found"
         self._slash_hooks: typing.Optional[tanjun_abc.SlashHooks] = None
+        self._slash_hook_chain: frozenset[tanjun_abc.SlashHooks] = frozenset((self._hooks,))
         self._is_closing = False
+        self._lazy_message_names: dict[str, list[tuple[str, _LazyModule]]] = {}
+        self._lazy_modules: dict[str, _LazyModule] = {}
+        self._lazy_slash_names: dict[str, _LazyModule] = {}
         self._listeners: dict[type[hikari.Event], list[injecting.SelfInjectingCallback[None]]] = {}
         self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._message_admission: typing.Optional[_AdmissionController] = None
         self._message_hooks: typing.Optional[tanjun_abc.MessageHooks] = None
+        self._message_hook_chain: frozenset[tanjun_abc.MessageHooks] = frozenset((self._hooks,))
+        self._message_index: typing.Optional[_MessageCommandIndex] = None
         self._metadata: dict[typing.Any, typing.Any] = {}
+        self._module_watcher: typing.Optional[_ModuleWatcher] = None
         self._modules: dict[str, types.ModuleType] = {}
         self._path_modules: dict[pathlib.Path, types.ModuleType] = {}
         self._prefix_getter: typing.Optional[injecting.CallbackDescriptor[collections.Iterable[str]]] = None
         self._prefixes: list[str] = []
+        self._prefix_trie = _PrefixTrie()
         self._rest = rest
         self._server = server
         self._shards = shards
+        self._slash_index: typing.Optional[_SlashCommandIndex] = None
+        self._timing_collector: typing.Optional[metrics.AbstractTimingCollector] = None
         self._voice = voice
 
         if event_managed:
@@ -999,9 +1825,34 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             )
             if command.is_global
         )
-        return await self.declare_application_commands(
-            commands, command_ids, application=application, guild=guild, force=force
-        )
+        lazy_payloads = [payload for module in self._lazy_modules.values() for payload in module.global_commands]
+        if not lazy_payloads:
+            return await self.declare_application_commands(
+                commands, command_ids, application=application, guild=guild, force=force
+            )
+
+        # Commands from modules which haven't been lazily loaded yet are declared from the manifest.
+        command_ids = command_ids or {}
+        names_to_commands, builders = _collect_builders(commands, command_ids)
+        entity_factory = self._rest.entity_factory
+        for payload in lazy_payloads:
+            if payload["name"] in builders:
+                raise ValueError(
+                    "Couldn't declare commands due to conflicts. The following command names have more than one "
+                    "command registered for them " + payload["name"]
+                )
+
+            builder = builders[payload["name"]] = _builder_from_payload(payload, entity_factory)
+            if command_id := command_ids.get(builder.name):
+                builder.set_id(hikari.Snowflake(command_id))
+
+        if len(builders) > 100:
+            raise ValueError("You can only declare up to 100 top level commands in a guild or globally")
+
+        if not application:
+            application = self._cached_application_id or await self.fetch_rest_application_id()
+
+        return await self._declare_builders(names_to_commands, builders, command_ids, application, guild, force)
 
     async def declare_application_command(
         self,
@@ -1050,34 +1901,144 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
     ) -> collections.Sequence[hikari.Command]:
         # <<inherited docstring from tanjun.abc.Client>>.
         command_ids = command_ids or {}
-        names_to_commands: dict[str, tanjun_abc.BaseSlashCommand] = {}
-        conflicts: set[str] = set()
-        builders: dict[str, hikari.api.CommandBuilder] = {}
+        names_to_commands, builders = _collect_builders(commands, command_ids)
+        if not application:
+            application = self._cached_application_id or await self.fetch_rest_application_id()
 
-        for command in commands:
-            names_to_commands[command.name] = command
-            if command.name in builders:
-                conflicts.add(command.name)
+        return await self._declare_builders(names_to_commands, builders, command_ids, application, guild, force)
 
-            builder = command.build()
-            if command_id := command_ids.get(command.name):
-                builder.set_id(hikari.Snowflake(command_id))
+    async def declare_guild_commands(
+        self,
+        guilds: collections.Mapping[
+            hikari.SnowflakeishOr[hikari.PartialGuild], collections.Iterable[tanjun_abc.BaseSlashCommand]
+        ],
+        /,
+        *,
+        application: typing.Optional[hikari.SnowflakeishOr[hikari.PartialApplication]] = None,
+        force: bool = False,
+        max_concurrency: int = 10,
+    ) -> dict[hikari.Snowflake, typing.Union[collections.Sequence[hikari.Command], Exception]]:
+        """Declare sets of guild-specific application commands across multiple guilds concurrently.
 
-            builders[command.name] = builder
+        This behaves like calling `Client.declare_application_commands` for
+        each guild but each command is only built once and the guilds are
+        declared concurrently.
 
-        if conflicts:
-            raise ValueError(
-                "Couldn't declare commands due to conflicts. The following command names have more than one command "
-                "registered for them " + ", ".join(conflicts)
-            )
+        .. note::
+            Hikari's REST client handles the per-route ratelimits, `max_concurrency`
+            just limits how many guilds are being declared at once to avoid
+            queueing up too many requests.
 
-        if len(builders) > 100:
-            raise ValueError("You can only declare up to 100 top level commands in a guild or globally")
+        Parameters
+        ----------
+        guilds : collections.abc.Mapping[hikari.snowflakes.SnowflakeishOr[hikari.guilds.PartialGuild], collections.abc.Iterable[tanjun.abc.BaseSlashCommand]]
+            Mapping of guilds to the commands to declare in them.
+
+        Other Parameters
+        ----------------
+        application : hikari.snowflakes.SnowflakeishOr[hikari.applications.PartialApplication] | None
+            Object or ID of the application to declare the commands for.
+
+            This will be determined automatically if left as `None`.
+        force : bool
+            Whether the commands should always be declared.
+
+            If `False` then each guild's declared commands will be fetched and
+            compared to the commands being declared to check whether they need
+            to be declared.
+        max_concurrency : int
+            The maximum amount of guilds to declare commands in at once.
 
+            Defaults to 10.
+
+        Returns
+        -------
+        dict[hikari.snowflakes.Snowflake, collections.abc.Sequence[hikari.commands.Command] | Exception]
+            Dictionary of guild IDs to either the commands which were declared
+            in them or the exception raised while declaring commands in them.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is less than 1, if any guild has conflicting
+            command names or if any guild has more than 100 top level commands.
+
+            These are checked before any commands are declared.
+        """  # noqa: E501 - line too long
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+
+        # No command IDs are set on these builders so they can be shared between guilds.
+        built: dict[tanjun_abc.BaseSlashCommand, hikari.api.CommandBuilder] = {}
+        to_declare = [
+            (hikari.Snowflake(guild), *_collect_builders(commands, {}, built=built))
+            for guild, commands in guilds.items()
+        ]
         if not application:
             application = self._cached_application_id or await self.fetch_rest_application_id()
 
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results: dict[hikari.Snowflake, typing.Union[collections.Sequence[hikari.Command], Exception]] = {}
+        # The records are stored together once every guild has been declared
+        # to avoid rewriting the store for each guild.
+        records: list[_DeclarationRecordEntry] = []
+
+        async def declare(
+            guild_id: hikari.Snowflake,
+            names_to_commands: dict[str, tanjun_abc.BaseSlashCommand],
+            builders: dict[str, hikari.api.CommandBuilder],
+        ) -> None:
+            assert application
+            async with semaphore:
+                try:
+                    results[guild_id] = await self._declare_builders(
+                        names_to_commands, builders, {}, application, guild_id, force, records=records
+                    )
+
+                except Exception as exc:
+                    _LOGGER.error("Failed to declare commands for guild %s", guild_id, exc_info=exc)
+                    results[guild_id] = exc
+
+        await asyncio.gather(*(declare(*declaration) for declaration in to_declare))
+        if records and self._declaration_store:
+            await self._declaration_store.set_records(records)
+
+        failed = sum(isinstance(result, Exception) for result in results.values())
+        _LOGGER.info("Declared commands in %s guilds, %s failed", len(results) - failed, failed)
+        return results
+
+    async def _declare_builders(
+        self,
+        names_to_commands: dict[str, tanjun_abc.BaseSlashCommand],
+        builders: dict[str, hikari.api.CommandBuilder],
+        command_ids: collections.Mapping[str, hikari.SnowflakeishOr[hikari.Command]],
+        application: hikari.SnowflakeishOr[hikari.PartialApplication],
+        guild: hikari.UndefinedOr[hikari.SnowflakeishOr[hikari.PartialGuild]],
+        force: bool,
+        /,
+        *,
+        records: typing.Optional[list[_DeclarationRecordEntry]] = None,
+    ) -> collections.Sequence[hikari.Command]:
         target_type = "global" if guild is hikari.UNDEFINED else f"guild {int(guild)}"
+        application_id = hikari.Snowflake(application)
+        guild_id = hikari.Snowflake(guild) if guild is not hikari.UNDEFINED else None
+        fingerprint = ""
+        if store := self._declaration_store:
+            entity_factory = self._rest.entity_factory
+            fingerprint = _fingerprint_builders(builders.values(), entity_factory)
+            record = await store.get_record(application_id, guild_id)
+            if record and record.fingerprint == fingerprint and record.commands.keys() == builders.keys():
+                _LOGGER.info(
+                    "Skipping bulk declare for %s slash commands since they match the last stored declaration",
+                    target_type,
+                )
+                responses = _rebuild_commands(builders, record, entity_factory, application_id, guild_id)
+                if not guild:
+                    for response in responses:
+                        if command := names_to_commands.get(response.name):
+                            command.set_tracked_command(response)
+
+                return responses
 
         if not force:
             registered_commands = await self._rest.fetch_application_commands(application, guild=guild)
@@ -1085,14 +2046,23 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
                 _cmp_command(builders.get(command.name), command) for command in registered_commands
             ):
                 _LOGGER.info("Skipping bulk declare for %s slash commands since they're already declared", target_type)
+                if store:
+                    await _store_declaration_record(
+                        store,
+                        records,
+                        application_id,
+                        guild_id,
+                        _make_declaration_record(fingerprint, registered_commands),
+                    )
+
                 return registered_commands
 
         _LOGGER.info("Bulk declaring %s %s slash commands", len(builders), target_type)
         responses = await self._rest.set_application_commands(application, list(builders.values()), guild=guild)
 
         for response in responses:
-            if not guild:
-                names_to_commands[response.name].set_tracked_command(response)  # TODO: is this fine?
+            if not guild and (command := names_to_commands.get(response.name)):
+                command.set_tracked_command(response)  # TODO: is this fine?
 
             if (expected_id := command_ids.get(response.name)) and hikari.Snowflake(expected_id) != response.id:
                 _LOGGER.warning(
@@ -1105,6 +2075,11 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
                 )
 
         _LOGGER.info("Successfully declared %s (top-level) %s commands", len(responses), target_type)
+        if store:
+            await _store_declaration_record(
+                store, records, application_id, guild_id, _make_declaration_record(fingerprint, responses)
+            )
+
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Declared %s command ids; %s",
@@ -1129,6 +2104,37 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         self._auto_defer_after = float(time) if time is not None else None
         return self
 
+    def set_declaration_store(
+        self: _ClientT, store: typing.Optional[declarations.AbstractDeclarationStore], /
+    ) -> _ClientT:
+        """Set the store used to skip declaring application commands which haven't changed.
+
+        When set, `Client.declare_application_commands` (and therefore
+        `Client.declare_global_commands` and startup declaration) stores a
+        hash of the declared commands alongside the IDs Discord returned for
+        them. If the commands being declared match the stored hash then both
+        the fetch and the bulk set requests are skipped (even if `force` is
+        passed) and the stored IDs are used to track the commands.
+
+        .. note::
+            This can't tell if the commands were changed elsewhere (e.g. by
+            another client); the store should be cleared when this happens.
+
+        Parameters
+        ----------
+        store : tanjun.dependencies.AbstractDeclarationStore | None
+            The store to use.
+
+            Passing `None` will disable this.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._declaration_store = store
+        return self
+
     def set_ephemeral_default(self: _ClientT, state: bool, /) -> _ClientT:
         """Set whether slash contexts spawned by this client should default to ephemeral responses.
 
@@ -1155,15 +2161,174 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         This is a short hand for calling `Client.add_type_dependency` for all
         the hikari trait types `bot` is valid for with bot.
 
-        Parameters
-        ----------
-        bot : hikari_traits.RESTAware
-            The hikari client to set dependency injectors for.
+        Parameters
+        ----------
+        bot : hikari_traits.RESTAware
+            The hikari client to set dependency injectors for.
+        """
+        for _, member in inspect.getmembers(hikari_traits):
+            if inspect.isclass(member) and isinstance(bot, member):
+                self.set_type_dependency(member, bot)
+
+        return self
+
+    def set_fair_scheduling(self: _ClientT, limit: typing.Optional[int], /, *, quantum: int = 1) -> _ClientT:
+        """Set whether command executions should be fairly scheduled between guilds.
+
+        When enabled, command executions past `limit` wait in a queue for
+        their guild (with DMs being queued per-user) and these queues are
+        served in turn using deficit round robin. This stops one busy guild
+        from holding up every other guild's commands.
+
+        .. note::
+            This is shared between message and interaction commands and is
+            applied after admission control (see `Client.set_message_admission`
+            and `Client.set_interaction_admission`).
+
+        Parameters
+        ----------
+        limit : int | None
+            The maximum amount of command executions to run at once.
+
+            Passing `None` will disable fair scheduling.
+
+        Other Parameters
+        ----------------
+        quantum : int
+            The amount of waiting executions to run from a guild's queue before
+            moving onto the next guild's queue.
+
+            Defaults to 1.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If `limit` or `quantum` is less than 1.
+        """
+        if limit is None:
+            self._fair_scheduler = None
+            return self
+
+        if limit < 1:
+            raise ValueError("limit must be greater than or equal to 1")
+
+        if quantum < 1:
+            raise ValueError("quantum must be greater than or equal to 1")
+
+        self._fair_scheduler = _FairScheduler(limit, quantum)
+        return self
+
+    def set_hot_reload(self: _ClientT, interval: typing.Optional[float], /, *, debounce: float = 0.5) -> _ClientT:
+        """Set whether this client should watch its loaded modules for changes and reload them.
+
+        This polls the modification times of the files behind the modules
+        loaded with `Client.load_modules` while the client is running and
+        reloads the changed modules through `Client.reload_modules_async`
+        (so a module which fails to reload is rolled back to its old state).
+
+        `tanjun.abc.ClientCallbackNames.MODULES_RELOADED` is dispatched with the
+        reload durations after each batch of changed modules has been reloaded.
+
+        Parameters
+        ----------
+        interval : float | None
+            How often in seconds the modules' files should be checked for changes.
+
+            If this is `None` then hot reloading will be disabled.
+
+        Other Parameters
+        ----------------
+        debounce : float
+            How long in seconds the modules have to go without changing before
+            the changed modules are reloaded.
+
+            This batches bursts of changes into one reload and defaults to `0.5`.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        if self._module_watcher:
+            self._module_watcher.stop()
+            self._module_watcher = None
+
+        if interval is not None:
+            self._module_watcher = _ModuleWatcher(
+                self,
+                self._modules,
+                self._path_modules,
+                self._reload_module_async,
+                debounce=float(debounce),
+                interval=float(interval),
+            )
+            if self._loop:
+                self._module_watcher.start(self._loop)
+
+        return self
+
+    def set_interaction_admission(
+        self: _ClientT,
+        limit: typing.Optional[int],
+        /,
+        *,
+        queue_size: int = 0,
+        policy: ShedPolicyEnum = ShedPolicyEnum.DROP_NEWEST,
+        reject_message: str = _DEFAULT_REJECT_MESSAGE,
+    ) -> _ClientT:
+        """Set the admission control for interaction command executions.
+
+        This limits how many interaction command executions the client will run
+        at once, with executions past this limit waiting in a bounded queue
+        and being shed according to `policy` once that queue is full.
+
+        .. note::
+            As interactions received over the REST server must be given a
+            response, these will always be rejected with `reject_message`
+            when shed regardless of `policy`.
+
+        `tanjun.abc.ClientCallbackNames.COMMAND_SHED` will be dispatched for
+        each execution which is shed.
+
+        Parameters
+        ----------
+        limit : int | None
+            The maximum amount of interaction command executions to run at once.
+
+            Passing `None` will disable admission control for interaction commands.
+
+        Other Parameters
+        ----------------
+        queue_size : int
+            The maximum amount of interaction command executions which can wait
+            for an execution slot.
+
+            Defaults to 0.
+        policy : ShedPolicyEnum
+            The policy to follow when the wait queue is full.
+
+            Defaults to `ShedPolicyEnum.DROP_NEWEST`.
+        reject_message : str
+            The message to respond with when an execution is rejected.
+
+            This is only used for `ShedPolicyEnum.REJECT` and interactions received over the REST server.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If `limit` is less than 1 or `queue_size` is negative.
         """
-        for _, member in inspect.getmembers(hikari_traits):
-            if inspect.isclass(member) and isinstance(bot, member):
-                self.set_type_dependency(member, bot)
-
+        self._interaction_admission = _make_admission_controller(limit, queue_size, policy, reject_message)
         return self
 
     def set_interaction_not_found(self: _ClientT, message: typing.Optional[str], /) -> _ClientT:
@@ -1196,6 +2361,90 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         self._accepts = accepts
         return self
 
+    def set_message_admission(
+        self: _ClientT,
+        limit: typing.Optional[int],
+        /,
+        *,
+        queue_size: int = 0,
+        policy: ShedPolicyEnum = ShedPolicyEnum.DROP_NEWEST,
+        reject_message: str = _DEFAULT_REJECT_MESSAGE,
+    ) -> _ClientT:
+        """Set the admission control for message command executions.
+
+        This limits how many message command executions the client will run
+        at once, with executions past this limit waiting in a bounded queue
+        and being shed according to `policy` once that queue is full.
+
+        `tanjun.abc.ClientCallbackNames.COMMAND_SHED` will be dispatched for
+        each execution which is shed.
+
+        Parameters
+        ----------
+        limit : int | None
+            The maximum amount of message command executions to run at once.
+
+            Passing `None` will disable admission control for message commands.
+
+        Other Parameters
+        ----------------
+        queue_size : int
+            The maximum amount of message command executions which can wait
+            for an execution slot.
+
+            Defaults to 0.
+        policy : ShedPolicyEnum
+            The policy to follow when the wait queue is full.
+
+            Defaults to `ShedPolicyEnum.DROP_NEWEST`.
+        reject_message : str
+            The message to respond with when an execution is rejected.
+
+            This is only used for `ShedPolicyEnum.REJECT`.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If `limit` is less than 1 or `queue_size` is negative.
+        """
+        self._message_admission = _make_admission_controller(limit, queue_size, policy, reject_message)
+        return self
+
+    def set_timing_collector(
+        self: _ClientT, collector: typing.Optional[metrics.AbstractTimingCollector], /
+    ) -> _ClientT:
+        """Set the collector used to time the stages of command dispatch.
+
+        When set this is also registered as the type dependency for
+        `tanjun.dependencies.AbstractTimingCollector`.
+
+        .. note::
+            Timing is disabled by default and, while disabled, only costs a
+            context variable lookup per stage.
+
+        Parameters
+        ----------
+        collector : tanjun.dependencies.AbstractTimingCollector | None
+            The collector to record dispatch timings with.
+
+            Passing `None` will disable timing collection.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+        """
+        self._timing_collector = collector
+        if collector:
+            self.set_type_dependency(metrics.AbstractTimingCollector, collector)
+
+        return self
+
     def set_message_ctx_maker(self: _ClientT, maker: _MessageContextMakerProto = context.MessageContext, /) -> _ClientT:
         """Set the message context maker to use when creating context for a message.
 
@@ -1355,6 +2604,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
 
         component.bind_client(self)
         self._components[component.name] = component
+        self._invalidate_routing()
 
         if add_injector:
             self.set_type_dependency(type(component), lambda: component)
@@ -1376,6 +2626,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             raise ValueError(f"The component {component!r} is not registered.")
 
         del self._components[component.name]
+        self._invalidate_routing()
 
         if self._loop:
             self._loop.create_task(component.close(unbind=True))
@@ -1501,6 +2752,10 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         content to determine whether the message command search stage of
         execution should be initiated.
 
+        .. note::
+            If multiple prefixes (including those returned by the prefix getter)
+            match a message then the longest match will be used.
+
         Parameters
         ----------
         prefixes : collections.abc.Iterable[str] | str
@@ -1513,11 +2768,12 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             The client instance to enable chained calls.
         """
         if isinstance(prefixes, str):
-            if prefixes not in self._prefixes:
-                self._prefixes.append(prefixes)
+            prefixes = (prefixes,)
 
-        else:
-            self._prefixes.extend(prefix for prefix in prefixes if prefix not in self._prefixes)
+        for prefix in prefixes:
+            if prefix not in self._prefixes:
+                self._prefixes.append(prefix)
+                self._prefix_trie.add(prefix)
 
         return self
 
@@ -1540,6 +2796,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             The client instance to enable chained calls.
         """
         self._prefixes.remove(prefix)
+        self._prefix_trie.remove(prefix)
         return self
 
     def set_prefix_getter(self: _ClientT, getter: typing.Optional[PrefixGetterSig], /) -> _ClientT:
@@ -1612,12 +2869,56 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
 
         return itertools.chain.from_iterable(component.slash_commands for component in self.components)
 
+    def _invalidate_routing(self) -> None:
+        # <<inherited docstring from tanjun.components._RoutingCacheClient>>.
+        self._message_index = None
+        self._slash_index = None
+
+    async def _run_checks(
+        self, ctx: tanjun_abc.Context, collector: typing.Optional[metrics.AbstractTimingCollector], /
+    ) -> bool:
+        if collector:
+            return await metrics.timed(collector, metrics.DispatchStage.CLIENT_CHECKS, self.check(ctx))
+
+        return await self.check(ctx)
+
+    def _get_message_index(self) -> _MessageCommandIndex:
+        if self._message_index is None:
+            self._message_index = _MessageCommandIndex(self._components.values())
+
+        return self._message_index
+
+    def _get_slash_index(self) -> _SlashCommandIndex:
+        if self._slash_index is None:
+            self._slash_index = _SlashCommandIndex(self._components.values())
+
+        return self._slash_index
+
+    def _execute_interaction(
+        self,
+        ctx: context.SlashContext,
+        component: tanjun_abc.Component,
+        route: typing.Optional[_SlashRoute],
+        option: typing.Optional[hikari.CommandInteractionOption],
+        hooks: typing.Optional[collections.Set[tanjun_abc.SlashHooks]],
+        /,
+    ) -> collections.Coroutine[typing.Any, typing.Any, typing.Optional[collections.Awaitable[None]]]:
+        # This is set on each call to ensure that any component state which was
+        # set to this isn't propagated to other components.
+        ctx.set_ephemeral_default(self._defaults_to_ephemeral)
+        if route is None:
+            return component.execute_interaction(ctx, hooks=hooks)
+
+        assert isinstance(component, components.Component)
+        return component.execute_interaction_route(ctx, route, option, hooks=hooks)
+
     def check_message_name(
         self, name: str, /
     ) -> collections.Iterator[tuple[str, tanjun_abc.MessageCommand[typing.Any]]]:
         # <<inherited docstring from tanjun.abc.Client>>.
         return itertools.chain.from_iterable(
-            component.check_message_name(name) for component in self._components.values()
+            component.check_message_name(name) if candidates is None else candidates
+            for component, candidates in self._get_message_index().find(name)
         )
 
     def check_slash_name(self, name: str, /) -> collections.Iterator[tanjun_abc.BaseSlashCommand]:
@@ -1627,16 +2928,11 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         )
 
     async def _check_prefix(self, ctx: tanjun_abc.MessageContext, /) -> typing.Optional[str]:
+        extra: typing.Optional[collections.Iterable[str]] = None
         if self._prefix_getter:
-            for prefix in await self._prefix_getter.resolve_with_command_context(ctx, ctx):
-                if ctx.content.startswith(prefix):
-                    return prefix
-
-        for prefix in self._prefixes:
-            if ctx.content.startswith(prefix):
-                return prefix
+            extra = await self._prefix_getter.resolve_with_command_context(ctx, ctx)
 
-        return None
+        return self._prefix_trie.longest_match(ctx.content, extra=extra)
 
     def _try_unsubscribe(
         self,
@@ -1685,6 +2981,9 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         if deregister_listeners and self._server:
             self._server.set_listener(hikari.CommandInteraction, None)
 
+        if self._module_watcher:
+            self._module_watcher.stop()
+
         await asyncio.gather(*(component.close() for component in self._components.copy().values()))
 
         self._loop = None
@@ -1721,9 +3020,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             if not user:
                 user = await self._rest.fetch_my_user()
 
-            for prefix in f"<@{user.id}>", f"<@!{user.id}>":
-                if prefix not in self._prefixes:
-                    self._prefixes.append(prefix)
+            self.add_prefix((f"<@{user.id}>", f"<@!{user.id}>"))
 
             self._grab_mention_prefix = False
 
@@ -1742,6 +3039,9 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         if register_listeners and self._server:
             self._server.set_listener(hikari.CommandInteraction, self.on_interaction_create_request)
 
+        if self._module_watcher:
+            self._module_watcher.start(self._loop)
+
         self._loop.create_task(self.dispatch_client_callback(ClientCallbackNames.STARTED))
 
     async def fetch_rest_application_id(self) -> hikari.Snowflake:
@@ -1789,6 +3089,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             The client instance to enable chained calls.
         """
         self._hooks = hooks
+        self._compile_hooks()
         return self
 
     def set_slash_hooks(self: _ClientT, hooks: typing.Optional[tanjun_abc.SlashHooks], /) -> _ClientT:
@@ -1811,6 +3112,7 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             The client instance to enable chained calls.
         """
         self._slash_hooks = hooks
+        self._compile_hooks()
         return self
 
     def set_message_hooks(self: _ClientT, hooks: typing.Optional[tanjun_abc.MessageHooks], /) -> _ClientT:
@@ -1833,8 +3135,15 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             The client instance to enable chained calls.
         """
         self._message_hooks = hooks
+        self._compile_hooks()
         return self
 
+    def _compile_hooks(self) -> None:
+        # The hooks this client adds to each command execution are compiled
+        # ahead of time so execution doesn't have to re-check each field.
+        self._message_hook_chain = frozenset(hooks_ for hooks_ in (self._hooks, self._message_hooks) if hooks_)
+        self._slash_hook_chain = frozenset(hooks_ for hooks_ in (self._hooks, self._slash_hooks) if hooks_)
+
     def _call_loaders(
         self, module_path: typing.Union[str, pathlib.Path], loaders: list[tanjun_abc.ClientLoader], /
     ) -> None:
@@ -1871,6 +3180,8 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
                 self._call_loaders(module_path, _get_loaders(module, module_path))
 
             self._modules[module_path] = module
+            if lazy_module := self._lazy_modules.get(module_path):
+                self._remove_lazy_module(lazy_module)
 
         else:
             module_path_abs = module_path.absolute()
@@ -1905,9 +3216,66 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
 
         return self
 
-    async def load_modules_async(self, *modules: typing.Union[str, pathlib.Path]) -> None:
-        # <<inherited docstring from tanjun.abc.Client>>.
+    async def load_modules_async(
+        self,
+        *modules: typing.Union[str, pathlib.Path],
+        parallel: bool = False,
+        dependencies: typing.Optional[
+            collections.Mapping[typing.Union[str, pathlib.Path], collections.Iterable[typing.Union[str, pathlib.Path]]]
+        ] = None,
+    ) -> None:
+        """Asynchronous variant of `Client.load_modules`.
+
+        Unlike `Client.load_modules`, this method will run blocking code in a
+        background thread.
+
+        For more information on the behaviour of this method see the
+        documentation for `Client.load_modules`.
+
+        Parameters
+        ----------
+        *modules : str | pathlib.Path
+            Path(s) of the modules to load from.
+
+        Other Parameters
+        ----------------
+        parallel : bool
+            Whether the modules should be imported concurrently in background threads.
+
+            The modules' loaders are still called one at a time on the event
+            loop in the order the modules were passed in (after any modules
+            they depend on) and the first failure is raised as
+            `tanjun.errors.FailedModuleLoad` with the modules before it staying
+            loaded.
+
+            .. note::
+                Already loaded modules are checked for before anything is imported.
+
+            Defaults to `False`.
+        dependencies : collections.abc.Mapping[str | pathlib.Path, collections.abc.Iterable[str | pathlib.Path]] | None
+            Mapping of modules to the modules which need to be imported and
+            loaded before them.
+
+            This only applies when `parallel` is `True` and every module in
+            this must also be passed in `modules`.
+
+        Raises
+        ------
+        ValueError
+            If `dependencies` references a module which isn't being loaded or
+            contains a cycle.
+        tanjun.errors.ModuleStateConflict
+            If the module is already loaded.
+        tanjun.errors.ModuleMissingLoaders
+            If no loaders are found in the module.
+        tanjun.errors.FailedModuleLoad
+            If the module fails to load.
+        """
         loop = asyncio.get_running_loop()
+        if parallel:
+            await self._load_modules_parallel(loop, modules, dependencies or {})
+            return
+
         for module_path in modules:
             if isinstance(module_path, pathlib.Path):
                 module_path = await loop.run_in_executor(None, module_path.absolute)
@@ -1924,6 +3292,221 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             else:
                 raise RuntimeError("Generator didn't finish")
 
+    async def _load_modules_parallel(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        modules: collections.Sequence[typing.Union[str, pathlib.Path]],
+        dependencies: collections.Mapping[
+            typing.Union[str, pathlib.Path], collections.Iterable[typing.Union[str, pathlib.Path]]
+        ],
+        /,
+    ) -> None:
+        dependencies = {
+            module_path: list(module_dependencies) for module_path, module_dependencies in dependencies.items()
+        }
+        paths = itertools.chain(modules, dependencies, itertools.chain.from_iterable(dependencies.values()))
+        if any(isinstance(path, pathlib.Path) for path in paths):
+            modules, dependencies = await loop.run_in_executor(None, _absolute_module_paths, modules, dependencies)
+
+        order = _sort_module_dependencies(modules, dependencies)
+        generators = {module_path: self._load_module(module_path) for module_path in order}
+        # This raises ModuleStateConflict for already loaded modules before anything's imported.
+        import_callbacks = {module_path: next(generator) for module_path, generator in generators.items()}
+        imports: dict[typing.Union[str, pathlib.Path], asyncio.Future[types.ModuleType]] = {}
+
+        async def import_module(module_path: typing.Union[str, pathlib.Path], /) -> types.ModuleType:
+            for dependency in dependencies.get(module_path, ()):
+                await asyncio.shield(imports[dependency])
+
+            return await loop.run_in_executor(None, import_callbacks[module_path])
+
+        # The modules are imported in dependency order so each module's dependencies are always scheduled first.
+        for module_path in order:
+            imports[module_path] = asyncio.ensure_future(import_module(module_path))
+
+        try:
+            for module_path in order:
+                with _WrapLoadError(errors.FailedModuleLoad):
+                    module = await imports[module_path]
+
+                try:
+                    generators[module_path].send(module)
+
+                except StopIteration:
+                    pass
+
+                else:
+                    raise RuntimeError("Generator didn't finish")
+
+        finally:
+            for future in imports.values():
+                future.cancel()
+
+            await asyncio.gather(*imports.values(), return_exceptions=True)
+
+    def generate_module_manifest(self, *modules: str) -> dict[str, typing.Any]:
+        """Generate a manifest of the commands declared by modules for lazy loading.
+
+        This loads each module into its own temporary client to find the
+        commands it declares. The returned manifest is JSON serialisable and
+        should be generated ahead of time (e.g. in a build script) then passed
+        to `Client.add_lazy_modules`.
+
+        .. warning::
+            This imports the modules and calls their loaders.
+
+        Parameters
+        ----------
+        *modules : str
+            Python module paths of the modules to include in the manifest.
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            The generated manifest.
+
+        Raises
+        ------
+        tanjun.errors.ModuleMissingLoaders
+            If no loaders are found in a module.
+        tanjun.errors.FailedModuleLoad
+            If a module fails to load.
+        """
+        entity_factory = self._rest.entity_factory
+        manifest_modules: dict[str, dict[str, typing.Any]] = {}
+        for module_path in modules:
+            client = Client(
+                self._rest,
+                cache=self._cache,
+                events=self._events,
+                server=self._server,
+                shards=self._shards,
+                voice=self._voice,
+            ).load_modules(module_path)
+            manifest_modules[module_path] = {
+                "message_commands": sorted(
+                    {
+                        name
+                        for component in client.components
+                        for command in component.message_commands
+                        for name in command.names
+                    }
+                ),
+                "slash_commands": [
+                    {"global": command.is_global, "payload": dict(command.build().build(entity_factory))}
+                    for component in client.components
+                    for command in component.slash_commands
+                ],
+            }
+
+        return {"version": _MANIFEST_VERSION, "modules": manifest_modules}
+
+    def add_lazy_modules(
+        self: _ClientT, manifest: typing.Union[str, pathlib.Path, collections.Mapping[str, typing.Any]], /
+    ) -> _ClientT:
+        """Register modules which should be loaded the first time one of their commands is used.
+
+        Until a module is loaded, messages and slash commands are routed to
+        it based on its command names in the manifest and its global slash
+        commands are declared from the manifest by `Client.declare_global_commands`.
+        The module is then loaded (as if by `Client.load_modules_async`) the
+        first time one of its commands is invoked before the command is
+        executed.
+
+        .. note::
+            If a lazy module fails to load then the error is logged and it
+            won't be tried again.
+
+        Parameters
+        ----------
+        manifest : str | pathlib.Path | collections.abc.Mapping[str, typing.Any]
+            The manifest generated by `Client.generate_module_manifest` or the
+            path to a JSON file containing it.
+
+            Modules in this which are already loaded are ignored.
+
+        Returns
+        -------
+        Self
+            The client instance to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If the manifest's format version isn't supported.
+        """
+        if not isinstance(manifest, collections.Mapping):
+            with pathlib.Path(manifest).open() as file:
+                manifest = typing.cast("dict[str, typing.Any]", json.load(file))
+
+        if manifest.get("version") != _MANIFEST_VERSION:
+            raise ValueError(f"Unsupported module manifest version {manifest.get('version')!r}")
+
+        for module_path, entry in manifest["modules"].items():
+            if module_path in self._modules:
+                continue
+
+            if old_module := self._lazy_modules.get(module_path):
+                self._remove_lazy_module(old_module)
+
+            module = self._lazy_modules[module_path] = _LazyModule(module_path)
+            for name in entry["message_commands"]:
+                module.message_names.append(name)
+                self._lazy_message_names.setdefault(name.split(" ", 1)[0], []).append((name, module))
+
+            for command in entry["slash_commands"]:
+                module.slash_names.append(command["payload"]["name"])
+                self._lazy_slash_names[command["payload"]["name"]] = module
+                if command["global"]:
+                    module.global_commands.append(command["payload"])
+
+        return self
+
+    def _remove_lazy_module(self, module: _LazyModule, /) -> None:
+        if self._lazy_modules.get(module.path) is not module:
+            return
+
+        del self._lazy_modules[module.path]
+        for name in module.message_names:
+            key = name.split(" ", 1)[0]
+            entries = [entry for entry in self._lazy_message_names.get(key, ()) if entry[1] is not module]
+            if entries:
+                self._lazy_message_names[key] = entries
+
+            else:
+                self._lazy_message_names.pop(key, None)
+
+        for name in module.slash_names:
+            if self._lazy_slash_names.get(name) is module:
+                del self._lazy_slash_names[name]
+
+    def _find_lazy_message_module(self, content: str, /) -> typing.Optional[_LazyModule]:
+        # This matches names the same way the message command index and standard component do.
+        for name, module in self._lazy_message_names.get(content.split(" ", 1)[0], ()):
+            if utilities.match_prefix_names(content, (name,)) is not None:
+                return module
+
+        return None
+
+    async def _import_lazy_module(self, module: _LazyModule, /) -> None:
+        try:
+            await self.load_modules_async(module.path)
+
+        except Exception as exc:
+            _LOGGER.error("Failed to lazily load %s", module.path, exc_info=exc)
+
+        finally:
+            self._remove_lazy_module(module)
+
+    async def _load_lazy_module(self, module: _LazyModule, /) -> None:
+        # Concurrent invocations of the module's commands share the same load.
+        if not module.task:
+            module.task = asyncio.get_running_loop().create_task(
+                self._import_lazy_module(module), name=f"lazy load {module.path}"
+            )
+
+        await asyncio.shield(module.task)
+
     def unload_modules(self: _ClientT, *modules: typing.Union[str, pathlib.Path]) -> _ClientT:
         # <<inherited docstring from tanjun.ab.Client>>.
         for module_path in modules:
@@ -1954,6 +3537,9 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
 
             def load_module() -> types.ModuleType:
                 assert old_module
+                # Reloading re-executes the module in its old namespace so the old
+                # module's registered loaders have to be cleared first.
+                vars(old_module).pop(components._LOADERS_ATTRIBUTE, None)
                 return importlib.reload(old_module)
 
             modules_dict: dict[typing.Any, types.ModuleType] = self._modules
@@ -2027,19 +3613,50 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             if isinstance(module_path, pathlib.Path):
                 module_path = await loop.run_in_executor(None, module_path.absolute)
 
-            generator = self._reload_module(module_path)
-            load_module = next(generator)
-            with _WrapLoadError(errors.FailedModuleLoad):
-                module = await loop.run_in_executor(None, load_module)
+            await self._reload_module_async(module_path, loop)
 
-            try:
-                generator.send(module)
+    async def _reload_module_async(
+        self, module_path: typing.Union[str, pathlib.Path], loop: asyncio.AbstractEventLoop, /
+    ) -> None:
+        generator = self._reload_module(module_path)
+        load_module = next(generator)
+        with _WrapLoadError(errors.FailedModuleLoad):
+            module = await loop.run_in_executor(None, load_module)
 
-            except StopIteration:
-                pass
+        try:
+            generator.send(module)
 
-            else:
-                raise RuntimeError("Generator didn't finish")
+        except StopIteration:
+            pass
+
+        else:
+            raise RuntimeError("Generator didn't finish")
+
+    def _is_probable_message_command(self, message: hikari.Message, /) -> bool:
+        # This lets messages which can't trigger a command be rejected before
+        # a context is built for them and should stay cheap.
+        content = message.content
+        if content is None:
+            return False
+
+        # Prefix getters are injected callbacks which need a context to be called.
+        if (
+            not self._prefix_getter
+            and not self._prefix_trie.has_empty_prefix
+            and content[:1] not in self._prefix_trie.first_characters
+        ):
+            return False
+
+        # The human check failing leads to the "not found" callbacks being called
+        # so this can only be done early when there aren't any of those.
+        if (
+            (message.author.is_bot or message.webhook_id is not None)
+            and self.is_human_only
+            and not self.get_client_callbacks(ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND)
+        ):
+            return False
+
+        return True
 
     async def on_message_create_event(self, event: hikari.MessageCreateEvent, /) -> None:
         """Execute a message command based on a gateway event.
@@ -2049,53 +3666,88 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         hikari.events.message_events.MessageCreateEvent
             The event to handle.
         """
-        if event.message.content is None:
+        if not self._is_probable_message_command(event.message):
             return
 
         ctx = self._make_message_context(
             client=self, injection_client=self, content=event.message.content, message=event.message
         )
-        if (prefix := await self._check_prefix(ctx)) is None:
-            return
+        collector = self._timing_collector
+        # This is reset once the invocation's finished so it doesn't leak into the caller's context.
+        token = metrics.set_active_collector(collector) if collector else None
+        try:
+            if collector:
+                prefix = await metrics.timed(collector, metrics.DispatchStage.PREFIX_MATCH, self._check_prefix(ctx))
 
-        ctx.set_content(ctx.content.lstrip()[len(prefix) :].lstrip()).set_triggering_prefix(prefix)
-        hooks: typing.Optional[set[tanjun_abc.MessageHooks]] = None
-        if self._hooks and self._message_hooks:
-            hooks = {self._hooks, self._message_hooks}
+            else:
+                prefix = await self._check_prefix(ctx)
 
-        elif self._hooks:
-            hooks = {self._hooks}
+            if prefix is None:
+                return
 
-        elif self._message_hooks:
-            hooks = {self._message_hooks}
+            ctx.set_content(ctx.content.lstrip()[len(prefix) :].lstrip()).set_triggering_prefix(prefix)
 
-        try:
-            if await self.check(ctx):
-                for component in self._components.values():
-                    if await component.execute_message(ctx, hooks=hooks):
-                        return
+            admission = self._message_admission
+            if admission and not await admission.acquire():
+                await self._on_command_shed(ctx, admission.reject_message if admission.should_reject else None)
+                return
 
-        except errors.HaltExecution:
-            pass
+            scheduler = self._fair_scheduler
+            try:
+                if scheduler:
+                    await scheduler.acquire(_get_fair_key(ctx))
 
-        except errors.CommandError as exc:
-            await ctx.respond(exc.message)
-            return
+            except BaseException:
+                if admission:
+                    admission.release()
+
+                raise
+
+            try:
+                try:
+                    if await self._run_checks(ctx, collector):
+                        # Lazy modules are only loaded once the invocation's been admitted and passed the client's checks.
+                        if self._lazy_message_names and (lazy_module := self._find_lazy_message_module(ctx.content)):
+                            await self._load_lazy_module(lazy_module)
+
+                        hooks = self._message_hook_chain or None
+                        for component, candidates in _find_routes(
+                            collector, self._get_message_index().find, ctx.content
+                        ):
+                            if candidates is None:
+                                if await component.execute_message(ctx, hooks=hooks):
+                                    return
+
+                            else:
+                                assert isinstance(component, components.Component)
+                                if await component.execute_message_candidates(ctx, candidates, hooks=hooks):
+                                    return
+
+                except errors.HaltExecution:
+                    pass
+
+                except errors.CommandError as exc:
+                    await ctx.respond(exc.message)
+                    return
+
+                await self.dispatch_client_callback(ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, ctx)
 
-        await self.dispatch_client_callback(ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, ctx)
+            finally:
+                try:
+                    await _release_dependencies(ctx)
 
-    def _get_slash_hooks(self) -> typing.Optional[set[tanjun_abc.SlashHooks]]:
-        hooks: typing.Optional[set[tanjun_abc.SlashHooks]] = None
-        if self._hooks and self._slash_hooks:
-            hooks = {self._hooks, self._slash_hooks}
+                finally:
+                    _release_slots(admission, scheduler)
 
-        elif self._hooks:
-            hooks = {self._hooks}
+        finally:
+            if token:
+                metrics.reset_active_collector(token)
 
-        elif self._slash_hooks:
-            hooks = {self._slash_hooks}
+    async def _on_command_shed(self, ctx: tanjun_abc.Context, reject_message: typing.Optional[str], /) -> None:
+        if reject_message:
+            await ctx.respond(reject_message)
 
-        return hooks
+        await self.dispatch_client_callback(ClientCallbackNames.COMMAND_SHED, ctx)
 
     async def _on_slash_not_found(self, ctx: context.SlashContext) -> None:
         await self.dispatch_client_callback(ClientCallbackNames.SLASH_COMMAND_NOT_FOUND, ctx)
@@ -2124,29 +3776,65 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
             on_not_found=self._on_slash_not_found,
             default_to_ephemeral=self._defaults_to_ephemeral,
         )
-        hooks = self._get_slash_hooks()
+        collector = self._timing_collector
+        token = metrics.set_active_collector(collector) if collector else None
+        try:
+            if self._auto_defer_after is not None:
+                ctx.start_defer_timer(self._auto_defer_after)
 
-        if self._auto_defer_after is not None:
-            ctx.start_defer_timer(self._auto_defer_after)
+            admission = self._interaction_admission
+            if admission and not await admission.acquire():
+                ctx.cancel_defer()
+                await self._on_command_shed(ctx, admission.reject_message if admission.should_reject else None)
+                return
 
-        try:
-            if await self.check(ctx):
-                for component in self._components.values():
-                    # This is set on each iteration to ensure that any component
-                    # state which was set to this isn't propagated to other components.
-                    ctx.set_ephemeral_default(self._defaults_to_ephemeral)
-                    if future := await component.execute_interaction(ctx, hooks=hooks):
-                        await future
-                        return
-
-        except errors.HaltExecution:
-            pass
+            scheduler = self._fair_scheduler
+            try:
+                if scheduler:
+                    await scheduler.acquire(_get_fair_key(ctx))
 
-        except errors.CommandError as exc:
-            await ctx.respond(exc.message)
-            return
+            except BaseException:
+                if admission:
+                    admission.release()
+
+                raise
+
+            try:
+                try:
+                    if await self._run_checks(ctx, collector):
+                        # Lazy modules are only loaded once the invocation's been admitted and passed the client's checks.
+                        if self._lazy_slash_names and (
+                            lazy_module := self._lazy_slash_names.get(ctx.interaction.command_name)
+                        ):
+                            await self._load_lazy_module(lazy_module)
+
+                        hooks = self._slash_hook_chain or None
+                        for component, route, option in _find_routes(
+                            collector, self._get_slash_index().find, ctx.interaction
+                        ):
+                            if future := await self._execute_interaction(ctx, component, route, option, hooks):
+                                await future
+                                return
+
+                except errors.HaltExecution:
+                    pass
+
+                except errors.CommandError as exc:
+                    await ctx.respond(exc.message)
+                    return
+
+                await ctx.mark_not_found()
+
+            finally:
+                try:
+                    await _release_dependencies(ctx)
+
+                finally:
+                    _release_slots(admission, scheduler)
 
-        await ctx.mark_not_found()
+        finally:
+            if token:
+                metrics.reset_active_collector(token)
 
     async def on_interaction_create_request(self, interaction: hikari.CommandInteraction, /) -> context.ResponseTypeT:
         """Execute a slash command based on received REST requests.
@@ -2171,31 +3859,106 @@ class Client(injecting.InjectorClient, tanjun_abc.Client):
         if self._auto_defer_after is not None:
             ctx.start_defer_timer(self._auto_defer_after)
 
-        hooks = self._get_slash_hooks()
         future = ctx.get_response_future()
+        collector = self._timing_collector
+        token = metrics.set_active_collector(collector) if collector else None
         try:
-            if await self.check(ctx):
-                for component in self._components.values():
-                    # This is set on each iteration to ensure that any component
-                    # state which was set to this isn't propagated to other components.
-                    ctx.set_ephemeral_default(self._defaults_to_ephemeral)
-                    if await component.execute_interaction(ctx, hooks=hooks):
-                        return await future
-
-        except errors.HaltExecution:
-            pass
+            admission = self._interaction_admission
+            if admission and not await admission.acquire():
+                # Interactions received over REST always have to be responded to.
+                ctx.cancel_defer()
+                asyncio.get_running_loop().create_task(
+                    self._on_command_shed(ctx, admission.reject_message), name=f"{interaction.id} shed responder"
+                )
+                return await future
+
+            scheduler = self._fair_scheduler
+            try:
+                if scheduler:
+                    await scheduler.acquire(_get_fair_key(ctx))
+
+            except BaseException:
+                if admission:
+                    admission.release()
+
+                raise
+
+            # The command's execution carries on past the initial response being
+            # returned so its execution slots are released once it's finished.
+            release_now = True
+            try:
+                if await self._run_checks(ctx, collector):
+                    # Lazy modules are only loaded once the invocation's been admitted and passed the client's checks.
+                    if self._lazy_slash_names and (
+                        lazy_module := self._lazy_slash_names.get(ctx.interaction.command_name)
+                    ):
+                        await self._load_lazy_module(lazy_module)
+
+                    hooks = self._slash_hook_chain or None
+                    for component, route, option in _find_routes(
+                        collector, self._get_slash_index().find, ctx.interaction
+                    ):
+                        if execution := await self._execute_interaction(ctx, component, route, option, hooks):
+                            if isinstance(execution, asyncio.Future):
+                                release_now = False
+                                execution.add_done_callback(lambda _: _release_slots(admission, scheduler))
+
+                            return await future
+
+            except errors.HaltExecution:
+                pass
+
+            except errors.CommandError as exc:
+                # Under very specific timing there may be another future which could set a result while we await
+                # ctx.respond therefore we create a task to avoid any erroneous behaviour from this trying to create
+                # another response before it's returned the initial response.
+                asyncio.get_running_loop().create_task(
+                    _release_after(ctx, ctx.respond(exc.message)), name=f"{interaction.id} command error responder"
+                )
+                return await future
+
+            finally:
+                if release_now:
+                    _release_slots(admission, scheduler)
 
-        except errors.CommandError as exc:
-            # Under very specific timing there may be another future which could set a result while we await
-            # ctx.respond therefore we create a task to avoid any erroneous behaviour from this trying to create
-            # another response before it's returned the initial response.
             asyncio.get_running_loop().create_task(
-                ctx.respond(exc.message), name=f"{interaction.id} command error responder"
+                _release_after(ctx, ctx.mark_not_found()), name=f"{interaction.id} not found"
             )
             return await future
 
-        asyncio.get_running_loop().create_task(ctx.mark_not_found(), name=f"{interaction.id} not found")
-        return await future
+        finally:
+            if token:
+                metrics.reset_active_collector(token)
+
+
+def _is_public_name(name: str, /) -> bool:
+    return not name.startswith("_") or name.startswith("__") and name.endswith("__")
+
+
+def _get_public_loaders(
+    namespace: collections.Mapping[str, typing.Any], registered: list[typing.Any], /
+) -> list[typing.Any]:
+    public_ids: set[int] = set()
+    unnamed: set[int] = set()
+    for loader in registered:
+        # Decorated callbacks are named after the function they wrap so checking
+        # whether they're bound to a public name is usually a single lookup.
+        name = getattr(loader, "__name__", None)
+        if name and namespace.get(name) is loader:
+            if _is_public_name(name):
+                public_ids.add(id(loader))
+
+        else:
+            unnamed.add(id(loader))
+
+    if unnamed:
+        # Other loaders (e.g. those made by Component.make_loader) have to be
+        # matched to the names they're bound to.
+        public_ids.update(
+            id(value) for name, value in namespace.items() if id(value) in unnamed and _is_public_name(name)
+        )
+
+    return [loader for loader in registered if id(loader) in public_ids]
 
 
 def _get_loaders(
@@ -2207,17 +3970,73 @@ def _get_loaders(
         exported = typing.cast("collections.Iterable[typing.Any]", exported)
         iterator = (getattr(module, name, None) for name in exported if isinstance(name, str))
 
+    elif (registered := vars(module).get(components._LOADERS_ATTRIBUTE)) is not None:
+        _LOGGER.debug("Using the loaders registered by %s", module_path)
+        iterator = _get_public_loaders(vars(module), typing.cast("list[typing.Any]", registered))
+
     else:
         _LOGGER.debug("Scanning all public members on %s", module_path)
-        iterator = (
-            member
-            for name, member in inspect.getmembers(module)
-            if not name.startswith("_") or name.startswith("__") and name.endswith("__")
-        )
+        iterator = (member for name, member in inspect.getmembers(module) if _is_public_name(name))
 
     return [value for value in iterator if isinstance(value, tanjun_abc.ClientLoader)]
 
 
+def _absolute_module_paths(
+    modules: collections.Sequence[typing.Union[str, pathlib.Path]],
+    dependencies: collections.Mapping[
+        typing.Union[str, pathlib.Path], collections.Iterable[typing.Union[str, pathlib.Path]]
+    ],
+    /,
+) -> tuple[
+    list[typing.Union[str, pathlib.Path]],
+    dict[typing.Union[str, pathlib.Path], list[typing.Union[str, pathlib.Path]]],
+]:
+    def absolute(path: typing.Union[str, pathlib.Path], /) -> typing.Union[str, pathlib.Path]:
+        return path.absolute() if isinstance(path, pathlib.Path) else path
+
+    return [absolute(path) for path in modules], {
+        absolute(path): [absolute(dependency) for dependency in path_dependencies]
+        for path, path_dependencies in dependencies.items()
+    }
+
+
+def _sort_module_dependencies(
+    modules: collections.Sequence[typing.Union[str, pathlib.Path]],
+    dependencies: collections.Mapping[
+        typing.Union[str, pathlib.Path], collections.Iterable[typing.Union[str, pathlib.Path]]
+    ],
+    /,
+) -> list[typing.Union[str, pathlib.Path]]:
+    # This is a depth-first topological sort which otherwise keeps the order the modules were passed in.
+    known = set(modules)
+    for module_path, module_dependencies in dependencies.items():
+        for module in itertools.chain((module_path,), module_dependencies):
+            if module not in known:
+                raise ValueError(f"Dependency module {module!s} isn't being loaded")
+
+    order: dict[typing.Union[str, pathlib.Path], None] = {}
+    visiting: set[typing.Union[str, pathlib.Path]] = set()
+
+    def visit(module_path: typing.Union[str, pathlib.Path], /) -> None:
+        if module_path in order:
+            return
+
+        if module_path in visiting:
+            raise ValueError(f"Module {module_path!s} has a circular dependency")
+
+        visiting.add(module_path)
+        for dependency in dependencies.get(module_path, ()):
+            visit(dependency)
+
+        visiting.remove(module_path)
+        order[module_path] = None
+
+    for module_path in modules:
+        visit(module_path)
+
+    return list(order)
+
+
 def _get_path_module(module_path: pathlib.Path, /) -> types.ModuleType:
     module_name = module_path.name.rsplit(".", 1)[0]
     spec = importlib_util.spec_from_file_location(module_name, module_path)
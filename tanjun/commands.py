@@ -57,6 +57,7 @@ __all__: list[str] = [
 ]
 
 import copy
+import logging
 import re
 import typing
 import warnings
@@ -72,6 +73,7 @@ from . import errors
 from . import hooks as hooks_
 from . import injecting
 from . import utilities
+from .dependencies import metrics
 
 if typing.TYPE_CHECKING:
     from hikari.api import special_endpoints as special_endpoints_api
@@ -94,6 +96,7 @@ AnyMessageCommandT = typing.TypeVar("AnyMessageCommandT", bound=abc.MessageComma
 ConverterSig = collections.Callable[..., abc.MaybeAwaitableT[typing.Any]]
 """Type hint of a converter used for a slash command option."""
 _EMPTY_DICT: typing.Final[dict[typing.Any, typing.Any]] = {}
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.tanjun.commands")
 _EMPTY_HOOKS: typing.Final[hooks_.Hooks[typing.Any]] = hooks_.Hooks()
 
 
@@ -182,6 +185,17 @@ class PartialCommand(abc.ExecutableCommand[abc.ContextT], components.AbstractCom
 _SCOMMAND_NAME_REG: typing.Final[re.Pattern[str]] = re.compile(r"^[\w-]{1,32}$", flags=re.UNICODE)
 
 
+async def _release_dependencies(ctx: abc.Context, exception: typing.Optional[BaseException], /) -> None:
+    if isinstance(ctx, injecting.AbstractInjectionContext):
+        # This is called in a finally block so errors are logged rather than
+        # raised to avoid them replacing the command's own exception.
+        try:
+            await ctx.release_dependencies(exception)
+
+        except Exception:
+            _LOGGER.exception("Failed to release a command's dependencies")
+
+
 def _validate_name(name: str) -> None:
     if not _SCOMMAND_NAME_REG.fullmatch(name):
         raise ValueError(f"Invalid name provided, {name!r} doesn't match the required regex `^\\w{{1,32}}$`")
@@ -1065,6 +1079,7 @@ class SlashCommandGroup(BaseSlashCommand, abc.SlashCommandGroup):
 
         command.set_parent(self)
         self._commands[command.name] = command
+        self._invalidate_routing()
         return self
 
     def remove_command(self: _SlashCommandGroupT, command: abc.BaseSlashCommand, /) -> _SlashCommandGroupT:
@@ -1081,8 +1096,18 @@ class SlashCommandGroup(BaseSlashCommand, abc.SlashCommandGroup):
             Object of this group to enable chained calls.
         """
         del self._commands[command.name]
+        self._invalidate_routing()
         return self
 
+    def _invalidate_routing(self) -> None:
+        # Slash command groups can only be nested one level deep.
+        root: abc.SlashCommandGroup = self.parent or self
+
+        # The standard client caches a routing table of slash command paths
+        # which has to be rebuilt when a bound group's sub-commands change.
+        if root.component:
+            components._invalidate_routing(root.component.client)
+
     def with_command(self, command: abc.BaseSlashCommandT, /) -> abc.BaseSlashCommandT:
         """Add a slash command to this group through a decorator call.
 
@@ -1105,7 +1130,7 @@ class SlashCommandGroup(BaseSlashCommand, abc.SlashCommandGroup):
         /,
         option: typing.Optional[hikari.CommandInteractionOption] = None,
         *,
-        hooks: typing.Optional[collections.MutableSet[abc.SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[abc.SlashHooks]] = None,
     ) -> None:
         # <<inherited docstring from tanjun.abc.BaseSlashCommand>>.
         if not option and ctx.interaction.options:
@@ -2036,7 +2061,7 @@ class SlashCommand(BaseSlashCommand, abc.SlashCommand[abc.CommandCallbackSigT]):
         /,
         option: typing.Optional[hikari.CommandInteractionOption] = None,
         *,
-        hooks: typing.Optional[collections.MutableSet[abc.SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[abc.SlashHooks]] = None,
     ) -> None:
         # <<inherited docstring from tanjun.abc.BaseSlashCommand>>.
         if self._always_defer and not ctx.has_been_deferred and not ctx.has_responded:
@@ -2044,8 +2069,16 @@ class SlashCommand(BaseSlashCommand, abc.SlashCommand[abc.CommandCallbackSigT]):
 
         ctx = ctx.set_command(self)
         own_hooks = self._hooks or _EMPTY_HOOKS
+        collector = metrics.get_active_collector()
+        exception: typing.Optional[BaseException] = None
         try:
-            await own_hooks.trigger_pre_execution(ctx, hooks=hooks)
+            pre_execution = own_hooks.trigger_pre_execution(ctx, hooks=hooks)
+            if collector:
+                pre_execution = metrics.timed(
+                    collector, metrics.DispatchStage.PRE_EXECUTION, pre_execution, name=self.name
+                )
+
+            await pre_execution
 
             if self._tracked_options:
                 kwargs = await self._process_args(ctx)
@@ -2053,17 +2086,24 @@ class SlashCommand(BaseSlashCommand, abc.SlashCommand[abc.CommandCallbackSigT]):
             else:
                 kwargs = _EMPTY_DICT
 
-            await self._callback.resolve_with_command_context(ctx, ctx, **kwargs)
+            callback = self._callback.resolve_with_command_context(ctx, ctx, **kwargs)
+            if collector:
+                callback = metrics.timed(collector, metrics.DispatchStage.CALLBACK, callback, name=self.name)
+
+            await callback
 
         except errors.CommandError as exc:
+            exception = exc
             await ctx.respond(exc.message)
 
-        except errors.HaltExecution:
+        except errors.HaltExecution as exc:
+            exception = exc
             # Unlike a message command, this won't necessarily reach the client level try except
             # block so we have to handle this here.
             await ctx.mark_not_found()
 
         except Exception as exc:
+            exception = exc
             if await own_hooks.trigger_error(ctx, exc, hooks=hooks) <= 0:
                 raise
 
@@ -2071,7 +2111,18 @@ class SlashCommand(BaseSlashCommand, abc.SlashCommand[abc.CommandCallbackSigT]):
             await own_hooks.trigger_success(ctx, hooks=hooks)
 
         finally:
-            await own_hooks.trigger_post_execution(ctx, hooks=hooks)
+            post_execution = own_hooks.trigger_post_execution(ctx, hooks=hooks)
+            if collector:
+                post_execution = metrics.timed(
+                    collector, metrics.DispatchStage.POST_EXECUTION, post_execution, name=self.name
+                )
+
+            try:
+                await post_execution
+
+            finally:
+                # Generator and context manager dependencies are released once the command's finished.
+                await _release_dependencies(ctx, exception)
 
     def copy(
         self: _SlashCommandT, *, _new: bool = True, parent: typing.Optional[abc.SlashCommandGroup] = None
@@ -2292,13 +2343,21 @@ class MessageCommand(PartialCommand[abc.MessageContext], abc.MessageCommand[abc.
         ctx: abc.MessageContext,
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[abc.MessageHooks]] = None,
+        hooks: typing.Optional[collections.Set[abc.MessageHooks]] = None,
     ) -> None:
         # <<inherited docstring from tanjun.abc.MessageCommand>>.
         ctx = ctx.set_command(self)
         own_hooks = self._hooks or _EMPTY_HOOKS
+        collector = metrics.get_active_collector()
+        exception: typing.Optional[BaseException] = None
         try:
-            await own_hooks.trigger_pre_execution(ctx, hooks=hooks)
+            pre_execution = own_hooks.trigger_pre_execution(ctx, hooks=hooks)
+            if collector:
+                pre_execution = metrics.timed(
+                    collector, metrics.DispatchStage.PRE_EXECUTION, pre_execution, name=self._names[0]
+                )
+
+            await pre_execution
 
             if self._parser is not None:
                 kwargs = await self._parser.parse(ctx)
@@ -2306,16 +2365,23 @@ class MessageCommand(PartialCommand[abc.MessageContext], abc.MessageCommand[abc.
             else:
                 kwargs = _EMPTY_DICT
 
-            await self._callback.resolve_with_command_context(ctx, ctx, **kwargs)
+            callback = self._callback.resolve_with_command_context(ctx, ctx, **kwargs)
+            if collector:
+                callback = metrics.timed(collector, metrics.DispatchStage.CALLBACK, callback, name=self._names[0])
+
+            await callback
 
         except errors.CommandError as exc:
+            exception = exc
             response = exc.message if len(exc.message) <= 2000 else exc.message[:1997] + "..."
             await ctx.respond(content=response)
 
-        except errors.HaltExecution:
+        except errors.HaltExecution as exc:
+            exception = exc
             raise
 
         except Exception as exc:
+            exception = exc
             if await own_hooks.trigger_error(ctx, exc, hooks=hooks) <= 0:
                 raise
 
@@ -2324,7 +2390,18 @@ class MessageCommand(PartialCommand[abc.MessageContext], abc.MessageCommand[abc.
             await own_hooks.trigger_success(ctx, hooks=hooks)
 
         finally:
-            await own_hooks.trigger_post_execution(ctx, hooks=hooks)
+            post_execution = own_hooks.trigger_post_execution(ctx, hooks=hooks)
+            if collector:
+                post_execution = metrics.timed(
+                    collector, metrics.DispatchStage.POST_EXECUTION, post_execution, name=self._names[0]
+                )
+
+            try:
+                await post_execution
+
+            finally:
+                # Generator and context manager dependencies are released once the command's finished.
+                await _release_dependencies(ctx, exception)
 
     def load_into_component(self, component: abc.Component, /) -> None:
         # <<inherited docstring from tanjun.components.load_into_component>>.
@@ -2485,17 +2562,14 @@ class MessageCommandGroup(MessageCommand[abc.CommandCallbackSigT], abc.MessageCo
         ctx: abc.MessageContext,
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[abc.MessageHooks]] = None,
+        hooks: typing.Optional[collections.Set[abc.MessageHooks]] = None,
     ) -> None:
         # <<inherited docstring from tanjun.abc.MessageCommand>>.
         if ctx.message.content is None:
             raise ValueError("Cannot execute a command with a content-less message")
 
         if self._hooks:
-            if hooks is None:
-                hooks = set()
-
-            hooks.add(self._hooks)
+            hooks = {*hooks, self._hooks} if hooks else {self._hooks}
 
         for name, command in self.find_command(ctx.content):
             if await command.check_context(ctx):
@@ -52,13 +52,18 @@ import random
 import typing
 from collections import abc as collections
 
+import hikari
+
 from . import abc as tanjun_abc
 from . import checks as checks_
 from . import errors
 from . import injecting
 from . import utilities
+from .dependencies import metrics
 
 if typing.TYPE_CHECKING:
+    import types
+
     from hikari.events import base_events
 
     from . import schedules
@@ -69,6 +74,7 @@ if typing.TYPE_CHECKING:
 
 CommandT = typing.TypeVar("CommandT", bound="tanjun_abc.ExecutableCommand[typing.Any]")
 _LOGGER = logging.getLogger("hikari.tanjun.components")
+_LOADERS_ATTRIBUTE: typing.Final[str] = "__tanjun_loaders__"
 # This errors on earlier 3.9 releases when not quotes cause dumb handling of the [CommandT] list
 WithCommandReturnSig = typing.Union[CommandT, "collections.Callable[[CommandT], CommandT]"]
 
@@ -124,6 +130,81 @@ def _filter_scope(scope: collections.Mapping[str, typing.Any]) -> collections.It
     return (value for key, value in scope.items() if not key.startswith("_"))
 
 
+async def _execute_slash_route(
+    ctx: tanjun_abc.SlashContext,
+    route: collections.Sequence[tanjun_abc.BaseSlashCommand],
+    option: typing.Optional[hikari.CommandInteractionOption],
+    /,
+    *,
+    hooks: typing.Optional[collections.Set[tanjun_abc.SlashHooks]] = None,
+) -> None:
+    # This mirrors how the standard slash command groups handle sub-commands.
+    for command in route:
+        if command.defaults_to_ephemeral is not None:
+            ctx.set_ephemeral_default(command.defaults_to_ephemeral)
+
+        if not await _check_command(ctx, command, command.name):
+            await ctx.mark_not_found()
+            return
+
+    await route[-1].execute(ctx, option=option, hooks=hooks)
+
+
+@typing.overload
+def _check_command(
+    ctx: tanjun_abc.SlashContext, command: tanjun_abc.BaseSlashCommand, name: str, /
+) -> collections.Coroutine[typing.Any, typing.Any, bool]:
+    ...
+
+
+@typing.overload
+def _check_command(
+    ctx: tanjun_abc.MessageContext, command: tanjun_abc.MessageCommand[typing.Any], name: str, /
+) -> collections.Coroutine[typing.Any, typing.Any, bool]:
+    ...
+
+
+def _check_command(
+    ctx: typing.Union[tanjun_abc.SlashContext, tanjun_abc.MessageContext],
+    command: typing.Union[tanjun_abc.BaseSlashCommand, tanjun_abc.MessageCommand[typing.Any]],
+    name: str,
+    /,
+) -> collections.Coroutine[typing.Any, typing.Any, bool]:
+    # The overloads ensure the context's type matches the command's.
+    checks = command.check_context(ctx)  # type: ignore
+    if collector := metrics.get_active_collector():
+        return metrics.timed(collector, metrics.DispatchStage.COMMAND_CHECKS, checks, name=name)
+
+    return checks
+
+
+class _RoutingCacheClient(abc.ABC):
+    """Internal interface of clients which cache routing derived from their components' commands.
+
+    This is implemented by the standard `tanjun.Client`; other client
+    implementations don't cache routing so have nothing to invalidate.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _invalidate_routing(self) -> None:
+        """Drop the cached routing so it's rebuilt from the current commands."""
+
+
+def _invalidate_routing(client: typing.Optional[tanjun_abc.Client], /) -> None:
+    # This has to be called when the commands a bound component (or command group) routes to change.
+    if isinstance(client, _RoutingCacheClient):
+        client._invalidate_routing()
+
+
+def _register_loader(loader: tanjun_abc.ClientLoader, frame: typing.Optional[types.FrameType], /) -> None:
+    # Loaders made at the top level of a module are registered in that module's
+    # namespace so Client.load_modules can find them before scanning its members.
+    if frame and frame.f_globals is frame.f_locals:
+        frame.f_globals.setdefault(_LOADERS_ATTRIBUTE, []).append(loader)
+
+
 class _ComponentManager(tanjun_abc.ClientLoader):
     __slots__ = ("_component", "_copy")
 
@@ -171,6 +252,7 @@ class Component(tanjun_abc.Component):
         "_listeners",
         "_loop",
         "_message_commands",
+        "_message_hook_chain",
         "_message_hooks",
         "_metadata",
         "_name",
@@ -179,6 +261,7 @@ class Component(tanjun_abc.Component):
         "_on_open",
         "_schedules",
         "_slash_commands",
+        "_slash_hook_chain",
         "_slash_hooks",
     )
 
@@ -208,6 +291,9 @@ class Component(tanjun_abc.Component):
         self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
         self._message_commands: list[tanjun_abc.MessageCommand[typing.Any]] = []
         self._message_hooks: typing.Optional[tanjun_abc.MessageHooks] = None
+        # These are the hooks this component adds to each command execution,
+        # compiled ahead of time so execution doesn't have to re-check each field.
+        self._message_hook_chain: frozenset[tanjun_abc.MessageHooks] = frozenset()
         self._metadata: dict[typing.Any, typing.Any] = {}
         self._name = name or base64.b64encode(random.randbytes(32)).decode()
         self._names_to_commands: dict[str, tanjun_abc.MessageCommand[typing.Any]] = {}
@@ -215,6 +301,7 @@ class Component(tanjun_abc.Component):
         self._on_open: list[injecting.CallbackDescriptor[None]] = []
         self._schedules: list[schedules.AbstractSchedule] = []
         self._slash_commands: dict[str, tanjun_abc.BaseSlashCommand] = {}
+        self._slash_hook_chain: frozenset[tanjun_abc.SlashHooks] = frozenset()
         self._slash_hooks: typing.Optional[tanjun_abc.SlashHooks] = None
 
     def __repr__(self) -> str:
@@ -298,6 +385,7 @@ class Component(tanjun_abc.Component):
             self._checks = [check.copy() for check in self._checks]
             self._slash_commands = {name: command.copy() for name, command in self._slash_commands.items()}
             self._hooks = self._hooks.copy() if self._hooks else None
+            self._compile_hooks()
             self._listeners = {
                 event: [copy.copy(listener) for listener in listeners] for event, listeners in self._listeners.items()
             }
@@ -419,16 +507,23 @@ class Component(tanjun_abc.Component):
         self._metadata[key] = value
         return self
 
+    def _compile_hooks(self) -> None:
+        self._message_hook_chain = frozenset(hooks_ for hooks_ in (self._message_hooks, self._hooks) if hooks_)
+        self._slash_hook_chain = frozenset(hooks_ for hooks_ in (self._slash_hooks, self._hooks) if hooks_)
+
     def set_slash_hooks(self: _ComponentT, hooks_: typing.Optional[tanjun_abc.SlashHooks], /) -> _ComponentT:
         self._slash_hooks = hooks_
+        self._compile_hooks()
         return self
 
     def set_message_hooks(self: _ComponentT, hooks_: typing.Optional[tanjun_abc.MessageHooks], /) -> _ComponentT:
         self._message_hooks = hooks_
+        self._compile_hooks()
         return self
 
     def set_hooks(self: _ComponentT, hooks: typing.Optional[tanjun_abc.AnyHooks], /) -> _ComponentT:
         self._hooks = hooks
+        self._compile_hooks()
         return self
 
     def add_check(self: _ComponentT, check: tanjun_abc.CheckSig, /) -> _ComponentT:
@@ -603,6 +698,7 @@ class Component(tanjun_abc.Component):
             command.bind_client(self._client)
 
         self._slash_commands[command.name.casefold()] = command
+        _invalidate_routing(self._client)
         return self
 
     def remove_slash_command(self: _ComponentT, command: tanjun_abc.BaseSlashCommand, /) -> _ComponentT:
@@ -612,6 +708,7 @@ class Component(tanjun_abc.Component):
         except KeyError:
             raise ValueError(f"Command {command.name} not found") from None
 
+        _invalidate_routing(self._client)
         return self
 
     @typing.overload
@@ -670,6 +767,7 @@ class Component(tanjun_abc.Component):
             command.bind_client(self._client)
 
         command.bind_component(self)
+        _invalidate_routing(self._client)
         return self
 
     def remove_message_command(self: _ComponentT, command: tanjun_abc.MessageCommand[typing.Any], /) -> _ComponentT:
@@ -681,6 +779,7 @@ class Component(tanjun_abc.Component):
                 if self._names_to_commands.get(name) == command:
                     del self._names_to_commands[name]
 
+        _invalidate_routing(self._client)
         return self
 
     @typing.overload
@@ -882,18 +981,25 @@ class Component(tanjun_abc.Component):
 
         return self
 
-    async def _check_context(self, ctx: tanjun_abc.Context, /) -> bool:
-        return await utilities.gather_checks(ctx, self._checks)
+    def _check_context(self, ctx: tanjun_abc.Context, /) -> collections.Coroutine[typing.Any, typing.Any, bool]:
+        checks = utilities.gather_checks(ctx, self._checks)
+        if collector := metrics.get_active_collector():
+            return metrics.timed(collector, metrics.DispatchStage.COMPONENT_CHECKS, checks, name=self._name)
+
+        return checks
 
     async def _check_message_context(
-        self, ctx: tanjun_abc.MessageContext, /
+        self,
+        ctx: tanjun_abc.MessageContext,
+        /,
+        candidates: typing.Optional[collections.Iterable[tuple[str, tanjun_abc.MessageCommand[typing.Any]]]] = None,
     ) -> collections.AsyncIterator[tuple[str, tanjun_abc.MessageCommand[typing.Any]]]:
         ctx.set_component(self)
 
-        if self._is_strict:
+        if candidates is None and self._is_strict:
             name = ctx.content.split(" ", 1)[0]
             command = self._names_to_commands.get(name)
-            if command and await self._check_context(ctx) and await command.check_context(ctx):
+            if command and await self._check_context(ctx) and await _check_command(ctx, command, name):
                 yield name, command
 
             else:
@@ -901,15 +1007,18 @@ class Component(tanjun_abc.Component):
 
             return
 
+        if candidates is None:
+            candidates = self.check_message_name(ctx.content)
+
         checks_run = False
-        for name, command in self.check_message_name(ctx.content):
+        for name, command in candidates:
             if not checks_run:
                 if not await self._check_context(ctx):
                     return
 
                 checks_run = True
 
-            if await command.check_context(ctx):
+            if await _check_command(ctx, command, name):
                 yield name, command
 
         ctx.set_component(None)
@@ -939,10 +1048,16 @@ class Component(tanjun_abc.Component):
         command: typing.Optional[tanjun_abc.BaseSlashCommand],
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[tanjun_abc.SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[tanjun_abc.SlashHooks]] = None,
+        route: collections.Sequence[tanjun_abc.BaseSlashCommand] = (),
+        option: typing.Optional[hikari.CommandInteractionOption] = None,
     ) -> typing.Optional[collections.Awaitable[None]]:
         try:
-            if not command or not await self._check_context(ctx) or not await command.check_context(ctx):
+            if (
+                not command
+                or not await self._check_context(ctx)
+                or not await _check_command(ctx, command, command.name)
+            ):
                 return None
 
         except errors.HaltExecution:
@@ -953,17 +1068,11 @@ class Component(tanjun_abc.Component):
             asyncio.get_running_loop().create_future().set_result(None)
             return None
 
-        if self._slash_hooks:
-            if hooks is None:
-                hooks = set()
+        if self._slash_hook_chain:
+            hooks = self._slash_hook_chain.union(hooks) if hooks else self._slash_hook_chain
 
-            hooks.add(self._slash_hooks)
-
-        if self._hooks:
-            if hooks is None:
-                hooks = set()
-
-            hooks.add(self._hooks)
+        if route:
+            return asyncio.get_running_loop().create_task(_execute_slash_route(ctx, route, option, hooks=hooks))
 
         return asyncio.get_running_loop().create_task(command.execute(ctx, hooks=hooks))
 
@@ -975,7 +1084,7 @@ class Component(tanjun_abc.Component):
         ctx: tanjun_abc.SlashContext,
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[tanjun_abc.SlashHooks]] = None,
+        hooks: typing.Optional[collections.Set[tanjun_abc.SlashHooks]] = None,
     ) -> collections.Coroutine[typing.Any, typing.Any, typing.Optional[collections.Awaitable[None]]]:
         # <<inherited docstring from tanjun.abc.Component>>.
         command = self._slash_commands.get(ctx.interaction.command_name)
@@ -988,31 +1097,105 @@ class Component(tanjun_abc.Component):
 
         return self._execute_interaction(ctx, command, hooks=hooks)
 
+    def execute_interaction_route(
+        self,
+        ctx: tanjun_abc.SlashContext,
+        route: collections.Sequence[tanjun_abc.BaseSlashCommand],
+        option: typing.Optional[hikari.CommandInteractionOption],
+        /,
+        *,
+        hooks: typing.Optional[collections.Set[tanjun_abc.SlashHooks]] = None,
+    ) -> collections.Coroutine[typing.Any, typing.Any, typing.Optional[collections.Awaitable[None]]]:
+        """Execute a slash command which has already been resolved from the interaction.
+
+        This is used by the standard client's slash command routing table to
+        avoid walking the interaction's options through each command group.
+
+        Parameters
+        ----------
+        ctx : tanjun.abc.SlashContext
+            The context to execute the command with.
+        route : collections.abc.Sequence[tanjun.abc.BaseSlashCommand]
+            The top-level command in this component followed by any
+            sub-command groups and the sub-command being executed.
+
+            The checks for each of these commands will be run in order.
+        option : hikari.CommandInteractionOption | None
+            The interaction option of the sub-command being executed.
+
+            This should be `None` if the top-level command is being executed.
+
+        Other Parameters
+        ----------------
+        hooks : collections.abc.Set[tanjun.abc.SlashHooks] | None
+            Set of hooks to include in this command execution.
+
+        Returns
+        -------
+        collections.abc.Coroutine[typing.Any, typing.Any, collections.abc.Awaitable[None] | None]
+            Coroutine which returns an awaitable for the command's execution
+            or `None` if the top-level command's checks failed.
+        """
+        command = route[0]
+        if command.defaults_to_ephemeral is not None:
+            ctx.set_ephemeral_default(command.defaults_to_ephemeral)
+
+        elif self._defaults_to_ephemeral is not None:
+            ctx.set_ephemeral_default(self._defaults_to_ephemeral)
+
+        return self._execute_interaction(ctx, command, hooks=hooks, route=route[1:], option=option)
+
     async def execute_message(
         self,
         ctx: tanjun_abc.MessageContext,
         /,
         *,
-        hooks: typing.Optional[collections.MutableSet[tanjun_abc.MessageHooks]] = None,
+        hooks: typing.Optional[collections.Set[tanjun_abc.MessageHooks]] = None,
     ) -> bool:
         # <<inherited docstring from tanjun.abc.Component>>.
-        async for name, command in self._check_message_context(ctx):
-            ctx.set_triggering_name(name)
-            ctx.set_content(ctx.content[len(name) :].lstrip())
-            ctx.set_component(self)
-            # Only add our hooks if we're sure we'll be executing the command here.
+        return await self.execute_message_candidates(ctx, None, hooks=hooks)
+
+    async def execute_message_candidates(
+        self,
+        ctx: tanjun_abc.MessageContext,
+        candidates: typing.Optional[collections.Iterable[tuple[str, tanjun_abc.MessageCommand[typing.Any]]]],
+        /,
+        *,
+        hooks: typing.Optional[collections.Set[tanjun_abc.MessageHooks]] = None,
+    ) -> bool:
+        """Execute a message command from a set of pre-matched commands.
 
-            if self._message_hooks:
-                if hooks is None:
-                    hooks = set()
+        This is used by the standard client's message command routing index to
+        avoid re-matching the message's content against this component's commands.
+
+        Parameters
+        ----------
+        ctx : tanjun.abc.MessageContext
+            The context to execute a command for.
+        candidates : collections.abc.Iterable[tuple[str, tanjun.abc.MessageCommand[typing.Any]]] | None
+            Iterable of the matched names to the commands in this component
+            which they matched, in the order they should be tried.
 
-                hooks.add(self._message_hooks)
+            If this is `None` then the candidates will be found by matching
+            the context's content against this component's commands.
 
-            if self._hooks:
-                if hooks is None:
-                    hooks = set()
+        Other Parameters
+        ----------------
+        hooks : collections.abc.Set[tanjun.abc.MessageHooks] | None
+            Set of hooks to include in this command execution.
 
-                hooks.add(self._hooks)
+        Returns
+        -------
+        bool
+            Whether a command was executed.
+        """
+        async for name, command in self._check_message_context(ctx, candidates):
+            ctx.set_triggering_name(name)
+            ctx.set_content(ctx.content[len(name) :].lstrip())
+            ctx.set_component(self)
+            # Only add our hooks if we're sure we'll be executing the command here.
+            if self._message_hook_chain:
+                hooks = self._message_hook_chain.union(hooks) if hooks else self._message_hook_chain
 
             await command.execute(ctx, hooks=hooks)
             return True
@@ -1154,4 +1337,6 @@ class Component(tanjun_abc.Component):
         tanjun.abc.ClientLoader
             The loader for this component.
         """
-        return _ComponentManager(self, copy)
+        loader = _ComponentManager(self, copy)
+        _register_loader(loader, (frame := inspect.currentframe()) and frame.f_back)
+        return loader
@@ -36,18 +36,19 @@ __all__: list[str] = ["MessageContext", "ResponseTypeT", "SlashContext", "SlashO
 
 import asyncio
 import datetime
+import functools
 import logging
 import typing
+from collections import abc as collections
 
 import hikari
 from hikari import snowflakes
 
 from . import abc as tanjun_abc
 from . import injecting
+from .dependencies import deletion
 
 if typing.TYPE_CHECKING:
-    from collections import abc as collections
-
     from hikari import traits as hikari_traits
 
     _BaseContextT = typing.TypeVar("_BaseContextT", bound="BaseContext")
@@ -68,7 +69,7 @@ def _delete_after_to_float(delete_after: typing.Union[datetime.timedelta, float,
 class BaseContext(injecting.BasicInjectionContext, tanjun_abc.Context):
     """Base class for all standard context implementations."""
 
-    __slots__ = ("_client", "_component", "_final")
+    __slots__ = ("_client", "_component", "_entity_memo", "_final", "_response_lock")
 
     def __init__(
         self,
@@ -81,12 +82,10 @@ class BaseContext(injecting.BasicInjectionContext, tanjun_abc.Context):
         super().__init__(injection_client)
         self._client = client
         self._component = component
+        self._entity_memo: typing.Optional[dict[collections.Hashable, asyncio.Future[typing.Any]]] = None
         self._final = False
-        (
-            self._set_type_special_case(tanjun_abc.Context, self)
-            ._set_type_special_case(BaseContext, self)
-            ._set_type_special_case(type(self), self)
-        )
+        # This is only made when it's first needed as most contexts don't respond concurrently.
+        self._response_lock: typing.Optional[asyncio.Lock] = None
 
     @property
     def cache(self) -> typing.Optional[hikari.api.Cache]:
@@ -132,6 +131,12 @@ class BaseContext(injecting.BasicInjectionContext, tanjun_abc.Context):
         if self._final:
             raise TypeError("Cannot modify a finalised context")
 
+    def _get_response_lock(self) -> asyncio.Lock:
+        if self._response_lock is None:
+            self._response_lock = asyncio.Lock()
+
+        return self._response_lock
+
     def finalise(self: _BaseContextT) -> _BaseContextT:
         """Finalise the context, dis-allowing any further modifications.
 
@@ -151,7 +156,7 @@ class BaseContext(injecting.BasicInjectionContext, tanjun_abc.Context):
                 type(component), component
             )
 
-        elif component_case := self._special_case_types.get(tanjun_abc.Component):
+        elif self._special_case_types and (component_case := self._special_case_types.get(tanjun_abc.Component)):
             self._remove_type_special_case(tanjun_abc.Component)
             self._remove_type_special_case(type(component_case))
 
@@ -187,6 +192,43 @@ class BaseContext(injecting.BasicInjectionContext, tanjun_abc.Context):
 
         return None
 
+    async def memoise_fetch(
+        self, key: collections.Hashable, callback: collections.Callable[[], collections.Awaitable[_T]], /
+    ) -> _T:
+        # <<inherited docstring from tanjun.abc.Context>>.
+        if self._entity_memo is None:
+            self._entity_memo = {}
+
+        while (future := self._entity_memo.get(key)) is not None:
+            try:
+                # This is shielded so cancelling one waiter doesn't cancel the fetch for the others.
+                return await asyncio.shield(future)
+
+            except asyncio.CancelledError:
+                # If the call which was fetching this was cancelled then it has
+                # to be retried by one of the waiters.
+                if not future.cancelled():
+                    raise
+
+        future = self._entity_memo[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await callback()
+
+        except asyncio.CancelledError:
+            del self._entity_memo[key]
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            del self._entity_memo[key]
+            future.set_exception(exc)
+            # This marks the exception as retrieved so it isn't logged as unhandled if nothing's waiting on it.
+            future.exception()
+            raise
+
+        future.set_result(result)
+        return result
+
 
 class MessageContext(BaseContext, tanjun_abc.MessageContext):
     """Standard implementation of a command context as used within Tanjun."""
@@ -196,7 +238,6 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
         "_content",
         "_initial_response_id",
         "_last_response_id",
-        "_response_lock",
         "_message",
         "_triggering_name",
         "_triggering_prefix",
@@ -222,11 +263,9 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
         self._content = content
         self._initial_response_id: typing.Optional[hikari.Snowflake] = None
         self._last_response_id: typing.Optional[hikari.Snowflake] = None
-        self._response_lock = asyncio.Lock()
         self._message = message
         self._triggering_name = triggering_name
         self._triggering_prefix = triggering_prefix
-        self._set_type_special_case(tanjun_abc.MessageContext, self)._set_type_special_case(MessageContext, self)
 
     def __repr__(self) -> str:
         return f"MessageContext <{self._message!r}, {self._command!r}>"
@@ -318,7 +357,7 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
                 ._set_type_special_case(type(command), command)
             )
 
-        elif command_case := self._special_case_types.get(tanjun_abc.ExecutableCommand):
+        elif self._special_case_types and (command_case := self._special_case_types.get(tanjun_abc.ExecutableCommand)):
             self._remove_type_special_case(tanjun_abc.ExecutableCommand)
             self._remove_type_special_case(tanjun_abc.MessageCommand)  # TODO: command group?
             self._remove_type_special_case(type(command_case))
@@ -409,7 +448,7 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
             role_mentions=role_mentions,
         )
         if delete_after is not None:
-            asyncio.create_task(self._delete_after(delete_after, message))
+            self._schedule_delete(delete_after, message)
 
         return message
 
@@ -455,7 +494,7 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
         )
 
         if delete_after is not None:
-            asyncio.create_task(self._delete_after(delete_after, message))
+            self._schedule_delete(delete_after, message)
 
         return message
 
@@ -473,6 +512,13 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
 
         raise LookupError("No responses found for this context")
 
+    def _schedule_delete(self, delete_after: float, message: hikari.Message, /) -> None:
+        if scheduler := self.get_type_dependency(deletion.AbstractDeletionScheduler):
+            scheduler.schedule_message(message, delete_after, guild_id=self.guild_id)
+
+        else:
+            asyncio.create_task(self._delete_after(delete_after, message))
+
     @staticmethod
     async def _delete_after(delete_after: float, message: hikari.Message) -> None:
         await asyncio.sleep(delete_after)
@@ -507,7 +553,7 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
     ) -> hikari.Message:
         # <<inherited docstring from tanjun.abc.Context>>.
         delete_after = _delete_after_to_float(delete_after) if delete_after is not None else None
-        async with self._response_lock:
+        async with self._get_response_lock():
             message = await self._message.respond(
                 content=content,
                 attachment=attachment,
@@ -529,7 +575,7 @@ class MessageContext(BaseContext, tanjun_abc.MessageContext):
                 self._initial_response_id = message.id
 
             if delete_after is not None:
-                asyncio.create_task(self._delete_after(delete_after, message))
+                self._schedule_delete(delete_after, message)
 
             return message
 
@@ -734,10 +780,34 @@ _COMMAND_OPTION_TYPES: typing.Final[frozenset[hikari.OptionType]] = frozenset(
 )
 
 
+class _SlashOptions(collections.Mapping[str, SlashOption]):
+    __slots__ = ("_interaction", "_options", "_wrapped")
+
+    def __init__(
+        self, interaction: hikari.CommandInteraction, options: collections.Sequence[hikari.CommandInteractionOption], /
+    ) -> None:
+        self._interaction = interaction
+        self._options = {option.name: option for option in options}
+        self._wrapped: dict[str, SlashOption] = {}
+
+    def __getitem__(self, name: str, /) -> SlashOption:
+        if (option := self._wrapped.get(name)) is None:
+            option = self._wrapped[name] = SlashOption(self._interaction, self._options[name])
+
+        return option
+
+    def __iter__(self) -> collections.Iterator[str]:
+        return iter(self._options)
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+
 class SlashContext(BaseContext, tanjun_abc.SlashContext):
     __slots__ = (
         "_command",
         "_defaults_to_ephemeral",
+        "_defer_handle",
         "_defer_task",
         "_has_been_deferred",
         "_has_responded",
@@ -747,7 +817,6 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         "_on_not_found",
         "_options",
         "_response_future",
-        "_response_lock",
     )
 
     def __init__(
@@ -764,6 +833,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         super().__init__(client, injection_client, component=component)
         self._command = command
         self._defaults_to_ephemeral = default_to_ephemeral
+        self._defer_handle: typing.Optional[asyncio.TimerHandle] = None
         self._defer_task: typing.Optional[asyncio.Task[None]] = None
         self._has_been_deferred = False
         self._has_responded = False
@@ -772,18 +842,8 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         self._marked_not_found = False
         self._on_not_found = on_not_found
         self._response_future: typing.Optional[asyncio.Future[ResponseTypeT]] = None
-        self._response_lock = asyncio.Lock()
-        self._set_type_special_case(tanjun_abc.SlashContext, self)._set_type_special_case(SlashContext, self)
-
-        options = interaction.options
-        while options and (first_option := options[0]).type in _COMMAND_OPTION_TYPES:
-            options = first_option.options
-
-        if options:
-            self._options = {option.name: SlashOption(interaction, option) for option in options}
-
-        else:
-            self._options = {}
+        # These are only wrapped when the options are first accessed.
+        self._options: typing.Optional[_SlashOptions] = None
 
     @property
     def author(self) -> hikari.User:
@@ -859,14 +919,28 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
     @property
     def options(self) -> collections.Mapping[str, tanjun_abc.SlashOption]:
         # <<inherited docstring from tanjun.abc.SlashContext>>.
-        return self._options.copy()
+        if self._options is None:
+            options = self._interaction.options
+            while options and (first_option := options[0]).type in _COMMAND_OPTION_TYPES:
+                options = first_option.options
+
+            self._options = _SlashOptions(self._interaction, options or ())
 
-    async def _auto_defer(self, countdown: typing.Union[int, float], /) -> None:
-        await asyncio.sleep(countdown)
+        return self._options
+
+    async def _auto_defer(self) -> None:
         await self.defer()
 
+    def _on_defer_timer(self) -> None:
+        self._defer_handle = None
+        self._defer_task = asyncio.create_task(self._auto_defer())
+
     def cancel_defer(self) -> None:
         """Cancel the auto-deferral if its active."""
+        if self._defer_handle:
+            self._defer_handle.cancel()
+            self._defer_handle = None
+
         if self._defer_task:
             self._defer_task.cancel()
 
@@ -917,10 +991,12 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
             This context to allow for chaining.
         """
         self._assert_not_final()
-        if self._defer_task:
+        if self._defer_handle or self._defer_task:
             raise RuntimeError("Defer timer already set")
 
-        self._defer_task = asyncio.create_task(self._auto_defer(count_down))
+        # This goes through the event loop's timer heap so a task only has to be
+        # made for the interactions which actually reach the count down.
+        self._defer_handle = asyncio.get_running_loop().call_later(count_down, self._on_defer_timer)
         return self
 
     def set_command(self: _SlashContextT, command: typing.Optional[tanjun_abc.BaseSlashCommand], /) -> _SlashContextT:
@@ -934,7 +1010,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
                 ._set_type_special_case(tanjun_abc.SlashCommand, command)
                 ._set_type_special_case(type(command), command)
             )
-        elif command_case := self._special_case_types.get(tanjun_abc.ExecutableCommand):
+        elif self._special_case_types and (command_case := self._special_case_types.get(tanjun_abc.ExecutableCommand)):
             self._remove_type_special_case(tanjun_abc.ExecutableCommand)
             self._remove_type_special_case(tanjun_abc.BaseSlashCommand)
             self._remove_type_special_case(tanjun_abc.SlashCommand)  # TODO: command group?
@@ -965,7 +1041,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         if not in_defer_task:
             self.cancel_defer()
 
-        async with self._response_lock:
+        async with self._get_response_lock():
             if self._has_been_deferred:
                 if in_defer_task:
                     return
@@ -991,6 +1067,13 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
 
         return delete_after
 
+    def _schedule_followup_delete(self, delete_after: float, message: hikari.Message, /) -> None:
+        if scheduler := self.get_type_dependency(deletion.AbstractDeletionScheduler):
+            scheduler.schedule_callback(functools.partial(self._interaction.delete_message, message), delete_after)
+
+        else:
+            asyncio.create_task(self._delete_followup_after(delete_after, message))
+
     async def _delete_followup_after(self, delete_after: float, message: hikari.Message) -> None:
         await asyncio.sleep(delete_after)
         try:
@@ -1043,7 +1126,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
             self._has_responded = True
 
         if delete_after is not None and not message.flags & hikari.MessageFlag.EPHEMERAL:
-            asyncio.create_task(self._delete_followup_after(delete_after, message))
+            self._schedule_followup_delete(delete_after, message)
 
         return message
 
@@ -1073,7 +1156,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         if ephemeral:
             flags = (flags or hikari.MessageFlag.NONE) | hikari.MessageFlag.EPHEMERAL
 
-        async with self._response_lock:
+        async with self._get_response_lock():
             return await self._create_followup(
                 content=content,
                 delete_after=delete_after,
@@ -1090,6 +1173,13 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
                 flags=flags,
             )
 
+    def _schedule_initial_response_delete(self, delete_after: float, /) -> None:
+        if scheduler := self.get_type_dependency(deletion.AbstractDeletionScheduler):
+            scheduler.schedule_callback(self.delete_initial_response, delete_after)
+
+        else:
+            asyncio.create_task(self._delete_initial_response_after(delete_after))
+
     async def _delete_initial_response_after(self, delete_after: float) -> None:
         await asyncio.sleep(delete_after)
         try:
@@ -1179,7 +1269,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
             self._response_future.set_result(result)
 
         if delete_after is not None and not flags & hikari.MessageFlag.EPHEMERAL:
-            asyncio.create_task(self._delete_initial_response_after(delete_after))
+            self._schedule_initial_response_delete(delete_after)
 
     async def create_initial_response(
         self,
@@ -1205,7 +1295,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         if ephemeral:
             flags = (flags or hikari.MessageFlag.NONE) | hikari.MessageFlag.EPHEMERAL
 
-        async with self._response_lock:
+        async with self._get_response_lock():
             await self._create_initial_response(
                 delete_after=delete_after,
                 content=content,
@@ -1279,7 +1369,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         self._has_responded = True
 
         if delete_after is not None and not message.flags & hikari.MessageFlag.EPHEMERAL:
-            asyncio.create_task(self._delete_initial_response_after(delete_after))
+            self._schedule_initial_response_delete(delete_after)
 
         return message
 
@@ -1321,7 +1411,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
                 role_mentions=role_mentions,
             )
             if delete_after is not None and not message.flags & hikari.MessageFlag.EPHEMERAL:
-                asyncio.create_task(self._delete_followup_after(delete_after, message))
+                self._schedule_followup_delete(delete_after, message)
 
             return message
 
@@ -1418,7 +1508,7 @@ class SlashContext(BaseContext, tanjun_abc.SlashContext):
         ] = hikari.UNDEFINED,
     ) -> typing.Optional[hikari.Message]:
         # <<inherited docstring from tanjun.abc.Context>>.
-        async with self._response_lock:
+        async with self._get_response_lock():
             if self._has_responded:
                 return await self._create_followup(
                     content,
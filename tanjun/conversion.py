@@ -73,6 +73,7 @@ __all__: list[str] = [
 
 import abc
 import datetime
+import functools
 import logging
 import operator
 import re
@@ -290,7 +291,9 @@ class ToChannel(BaseConverter[hikari.PartialChannel]):
                 pass
 
         try:
-            channel = await ctx.rest.fetch_channel(channel_id)
+            channel = await ctx.memoise_fetch(
+                (hikari.PartialChannel, channel_id), functools.partial(ctx.rest.fetch_channel, channel_id)
+            )
             if self._include_dms or isinstance(channel, hikari.GuildChannel):
                 return channel
 
@@ -429,7 +432,7 @@ class ToGuild(BaseConverter[hikari.Guild]):
                 pass
 
         try:
-            return await ctx.rest.fetch_guild(guild_id)
+            return await ctx.memoise_fetch((hikari.Guild, guild_id), functools.partial(ctx.rest.fetch_guild, guild_id))
 
         except hikari.NotFoundError:
             pass
@@ -627,7 +630,10 @@ class ToMember(BaseConverter[hikari.Member]):
                     pass
 
             try:
-                return await ctx.rest.fetch_member(ctx.guild_id, user_id)
+                return await ctx.memoise_fetch(
+                    (hikari.Member, ctx.guild_id, user_id),
+                    functools.partial(ctx.rest.fetch_member, ctx.guild_id, user_id),
+                )
 
             except hikari.NotFoundError:
                 pass
@@ -747,7 +753,10 @@ class ToRole(BaseConverter[hikari.Role]):
                 pass
 
         if ctx.guild_id:
-            for role in await ctx.rest.fetch_roles(ctx.guild_id):
+            roles = await ctx.memoise_fetch(
+                (hikari.Role, ctx.guild_id), functools.partial(ctx.rest.fetch_roles, ctx.guild_id)
+            )
+            for role in roles:
                 if role.id == role_id:
                     return role
 
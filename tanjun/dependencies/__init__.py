@@ -55,6 +55,15 @@ __all__: list[str] = [
     "cached_inject",
     "LazyConstant",
     "inject_lc",
+    # declarations.py
+    "declarations",
+    "AbstractDeclarationStore",
+    "DeclarationRecord",
+    "FileDeclarationStore",
+    # deletion.py
+    "deletion",
+    "AbstractDeletionScheduler",
+    "DeletionScheduler",
     # limiters.py
     "limiters",
     "AbstractConcurrencyLimiter",
@@ -67,6 +76,12 @@ __all__: list[str] = [
     "InMemoryCooldownManager",
     "with_concurrency_limit",
     "with_cooldown",
+    # metrics.py
+    "metrics",
+    "AbstractTimingCollector",
+    "DispatchStage",
+    "InMemoryTimingCollector",
+    "TimingHistogram",
     # owners.py
     "owners",
     "AbstractOwners",
@@ -90,6 +105,11 @@ from .callbacks import fetch_my_user
 from .data import LazyConstant
 from .data import cached_inject
 from .data import inject_lc
+from .declarations import AbstractDeclarationStore
+from .declarations import DeclarationRecord
+from .declarations import FileDeclarationStore
+from .deletion import AbstractDeletionScheduler
+from .deletion import DeletionScheduler
 from .limiters import AbstractConcurrencyLimiter
 from .limiters import AbstractCooldownManager
 from .limiters import BucketResource
@@ -100,6 +120,10 @@ from .limiters import InMemoryConcurrencyLimiter
 from .limiters import InMemoryCooldownManager
 from .limiters import with_concurrency_limit
 from .limiters import with_cooldown
+from .metrics import AbstractTimingCollector
+from .metrics import DispatchStage
+from .metrics import InMemoryTimingCollector
+from .metrics import TimingHistogram
 from .owners import AbstractOwners
 from .owners import Owners
 
@@ -112,6 +136,8 @@ def set_standard_dependencies(client: injecting.InjectorClient, /) -> None:
     client: tanjun.injecting.InjectorClient
         The injector client to set the standard dependencies on.
     """
-    client.set_type_dependency(AbstractOwners, Owners()).set_type_dependency(
-        LazyConstant[hikari.OwnUser], LazyConstant[hikari.OwnUser](fetch_my_user)
+    (
+        client.set_type_dependency(AbstractOwners, Owners())
+        .set_type_dependency(LazyConstant[hikari.OwnUser], LazyConstant[hikari.OwnUser](fetch_my_user))
+        .set_type_dependency(AbstractDeletionScheduler, DeletionScheduler())
     )
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Dependency used for persisting application command declarations between startups."""
+from __future__ import annotations
+
+__all__: list[str] = ["AbstractDeclarationStore", "DeclarationRecord", "FileDeclarationStore"]
+
+import abc
+import json
+import logging
+import pathlib
+import typing
+
+import hikari
+
+if typing.TYPE_CHECKING:
+    from collections import abc as collections
+
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.tanjun")
+
+
+class DeclarationRecord:
+    """Record of the application commands which were last declared for an application."""
+
+    __slots__ = ("_commands", "_fingerprint")
+
+    def __init__(
+        self, fingerprint: str, commands: collections.Mapping[str, tuple[hikari.Snowflake, hikari.Snowflake]], /
+    ) -> None:
+        """Initialise a declaration record.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Hash of the command builders which were declared.
+        commands : collections.abc.Mapping[str, tuple[hikari.snowflakes.Snowflake, hikari.snowflakes.Snowflake]]
+            Mapping of the declared commands' names to their IDs and versions.
+        """
+        self._commands = dict(commands)
+        self._fingerprint = fingerprint
+
+    @property
+    def commands(self) -> collections.Mapping[str, tuple[hikari.Snowflake, hikari.Snowflake]]:
+        """Mapping of the declared commands' names to their IDs and versions."""
+        return self._commands.copy()
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the command builders which were declared."""
+        return self._fingerprint
+
+
+class AbstractDeclarationStore(abc.ABC):
+    """Interface used to persist application command declarations between startups.
+
+    This can be set on the standard client with
+    `tanjun.Client.set_declaration_store` to let it skip declaring commands
+    which haven't changed since they were last declared.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def get_record(
+        self, application_id: hikari.Snowflake, guild_id: typing.Optional[hikari.Snowflake], /
+    ) -> typing.Optional[DeclarationRecord]:
+        """Get the record of the commands which were last declared.
+
+        Parameters
+        ----------
+        application_id : hikari.snowflakes.Snowflake
+            ID of the application the commands were declared for.
+        guild_id : hikari.snowflakes.Snowflake | None
+            ID of the guild the commands were declared in.
+
+            This will be `None` for global commands.
+
+        Returns
+        -------
+        DeclarationRecord | None
+            The found record or `None` if no record was found.
+        """
+
+    @abc.abstractmethod
+    async def set_record(
+        self,
+        application_id: hikari.Snowflake,
+        guild_id: typing.Optional[hikari.Snowflake],
+        record: DeclarationRecord,
+        /,
+    ) -> None:
+        """Set the record of the commands which were last declared.
+
+        Parameters
+        ----------
+        application_id : hikari.snowflakes.Snowflake
+            ID of the application the commands were declared for.
+        guild_id : hikari.snowflakes.Snowflake | None
+            ID of the guild the commands were declared in.
+
+            This will be `None` for global commands.
+        record : DeclarationRecord
+            The record to set.
+        """
+
+    async def set_records(
+        self,
+        records: collections.Iterable[tuple[hikari.Snowflake, typing.Optional[hikari.Snowflake], DeclarationRecord]],
+        /,
+    ) -> None:
+        """Set multiple records at once.
+
+        This is used when declaring commands across multiple guilds and by
+        default just calls `AbstractDeclarationStore.set_record` for each
+        record; implementations may override it to persist them together.
+
+        Parameters
+        ----------
+        records : collections.abc.Iterable[tuple[hikari.snowflakes.Snowflake, hikari.snowflakes.Snowflake | None, DeclarationRecord]]
+            Iterable of application IDs, guild IDs (`None` for global commands)
+            and the records to set for them.
+        """  # noqa: E501 - line too long
+        for application_id, guild_id, record in records:
+            await self.set_record(application_id, guild_id, record)
+
+
+def _make_key(application_id: hikari.Snowflake, guild_id: typing.Optional[hikari.Snowflake], /) -> str:
+    return f"{int(application_id)}:{int(guild_id) if guild_id is not None else 'global'}"
+
+
+class FileDeclarationStore(AbstractDeclarationStore):
+    """File-backed standard implementation of `AbstractDeclarationStore`.
+
+    The records are stored in a JSON file which is read the first time a
+    record is requested and atomically rewritten whenever records are set.
+
+    .. note::
+        As this is only used while declaring commands (usually at startup) and
+        the file is small, the file is read and written synchronously.
+    """
+
+    __slots__ = ("_path", "_records")
+
+    def __init__(self, path: typing.Union[str, pathlib.Path], /) -> None:
+        """Initialise a file-backed declaration store.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            Path of the JSON file to store the records in.
+
+            This will be created if it doesn't exist yet.
+        """
+        self._path = pathlib.Path(path)
+        self._records: typing.Optional[dict[str, DeclarationRecord]] = None
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Path of the JSON file the records are stored in."""
+        return self._path
+
+    def _load(self) -> dict[str, DeclarationRecord]:
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+        try:
+            with self._path.open() as file:
+                data = json.load(file)
+
+            for key, value in data["records"].items():
+                commands = {
+                    name: (hikari.Snowflake(command_id), hikari.Snowflake(version))
+                    for name, (command_id, version) in value["commands"].items()
+                }
+                self._records[key] = DeclarationRecord(value["fingerprint"], commands)
+
+        except FileNotFoundError:
+            pass
+
+        except (KeyError, TypeError, ValueError) as exc:
+            # A corrupt file just means every command set gets declared again.
+            _LOGGER.warning("Ignoring invalid command declaration store %s", self._path, exc_info=exc)
+            self._records = {}
+
+        return self._records
+
+    def _save(self) -> None:
+        data = {
+            "records": {
+                key: {
+                    "fingerprint": record.fingerprint,
+                    "commands": {
+                        name: [str(command_id), str(version)] for name, (command_id, version) in record.commands.items()
+                    },
+                }
+                for key, record in self._load().items()
+            }
+        }
+        # Writing to a temporary file first avoids leaving a half-written file behind.
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        with temp_path.open("w") as file:
+            json.dump(data, file, indent=2)
+
+        temp_path.replace(self._path)
+
+    def clear(self) -> None:
+        """Clear the stored records.
+
+        This will force every command set to be declared again the next time
+        they're declared.
+        """
+        self._records = {}
+        self._save()
+
+    async def get_record(
+        self, application_id: hikari.Snowflake, guild_id: typing.Optional[hikari.Snowflake], /
+    ) -> typing.Optional[DeclarationRecord]:
+        # <<inherited docstring from AbstractDeclarationStore>>.
+        return self._load().get(_make_key(application_id, guild_id))
+
+    async def set_record(
+        self,
+        application_id: hikari.Snowflake,
+        guild_id: typing.Optional[hikari.Snowflake],
+        record: DeclarationRecord,
+        /,
+    ) -> None:
+        # <<inherited docstring from AbstractDeclarationStore>>.
+        self._load()[_make_key(application_id, guild_id)] = record
+        self._save()
+
+    async def set_records(
+        self,
+        records: collections.Iterable[tuple[hikari.Snowflake, typing.Optional[hikari.Snowflake], DeclarationRecord]],
+        /,
+    ) -> None:
+        # <<inherited docstring from AbstractDeclarationStore>>.
+        stored = self._load()
+        stored.update((_make_key(application_id, guild_id), record) for application_id, guild_id, record in records)
+        self._save()
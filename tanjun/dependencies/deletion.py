@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Dependency used for deleting command responses after a delay."""
+from __future__ import annotations
+
+__all__: list[str] = ["AbstractDeletionScheduler", "DeletionScheduler"]
+
+import abc
+import asyncio
+import datetime
+import heapq
+import itertools
+import logging
+import typing
+
+import hikari
+
+if typing.TYPE_CHECKING:
+    from collections import abc as collections
+
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.tanjun")
+# Discord won't bulk delete messages which are older than 14 days.
+_MAX_BULK_AGE: typing.Final[datetime.timedelta] = datetime.timedelta(days=14, minutes=-5)
+
+
+class AbstractDeletionScheduler(abc.ABC):
+    """Interface used by the standard contexts to delete responses after a delay.
+
+    This is used for the `delete_after` argument of the standard contexts'
+    response methods when it's registered as a type dependency.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def schedule_message(
+        self,
+        message: hikari.PartialMessage,
+        delete_after: float,
+        /,
+        *,
+        guild_id: typing.Optional[hikari.Snowflakeish] = None,
+    ) -> None:
+        """Schedule a message to be deleted.
+
+        Parameters
+        ----------
+        message : hikari.PartialMessage
+            The message to delete.
+        delete_after : float
+            How long in seconds to wait before deleting the message.
+
+        Other Parameters
+        ----------------
+        guild_id : typing.Optional[hikari.Snowflakeish]
+            ID of the guild the message is in.
+
+            This should be passed for messages returned by REST requests
+            as they never have `guild_id` set.
+
+            Defaults to the message's `guild_id`.
+        """
+
+    @abc.abstractmethod
+    def schedule_callback(
+        self, callback: collections.Callable[[], collections.Awaitable[typing.Any]], delete_after: float, /
+    ) -> None:
+        """Schedule a callback which deletes a message to be called.
+
+        This is used for messages which have to be deleted through something
+        other than the channel (e.g. interaction responses).
+
+        Parameters
+        ----------
+        callback : collections.abc.Callable[[], collections.abc.Awaitable[typing.Any]]
+            The callback which deletes the message.
+
+            `hikari.NotFoundError`s raised by this will be ignored.
+        delete_after : float
+            How long in seconds to wait before calling the callback.
+        """
+
+
+async def _delete_message(message: hikari.PartialMessage, /) -> None:
+    try:
+        await message.delete()
+
+    except hikari.NotFoundError as exc:
+        _LOGGER.debug("Failed to delete response message %s", message.id, exc_info=exc)
+
+
+async def _call_delete(callback: collections.Callable[[], collections.Awaitable[typing.Any]], /) -> None:
+    try:
+        await callback()
+
+    except hikari.NotFoundError as exc:
+        _LOGGER.debug("Failed to delete response message", exc_info=exc)
+
+
+# Messages are stored alongside the ID of the guild they're in since REST messages never have guild_id set.
+_Deletion = typing.Union[
+    "tuple[hikari.PartialMessage, typing.Optional[hikari.Snowflake]]",
+    "collections.Callable[[], collections.Awaitable[typing.Any]]",
+]
+
+
+class DeletionScheduler(AbstractDeletionScheduler):
+    """Standard implementation of `AbstractDeletionScheduler`.
+
+    This keeps the scheduled deletions in a single heap which is driven by one
+    event loop timer and deletes the messages which are due in the same
+    channel together with bulk deletion (falling back to deleting them one by
+    one when bulk deletion isn't possible).
+    """
+
+    __slots__ = ("_coalesce_window", "_counter", "_handle", "_heap", "_no_bulk_guilds", "_tasks")
+
+    def __init__(self, *, coalesce_window: float = 0.5) -> None:
+        """Initialise a deletion scheduler.
+
+        Other Parameters
+        ----------------
+        coalesce_window : float
+            How many seconds early a deletion may be carried out so it can be
+            bulk deleted alongside other messages in the same channel.
+
+            Defaults to 0.5.
+
+        Raises
+        ------
+        ValueError
+            If `coalesce_window` is negative.
+        """
+        if coalesce_window < 0:
+            raise ValueError("coalesce_window must be greater than or equal to 0")
+
+        self._coalesce_window = coalesce_window
+        self._counter = itertools.count()
+        self._handle: typing.Optional[asyncio.TimerHandle] = None
+        # The counter is a tie breaker which keeps deletions in the order they were scheduled.
+        self._heap: list[tuple[float, int, _Deletion]] = []
+        # Bulk deletion needs MANAGE_MESSAGES (even for the bot's own messages) so
+        # it's not tried again in guilds where the bot's been found to lack this.
+        self._no_bulk_guilds: set[hikari.Snowflake] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule_message(
+        self,
+        message: hikari.PartialMessage,
+        delete_after: float,
+        /,
+        *,
+        guild_id: typing.Optional[hikari.Snowflakeish] = None,
+    ) -> None:
+        # <<inherited docstring from AbstractDeletionScheduler>>.
+        guild_id = hikari.Snowflake(guild_id) if guild_id is not None else message.guild_id
+        self._schedule((message, guild_id), delete_after)
+
+    def schedule_callback(
+        self, callback: collections.Callable[[], collections.Awaitable[typing.Any]], delete_after: float, /
+    ) -> None:
+        # <<inherited docstring from AbstractDeletionScheduler>>.
+        self._schedule(callback, delete_after)
+
+    def _schedule(self, deletion: _Deletion, delete_after: float, /) -> None:
+        loop = asyncio.get_running_loop()
+        heapq.heappush(self._heap, (loop.time() + delete_after, next(self._counter), deletion))
+        self._start_timer(loop)
+
+    def _start_timer(self, loop: asyncio.AbstractEventLoop, /) -> None:
+        if not self._heap:
+            return
+
+        when = self._heap[0][0]
+        if self._handle:
+            if self._handle.when() <= when:
+                return
+
+            self._handle.cancel()
+
+        self._handle = loop.call_at(when, self._on_timer, when)
+
+    def _on_timer(self, when: float, /) -> None:
+        self._handle = None
+        loop = asyncio.get_running_loop()
+        # The loop may call this slightly before `when` (within its clock resolution)
+        # and deletions which are due soon after are brought forward to be deleted
+        # alongside the ones which are due now.
+        until = max(loop.time(), when) + self._coalesce_window
+        callbacks: list[collections.Callable[[], collections.Awaitable[typing.Any]]] = []
+        messages: dict[hikari.Snowflake, list[tuple[hikari.PartialMessage, typing.Optional[hikari.Snowflake]]]] = {}
+        while self._heap and self._heap[0][0] <= until:
+            deletion = heapq.heappop(self._heap)[2]
+            if isinstance(deletion, tuple):
+                messages.setdefault(deletion[0].channel_id, []).append(deletion)
+
+            else:
+                callbacks.append(deletion)
+
+        # The event loop only keeps weak references to tasks.
+        task = loop.create_task(self._delete(messages, callbacks))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._start_timer(loop)
+
+    async def _delete(
+        self,
+        messages: collections.Mapping[
+            hikari.Snowflake, list[tuple[hikari.PartialMessage, typing.Optional[hikari.Snowflake]]]
+        ],
+        callbacks: collections.Sequence[collections.Callable[[], collections.Awaitable[typing.Any]]],
+        /,
+    ) -> None:
+        results = await asyncio.gather(
+            *map(self._delete_channel_messages, messages.values()),
+            *map(_call_delete, callbacks),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to delete response messages", exc_info=result)
+
+    async def _delete_channel_messages(
+        self, messages: list[tuple[hikari.PartialMessage, typing.Optional[hikari.Snowflake]]], /
+    ) -> None:
+        # Bulk deletion doesn't work in DMs or for messages older than 14 days.
+        bulk_after = datetime.datetime.now(tz=datetime.timezone.utc) - _MAX_BULK_AGE
+        bulk: list[hikari.PartialMessage] = []
+        bulk_guild_id: typing.Optional[hikari.Snowflake] = None
+        singular: list[hikari.PartialMessage] = []
+        for message, guild_id in messages:
+            if guild_id is not None and guild_id not in self._no_bulk_guilds and message.created_at > bulk_after:
+                bulk.append(message)
+                bulk_guild_id = guild_id
+
+            else:
+                singular.append(message)
+
+        if len(bulk) < 2:
+            singular.extend(bulk)
+
+        else:
+            try:
+                await bulk[0].app.rest.delete_messages(bulk[0].channel_id, bulk)
+
+            except hikari.BulkDeleteError as exc:
+                _LOGGER.debug("Failed to bulk delete response messages", exc_info=exc)
+                if bulk_guild_id is not None and isinstance(exc.__cause__, hikari.ForbiddenError):
+                    self._no_bulk_guilds.add(bulk_guild_id)
+
+                skipped = set(map(int, exc.messages_skipped))
+                singular.extend(message for message in bulk if message.id in skipped)
+
+        await asyncio.gather(*map(_delete_message, singular))
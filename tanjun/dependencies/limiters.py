@@ -49,6 +49,7 @@ import abc
 import asyncio
 import datetime
 import enum
+import functools
 import logging
 import time
 import typing
@@ -204,6 +205,16 @@ async def _try_get_role(
         pass
 
 
+async def _fetch_channel(ctx: tanjun_abc.Context, channel_id: hikari.Snowflake, /) -> hikari.PartialChannel:
+    # TODO: upgrade this to the standard interface
+    assert isinstance(ctx, injecting.AbstractInjectionContext)
+    channel_cache = ctx.get_type_dependency(async_cache.SfCache[hikari.GuildChannel])
+    if channel_cache and (channel := await channel_cache.get(channel_id, default=None)):
+        return channel
+
+    return await ctx.rest.fetch_channel(channel_id)
+
+
 async def _get_ctx_target(ctx: tanjun_abc.Context, type_: BucketResource, /) -> hikari.Snowflake:
     if type_ is BucketResource.USER:
         return ctx.author.id
@@ -218,14 +229,10 @@ async def _get_ctx_target(ctx: tanjun_abc.Context, type_: BucketResource, /) ->
         if cached_channel := ctx.get_channel():
             return cached_channel.parent_id or ctx.guild_id
 
-        # TODO: upgrade this to the standard interface
-        assert isinstance(ctx, injecting.AbstractInjectionContext)
-        channel_cache = ctx.get_type_dependency(async_cache.SfCache[hikari.GuildChannel])
-        if channel_cache and (channel_ := await channel_cache.get(ctx.channel_id, default=None)):
-            return channel_.parent_id or ctx.guild_id
-
-        channel = await ctx.fetch_channel()
-        assert isinstance(channel, hikari.TextableGuildChannel)
+        channel = await ctx.memoise_fetch(
+            (hikari.PartialChannel, ctx.channel_id), functools.partial(_fetch_channel, ctx, ctx.channel_id)
+        )
+        assert isinstance(channel, hikari.GuildChannel)
         return channel.parent_id or ctx.guild_id
 
     # if type_ is BucketResource.CATEGORY:
@@ -263,7 +270,11 @@ async def _get_ctx_target(ctx: tanjun_abc.Context, type_: BucketResource, /) ->
                 pass
 
         if try_rest:
-            roles = await ctx.member.fetch_roles()
+            guild_roles = await ctx.memoise_fetch(
+                (hikari.Role, ctx.guild_id), functools.partial(ctx.rest.fetch_roles, ctx.guild_id)
+            )
+            role_ids = set(ctx.member.role_ids)
+            roles = [role for role in guild_roles if role.id in role_ids]
 
         return next(iter(sorted(roles, key=lambda r: r.position, reverse=True))).id
 
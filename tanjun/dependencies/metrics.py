@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Dependency used for collecting per-stage command dispatch timings."""
+from __future__ import annotations
+
+__all__: list[str] = [
+    "AbstractTimingCollector",
+    "DispatchStage",
+    "InMemoryTimingCollector",
+    "TimingHistogram",
+    "get_active_collector",
+    "reset_active_collector",
+    "set_active_collector",
+    "timed",
+]
+
+import abc
+import bisect
+import contextvars
+import enum
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections import abc as collections
+
+
+_T = typing.TypeVar("_T")
+
+
+class DispatchStage(str, enum.Enum):
+    """The stages of command dispatch which timings are collected for."""
+
+    PREFIX_MATCH = "PREFIX_MATCH"
+    """Matching a message's content against the client's prefixes."""
+
+    ROUTING = "ROUTING"
+    """Finding the commands which a message or interaction may be for."""
+
+    CLIENT_CHECKS = "CLIENT_CHECKS"
+    """Running the client's checks."""
+
+    COMPONENT_CHECKS = "COMPONENT_CHECKS"
+    """Running a component's checks.
+
+    These are recorded with the component's name.
+    """
+
+    COMMAND_CHECKS = "COMMAND_CHECKS"
+    """Running a command's checks.
+
+    These are recorded with the command's name.
+    """
+
+    PARSE = "PARSE"
+    """Parsing a message command's arguments with `tanjun.ShlexParser`."""
+
+    CONVERT = "CONVERT"
+    """Converting a single parsed value with `tanjun.parsing.Parameter.convert`.
+
+    These are recorded with the parameter's key.
+    """
+
+    PRE_EXECUTION = "PRE_EXECUTION"
+    """Running the pre-execution hooks for a command."""
+
+    CALLBACK = "CALLBACK"
+    """Running a command's callback.
+
+    These are recorded with the command's name.
+    """
+
+    POST_EXECUTION = "POST_EXECUTION"
+    """Running the post-execution hooks for a command."""
+
+
+class AbstractTimingCollector(abc.ABC):
+    """Interface used to collect per-stage command dispatch timings.
+
+    This can be set on the standard client with `tanjun.Client.set_timing_collector`.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def record(self, stage: DispatchStage, duration: float, /, *, name: typing.Optional[str] = None) -> None:
+        """Record how long a dispatch stage took.
+
+        .. note::
+            This is called while commands are being dispatched and therefore
+            shouldn't block.
+
+        Parameters
+        ----------
+        stage : DispatchStage
+            The stage which was timed.
+        duration : float
+            How long the stage took in seconds.
+
+        Other Parameters
+        ----------------
+        name : str | None
+            Name of the command, component or parameter the stage was for.
+
+            This will be `None` for stages which aren't specific to one of these.
+        """
+
+
+_DEFAULT_BOUNDS: typing.Final[tuple[float, ...]] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+
+class TimingHistogram:
+    """Histogram of the timings recorded for a dispatch stage."""
+
+    __slots__ = ("_bounds", "_counts", "_max", "_total")
+
+    def __init__(self, bounds: collections.Sequence[float], /) -> None:
+        self._bounds = bounds
+        # The last bucket is for values which are greater than every bound.
+        self._counts = [0] * (len(bounds) + 1)
+        self._max = 0.0
+        self._total = 0.0
+
+    @property
+    def bounds(self) -> collections.Sequence[float]:
+        """The inclusive upper bounds of the histogram's buckets in seconds."""
+        return self._bounds
+
+    @property
+    def counts(self) -> collections.Sequence[int]:
+        """How many timings fell in each bucket.
+
+        This has an extra final bucket for timings greater than every bound.
+        """
+        return self._counts.copy()
+
+    @property
+    def count(self) -> int:
+        """How many timings were recorded."""
+        return sum(self._counts)
+
+    @property
+    def max(self) -> float:
+        """The longest recorded timing in seconds."""
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """The mean recorded timing in seconds."""
+        return self._total / count if (count := self.count) else 0.0
+
+    @property
+    def total(self) -> float:
+        """The sum of the recorded timings in seconds."""
+        return self._total
+
+    def add(self, duration: float, /) -> None:
+        """Add a timing to the histogram.
+
+        Parameters
+        ----------
+        duration : float
+            The timing to add in seconds.
+        """
+        self._counts[bisect.bisect_left(self._bounds, duration)] += 1
+        self._total += duration
+        if duration > self._max:
+            self._max = duration
+
+    def quantile(self, quantile: float, /) -> float:
+        """Estimate a quantile of the recorded timings.
+
+        Parameters
+        ----------
+        quantile : float
+            The quantile to estimate (between 0 and 1).
+
+        Returns
+        -------
+        float
+            The upper bound of the bucket the quantile falls in (in seconds).
+
+            This will be the longest recorded timing if the quantile falls
+            past the last bound and 0 if no timings were recorded.
+        """
+        target = quantile * self.count
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts):
+            seen += count
+            if count and seen >= target:
+                return bound
+
+        return self._max
+
+
+class InMemoryTimingCollector(AbstractTimingCollector):
+    """In-memory standard implementation of `AbstractTimingCollector` which keeps histograms of timings."""
+
+    __slots__ = ("_bounds", "_histograms")
+
+    def __init__(self, *, bounds: collections.Sequence[float] = _DEFAULT_BOUNDS) -> None:
+        """Initialise an in-memory timing collector.
+
+        Other Parameters
+        ----------------
+        bounds : collections.abc.Sequence[float]
+            The upper bounds (in seconds) of the histogram buckets to use.
+
+            Defaults to buckets between 100 microseconds and 5 seconds.
+        """
+        self._bounds = tuple(sorted(bounds))
+        self._histograms: dict[tuple[DispatchStage, typing.Optional[str]], TimingHistogram] = {}
+
+    @property
+    def histograms(self) -> collections.Mapping[tuple[DispatchStage, typing.Optional[str]], TimingHistogram]:
+        """Mapping of the recorded stages and names to their timing histograms."""
+        return self._histograms.copy()
+
+    def clear(self) -> None:
+        """Clear the recorded timings."""
+        self._histograms.clear()
+
+    def get_histogram(
+        self, stage: DispatchStage, /, *, name: typing.Optional[str] = None
+    ) -> typing.Optional[TimingHistogram]:
+        """Get the timing histogram for a stage.
+
+        Parameters
+        ----------
+        stage : DispatchStage
+            The stage to get the histogram for.
+
+        Other Parameters
+        ----------------
+        name : str | None
+            Name of the command, component or parameter to get the histogram for.
+
+        Returns
+        -------
+        TimingHistogram | None
+            The found histogram or `None` if no timings have been recorded for it.
+        """
+        return self._histograms.get((stage, name))
+
+    def record(self, stage: DispatchStage, duration: float, /, *, name: typing.Optional[str] = None) -> None:
+        # <<inherited docstring from AbstractTimingCollector>>.
+        try:
+            self._histograms[(stage, name)].add(duration)
+
+        except KeyError:
+            histogram = self._histograms[(stage, name)] = TimingHistogram(self._bounds)
+            histogram.add(duration)
+
+
+# Each event is dispatched in its own task (with tasks copying the current
+# context) so this is scoped to the command invocation it's set for.
+_active_collector: contextvars.ContextVar[typing.Optional[AbstractTimingCollector]] = contextvars.ContextVar(
+    "tanjun_timing_collector", default=None
+)
+
+
+def get_active_collector() -> typing.Optional[AbstractTimingCollector]:
+    """Get the timing collector for the command invocation being dispatched.
+
+    Returns
+    -------
+    AbstractTimingCollector | None
+        The active timing collector or `None` if timings aren't being collected.
+    """
+    return _active_collector.get()
+
+
+def set_active_collector(
+    collector: typing.Optional[AbstractTimingCollector], /
+) -> contextvars.Token[typing.Optional[AbstractTimingCollector]]:
+    """Set the timing collector for the command invocation being dispatched.
+
+    This is called by the standard client before it dispatches a command
+    invocation and is scoped to the current asyncio task (and any tasks it creates).
+
+    Parameters
+    ----------
+    collector : AbstractTimingCollector | None
+        The timing collector to set.
+
+    Returns
+    -------
+    contextvars.Token[AbstractTimingCollector | None]
+        Token which can be passed to `reset_active_collector` to restore the
+        previously active collector once the invocation's finished.
+    """
+    return _active_collector.set(collector)
+
+
+def reset_active_collector(token: contextvars.Token[typing.Optional[AbstractTimingCollector]], /) -> None:
+    """Restore the timing collector which was active before `set_active_collector` was called.
+
+    Parameters
+    ----------
+    token : contextvars.Token[AbstractTimingCollector | None]
+        The token returned by the `set_active_collector` call to undo.
+    """
+    _active_collector.reset(token)
+
+
+async def timed(
+    collector: AbstractTimingCollector,
+    stage: DispatchStage,
+    awaitable: collections.Awaitable[_T],
+    /,
+    *,
+    name: typing.Optional[str] = None,
+) -> _T:
+    """Await an awaitable while timing it as a dispatch stage.
+
+    Parameters
+    ----------
+    collector : AbstractTimingCollector
+        The collector to record the timing with.
+    stage : DispatchStage
+        The stage being timed.
+    awaitable : collections.abc.Awaitable[T]
+        The awaitable to time.
+
+    Other Parameters
+    ----------------
+    name : str | None
+        Name of the command, component or parameter the stage is for.
+
+    Returns
+    -------
+    T
+        The awaitable's result.
+    """
+    start = time.perf_counter()
+    try:
+        return await awaitable
+
+    finally:
+        collector.record(stage, time.perf_counter() - start, name=name)
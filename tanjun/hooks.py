@@ -45,10 +45,20 @@ from . import injecting
 
 if typing.TypeVar:
     _HooksT = typing.TypeVar("_HooksT", bound="Hooks[typing.Any]")
+    _T = typing.TypeVar("_T")
 
 CommandT = typing.TypeVar("CommandT", bound=abc.ExecutableCommand[typing.Any])
 
 
+async def _gather(awaitables: list[collections.Awaitable[_T]], /) -> list[_T]:
+    # asyncio.gather wraps each awaitable in a task, which is wasted work when
+    # there's only one (the most common case for hooks).
+    if len(awaitables) == 1:
+        return [await awaitables[0]]
+
+    return await asyncio.gather(*awaitables)
+
+
 class Hooks(abc.Hooks[abc.ContextT_contra]):
     """Standard implementation of `tanjun.abc.Hooks` used for command execution.
 
@@ -292,19 +302,19 @@ class Hooks(abc.Hooks[abc.ContextT_contra]):
         level = 0
         if isinstance(exception, errors.ParserError):
             if self._parser_error_callbacks:
-                await asyncio.gather(
-                    *(c.resolve_with_command_context(ctx, ctx, exception) for c in self._parser_error_callbacks)
+                await _gather(
+                    [c.resolve_with_command_context(ctx, ctx, exception) for c in self._parser_error_callbacks]
                 )
                 level = 100  # We don't want to re-raise a parser error if it was caught
 
         elif self._error_callbacks:
-            results = await asyncio.gather(
-                *(c.resolve_with_command_context(ctx, ctx, exception) for c in self._error_callbacks)
+            results = await _gather(
+                [c.resolve_with_command_context(ctx, ctx, exception) for c in self._error_callbacks]
             )
             level = results.count(True) - results.count(False)
 
         if hooks:
-            level += sum(await asyncio.gather(*(hook.trigger_error(ctx, exception) for hook in hooks)))
+            level += sum(await _gather([hook.trigger_error(ctx, exception) for hook in hooks]))
 
         return level
 
@@ -317,10 +327,10 @@ class Hooks(abc.Hooks[abc.ContextT_contra]):
     ) -> None:
         # <<inherited docstring from tanjun.abc.Hooks>>.
         if self._post_execution_callbacks:
-            await asyncio.gather(*(c.resolve_with_command_context(ctx, ctx) for c in self._post_execution_callbacks))
+            await _gather([c.resolve_with_command_context(ctx, ctx) for c in self._post_execution_callbacks])
 
         if hooks:
-            await asyncio.gather(*(hook.trigger_post_execution(ctx) for hook in hooks))
+            await _gather([hook.trigger_post_execution(ctx) for hook in hooks])
 
     async def trigger_pre_execution(
         self,
@@ -331,10 +341,10 @@ class Hooks(abc.Hooks[abc.ContextT_contra]):
     ) -> None:
         # <<inherited docstring from tanjun.abc.Hooks>>.
         if self._pre_execution_callbacks:
-            await asyncio.gather(*(c.resolve_with_command_context(ctx, ctx) for c in self._pre_execution_callbacks))
+            await _gather([c.resolve_with_command_context(ctx, ctx) for c in self._pre_execution_callbacks])
 
         if hooks:
-            await asyncio.gather(*(hook.trigger_pre_execution(ctx) for hook in hooks))
+            await _gather([hook.trigger_pre_execution(ctx) for hook in hooks])
 
     async def trigger_success(
         self,
@@ -345,10 +355,10 @@ class Hooks(abc.Hooks[abc.ContextT_contra]):
     ) -> None:
         # <<inherited docstring from tanjun.abc.Hooks>>.
         if self._success_callbacks:
-            await asyncio.gather(*(c.resolve_with_command_context(ctx, ctx) for c in self._success_callbacks))
+            await _gather([c.resolve_with_command_context(ctx, ctx) for c in self._success_callbacks])
 
         if hooks:
-            await asyncio.gather(*(hook.trigger_success(ctx) for hook in hooks))
+            await _gather([hook.trigger_success(ctx) for hook in hooks])
 
 
 AnyHooks = Hooks[abc.Context]
@@ -39,6 +39,7 @@ __all__: list[str] = [
     "BasicInjectionContext",
     "CallbackDescriptor",
     "CallbackSig",
+    "DependencyScope",
     "Undefined",
     "UNDEFINED",
     "UndefinedOr",
@@ -51,12 +52,21 @@ __all__: list[str] = [
 ]
 
 import abc
+import asyncio
 import collections.abc as collections
+import contextlib
 import copy
+import datetime
+import enum
+import functools
 import inspect
 import sys
+import time
 import types
 import typing
+import weakref
+
+import hikari
 
 from . import abc as tanjun_abc
 from . import errors
@@ -166,11 +176,53 @@ class AbstractInjectionContext(abc.ABC):
             The resolved type if found, else `Undefined`.
         """
 
+    async def _resolve_once(
+        self, _: CallbackSig[_T], resolve: collections.Callable[[], collections.Awaitable[_T]], /
+    ) -> _T:
+        # This is called to resolve a callback when dependencies are being
+        # resolved concurrently and should share any in-flight resolution
+        # of the callback within this context.
+        return await resolve()
+
+    async def _enter_context(self, callback: CallbackSig[typing.Any], manager: _ManagerT[_T], /) -> _T:
+        # This is called to acquire the value of a generator or context manager
+        # callback, with it being released by `release_dependencies`.
+        raise RuntimeError(f"{type(self).__name__} doesn't support dependencies which have to be released")
+
+    async def release_dependencies(self, exception: typing.Optional[BaseException] = None, /) -> None:
+        """Release the dependencies which were acquired within this context.
+
+        This releases the values of generator and context manager callback
+        dependencies (in the reverse order they were acquired in) and is
+        called by the standard commands once they've finished executing
+        (after the post-execution hooks have been called).
+
+        Parameters
+        ----------
+        exception : BaseException | None
+            The exception the command failed with, if applicable.
+
+            This is thrown into generator dependencies at their `yield` and
+            passed to context manager dependencies' `__exit__`/`__aexit__`
+            so they can roll back. Exceptions which are suppressed by the
+            dependencies are still raised by the command.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while releasing the dependencies.
+            The standard commands and client log these rather than letting
+            them replace the command's exception.
+        """
+
 
 class BasicInjectionContext(AbstractInjectionContext):
     """Basic implementation of a `AbstractInjectionContext`."""
 
-    __slots__ = ("_injection_client", "_result_cache", "_special_case_types")
+    __slots__ = ("_exit_stack", "_in_flight", "_injection_client", "_result_cache", "_special_case_types")
+
+    # Class-level table of the types which this context is injected for.
+    _self_types: typing.ClassVar[frozenset[type[typing.Any]]]
 
     def __init__(self, client: InjectorClient, /) -> None:
         """Initialise a basic injection context.
@@ -180,13 +232,21 @@ class BasicInjectionContext(AbstractInjectionContext):
         client : InjectorClient
             The injection client this context is bound to.
         """
+        # This is only made when a dependency which has to be released is resolved.
+        self._exit_stack: typing.Optional[contextlib.AsyncExitStack] = None
+        # This is only made when dependencies are resolved concurrently.
+        self._in_flight: typing.Optional[dict[CallbackSig[typing.Any], asyncio.Future[typing.Any]]] = None
         self._injection_client = client
         self._result_cache: typing.Optional[dict[CallbackSig[typing.Any], typing.Any]] = None
-        self._special_case_types: dict[type[typing.Any], typing.Any] = {
-            AbstractInjectionContext: self,
-            BasicInjectionContext: self,
-            type(self): self,
-        }
+        # This is only made when a context specific special case is set.
+        self._special_case_types: typing.Optional[dict[type[typing.Any], typing.Any]] = None
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Contexts are injected for the context types they inherit from (e.g. `tanjun.abc.Context`).
+        cls._self_types = frozenset(
+            type_ for type_ in cls.__mro__ if issubclass(type_, (AbstractInjectionContext, tanjun_abc.Context))
+        )
 
     @property
     def injection_client(self) -> InjectorClient:
@@ -206,20 +266,95 @@ class BasicInjectionContext(AbstractInjectionContext):
 
     def get_type_dependency(self, type_: type[_T], /) -> UndefinedOr[_T]:
         # <<inherited docstring from AbstractInjectionContext>>.
-        if (value := self._special_case_types.get(type_, UNDEFINED)) is not UNDEFINED:
+        if self._special_case_types and (value := self._special_case_types.get(type_, UNDEFINED)) is not UNDEFINED:
             return value
 
+        if type_ in self._self_types:
+            return typing.cast("_T", self)
+
         return self._injection_client.get_type_dependency(type_)
 
+    async def _resolve_once(
+        self, callback: CallbackSig[_T], resolve: collections.Callable[[], collections.Awaitable[_T]], /
+    ) -> _T:
+        # Concurrently resolved dependencies share any in-flight resolution of
+        # a callback so it's still only resolved once per context.
+        if self._in_flight is None:
+            self._in_flight = {}
+
+        if (future := self._in_flight.get(callback)) is not None:
+            return await asyncio.shield(future)
+
+        future = self._in_flight[callback] = asyncio.get_running_loop().create_future()
+        try:
+            result = await resolve()
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            future.set_exception(exc)
+            # This marks the exception as retrieved so it isn't logged as unhandled if nothing's waiting on it.
+            future.exception()
+            raise
+
+        else:
+            future.set_result(result)
+            return result
+
+        finally:
+            # Once resolved the result is found in the result cache.
+            del self._in_flight[callback]
+
+    async def _enter_context(self, callback: CallbackSig[typing.Any], manager: _ManagerT[_T], /) -> _T:
+        if self._exit_stack is None:
+            self._exit_stack = contextlib.AsyncExitStack()
+
+        if isinstance(manager, contextlib.AbstractAsyncContextManager):
+            result = await self._exit_stack.enter_async_context(manager)
+
+        else:
+            result = self._exit_stack.enter_context(manager)
+
+        # This ensures a released value won't be injected again if the callback
+        # is resolved after the dependencies have been released.
+        self._exit_stack.callback(self._uncache_result, callback)
+        return result
+
+    def _uncache_result(self, callback: CallbackSig[typing.Any], /) -> None:
+        if self._result_cache:
+            self._result_cache.pop(callback, None)
+
+    async def release_dependencies(self, exception: typing.Optional[BaseException] = None, /) -> None:
+        # <<inherited docstring from AbstractInjectionContext>>.
+        if self._exit_stack is not None:
+            exit_stack = self._exit_stack
+            self._exit_stack = None
+            if exception is None:
+                await exit_stack.aclose()
+
+            else:
+                await exit_stack.__aexit__(type(exception), exception, exception.__traceback__)
+
     def _set_type_special_case(self: _BasicInjectionContextT, type_: type[_T], value: _T, /) -> _BasicInjectionContextT:
+        if self._special_case_types is None:
+            self._special_case_types = {}
+
         self._special_case_types[type_] = value
         return self
 
     def _remove_type_special_case(self: _BasicInjectionContextT, type_: type[typing.Any], /) -> _BasicInjectionContextT:
+        if not self._special_case_types:
+            raise KeyError(type_)
+
         del self._special_case_types[type_]
         return self
 
 
+BasicInjectionContext._self_types = frozenset((AbstractInjectionContext, BasicInjectionContext))
+
+
 class AbstractDescriptor(abc.ABC, typing.Generic[_T]):
     """Abstract class for all injected argument descriptors."""
 
@@ -294,13 +429,157 @@ class AbstractDescriptor(abc.ABC, typing.Generic[_T]):
         """
 
 
+_ResolverSig = collections.Callable[[AbstractInjectionContext], collections.Awaitable[typing.Any]]
+_ManagerT = typing.Union[contextlib.AbstractAsyncContextManager[_T], contextlib.AbstractContextManager[_T]]
+
+
+def _get_manager_factory(
+    callback: CallbackSig[typing.Any], /
+) -> typing.Optional[collections.Callable[..., typing.Any]]:
+    """Get the context manager factory for a generator or context manager callback.
+
+    Returns
+    -------
+    collections.abc.Callable[..., typing.Any] | None
+        Callable which should be called in place of the callback to get the
+        context manager to acquire its value from, or `None` if the callback's
+        value doesn't have to be released.
+    """
+    if inspect.isasyncgenfunction(callback):
+        return contextlib.asynccontextmanager(callback)
+
+    if inspect.isgeneratorfunction(callback):
+        return contextlib.contextmanager(callback)
+
+    # This catches callbacks which were decorated with contextlib.(async)contextmanager.
+    wrapped = getattr(callback, "__wrapped__", None)
+    if inspect.isasyncgenfunction(wrapped) or inspect.isgeneratorfunction(wrapped):
+        return callback
+
+    return None
+
+
+class _CompiledCallback(typing.Generic[_T]):
+    """A callback descriptor's resolution logic specialised for a specific injector client.
+
+    This has any callback override already applied and its injected
+    parameters' resolvers precomputed.
+    """
+
+    __slots__ = ("_callback", "_concurrent", "_gathered", "_is_async", "_manager_factory", "_resolvers")
+
+    def __init__(
+        self,
+        callback: CallbackSig[_T],
+        resolvers: tuple[tuple[str, _ResolverSig], ...],
+        /,
+        *,
+        concurrent: bool = False,
+        gathered: tuple[tuple[str, _ResolverSig], ...] = (),
+    ) -> None:
+        self._callback = callback
+        self._concurrent = concurrent
+        self._gathered = gathered
+        self._is_async: typing.Optional[bool] = None
+        self._manager_factory = _get_manager_factory(callback)
+        self._resolvers = resolvers
+
+    async def resolve(self, ctx: AbstractInjectionContext, /, *args: typing.Any, **kwargs: typing.Any) -> _T:
+        if (result := ctx.get_cached_result(self._callback)) is not UNDEFINED:
+            assert not isinstance(result, Undefined)
+            return result
+
+        if self._concurrent:
+            return await ctx._resolve_once(self._callback, functools.partial(self._call, ctx, args, kwargs))
+
+        return await self._call(ctx, args, kwargs)
+
+    async def _call(
+        self, ctx: AbstractInjectionContext, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any], /
+    ) -> _T:
+        if self._resolvers or self._gathered:
+            sub_results = {name: await resolver(ctx) for name, resolver in self._resolvers}
+            if self._gathered:
+                results = await asyncio.gather(
+                    *(resolver(ctx) for _, resolver in self._gathered), return_exceptions=True
+                )
+                # Errors are raised in the order the parameters were declared in
+                # so the raised error doesn't depend on which finished first.
+                for (name, _), result in zip(self._gathered, results):
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    sub_results[name] = result
+
+            result = (self._manager_factory or self._callback)(*args, **sub_results, **kwargs)
+
+        else:
+            result = (self._manager_factory or self._callback)(*args, **kwargs)
+
+        if self._manager_factory and isinstance(
+            result, (contextlib.AbstractAsyncContextManager, contextlib.AbstractContextManager)
+        ):
+            result = await ctx._enter_context(self._callback, result)
+
+        else:
+            if self._is_async is None:
+                self._is_async = inspect.isawaitable(result)
+
+            if self._is_async:
+                assert inspect.isawaitable(result)
+                result = await result
+
+        # TODO: should we avoid caching the result if args/kwargs are passed?
+        ctx.cache_result(self._callback, result)
+        return typing.cast(_T, result)
+
+
+_ParsedDescriptors = tuple[dict[str, AbstractDescriptor[typing.Any]], bool]
+
+# Process-wide caches of the injected parameters parsed from callbacks so
+# each function's signature is only parsed once no matter how many
+# descriptors are made for it (e.g. by copying components). These are
+# weakly keyed by function so they don't keep unloaded modules alive.
+_DESCRIPTOR_CACHE: weakref.WeakKeyDictionary[types.FunctionType, _ParsedDescriptors] = weakref.WeakKeyDictionary()
+# Bound methods and callable instances are keyed by their underlying function
+# (with the first parameter being bound) and are cached separately from functions.
+_BOUND_DESCRIPTOR_CACHE: weakref.WeakKeyDictionary[types.FunctionType, _ParsedDescriptors] = weakref.WeakKeyDictionary()
+
+
+def _get_cache_key(
+    callback: CallbackSig[typing.Any], /
+) -> typing.Optional[tuple[weakref.WeakKeyDictionary[types.FunctionType, _ParsedDescriptors], types.FunctionType]]:
+    if isinstance(callback, types.FunctionType):
+        return _DESCRIPTOR_CACHE, callback
+
+    if isinstance(callback, types.MethodType):
+        if isinstance(callback.__func__, types.FunctionType):
+            return _BOUND_DESCRIPTOR_CACHE, callback.__func__
+
+        return None
+
+    # The signature of a callable instance can only differ from its class's
+    # __call__ method if it's been set on the instance, which slotted classes
+    # (e.g. the standard checks and converters) prevent.
+    call = getattr(type(callback), "__call__", None)
+    if (
+        isinstance(call, types.FunctionType)
+        and not hasattr(callback, "__dict__")
+        and not hasattr(callback, "__signature__")
+        and not hasattr(callback, "__wrapped__")
+    ):
+        return _BOUND_DESCRIPTOR_CACHE, call
+
+    return None
+
+
 class CallbackDescriptor(AbstractDescriptor[_T]):
     """Descriptor of a callback taking advantage of dependency injection.
 
     This holds metadata and logic necessary for callback injection.
     """
 
-    __slots__ = ("_callback", "_descriptors", "_is_async", "_needs_injector")
+    __slots__ = ("_callback", "_compiled", "_descriptors", "_needs_injector")
 
     def __init__(self, callback: CallbackSig[_T], /) -> None:
         """Initialise an injected callback descriptor.
@@ -317,7 +596,8 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
             positionally.
         """
         self._callback = callback
-        self._is_async: typing.Optional[bool] = None
+        # The client's compile token and this descriptor's resolution logic compiled for that client.
+        self._compiled: typing.Optional[tuple[object, _CompiledCallback[_T]]] = None
         self._descriptors, self._needs_injector = self._parse_descriptors(callback)
 
     # This is delegated to the callback to delegate set/list behaviour for this class to the callback.
@@ -339,7 +619,18 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
         return self._needs_injector
 
     @staticmethod
-    def _parse_descriptors(callback: CallbackSig[_T], /) -> tuple[dict[str, AbstractDescriptor[typing.Any]], bool]:
+    def _parse_descriptors(callback: CallbackSig[_T], /) -> _ParsedDescriptors:
+        if not (cache_key := _get_cache_key(callback)):
+            return CallbackDescriptor._parse_signature(callback)
+
+        cache, key = cache_key
+        if (result := cache.get(key)) is None:
+            result = cache[key] = CallbackDescriptor._parse_signature(callback)
+
+        return result
+
+    @staticmethod
+    def _parse_signature(callback: CallbackSig[_T], /) -> _ParsedDescriptors:
         try:
             parameters = inspect.signature(callback).parameters.items()
         except ValueError:  # If we can't inspect it then we have to assume this is a NO
@@ -361,7 +652,9 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
                 assert parameter.default.type is not None
                 descriptors[name] = TypeDescriptor(typing.cast("type[_T]", parameter.default.type))
 
-        return descriptors, any(d.needs_injector for d in descriptors.values())
+        # The values of generator and context manager callbacks can only be released by an injection context.
+        needs_injector = _get_manager_factory(callback) is not None
+        return descriptors, needs_injector or any(d.needs_injector for d in descriptors.values())
 
     def copy(self: _CallbackDescriptorT, *, _new: bool = True) -> _CallbackDescriptorT:
         """Create a copy of this descriptor.
@@ -373,6 +666,7 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
         """
         if not _new:
             self._callback = copy.copy(self._callback)
+            self._compiled = None
             return self
 
         return copy.copy(self).copy(_new=False)
@@ -392,9 +686,47 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
             positionally.
         """
         self._callback = callback
-        self._is_async = None
+        self._compiled = None
         self._descriptors, self._needs_injector = self._parse_descriptors(callback)
 
+    def _compile(self, client: InjectorClient, /) -> _CompiledCallback[_T]:
+        # Overrides replace the client's compile token, invalidating the compiled callbacks.
+        if self._compiled and self._compiled[0] is client._compile_token:
+            return self._compiled[1]
+
+        if override := client.get_callback_override(self._callback):
+            compiled = override._compile(client)
+
+        elif client._concurrent_resolution:
+            # Only callback dependencies are worth resolving concurrently as
+            # type dependencies are resolved without yielding to the event loop.
+            resolvers: list[tuple[str, _ResolverSig]] = []
+            gathered: list[tuple[str, _ResolverSig]] = []
+            for name, descriptor in self._descriptors.items():
+                if isinstance(descriptor, CallbackDescriptor):
+                    gathered.append((name, descriptor._compile(client).resolve))
+
+                else:
+                    resolvers.append((name, descriptor.resolve))
+
+            if len(gathered) < 2:
+                resolvers.extend(gathered)
+                gathered.clear()
+
+            compiled = _CompiledCallback(self._callback, tuple(resolvers), concurrent=True, gathered=tuple(gathered))
+
+        else:
+            resolvers_ = tuple(
+                (name, descriptor._compile(client).resolve)
+                if isinstance(descriptor, CallbackDescriptor)
+                else (name, descriptor.resolve)
+                for name, descriptor in self._descriptors.items()
+            )
+            compiled = _CompiledCallback(self._callback, resolvers_)
+
+        self._compiled = (client._compile_token, compiled)
+        return compiled
+
     def resolve_with_command_context(
         self, ctx: tanjun_abc.Context, /, *args: typing.Any, **kwargs: typing.Any
     ) -> collections.Coroutine[typing.Any, typing.Any, _T]:
@@ -455,7 +787,9 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
 
         return self.resolve(_EmptyContext(), *args, **kwargs)
 
-    async def resolve(self, ctx: AbstractInjectionContext, /, *args: typing.Any, **kwargs: typing.Any) -> _T:
+    def resolve(
+        self, ctx: AbstractInjectionContext, /, *args: typing.Any, **kwargs: typing.Any
+    ) -> collections.Coroutine[typing.Any, typing.Any, _T]:
         """Resolve the callback with the given dependency injection context.
 
         Parameters
@@ -478,26 +812,7 @@ class CallbackDescriptor(AbstractDescriptor[_T]):
             If the callback needs an injected type which isn't present in the
             context or client and doesn't have a set default.
         """
-        if override := ctx.injection_client.get_callback_override(self._callback):
-            return await override.resolve(ctx, *args, **kwargs)
-
-        if (result := ctx.get_cached_result(self._callback)) is not UNDEFINED:
-            assert not isinstance(result, Undefined)
-            return result
-
-        sub_results = {name: await descriptor.resolve(ctx) for name, descriptor in self._descriptors.items()}
-        result = self._callback(*args, **sub_results, **kwargs)
-
-        if self._is_async is None:
-            self._is_async = inspect.isawaitable(result)
-
-        if self._is_async:
-            assert inspect.isawaitable(result)
-            result = await result
-
-        # TODO: should we avoid caching the result if args/kwargs are passed?
-        ctx.cache_result(self._callback, result)
-        return typing.cast(_T, result)
+        return self._compile(ctx.injection_client).resolve(ctx, *args, **kwargs)
 
 
 class SelfInjectingCallback(CallbackDescriptor[_T]):
@@ -667,6 +982,9 @@ class TypeDescriptor(AbstractDescriptor[_T]):
             assert not isinstance(result, Undefined)
             return result
 
+        if scoped := ctx.injection_client._scoped_dependencies.get(self._type):
+            return await scoped.resolve(ctx)
+
         # We still want to allow for the possibility of a Union being
         # explicitly implemented so we check types within a union
         # after the literal type.
@@ -676,6 +994,9 @@ class TypeDescriptor(AbstractDescriptor[_T]):
                     assert not isinstance(result, Undefined)
                     return result
 
+                if scoped := ctx.injection_client._scoped_dependencies.get(cls):
+                    return await scoped.resolve(ctx)
+
         if self._default is not UNDEFINED:
             assert not isinstance(self._default, Undefined)
             return self._default
@@ -710,6 +1031,12 @@ class Injected(typing.Generic[_T]):
             If this callback has no type dependencies then this will still work
             without an injection context but this can be overridden using
             `InjectionClient.set_callback_override`.
+
+            This may also be a sync or async generator (or a function decorated
+            with `contextlib.contextmanager` or `contextlib.asynccontextmanager`),
+            in which case the value it yields will be acquired the first time it's
+            resolved within a context and released once the command has finished
+            executing (see `AbstractInjectionContext.release_dependencies`).
         type : type[_T] | None
             The type of the dependency to resolve.
 
@@ -770,6 +1097,12 @@ def inject(
         If this callback has no type dependencies then this will still work
         without an injection context but this can be overridden using
         `InjectionClient.set_callback_override`.
+
+        This may also be a sync or async generator (or a function decorated
+        with `contextlib.contextmanager` or `contextlib.asynccontextmanager`),
+        in which case the value it yields will be acquired the first time it's
+        resolved within a context and released once the command has finished
+        executing (see `AbstractInjectionContext.release_dependencies`).
     type : type[_T] | None
         The type of the dependency to resolve.
 
@@ -799,16 +1132,211 @@ def injected(
     return inject(callback=callback, type=type)
 
 
+class DependencyScope(str, enum.Enum):
+    """The scopes a dependency's value may be cached within.
+
+    These are used with `InjectorClient.set_scoped_dependency`.
+    """
+
+    SINGLETON = "SINGLETON"
+    """The value is shared between all contexts."""
+
+    CONTEXT = "CONTEXT"
+    """The value is only cached for the context it was resolved in."""
+
+    GUILD = "GUILD"
+    """The value is cached per guild.
+
+    Values resolved for contexts which aren't in a guild are only cached
+    for the context they were resolved in.
+    """
+
+    USER = "USER"
+    """The value is cached per the author of the context."""
+
+    CHANNEL = "CHANNEL"
+    """The value is cached per the channel of the context."""
+
+
+class _ScopedDependency(typing.Generic[_T]):
+    """Cache of a scoped dependency's resolved values."""
+
+    __slots__ = ("_callback", "_entries", "_expire_after", "_max_size", "_scope")
+
+    def __init__(
+        self,
+        callback: CallbackSig[_T],
+        /,
+        *,
+        expire_after: typing.Union[int, float, datetime.timedelta, None],
+        max_size: typing.Optional[int],
+        scope: DependencyScope,
+    ) -> None:
+        if isinstance(expire_after, datetime.timedelta):
+            expire_after = expire_after.total_seconds()
+
+        elif expire_after is not None:
+            expire_after = float(expire_after)
+
+        if expire_after is not None and expire_after <= 0:
+            raise ValueError("expire_after must be more than 0 seconds")
+
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self._callback = CallbackDescriptor(callback)
+        # This is kept in least to most recently used order and maps scope keys to the
+        # monotonic time they expire at and a future of the value (while it's being resolved).
+        self._entries: dict[typing.Optional[int], tuple[typing.Optional[float], asyncio.Future[_T]]] = {}
+        self._expire_after = expire_after
+        self._max_size = max_size
+        self._scope = scope
+
+    def _get_key(self, ctx: AbstractInjectionContext, /) -> UndefinedOr[typing.Optional[int]]:
+        if self._scope is DependencyScope.SINGLETON:
+            return None
+
+        if self._scope is DependencyScope.CONTEXT or not isinstance(ctx, tanjun_abc.Context):
+            return UNDEFINED
+
+        if self._scope is DependencyScope.GUILD:
+            return UNDEFINED if ctx.guild_id is None else ctx.guild_id
+
+        if self._scope is DependencyScope.USER:
+            return ctx.author.id
+
+        return ctx.channel_id
+
+    def invalidate(self, key: UndefinedOr[typing.Optional[int]] = UNDEFINED, /) -> None:
+        if key is UNDEFINED:
+            self._entries.clear()
+
+        else:
+            self._entries.pop(typing.cast("typing.Optional[int]", key), None)
+
+    async def resolve(self, ctx: AbstractInjectionContext, /) -> _T:
+        key = self._get_key(ctx)
+        if key is UNDEFINED:
+            # Callback descriptors already cache their result for the context they're resolved in.
+            return await self._callback.resolve(ctx)
+
+        assert not isinstance(key, Undefined)
+        while entry := self._entries.get(key):
+            expires_at, future = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                break
+
+            # Move the entry to the end to mark it as the most recently used.
+            del self._entries[key]
+            self._entries[key] = entry
+            try:
+                # This is shielded so cancelling one waiter doesn't cancel the resolution for the others.
+                return await asyncio.shield(future)
+
+            except asyncio.CancelledError:
+                # If the call which was resolving this was cancelled then it has
+                # to be retried by one of the waiters.
+                if not future.cancelled():
+                    raise
+
+        now = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        entry = self._entries[key] = (None if self._expire_after is None else now + self._expire_after, future)
+        self._evict(now)
+        try:
+            result = await self._callback.resolve(ctx)
+
+        except asyncio.CancelledError:
+            self._remove_entry(key, entry)
+            future.cancel()
+            raise
+
+        except BaseException as exc:
+            self._remove_entry(key, entry)
+            future.set_exception(exc)
+            # This marks the exception as retrieved so it isn't logged as unhandled if nothing's waiting on it.
+            future.exception()
+            raise
+
+        future.set_result(result)
+        return result
+
+    def _evict(self, now: float, /) -> None:
+        if self._max_size is not None:
+            while len(self._entries) > self._max_size:
+                del self._entries[next(iter(self._entries))]
+
+        # Expired entries are dropped from the least recently used end as new
+        # entries are added so they don't build up when max_size isn't set.
+        if self._expire_after is not None:
+            for key, (expires_at, _) in list(self._entries.items()):
+                assert expires_at is not None
+                if expires_at > now:
+                    break
+
+                del self._entries[key]
+
+    def _remove_entry(
+        self, key: typing.Optional[int], entry: tuple[typing.Optional[float], asyncio.Future[_T]], /
+    ) -> None:
+        # The entry may've already been evicted, invalidated or replaced.
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+
+
 class InjectorClient:
     """Dependency injection client used by Tanjun's standard implementation."""
 
-    __slots__ = ("_callback_overrides", "_type_dependencies")
+    __slots__ = (
+        "_callback_overrides",
+        "_compile_token",
+        "_concurrent_resolution",
+        "_scoped_dependencies",
+        "_type_dependencies",
+    )
 
     def __init__(self) -> None:
         """Initialise an injector client."""
         self._callback_overrides: dict[CallbackSig[typing.Any], CallbackDescriptor[typing.Any]] = {}
+        # Callback descriptors compile their resolution logic against this token.
+        self._compile_token = object()
+        self._concurrent_resolution = False
+        self._scoped_dependencies: dict[type[typing.Any], _ScopedDependency[typing.Any]] = {}
         self._type_dependencies: dict[type[typing.Any], typing.Any] = {InjectorClient: self}
 
+    def set_concurrent_resolution(self: _InjectorClientT, state: bool = True, /) -> _InjectorClientT:
+        """Set whether a callback's injected callback dependencies should be resolved concurrently.
+
+        When enabled, a callback which injects multiple callback dependencies
+        (e.g. multiple `tanjun.dependencies.cached_inject` resources) will
+        resolve them at the same time with `asyncio.gather` rather than one
+        after the other. Dependencies which are shared between these will still
+        only be resolved once per context.
+
+        If multiple dependencies fail to resolve then the error raised will be
+        the one from the first failed dependency's parameter.
+
+        .. note::
+            This is disabled by default as it changes the order callback
+            dependencies are called in.
+
+        Parameters
+        ----------
+        state : bool
+            Whether injected callback dependencies should be resolved concurrently.
+
+            Defaults to `True`.
+
+        Returns
+        -------
+        Self
+            The client instance to allow chaining.
+        """
+        self._concurrent_resolution = state
+        self._compile_token = object()
+        return self
+
     def set_type_dependency(self: _InjectorClientT, type_: type[_T], value: _T, /) -> _InjectorClientT:
         """Set a callback to be called to resolve a injected type.
 
@@ -867,6 +1395,149 @@ class InjectorClient:
         del self._type_dependencies[type_]
         return self
 
+    def set_scoped_dependency(
+        self: _InjectorClientT,
+        type_: type[_T],
+        callback: CallbackSig[_T],
+        /,
+        *,
+        expire_after: typing.Union[int, float, datetime.timedelta, None] = None,
+        max_size: typing.Optional[int] = None,
+        scope: DependencyScope = DependencyScope.SINGLETON,
+    ) -> _InjectorClientT:
+        """Set a callback to be called to resolve an injected type within a scope.
+
+        The callback's result will be cached within the scope it was resolved
+        for, with the scope's key being derived from the context being
+        injected (e.g. `tanjun.abc.Context.guild_id` for
+        `DependencyScope.GUILD`).
+
+        .. note::
+            Type dependencies set with `InjectorClient.set_type_dependency`
+            take priority over scoped dependencies.
+
+        Examples
+        --------
+        ```py
+        async def fetch_settings(
+            ctx: tanjun.abc.Context = tanjun.inject(type=tanjun.abc.Context),
+            db: Database = tanjun.inject(type=Database),
+        ) -> GuildSettings:
+            return await db.get_guild_settings(ctx.guild_id)
+
+        client.set_scoped_dependency(
+            GuildSettings, fetch_settings, scope=tanjun.injecting.DependencyScope.GUILD, max_size=1000, expire_after=300
+        )
+        ```
+
+        Parameters
+        ----------
+        type_: type[_T]
+            The type of the dependency to resolve.
+        callback: CallbackSig[_T]
+            The callback to use to resolve the dependency.
+
+            This supports dependency injection and may either be sync or asynchronous.
+
+        Other Parameters
+        ----------------
+        expire_after : int | float | datetime.timedelta | None
+            The amount of time to cache each resolved value for in seconds.
+
+            Leave this as `None` to cache values until they're evicted or invalidated.
+        max_size : int | None
+            The maximum amount of values to cache for this dependency.
+
+            When this is exceeded the least recently used values will be evicted.
+            Leave this as `None` to not limit the amount of cached values.
+        scope : DependencyScope
+            The scope to cache the dependency's values within.
+
+            Defaults to `DependencyScope.SINGLETON`.
+
+        Returns
+        -------
+        Self
+            The client instance to allow chaining.
+
+        Raises
+        ------
+        ValueError
+            If `expire_after` is less than or equal to 0 seconds.
+            If `max_size` is less than or equal to 0.
+            If `callback` is a generator or context manager; the values of
+            these are released when the context which resolved them is
+            released so they can't be cached.
+        """
+        if _get_manager_factory(callback) is not None:
+            raise ValueError("Generator and context manager callbacks cannot be used as scoped dependencies")
+
+        self._scoped_dependencies[type_] = _ScopedDependency(
+            callback, expire_after=expire_after, max_size=max_size, scope=scope
+        )
+        return self
+
+    def invalidate_scoped_dependency(
+        self: _InjectorClientT,
+        type_: type[typing.Any],
+        /,
+        *,
+        key: typing.Optional[hikari.SnowflakeishOr[hikari.Unique]] = None,
+    ) -> _InjectorClientT:
+        """Invalidate the cached values of a scoped dependency.
+
+        .. note::
+            This won't effect values which have already been resolved and cached
+            for a context.
+
+        Parameters
+        ----------
+        type_: type[typing.Any]
+            The type of the scoped dependency to invalidate.
+
+        Other Parameters
+        ----------------
+        key : hikari.snowflakes.SnowflakeishOr[hikari.snowflakes.Unique] | None
+            The guild, user or channel to invalidate the dependency's cached
+            value for (dependent on the dependency's scope).
+
+            If left as `None` then all of the dependency's cached values will be
+            invalidated.
+
+        Returns
+        -------
+        Self
+            The client instance to allow chaining.
+
+        Raises
+        ------
+        KeyError
+            If no scoped dependency is registered for `type_`.
+        """
+        self._scoped_dependencies[type_].invalidate(UNDEFINED if key is None else hikari.Snowflake(key))
+        return self
+
+    def remove_scoped_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT:
+        """Remove a scoped dependency.
+
+        Parameters
+        ----------
+        type_: type[typing.Any]
+            The associated type.
+
+        Returns
+        -------
+        Self
+            The client instance to allow chaining.
+
+        Raises
+        ------
+        KeyError
+            If no scoped dependency is registered for `type_`.
+        """
+        del self._scoped_dependencies[type_]
+        return self
+
     def set_callback_override(
         self: _InjectorClientT, callback: CallbackSig[_T], override: CallbackSig[_T], /
     ) -> _InjectorClientT:
@@ -888,6 +1559,7 @@ class InjectorClient:
             The client instance to allow chaining.
         """
         self._callback_overrides[callback] = CallbackDescriptor(override)
+        self._compile_token = object()
         return self
 
     def get_callback_override(self, callback: CallbackSig[_T], /) -> typing.Optional[CallbackDescriptor[_T]]:
@@ -924,6 +1596,7 @@ class InjectorClient:
             If no override is found for the callback.
         """
         del self._callback_overrides[callback]
+        self._compile_token = object()
         return self
 
 
@@ -939,6 +1612,19 @@ class _EmptyInjectorClient(InjectorClient):
     def remove_type_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT:
         raise KeyError(type_)
 
+    def set_scoped_dependency(
+        self: _InjectorClientT, _: type[_T], __: CallbackSig[_T], /, **___: typing.Any
+    ) -> _InjectorClientT:
+        return self  # NOOP is safer here than NotImplementedError
+
+    def invalidate_scoped_dependency(
+        self: _InjectorClientT, type_: type[typing.Any], /, **_: typing.Any
+    ) -> _InjectorClientT:
+        raise KeyError(type_)
+
+    def remove_scoped_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT:
+        raise KeyError(type_)
+
     def set_callback_override(self: _InjectorClientT, _: CallbackSig[_T], __: CallbackSig[_T], /) -> _InjectorClientT:
         return self  # NOOP is safer here than NotImplementedError
 
@@ -38,6 +38,7 @@ __all__: list[str] = [
     "BasicInjectionContext",
     "CallbackDescriptor",
     "CallbackSig",
+    "DependencyScope",
     "Undefined",
     "UNDEFINED",
     "UndefinedOr",
@@ -50,9 +51,14 @@ __all__: list[str] = [
 ]
 
 import abc
+import contextlib
+import datetime
+import enum
 import typing
 from collections import abc as collections
 
+import hikari
+
 from . import abc as tanjun_abc
 
 _BasicInjectionContextT = typing.TypeVar("_BasicInjectionContextT", bound="BasicInjectionContext")
@@ -79,16 +85,20 @@ class AbstractInjectionContext(abc.ABC):
     def get_cached_result(self, callback: CallbackSig[_T], /) -> UndefinedOr[_T]: ...
     @abc.abstractmethod
     def get_type_dependency(self, type_: type[_T], /) -> UndefinedOr[_T]: ...
+    async def release_dependencies(self, exception: typing.Optional[BaseException] = None, /) -> None: ...
 
 class BasicInjectionContext(AbstractInjectionContext):
     __slots__: typing.Union[str, collections.Iterable[str]]
-    _special_case_types: dict[type[typing.Any], typing.Any]
+    _self_types: typing.ClassVar[frozenset[type[typing.Any]]]
+    _special_case_types: typing.Optional[dict[type[typing.Any], typing.Any]]
     def __init__(self, client: InjectorClient, /) -> None: ...
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None: ...
     @property
     def injection_client(self) -> InjectorClient: ...
     def cache_result(self, callback: CallbackSig[_T], value: _T, /) -> None: ...
     def get_cached_result(self, callback: CallbackSig[_T], /) -> UndefinedOr[_T]: ...
     def get_type_dependency(self, _: type[_T], /) -> UndefinedOr[_T]: ...
+    async def release_dependencies(self, exception: typing.Optional[BaseException] = None, /) -> None: ...
     def _set_type_special_case(
         self: _BasicInjectionContextT, type_: type[_T], value: _T, /
     ) -> _BasicInjectionContextT: ...
@@ -152,6 +162,14 @@ class Injected(typing.Generic[_T]):
     @typing.overload
     def __init__(self, *, callback: collections.Callable[..., collections.Awaitable[_T]]) -> None: ...
     @typing.overload
+    def __init__(self, *, callback: collections.Callable[..., collections.AsyncIterator[_T]]) -> None: ...
+    @typing.overload
+    def __init__(self, *, callback: collections.Callable[..., contextlib.AbstractAsyncContextManager[_T]]) -> None: ...
+    @typing.overload
+    def __init__(self, *, callback: collections.Callable[..., collections.Iterator[_T]]) -> None: ...
+    @typing.overload
+    def __init__(self, *, callback: collections.Callable[..., contextlib.AbstractContextManager[_T]]) -> None: ...
+    @typing.overload
     def __init__(self, *, callback: collections.Callable[..., _T]) -> None: ...
     @typing.overload
     def __init__(self, *, type: _TypeT[_T]) -> None: ...
@@ -159,22 +177,64 @@ class Injected(typing.Generic[_T]):
 @typing.overload
 def inject(*, callback: collections.Callable[..., collections.Awaitable[_T]]) -> _T: ...
 @typing.overload
+def inject(*, callback: collections.Callable[..., collections.AsyncIterator[_T]]) -> _T: ...
+@typing.overload
+def inject(*, callback: collections.Callable[..., contextlib.AbstractAsyncContextManager[_T]]) -> _T: ...
+@typing.overload
+def inject(*, callback: collections.Callable[..., collections.Iterator[_T]]) -> _T: ...
+@typing.overload
+def inject(*, callback: collections.Callable[..., contextlib.AbstractContextManager[_T]]) -> _T: ...
+@typing.overload
 def inject(*, callback: collections.Callable[..., _T]) -> _T: ...
 @typing.overload
 def inject(*, type: _TypeT[_T]) -> _T: ...
 @typing.overload
 def injected(*, callback: collections.Callable[..., collections.Awaitable[_T]]) -> _T: ...
 @typing.overload
+def injected(*, callback: collections.Callable[..., collections.AsyncIterator[_T]]) -> _T: ...
+@typing.overload
+def injected(*, callback: collections.Callable[..., contextlib.AbstractAsyncContextManager[_T]]) -> _T: ...
+@typing.overload
+def injected(*, callback: collections.Callable[..., collections.Iterator[_T]]) -> _T: ...
+@typing.overload
+def injected(*, callback: collections.Callable[..., contextlib.AbstractContextManager[_T]]) -> _T: ...
+@typing.overload
 def injected(*, callback: collections.Callable[..., _T]) -> _T: ...
 @typing.overload
 def injected(*, type: _TypeT[_T]) -> _T: ...
 
+class DependencyScope(str, enum.Enum):
+    SINGLETON = "SINGLETON"
+    CONTEXT = "CONTEXT"
+    GUILD = "GUILD"
+    USER = "USER"
+    CHANNEL = "CHANNEL"
+
 class InjectorClient:
     __slots__: typing.Union[str, collections.Iterable[str]]
     def __init__(self) -> None: ...
+    def set_concurrent_resolution(self: _InjectorClientT, state: bool = ..., /) -> _InjectorClientT: ...
     def set_type_dependency(self: _InjectorClientT, type_: type[_T], value: _T, /) -> _InjectorClientT: ...
     def get_type_dependency(self, type_: type[_T], /) -> UndefinedOr[_T]: ...
     def remove_type_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT: ...
+    def set_scoped_dependency(
+        self: _InjectorClientT,
+        type_: type[_T],
+        callback: CallbackSig[_T],
+        /,
+        *,
+        expire_after: typing.Union[int, float, datetime.timedelta, None] = ...,
+        max_size: typing.Optional[int] = ...,
+        scope: DependencyScope = ...,
+    ) -> _InjectorClientT: ...
+    def invalidate_scoped_dependency(
+        self: _InjectorClientT,
+        type_: type[typing.Any],
+        /,
+        *,
+        key: typing.Optional[hikari.SnowflakeishOr[hikari.Unique]] = ...,
+    ) -> _InjectorClientT: ...
+    def remove_scoped_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT: ...
     def set_callback_override(
         self: _InjectorClientT, callback: CallbackSig[_T], override: CallbackSig[_T], /
     ) -> _InjectorClientT: ...
@@ -186,6 +246,13 @@ class _EmptyInjectorClient(InjectorClient):
     def set_type_dependency(self: _InjectorClientT, _: type[_T], __: _T, /) -> _InjectorClientT: ...
     def get_type_dependency(self, _: type[typing.Any], /) -> Undefined: ...
     def remove_type_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT: ...
+    def set_scoped_dependency(
+        self: _InjectorClientT, _: type[_T], __: CallbackSig[_T], /, **___: typing.Any
+    ) -> _InjectorClientT: ...
+    def invalidate_scoped_dependency(
+        self: _InjectorClientT, type_: type[typing.Any], /, **_: typing.Any
+    ) -> _InjectorClientT: ...
+    def remove_scoped_dependency(self: _InjectorClientT, type_: type[typing.Any], /) -> _InjectorClientT: ...
     def set_callback_override(
         self: _InjectorClientT, _: CallbackSig[_T], __: CallbackSig[_T], /
     ) -> _InjectorClientT: ...
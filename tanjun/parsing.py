@@ -61,6 +61,7 @@ from . import abc as tanjun_abc
 from . import conversion
 from . import errors
 from . import injecting
+from .dependencies import metrics
 
 if typing.TYPE_CHECKING:
     _CommandT = typing.TypeVar("_CommandT", bound=tanjun_abc.MessageCommand[typing.Any])
@@ -1360,8 +1361,14 @@ class Parameter:
         if self._max_value is not UNDEFINED and self._max_value < value:
             raise errors.ConversionError(f"{self._key!r} must be less than or equal to {self._max_value!r}", self.key)
 
-    async def convert(self, ctx: tanjun_abc.Context, value: str) -> typing.Any:
+    def convert(self, ctx: tanjun_abc.Context, value: str) -> collections.Coroutine[typing.Any, typing.Any, typing.Any]:
         """Convert the given value to the type of this parameter."""
+        if collector := metrics.get_active_collector():
+            return metrics.timed(collector, metrics.DispatchStage.CONVERT, self._convert(ctx, value), name=self._key)
+
+        return self._convert(ctx, value)
+
+    async def _convert(self, ctx: tanjun_abc.Context, value: str, /) -> typing.Any:
         if not self._converters:
             self._validate(value)
             return value
@@ -1811,7 +1818,11 @@ class ShlexParser(AbstractOptionParser):
         self, ctx: tanjun_abc.MessageContext, /
     ) -> collections.Coroutine[typing.Any, typing.Any, dict[str, typing.Any]]:
         # <<inherited docstring from AbstractOptionParser>>.
-        return _SemanticShlex(ctx, self._arguments, self._options).parse()
+        parse = _SemanticShlex(ctx, self._arguments, self._options).parse()
+        if collector := metrics.get_active_collector():
+            return metrics.timed(collector, metrics.DispatchStage.PARSE, parse)
+
+        return parse
 
 
 def with_parser(command: _CommandT, /) -> _CommandT:
@@ -45,6 +45,7 @@ __all__: list[str] = [
 ]
 
 import asyncio
+import functools
 import typing
 from collections import abc as collections
 
@@ -62,6 +63,7 @@ if typing.TYPE_CHECKING:
 _KeyT = typing.TypeVar("_KeyT")
 _ValueT = typing.TypeVar("_ValueT")
 _OtherValueT = typing.TypeVar("_OtherValueT")
+_T = typing.TypeVar("_T")
 
 
 async def gather_checks(ctx: abc.Context, checks_: collections.Iterable[checks.InjectableCheck], /) -> bool:
@@ -79,8 +81,17 @@ async def gather_checks(ctx: abc.Context, checks_: collections.Iterable[checks.I
     bool
         Whether all the checks passed or not.
     """
+    if not isinstance(checks_, collections.Sequence):
+        checks_ = tuple(checks_)
+
     try:
-        await asyncio.gather(*(check(ctx) for check in checks_))
+        # Avoid wrapping the checks in tasks when there's no concurrency to be had.
+        if len(checks_) == 1:
+            await checks_[0](ctx)
+
+        elif checks_:
+            await asyncio.gather(*(check(ctx) for check in checks_))
+
         # InjectableCheck will raise FailedCheck if a false is received so if
         # we get this far then it's True.
         return True
@@ -217,8 +228,40 @@ def calculate_permissions(
     return _calculate_channel_overwrites(channel, member, permissions)
 
 
+async def _memoise(
+    context: typing.Optional[abc.Context],
+    key: collections.Hashable,
+    callback: collections.Callable[[], collections.Awaitable[_T]],
+    /,
+) -> _T:
+    if context is None:
+        return await callback()
+
+    return await context.memoise_fetch(key, callback)
+
+
+async def _fetch_uncached_channel(
+    client: injecting.InjectorClient, channel_id: hikari.Snowflake, /
+) -> hikari.PartialChannel:
+    if channel_cache := client.get_type_dependency(_ChannelCacheT):
+        try:
+            return await channel_cache.get(channel_id)
+
+        except async_cache.EntryNotFound:
+            raise
+
+        except async_cache.CacheMissError:
+            pass
+
+    return await client.rest.fetch_channel(channel_id)
+
+
 async def _fetch_channel(
-    client: abc.Client, channel: hikari.SnowflakeishOr[hikari.PartialChannel]
+    client: abc.Client,
+    channel: hikari.SnowflakeishOr[hikari.PartialChannel],
+    /,
+    *,
+    context: typing.Optional[abc.Context] = None,
 ) -> hikari.GuildChannel:
     # TODO: upgrade injecting stuff to the standard interface
     assert isinstance(client, injecting.InjectorClient)
@@ -230,9 +273,17 @@ async def _fetch_channel(
     if client.cache and (found_channel_ := client.cache.get_guild_channel(channel_id)):
         return found_channel_
 
-    if channel_cache := client.get_type_dependency(_ChannelCacheT):
+    found_channel = await _memoise(
+        context, (hikari.PartialChannel, channel_id), functools.partial(_fetch_uncached_channel, client, channel_id)
+    )
+    assert isinstance(found_channel, hikari.GuildChannel), "Cannot perform operation on a DM channel."
+    return found_channel
+
+
+async def _fetch_uncached_guild(client: injecting.InjectorClient, guild_id: hikari.Snowflake, /) -> hikari.Guild:
+    if guild_cache := client.get_type_dependency(_GuildCacheT):
         try:
-            return await channel_cache.get(channel_id)
+            return await guild_cache.get(guild_id)
 
         except async_cache.EntryNotFound:
             raise
@@ -240,9 +291,7 @@ async def _fetch_channel(
         except async_cache.CacheMissError:
             pass
 
-    found_channel = await client.rest.fetch_channel(channel_id)
-    assert isinstance(found_channel, hikari.GuildChannel), "Cannot perform operation on a DM channel."
-    return found_channel
+    return await client.rest.fetch_guild(guild_id)
 
 
 _ChannelCacheT = async_cache.SfCache[hikari.GuildChannel]
@@ -257,6 +306,7 @@ async def fetch_permissions(
     /,
     *,
     channel: typing.Optional[hikari.SnowflakeishOr[hikari.PartialChannel]] = None,
+    context: typing.Optional[abc.Context] = None,
 ) -> hikari.Permissions:
     """Calculate the permissions a member has within a guild.
 
@@ -277,33 +327,47 @@ async def fetch_permissions(
         The object of ID of the channel to get their permissions in.
         If left as `None` then this will return their base guild
         permissions.
+    context : tanjun.abc.Context | None
+        The context to memoise the calculated permissions and any entities
+        fetched while calculating them with.
+
+        If left as `None` then nothing will be memoised.
 
     Returns
     -------
     hikari.permissions.Permissions
         The calculated permissions.
     """
+    if context is None:
+        return await _fetch_permissions(client, member, channel, None)
+
+    channel_id = hikari.Snowflake(channel) if channel else None
+    return await context.memoise_fetch(
+        (hikari.Permissions, member.guild_id, member.user.id, channel_id),
+        functools.partial(_fetch_permissions, client, member, channel, context),
+    )
+
+
+async def _fetch_permissions(
+    client: abc.Client,
+    member: hikari.Member,
+    channel: typing.Optional[hikari.SnowflakeishOr[hikari.PartialChannel]],
+    context: typing.Optional[abc.Context],
+    /,
+) -> hikari.Permissions:
     # TODO: upgrade injecting stuff to the standard interface
     assert isinstance(client, injecting.InjectorClient)
 
     # The ordering of how this adds and removes permissions does matter.
     # For more information see https://discord.com/developers/docs/topics/permissions#permission-hierarchy.
-    guild: typing.Optional[hikari.Guild]
     roles: typing.Optional[collections.Mapping[hikari.Snowflake, hikari.Role]] = None
     guild = client.cache.get_guild(member.guild_id) if client.cache else None
-    if not guild and (guild_cache := client.get_type_dependency(_GuildCacheT)):
-        try:
-            guild = await guild_cache.get(member.guild_id)
-
-        except async_cache.EntryNotFound:
-            raise
-
-        except async_cache.CacheMissError:
-            pass
-
     if not guild:
-        guild = await client.rest.fetch_guild(member.guild_id)
-        roles = guild.roles
+        guild = await _memoise(
+            context, (hikari.Guild, member.guild_id), functools.partial(_fetch_uncached_guild, client, member.guild_id)
+        )
+        if isinstance(guild, hikari.RESTGuild):
+            roles = guild.roles
 
     # Guild owners are implicitly admins.
     if guild.owner_id == member.user.id:
@@ -314,7 +378,9 @@ async def fetch_permissions(
         roles = {role.id: role for role in await role_cache.iter_for_guild(member.guild_id)}
 
     if not roles:
-        raw_roles = await client.rest.fetch_roles(member.guild_id)
+        raw_roles = await _memoise(
+            context, (hikari.Role, member.guild_id), functools.partial(client.rest.fetch_roles, member.guild_id)
+        )
         roles = {role.id: role for role in raw_roles}
 
     # Admin permission overrides all overwrites and is only applicable to roles.
@@ -324,7 +390,7 @@ async def fetch_permissions(
     if not channel:
         return permissions
 
-    channel = await _fetch_channel(client, channel)
+    channel = await _fetch_channel(client, channel, context=context)
     if channel.guild_id != guild.id:
         raise ValueError("Channel doesn't match up with the member's guild")
 
@@ -380,6 +446,7 @@ async def fetch_everyone_permissions(
     /,
     *,
     channel: typing.Optional[hikari.SnowflakeishOr[hikari.PartialChannel]] = None,
+    context: typing.Optional[abc.Context] = None,
 ) -> hikari.Permissions:
     """Calculate the permissions a guild's default @everyone role has within a guild or for a specific channel.
 
@@ -401,13 +468,34 @@ async def fetch_everyone_permissions(
 
         If this is left as `None` then this will just calculate the default
         permissions on a guild level.
+    context : tanjun.abc.Context | None
+        The context to memoise the calculated permissions and any entities
+        fetched while calculating them with.
 
+        If left as `None` then nothing will be memoised.
 
     Returns
     -------
     hikari.permissions.Permissions
         The calculated permissions.
     """
+    if context is None:
+        return await _fetch_everyone_permissions(client, guild_id, channel, None)
+
+    channel_id = hikari.Snowflake(channel) if channel else None
+    return await context.memoise_fetch(
+        (hikari.Permissions, guild_id, None, channel_id),
+        functools.partial(_fetch_everyone_permissions, client, guild_id, channel, context),
+    )
+
+
+async def _fetch_everyone_permissions(
+    client: abc.Client,
+    guild_id: hikari.Snowflake,
+    channel: typing.Optional[hikari.SnowflakeishOr[hikari.PartialChannel]],
+    context: typing.Optional[abc.Context],
+    /,
+) -> hikari.Permissions:
     # TODO: upgrade injecting stuff to the standard interface
     assert isinstance(client, injecting.InjectorClient)
     # The ordering of how this adds and removes permissions does matter.
@@ -424,7 +512,8 @@ async def fetch_everyone_permissions(
             pass
 
     if not role:
-        for role in await client.rest.fetch_roles(guild_id):
+        roles = await _memoise(context, (hikari.Role, guild_id), functools.partial(client.rest.fetch_roles, guild_id))
+        for role in roles:
             if role.id == guild_id:
                 break
 
@@ -439,7 +528,7 @@ async def fetch_everyone_permissions(
     if not channel:
         return permissions
 
-    channel = await _fetch_channel(client, channel)
+    channel = await _fetch_channel(client, channel, context=context)
     if everyone_overwrite := channel.permission_overwrites.get(guild_id):
         permissions &= ~everyone_overwrite.deny
         permissions |= everyone_overwrite.allow
@@ -47,6 +47,7 @@ def test_set_standard_dependencies():
     stack = contextlib.ExitStack()
     owner_check = stack.enter_context(mock.patch.object(tanjun.dependencies, "Owners"))
     lazy_constant = stack.enter_context(mock.patch.object(tanjun.dependencies, "LazyConstant"))
+    deletion_scheduler = stack.enter_context(mock.patch.object(tanjun.dependencies, "DeletionScheduler"))
 
     with stack:
         tanjun.dependencies.set_standard_dependencies(mock_client)
@@ -54,9 +55,11 @@ def test_set_standard_dependencies():
     owner_check.assert_called_once_with()
     lazy_constant.assert_called_once_with(tanjun.dependencies.fetch_my_user)
     lazy_constant.__getitem__.assert_called_once_with(hikari.OwnUser)
+    deletion_scheduler.assert_called_once_with()
     mock_client.set_type_dependency.assert_has_calls(
         [
             mock.call(tanjun.dependencies.AbstractOwners, owner_check.return_value),
             mock.call(lazy_constant.__getitem__.return_value, lazy_constant.return_value),
+            mock.call(tanjun.dependencies.AbstractDeletionScheduler, deletion_scheduler.return_value),
         ]
     )
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
+# This leads to too many false-positives around mocks.
+import pathlib
+
+import hikari
+import pytest
+
+import tanjun
+
+
+class TestDeclarationRecord:
+    def test_properties(self):
+        record = tanjun.dependencies.DeclarationRecord("hash", {"meow": (hikari.Snowflake(123), hikari.Snowflake(456))})
+
+        assert record.fingerprint == "hash"
+        assert record.commands == {"meow": (123, 456)}
+
+
+class TestFileDeclarationStore:
+    @pytest.mark.asyncio()
+    async def test_set_record(self, tmp_path: pathlib.Path):
+        path = tmp_path / "commands.json"
+        store = tanjun.dependencies.FileDeclarationStore(path)
+        record = tanjun.dependencies.DeclarationRecord("hash", {"meow": (hikari.Snowflake(123), hikari.Snowflake(456))})
+
+        await store.set_record(hikari.Snowflake(321), None, record)
+        await store.set_record(
+            hikari.Snowflake(321), hikari.Snowflake(654), tanjun.dependencies.DeclarationRecord("other", {})
+        )
+
+        assert store.path == path
+        result = await tanjun.dependencies.FileDeclarationStore(path).get_record(hikari.Snowflake(321), None)
+        assert result
+        assert result.fingerprint == "hash"
+        assert result.commands == {"meow": (123, 456)}
+        result = await tanjun.dependencies.FileDeclarationStore(path).get_record(
+            hikari.Snowflake(321), hikari.Snowflake(654)
+        )
+        assert result
+        assert result.fingerprint == "other"
+        assert result.commands == {}
+
+    @pytest.mark.asyncio()
+    async def test_set_records(self, tmp_path: pathlib.Path):
+        path = tmp_path / "commands.json"
+        store = tanjun.dependencies.FileDeclarationStore(path)
+        await store.set_record(hikari.Snowflake(321), None, tanjun.dependencies.DeclarationRecord("old", {}))
+
+        await store.set_records(
+            [
+                (hikari.Snowflake(321), hikari.Snowflake(654), tanjun.dependencies.DeclarationRecord("meow", {})),
+                (hikari.Snowflake(321), hikari.Snowflake(987), tanjun.dependencies.DeclarationRecord("nyaa", {})),
+            ]
+        )
+
+        new_store = tanjun.dependencies.FileDeclarationStore(path)
+        for guild_id, fingerprint in [(None, "old"), (hikari.Snowflake(654), "meow"), (hikari.Snowflake(987), "nyaa")]:
+            result = await new_store.get_record(hikari.Snowflake(321), guild_id)
+            assert result
+            assert result.fingerprint == fingerprint
+
+        assert not path.with_name("commands.json.tmp").exists()
+
+    @pytest.mark.asyncio()
+    async def test_get_record_when_not_found(self, tmp_path: pathlib.Path):
+        store = tanjun.dependencies.FileDeclarationStore(tmp_path / "commands.json")
+
+        assert await store.get_record(hikari.Snowflake(321), None) is None
+
+    @pytest.mark.asyncio()
+    async def test_get_record_when_file_invalid(self, tmp_path: pathlib.Path):
+        path = tmp_path / "commands.json"
+        path.write_text('{"records": {"321:global": {"fingerprint": "hash"}}}')
+        store = tanjun.dependencies.FileDeclarationStore(path)
+
+        assert await store.get_record(hikari.Snowflake(321), None) is None
+
+    @pytest.mark.asyncio()
+    async def test_clear(self, tmp_path: pathlib.Path):
+        path = tmp_path / "commands.json"
+        store = tanjun.dependencies.FileDeclarationStore(path)
+        await store.set_record(hikari.Snowflake(321), None, tanjun.dependencies.DeclarationRecord("hash", {}))
+
+        store.clear()
+
+        assert await store.get_record(hikari.Snowflake(321), None) is None
+        assert await tanjun.dependencies.FileDeclarationStore(path).get_record(hikari.Snowflake(321), None) is None
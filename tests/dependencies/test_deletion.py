@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
+import asyncio
+import datetime
+import typing
+from unittest import mock
+
+import hikari
+import pytest
+
+import tanjun
+
+
+def _make_message(
+    message_id: int,
+    *,
+    channel_id: int = 123,
+    guild_id: typing.Optional[int] = 321,
+    created_at: typing.Optional[datetime.datetime] = None,
+) -> mock.Mock:
+    message = mock.Mock(
+        hikari.PartialMessage,
+        id=hikari.Snowflake(message_id),
+        channel_id=hikari.Snowflake(channel_id),
+        guild_id=hikari.Snowflake(guild_id) if guild_id else None,
+        created_at=created_at or datetime.datetime.now(tz=datetime.timezone.utc),
+        delete=mock.AsyncMock(),
+    )
+    message.app.rest.delete_messages = mock.AsyncMock()
+    return message
+
+
+class TestDeletionScheduler:
+    @pytest.mark.asyncio()
+    async def test_schedule_message(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message = _make_message(1)
+
+        scheduler.schedule_message(message, 0.01)
+        assert len(scheduler) == 1
+        await asyncio.sleep(0.05)
+
+        message.delete.assert_awaited_once_with()
+        message.app.rest.delete_messages.assert_not_called()
+        assert len(scheduler) == 0
+        assert scheduler._handle is None
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_bulk_deletes_due_messages_per_channel(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message_1 = _make_message(1)
+        message_2 = _make_message(2, channel_id=456)
+        message_3 = _make_message(3)
+        message_4 = _make_message(4)
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.01)
+        scheduler.schedule_message(message_3, 0.01)
+        scheduler.schedule_message(message_4, 5)
+        await asyncio.sleep(0.05)
+
+        message_1.app.rest.delete_messages.assert_awaited_once_with(message_1.channel_id, [message_1, message_3])
+        message_1.delete.assert_not_called()
+        message_3.delete.assert_not_called()
+        message_2.delete.assert_awaited_once_with()
+        message_4.delete.assert_not_called()
+        assert len(scheduler) == 1
+        assert scheduler._handle is not None
+        scheduler._handle.cancel()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_bulk_deletes_rest_messages_with_guild_id(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        # Messages returned by REST requests never have guild_id set.
+        message_1 = _make_message(1, guild_id=None)
+        message_2 = _make_message(2, guild_id=None)
+
+        scheduler.schedule_message(message_1, 0.01, guild_id=321)
+        scheduler.schedule_message(message_2, 0.01, guild_id=hikari.Snowflake(321))
+        await asyncio.sleep(0.05)
+
+        message_1.app.rest.delete_messages.assert_awaited_once_with(message_1.channel_id, [message_1, message_2])
+        message_1.delete.assert_not_called()
+        message_2.delete.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_deletes_individually_when_cant_be_bulk_deleted(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        old_message = _make_message(
+            1, created_at=datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=14)
+        )
+        message = _make_message(2)
+        dm_message_1 = _make_message(3, channel_id=789, guild_id=None)
+        dm_message_2 = _make_message(4, channel_id=789, guild_id=None)
+
+        for message_ in (old_message, message, dm_message_1, dm_message_2):
+            scheduler.schedule_message(message_, 0.01)
+
+        await asyncio.sleep(0.05)
+
+        for message_ in (old_message, message, dm_message_1, dm_message_2):
+            message_.delete.assert_awaited_once_with()
+            message_.app.rest.delete_messages.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_falls_back_to_individual_deletes_when_bulk_delete_fails(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message_1 = _make_message(1)
+        message_2 = _make_message(2)
+        message_3 = _make_message(3)
+        message_1.app.rest.delete_messages.side_effect = hikari.BulkDeleteError([], [message_2.id, message_3.id])
+
+        for message in (message_1, message_2, message_3):
+            scheduler.schedule_message(message, 0.01)
+
+        await asyncio.sleep(0.05)
+
+        message_1.app.rest.delete_messages.assert_awaited_once_with(
+            message_1.channel_id, [message_1, message_2, message_3]
+        )
+        message_1.delete.assert_not_called()
+        message_2.delete.assert_awaited_once_with()
+        message_3.delete.assert_awaited_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_coalesces_messages_due_soon_after(self):
+        scheduler = tanjun.dependencies.DeletionScheduler(coalesce_window=0.5)
+        message_1 = _make_message(1)
+        message_2 = _make_message(2)
+        message_3 = _make_message(3)
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.2)
+        scheduler.schedule_message(message_3, 5)
+        await asyncio.sleep(0.05)
+
+        message_1.app.rest.delete_messages.assert_awaited_once_with(message_1.channel_id, [message_1, message_2])
+        message_1.delete.assert_not_called()
+        message_2.delete.assert_not_called()
+        assert len(scheduler) == 1
+        assert scheduler._handle is not None
+        scheduler._handle.cancel()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_when_coalescing_disabled(self):
+        scheduler = tanjun.dependencies.DeletionScheduler(coalesce_window=0)
+        message_1 = _make_message(1)
+        message_2 = _make_message(2)
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.2)
+        await asyncio.sleep(0.05)
+
+        message_1.delete.assert_awaited_once_with()
+        message_2.delete.assert_not_called()
+        assert len(scheduler) == 1
+        assert scheduler._handle is not None
+        scheduler._handle.cancel()
+
+    def test_init_when_coalesce_window_negative(self):
+        with pytest.raises(ValueError, match="coalesce_window must be greater than or equal to 0"):
+            tanjun.dependencies.DeletionScheduler(coalesce_window=-1)
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_stops_bulk_deleting_in_guild_after_permission_error(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message_1 = _make_message(1)
+        message_2 = _make_message(2)
+        error = hikari.BulkDeleteError([], [message_1.id, message_2.id])
+        error.__cause__ = hikari.ForbiddenError(url="", headers={}, raw_body=None)
+        message_1.app.rest.delete_messages.side_effect = error
+        message_3 = _make_message(3)
+        message_4 = _make_message(4)
+        other_guild_message_1 = _make_message(5, channel_id=456, guild_id=654)
+        other_guild_message_2 = _make_message(6, channel_id=456, guild_id=654)
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.01)
+        await asyncio.sleep(0.05)
+        for message in (message_3, message_4, other_guild_message_1, other_guild_message_2):
+            scheduler.schedule_message(message, 0.01)
+
+        await asyncio.sleep(0.05)
+
+        message_1.app.rest.delete_messages.assert_awaited_once_with(message_1.channel_id, [message_1, message_2])
+        for message in (message_1, message_2, message_3, message_4):
+            message.delete.assert_awaited_once_with()
+
+        other_guild_message_1.app.rest.delete_messages.assert_awaited_once_with(
+            other_guild_message_1.channel_id, [other_guild_message_1, other_guild_message_2]
+        )
+        assert scheduler._no_bulk_guilds == {321}
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_keeps_bulk_deleting_after_other_errors(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message_1 = _make_message(1)
+        message_2 = _make_message(2)
+        message_1.app.rest.delete_messages.side_effect = hikari.BulkDeleteError([], [message_1.id, message_2.id])
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.01)
+        await asyncio.sleep(0.05)
+
+        assert scheduler._no_bulk_guilds == set()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_keeps_reference_to_deletion_task(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        deleting = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def delete() -> None:
+            deleting.set()
+            await finish.wait()
+
+        message = _make_message(1)
+        message.delete.side_effect = delete
+
+        scheduler.schedule_message(message, 0.01)
+        await asyncio.wait_for(deleting.wait(), timeout=1)
+
+        assert len(scheduler._tasks) == 1
+        finish.set()
+        await asyncio.wait_for(asyncio.gather(*scheduler._tasks), timeout=1)
+        await asyncio.sleep(0)
+        assert scheduler._tasks == set()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_message_ignores_not_found_error(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        message_1 = _make_message(1, channel_id=1)
+        message_1.delete.side_effect = hikari.NotFoundError(url="", headers={}, raw_body=None)
+        message_2 = _make_message(2, channel_id=2)
+
+        scheduler.schedule_message(message_1, 0.01)
+        scheduler.schedule_message(message_2, 0.01)
+        await asyncio.sleep(0.05)
+
+        message_1.delete.assert_awaited_once_with()
+        message_2.delete.assert_awaited_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_callback(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        callback_1 = mock.AsyncMock(side_effect=hikari.NotFoundError(url="", headers={}, raw_body=None))
+        callback_2 = mock.AsyncMock()
+
+        scheduler.schedule_callback(callback_1, 0.01)
+        scheduler.schedule_callback(callback_2, 0.02)
+        await asyncio.sleep(0.05)
+
+        callback_1.assert_awaited_once_with()
+        callback_2.assert_awaited_once_with()
+        assert len(scheduler) == 0
+
+    @pytest.mark.asyncio()
+    async def test_schedule_reschedules_timer_for_earlier_deletion(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+        late_callback = mock.AsyncMock()
+        early_callback = mock.AsyncMock()
+
+        scheduler.schedule_callback(late_callback, 5)
+        assert scheduler._handle is not None
+        late_handle = scheduler._handle
+        scheduler.schedule_callback(early_callback, 0.01)
+        await asyncio.sleep(0.05)
+
+        assert late_handle.cancelled()
+        early_callback.assert_awaited_once_with()
+        late_callback.assert_not_called()
+        assert len(scheduler) == 1
+        assert scheduler._handle is not None
+        assert scheduler._handle is not late_handle
+        scheduler._handle.cancel()
+
+    @pytest.mark.asyncio()
+    async def test_schedule_keeps_timer_for_later_deletion(self):
+        scheduler = tanjun.dependencies.DeletionScheduler()
+
+        scheduler.schedule_callback(mock.AsyncMock(), 1)
+        handle = scheduler._handle
+        scheduler.schedule_callback(mock.AsyncMock(), 5)
+
+        assert scheduler._handle is handle
+        assert handle
+        handle.cancel()
@@ -38,6 +38,7 @@ import contextlib
 import datetime
 import time
 import typing
+from collections import abc as collections
 from unittest import mock
 
 import hikari
@@ -46,6 +47,12 @@ import pytest
 import tanjun
 
 
+async def _memoise_fetch(
+    _: typing.Any, callback: collections.Callable[[], collections.Awaitable[typing.Any]], /
+) -> typing.Any:
+    return await callback()
+
+
 @pytest.mark.parametrize(
     ("resource_type", "mock_ctx", "expected"),
     [
@@ -79,7 +86,10 @@ async def test__get_ctx_target_when_parent_channel_and_cache_result(channel: moc
 
 @pytest.mark.parametrize(
     ("channel", "result"),
-    [(mock.Mock(parent_id=None, id=123), 123), (mock.Mock(parent_id=54123123, id=123321), 123321)],
+    [
+        (mock.Mock(hikari.GuildChannel, parent_id=None, id=123), 123),
+        (mock.Mock(hikari.GuildChannel, parent_id=54123123, id=123321), 123321),
+    ],
 )
 @pytest.mark.asyncio()
 async def test__get_ctx_target_when_parent_channel_when_async_cache_returns_channel(channel: mock.Mock, result: int):
@@ -88,14 +98,16 @@ async def test__get_ctx_target_when_parent_channel_when_async_cache_returns_chan
     mock_context = mock.Mock(tanjun.context.BaseContext)
     mock_context.get_channel.return_value = None
     mock_context.get_type_dependency.return_value = mock_cache
+    mock_context.memoise_fetch.side_effect = _memoise_fetch
 
     result = await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.PARENT_CHANNEL)
 
     assert result == result
     mock_context.get_channel.assert_called_once_with()
     mock_cache.get.assert_awaited_once_with(mock_context.channel_id, default=None)
-    mock_context.fetch_channel.assert_not_called()
+    mock_context.rest.fetch_channel.assert_not_called()
     mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.GuildChannel])
+    mock_context.memoise_fetch.assert_awaited_once_with((hikari.PartialChannel, mock_context.channel_id), mock.ANY)
 
 
 @pytest.mark.parametrize(
@@ -111,7 +123,8 @@ async def test__get_ctx_target_when_parent_channel_when_async_cache_returns_none
 ):
     mock_context = mock.Mock(tanjun.context.BaseContext)
     mock_context.get_channel.return_value = None
-    mock_context.fetch_channel = mock.AsyncMock(return_value=channel)
+    mock_context.rest.fetch_channel = mock.AsyncMock(return_value=channel)
+    mock_context.memoise_fetch.side_effect = _memoise_fetch
     mock_cache = mock.AsyncMock()
     mock_cache.get.return_value = None
     mock_context.get_type_dependency.return_value = mock_cache
@@ -120,7 +133,7 @@ async def test__get_ctx_target_when_parent_channel_when_async_cache_returns_none
 
     assert result == result
     mock_context.get_channel.assert_called_once_with()
-    mock_context.fetch_channel.assert_awaited_once()
+    mock_context.rest.fetch_channel.assert_awaited_once_with(mock_context.channel_id)
     mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.GuildChannel])
     mock_cache.get.assert_awaited_once_with(mock_context.channel_id, default=None)
 
@@ -138,14 +151,15 @@ async def test__get_ctx_target_when_parent_channel_and_no_async_cache_falls_back
 ):
     mock_context = mock.Mock(tanjun.context.BaseContext)
     mock_context.get_channel.return_value = None
-    mock_context.fetch_channel = mock.AsyncMock(return_value=channel)
+    mock_context.rest.fetch_channel = mock.AsyncMock(return_value=channel)
+    mock_context.memoise_fetch.side_effect = _memoise_fetch
     mock_context.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
     result = await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.PARENT_CHANNEL)
 
     assert result == result
     mock_context.get_channel.assert_called_once_with()
-    mock_context.fetch_channel.assert_awaited_once()
+    mock_context.rest.fetch_channel.assert_awaited_once_with(mock_context.channel_id)
     mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.GuildChannel])
 
 
@@ -211,9 +225,10 @@ async def test__get_ctx_target_when_top_role_falls_back_to_rest_when_async_cache
         mock.Mock(id=4123, position=6959),
     ]
     mock_context = mock.Mock(tanjun.context.BaseContext)
-    mock_context.member.role_ids = [123, 312, 654]
+    mock_context.member.role_ids = [123321, 431, 111, 654]
     mock_context.member.get_roles = mock.Mock(return_value=[])
-    mock_context.member.fetch_roles = mock.AsyncMock(return_value=mock_roles)
+    mock_context.rest.fetch_roles = mock.AsyncMock(return_value=mock_roles)
+    mock_context.memoise_fetch.side_effect = _memoise_fetch
     mock_cache = mock.AsyncMock()
     mock_cache.get.side_effect = [mock.Mock(), tanjun.dependencies.CacheMissError]
     mock_context.get_type_dependency.return_value = mock_cache
@@ -221,9 +236,10 @@ async def test__get_ctx_target_when_top_role_falls_back_to_rest_when_async_cache
     assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 431
 
     mock_context.member.get_roles.assert_called_once_with()
-    mock_context.member.fetch_roles.assert_awaited_once_with()
+    mock_context.rest.fetch_roles.assert_awaited_once_with(mock_context.guild_id)
+    mock_context.memoise_fetch.assert_awaited_once_with((hikari.Role, mock_context.guild_id), mock.ANY)
     mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.Role])
-    mock_cache.get.assert_has_awaits([mock.call(123), mock.call(312)])
+    mock_cache.get.assert_has_awaits([mock.call(123321), mock.call(431)])
 
 
 @pytest.mark.asyncio()
@@ -236,15 +252,16 @@ async def test__get_ctx_target_when_top_role_falls_back_to_rest():
         mock.Mock(id=4123, position=6959),
     ]
     mock_context = mock.Mock(tanjun.context.BaseContext)
-    mock_context.member.role_ids = [123, 312]
+    mock_context.member.role_ids = [123322, 431, 4123]
     mock_context.member.get_roles = mock.Mock(return_value=[])
-    mock_context.member.fetch_roles = mock.AsyncMock(return_value=mock_roles)
+    mock_context.rest.fetch_roles = mock.AsyncMock(return_value=mock_roles)
+    mock_context.memoise_fetch.side_effect = _memoise_fetch
     mock_context.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
     assert await tanjun.dependencies.limiters._get_ctx_target(mock_context, tanjun.BucketResource.TOP_ROLE) == 431
 
     mock_context.member.get_roles.assert_called_once_with()
-    mock_context.member.fetch_roles.assert_awaited_once_with()
+    mock_context.rest.fetch_roles.assert_awaited_once_with(mock_context.guild_id)
     mock_context.get_type_dependency.assert_called_once_with(tanjun.dependencies.SfCache[hikari.Role])
 
 
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2022, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
+# This leads to too many false-positives around mocks.
+import asyncio
+from unittest import mock
+
+import pytest
+
+import tanjun
+from tanjun.dependencies import metrics
+
+
+class TestTimingHistogram:
+    def test_add(self):
+        histogram = tanjun.dependencies.TimingHistogram((0.1, 1.0))
+
+        histogram.add(0.05)
+        histogram.add(0.1)
+        histogram.add(0.5)
+        histogram.add(2.0)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.max == 2.0
+        assert histogram.total == pytest.approx(2.65)
+        assert histogram.mean == pytest.approx(0.6625)
+
+    def test_mean_when_empty(self):
+        assert tanjun.dependencies.TimingHistogram((0.1,)).mean == 0.0
+
+    @pytest.mark.parametrize(("quantile", "expected"), [(0.0, 0.1), (0.5, 0.1), (0.75, 1.0), (1.0, 3.0)])
+    def test_quantile(self, quantile: float, expected: float):
+        histogram = tanjun.dependencies.TimingHistogram((0.1, 1.0))
+        histogram.add(0.01)
+        histogram.add(0.02)
+        histogram.add(0.5)
+        histogram.add(3.0)
+
+        assert histogram.quantile(quantile) == expected
+
+    def test_quantile_when_empty(self):
+        assert tanjun.dependencies.TimingHistogram((0.1,)).quantile(0.5) == 0.0
+
+
+class TestInMemoryTimingCollector:
+    def test_record(self):
+        collector = tanjun.dependencies.InMemoryTimingCollector(bounds=(1.0, 0.1))
+
+        collector.record(tanjun.dependencies.DispatchStage.CALLBACK, 0.2, name="meow")
+        collector.record(tanjun.dependencies.DispatchStage.CALLBACK, 0.05, name="meow")
+        collector.record(tanjun.dependencies.DispatchStage.ROUTING, 0.05)
+
+        histogram = collector.get_histogram(tanjun.dependencies.DispatchStage.CALLBACK, name="meow")
+        assert histogram
+        assert histogram.bounds == (0.1, 1.0)
+        assert histogram.counts == [1, 1, 0]
+        routing = collector.get_histogram(tanjun.dependencies.DispatchStage.ROUTING)
+        assert routing
+        assert routing.count == 1
+        assert collector.get_histogram(tanjun.dependencies.DispatchStage.CALLBACK) is None
+        assert set(collector.histograms) == {
+            (tanjun.dependencies.DispatchStage.CALLBACK, "meow"),
+            (tanjun.dependencies.DispatchStage.ROUTING, None),
+        }
+
+    def test_clear(self):
+        collector = tanjun.dependencies.InMemoryTimingCollector()
+        collector.record(tanjun.dependencies.DispatchStage.PARSE, 0.2)
+
+        collector.clear()
+
+        assert collector.histograms == {}
+
+
+def test_set_active_collector():
+    collector = mock.Mock()
+
+    async def run() -> None:
+        assert metrics.get_active_collector() is None
+        token = metrics.set_active_collector(collector)
+        assert metrics.get_active_collector() is collector
+        metrics.reset_active_collector(token)
+        assert metrics.get_active_collector() is None
+        metrics.set_active_collector(collector)
+
+    asyncio.run(run())
+
+    assert metrics.get_active_collector() is None
+
+
+def test_reset_active_collector_restores_previous_collector():
+    outer = mock.Mock()
+    inner = mock.Mock()
+
+    async def run() -> None:
+        outer_token = metrics.set_active_collector(outer)
+        inner_token = metrics.set_active_collector(inner)
+
+        metrics.reset_active_collector(inner_token)
+
+        assert metrics.get_active_collector() is outer
+        metrics.reset_active_collector(outer_token)
+        assert metrics.get_active_collector() is None
+
+    asyncio.run(run())
+
+
+@pytest.mark.asyncio()
+async def test_timed():
+    collector = mock.Mock()
+    mock_coro = mock.AsyncMock(return_value="nyaa")()
+
+    result = await metrics.timed(collector, tanjun.dependencies.DispatchStage.CALLBACK, mock_coro, name="echo")
+
+    assert result == "nyaa"
+    collector.record.assert_called_once_with(tanjun.dependencies.DispatchStage.CALLBACK, mock.ANY, name="echo")
+    assert collector.record.call_args.args[1] >= 0
+
+
+@pytest.mark.asyncio()
+async def test_timed_when_raises():
+    collector = mock.Mock()
+    error = ValueError()
+
+    with pytest.raises(ValueError) as exc_info:
+        await metrics.timed(collector, tanjun.dependencies.DispatchStage.PARSE, mock.AsyncMock(side_effect=error)())
+
+    assert exc_info.value is error
+    collector.record.assert_called_once_with(tanjun.dependencies.DispatchStage.PARSE, mock.ANY, name=None)
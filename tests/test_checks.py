@@ -34,6 +34,7 @@
 # This leads to too many false-positives around mocks.
 
 import typing
+from collections import abc as collections
 from unittest import mock
 
 import hikari
@@ -42,6 +43,12 @@ import pytest
 import tanjun
 
 
+async def _memoise_fetch(
+    _: typing.Any, callback: collections.Callable[[], collections.Awaitable[typing.Any]], /
+) -> typing.Any:
+    return await callback()
+
+
 @pytest.fixture()
 def command() -> tanjun.abc.ExecutableCommand[typing.Any]:
     command_ = mock.MagicMock(tanjun.abc.ExecutableCommand)
@@ -167,6 +174,7 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_async_cache_raises_not_found(self):
         mock_context = mock.Mock(cache=None, rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_cache = mock.AsyncMock()
         mock_cache.get.side_effect = tanjun.dependencies.EntryNotFound
         check = tanjun.checks.NsfwCheck(error_message=None, halt_execution=False)
@@ -180,8 +188,9 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_cache_bound_and_async_cache_hit(self):
         mock_context = mock.Mock(cache=None, rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_cache = mock.AsyncMock()
-        mock_cache.get.return_value.is_nsfw = True
+        mock_cache.get.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         check = tanjun.checks.NsfwCheck(error_message=None, halt_execution=False)
 
         result = await check(mock_context, channel_cache=mock_cache)
@@ -193,9 +202,10 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_found_in_cache_and_async_cache_hit(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_cache = mock.AsyncMock()
-        mock_cache.get.return_value.is_nsfw = None
+        mock_cache.get.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=None)
         check = tanjun.checks.NsfwCheck(error_message=None, halt_execution=False)
 
         result = await check(mock_context, channel_cache=mock_cache)
@@ -208,6 +218,7 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_cache_bound(self):
         mock_context = mock.Mock(cache=None, rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         check = tanjun.checks.NsfwCheck(error_message=None, halt_execution=False)
 
@@ -219,6 +230,7 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_found_in_cache(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         mock_cache = mock.AsyncMock()
@@ -262,6 +274,7 @@ class TestNsfwCheck:
     @pytest.mark.asyncio()
     async def test_when_false_and_halt_execution(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=False)
         mock_cache = mock.AsyncMock()
@@ -307,8 +320,9 @@ class TestSfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_cache_bound_and_async_cache_hit(self):
         mock_context = mock.Mock(cache=None, rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_cache = mock.AsyncMock()
-        mock_cache.get.return_value.is_nsfw = False
+        mock_cache.get.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=False)
         check = tanjun.checks.SfwCheck(error_message=None, halt_execution=False)
 
         result = await check(mock_context, channel_cache=mock_cache)
@@ -320,9 +334,10 @@ class TestSfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_found_in_cache_and_async_cache_hit(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_cache = mock.AsyncMock()
-        mock_cache.get.return_value.is_nsfw = None
+        mock_cache.get.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=None)
         check = tanjun.checks.SfwCheck(error_message=None, halt_execution=False)
 
         result = await check(mock_context, channel_cache=mock_cache)
@@ -335,6 +350,7 @@ class TestSfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_cache_bound(self):
         mock_context = mock.Mock(cache=None, rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         check = tanjun.checks.SfwCheck(error_message=None, halt_execution=False)
 
@@ -346,6 +362,7 @@ class TestSfwCheck:
     @pytest.mark.asyncio()
     async def test_when_not_found_in_cache(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         mock_cache = mock.AsyncMock()
@@ -389,6 +406,7 @@ class TestSfwCheck:
     @pytest.mark.asyncio()
     async def test_when_is_nsfw_and_halt_execution(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel, is_nsfw=True)
         mock_cache = mock.AsyncMock()
@@ -38,10 +38,16 @@ import asyncio
 # This leads to too many false-positives around mocks.
 import base64
 import importlib
+import inspect
+import json
+import os
 import pathlib
 import random
 import tempfile
 import textwrap
+import threading
+import time
+import types
 import typing
 from collections import abc as collections
 from unittest import mock
@@ -129,6 +135,20 @@ class Test_LoaderDescriptor:
         assert result is False
         mock_callback.assert_not_called()
 
+    def test_registers_with_module(self):
+        namespace: dict[str, typing.Any] = {"tanjun": tanjun}
+
+        exec("@tanjun.as_loader\ndef load(client): ...\n@tanjun.as_unloader\ndef unload(client): ...", namespace)
+
+        assert namespace["__tanjun_loaders__"] == [namespace["load"], namespace["unload"]]
+
+    def test_doesnt_register_when_not_made_at_module_level(self):
+        namespace: dict[str, typing.Any] = {"tanjun": tanjun}
+
+        exec("def make():\n    return tanjun.as_loader(lambda client: None)\nloader = make()", namespace)
+
+        assert "__tanjun_loaders__" not in namespace
+
 
 class Test_UnloaderDescriptor:
     def test_has_load_property(self):
@@ -194,6 +214,373 @@ class Test_UnloaderDescriptor:
         mock_callback.assert_called_once_with(mock_client)
 
 
+class Test_PrefixTrie:
+    def test_longest_match(self):
+        trie = tanjun.clients._PrefixTrie()
+        trie.add("!")
+        trie.add("!!")
+        trie.add("bot ")
+
+        assert trie.longest_match("!!help") == "!!"
+        assert trie.longest_match("!help") == "!"
+        assert trie.longest_match("bot help") == "bot "
+        assert trie.longest_match("bo help") is None
+
+    def test_longest_match_with_extra(self):
+        trie = tanjun.clients._PrefixTrie()
+        trie.add("!")
+
+        assert trie.longest_match("!?help", extra=["!?", "?"]) == "!?"
+        assert trie.longest_match("!help", extra=["!?", "?"]) == "!"
+        assert trie.longest_match("?help", extra=["!?", "?"]) == "?"
+
+    def test_longest_match_with_empty_prefix(self):
+        trie = tanjun.clients._PrefixTrie()
+        trie.add("")
+        trie.add("!")
+
+        assert trie.has_empty_prefix is True
+        assert trie.longest_match("!help") == "!"
+        assert trie.longest_match("help") == ""
+
+    def test_remove(self):
+        trie = tanjun.clients._PrefixTrie()
+        trie.add("!")
+        trie.add("!ab")
+
+        trie.remove("!ab")
+
+        assert trie.longest_match("!abc") == "!"
+        assert list(trie.first_characters) == ["!"]
+
+        trie.remove("!")
+
+        assert trie.longest_match("!abc") is None
+        assert not trie.first_characters
+
+    def test_remove_when_not_present(self):
+        trie = tanjun.clients._PrefixTrie()
+        trie.add("!ab")
+
+        with pytest.raises(KeyError):
+            trie.remove("!a")
+
+        assert trie.longest_match("!ab") == "!ab"
+
+
+class Test_MessageCommandIndex:
+    def test_find(self):
+        command_1 = tanjun.MessageCommand(mock.AsyncMock(), "foo", "foo bar")
+        command_2 = tanjun.MessageCommand(mock.AsyncMock(), "foo bar baz")
+        command_3 = tanjun.MessageCommand(mock.AsyncMock(), "food")
+        command_4 = tanjun.MessageCommand(mock.AsyncMock(), "foo")
+        component_1 = tanjun.Component().add_command(command_1).add_command(command_2).add_command(command_3)
+        component_2 = tanjun.Component(strict=True).add_command(command_4)
+        index = tanjun.clients._MessageCommandIndex([component_1, component_2])
+
+        result = list(index.find("foo bar baz bag"))
+
+        assert result == [
+            (component_1, [("foo", command_1), ("foo bar baz", command_2)]),
+            (component_2, [("foo", command_4)]),
+        ]
+
+    def test_find_when_name_with_space_doesnt_match(self):
+        command = tanjun.MessageCommand(mock.AsyncMock(), "foo bar")
+        component = tanjun.Component().add_command(command)
+        index = tanjun.clients._MessageCommandIndex([component])
+
+        assert list(index.find("foo barr")) == []
+        assert list(index.find("foo bar")) == [(component, [("foo bar", command)])]
+
+    def test_find_keeps_custom_components_in_order(self):
+        command_1 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        command_2 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        component_1 = tanjun.Component().add_command(command_1)
+        component_2 = mock.Mock()
+        component_3 = tanjun.Component().add_command(command_2)
+        component_4 = mock.Mock()
+        index = tanjun.clients._MessageCommandIndex([component_1, component_2, component_3, component_4])
+
+        result = list(index.find("meow"))
+
+        assert result == [
+            (component_1, [("meow", command_1)]),
+            (component_2, None),
+            (component_3, [("meow", command_2)]),
+            (component_4, None),
+        ]
+
+    def test_find_when_component_subclass_overrides_routing(self):
+        class CustomComponent(tanjun.Component):
+            def check_message_name(
+                self, content: str, /
+            ) -> collections.Iterator[tuple[str, tanjun.abc.MessageCommand[typing.Any]]]:
+                raise NotImplementedError
+
+        class OtherComponent(tanjun.Component):
+            async def execute_message(
+                self,
+                ctx: tanjun.abc.MessageContext,
+                /,
+                *,
+                hooks: typing.Optional[collections.Set[tanjun.abc.MessageHooks]] = None,
+            ) -> bool:
+                raise NotImplementedError
+
+        class SubComponent(tanjun.Component):
+            ...
+
+        command_1 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        command_2 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        command_3 = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        component_1 = CustomComponent().add_command(command_1)
+        component_2 = OtherComponent().add_command(command_2)
+        component_3 = SubComponent().add_command(command_3)
+        index = tanjun.clients._MessageCommandIndex([component_1, component_2, component_3])
+
+        result = list(index.find("meow"))
+
+        assert result == [(component_1, None), (component_2, None), (component_3, [("meow", command_3)])]
+
+
+class Test_SlashCommandIndex:
+    def test_find(self):
+        command_1 = tanjun.SlashCommand(mock.AsyncMock(), "foo", "description")
+        sub_command = tanjun.SlashCommand(mock.AsyncMock(), "sub", "description")
+        sub_group = tanjun.SlashCommandGroup("group", "description").add_command(sub_command)
+        group = tanjun.SlashCommandGroup("top", "description").add_command(sub_group)
+        component_1 = tanjun.Component().add_command(command_1)
+        component_2 = tanjun.Component().add_command(group)
+        index = tanjun.clients._SlashCommandIndex([component_1, component_2])
+        mock_option = mock.Mock(type=hikari.OptionType.SUB_COMMAND, options=[])
+        mock_option.name = "sub"
+        mock_group_option = mock.Mock(type=hikari.OptionType.SUB_COMMAND_GROUP, options=[mock_option])
+        mock_group_option.name = "group"
+        mock_interaction = mock.Mock(command_name="top", options=[mock_group_option])
+
+        result = list(index.find(mock_interaction))
+
+        assert result == [(component_2, (group, sub_group, sub_command), mock_option)]
+
+    def test_find_for_top_level_command(self):
+        command = tanjun.SlashCommand(mock.AsyncMock(), "foo", "description")
+        component = tanjun.Component().add_command(command)
+        index = tanjun.clients._SlashCommandIndex([component])
+        mock_interaction = mock.Mock(command_name="foo", options=[mock.Mock(type=hikari.OptionType.STRING)])
+
+        result = list(index.find(mock_interaction))
+
+        assert result == [(component, (command,), None)]
+
+    def test_find_keeps_custom_components_in_order(self):
+        command_1 = tanjun.SlashCommand(mock.AsyncMock(), "meow", "description")
+        command_2 = tanjun.SlashCommand(mock.AsyncMock(), "meow", "description")
+        component_1 = mock.Mock()
+        component_2 = tanjun.Component().add_command(command_1)
+        component_3 = mock.Mock()
+        component_4 = tanjun.Component().add_command(command_2)
+        index = tanjun.clients._SlashCommandIndex([component_1, component_2, component_3, component_4])
+
+        result = list(index.find(mock.Mock(command_name="meow", options=None)))
+
+        assert result == [
+            (component_1, None, None),
+            (component_2, (command_1,), None),
+            (component_3, None, None),
+            (component_4, (command_2,), None),
+        ]
+
+    def test_find_when_component_subclass_overrides_routing(self):
+        class CustomComponent(tanjun.Component):
+            def execute_interaction(
+                self,
+                ctx: tanjun.abc.SlashContext,
+                /,
+                *,
+                hooks: typing.Optional[collections.Set[tanjun.abc.SlashHooks]] = None,
+            ) -> collections.Coroutine[typing.Any, typing.Any, typing.Optional[collections.Awaitable[None]]]:
+                raise NotImplementedError
+
+        command = tanjun.SlashCommand(mock.AsyncMock(), "meow", "description")
+        component = CustomComponent().add_command(command)
+        index = tanjun.clients._SlashCommandIndex([component])
+
+        result = list(index.find(mock.Mock(command_name="meow", options=None)))
+
+        assert result == [(component, None, None)]
+
+    def test_find_when_group_overrides_execute(self):
+        class CustomGroup(tanjun.SlashCommandGroup):
+            async def execute(
+                self,
+                ctx: tanjun.abc.SlashContext,
+                /,
+                option: typing.Optional[hikari.CommandInteractionOption] = None,
+                *,
+                hooks: typing.Optional[collections.Set[tanjun.abc.SlashHooks]] = None,
+            ) -> None:
+                raise NotImplementedError
+
+        sub_command = tanjun.SlashCommand(mock.AsyncMock(), "sub", "description")
+        custom_group = CustomGroup("group", "description").add_command(sub_command)
+        group = tanjun.SlashCommandGroup("top", "description").add_command(custom_group)
+        other_command = tanjun.SlashCommand(mock.AsyncMock(), "top", "description")
+        component_1 = tanjun.Component().add_command(group)
+        component_2 = tanjun.Component().add_command(other_command)
+        index = tanjun.clients._SlashCommandIndex([component_1, component_2])
+        mock_option = mock.Mock(type=hikari.OptionType.SUB_COMMAND, options=[])
+        mock_option.name = "sub"
+        mock_group_option = mock.Mock(type=hikari.OptionType.SUB_COMMAND_GROUP, options=[mock_option])
+        mock_group_option.name = "group"
+
+        result = list(index.find(mock.Mock(command_name="top", options=[mock_group_option])))
+
+        assert result == [(component_1, None, mock_option)]
+        assert list(index.find(mock.Mock(command_name="top", options=None))) == [
+            (component_1, None, None),
+            (component_2, (other_command,), None),
+        ]
+
+    def test_find_casefolds_top_level_names(self):
+        mock_command = mock.Mock(tanjun.abc.SlashCommand)
+        mock_command.name = "Meow"
+        component = tanjun.Component().add_slash_command(mock_command)
+        index = tanjun.clients._SlashCommandIndex([component])
+
+        result = list(index.find(mock.Mock(command_name="meow", options=None)))
+
+        assert result == [(component, (mock_command,), None)]
+
+    def test_find_when_only_custom_components_doesnt_inspect_interaction(self):
+        component = mock.Mock()
+        index = tanjun.clients._SlashCommandIndex([component])
+        mock_interaction = mock.Mock(hikari.CommandInteraction)
+
+        assert list(index.find(mock_interaction)) == [(component, None, None)]
+
+
+class Test_AdmissionController:
+    @pytest.mark.asyncio()
+    async def test_acquire(self):
+        controller = tanjun.clients._AdmissionController(2, 0, tanjun.ShedPolicyEnum.DROP_NEWEST, "")
+
+        assert await controller.acquire() is True
+        assert await controller.acquire() is True
+        assert await controller.acquire() is False
+
+    @pytest.mark.asyncio()
+    async def test_release_hands_slot_to_waiter(self):
+        controller = tanjun.clients._AdmissionController(1, 1, tanjun.ShedPolicyEnum.DROP_NEWEST, "")
+        assert await controller.acquire() is True
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert await controller.acquire() is False
+        controller.release()
+
+        assert await waiter is True
+        controller.release()
+        assert await controller.acquire() is True
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_drop_oldest(self):
+        controller = tanjun.clients._AdmissionController(1, 1, tanjun.ShedPolicyEnum.DROP_OLDEST, "")
+        assert await controller.acquire() is True
+
+        oldest = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        newest = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        controller.release()
+
+        assert await oldest is False
+        assert await newest is True
+
+    @pytest.mark.asyncio()
+    async def test_acquire_when_cancelled(self):
+        controller = tanjun.clients._AdmissionController(1, 1, tanjun.ShedPolicyEnum.DROP_NEWEST, "")
+        assert await controller.acquire() is True
+
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        controller.release()
+        assert await controller.acquire() is True
+
+
+class Test_FairScheduler:
+    @pytest.mark.asyncio()
+    async def test_acquire_serves_guilds_in_turn(self):
+        scheduler = tanjun.clients._FairScheduler(1, 1)
+        order: list[str] = []
+        await scheduler.acquire((hikari.Snowflake(1), None))
+
+        async def wait(key: tanjun.clients._FairKey, name: str) -> None:
+            await scheduler.acquire(key)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 1")),
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 2")),
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 3")),
+            asyncio.create_task(wait((hikari.Snowflake(2), None), "quiet")),
+            asyncio.create_task(wait((None, hikari.Snowflake(3)), "dm")),
+        ]
+        await asyncio.sleep(0)
+
+        for _ in tasks:
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks)
+        assert order == ["busy 1", "quiet", "dm", "busy 2", "busy 3"]
+
+    @pytest.mark.asyncio()
+    async def test_acquire_with_quantum(self):
+        scheduler = tanjun.clients._FairScheduler(1, 2)
+        order: list[str] = []
+        await scheduler.acquire((hikari.Snowflake(1), None))
+
+        async def wait(key: tanjun.clients._FairKey, name: str) -> None:
+            await scheduler.acquire(key)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 1")),
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 2")),
+            asyncio.create_task(wait((hikari.Snowflake(1), None), "busy 3")),
+            asyncio.create_task(wait((hikari.Snowflake(2), None), "quiet")),
+        ]
+        await asyncio.sleep(0)
+
+        for _ in tasks:
+            scheduler.release()
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks)
+        assert order == ["busy 1", "busy 2", "quiet", "busy 3"]
+
+    @pytest.mark.asyncio()
+    async def test_release_skips_cancelled_waiters(self):
+        scheduler = tanjun.clients._FairScheduler(1, 1)
+        await scheduler.acquire((hikari.Snowflake(1), None))
+        cancelled = asyncio.create_task(scheduler.acquire((hikari.Snowflake(1), None)))
+        waiter = asyncio.create_task(scheduler.acquire((hikari.Snowflake(2), None)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        scheduler.release()
+
+        await waiter
+        scheduler.release()
+        await asyncio.wait_for(scheduler.acquire((hikari.Snowflake(1), None)), timeout=1)
+
+
 class TestClient:
     @pytest.mark.skip(reason="TODO")
     def test___init__(self):
@@ -495,6 +882,163 @@ class TestClient:
     async def test_declare_application_commands(self):
         ...
 
+    @pytest.mark.parametrize("force", [False, True])
+    @pytest.mark.asyncio()
+    async def test_declare_application_commands_when_stored_declaration_matches(
+        self, tmp_path: pathlib.Path, force: bool
+    ):
+        entity_factory = hikari.impl.EntityFactoryImpl(mock.Mock())
+        rest = mock.AsyncMock(entity_factory=entity_factory)
+        rest.fetch_application_commands.return_value = []
+        rest.set_application_commands.return_value = [
+            entity_factory.deserialize_command(
+                {
+                    "id": "123",
+                    "application_id": "321",
+                    "name": "meow",
+                    "description": "nyaa",
+                    "version": "456",
+                    "guild_id": None,
+                }
+            )
+        ]
+        path = tmp_path / "commands.json"
+        await (
+            tanjun.Client(rest)
+            .set_declaration_store(tanjun.dependencies.FileDeclarationStore(path))
+            .declare_application_commands([tanjun.SlashCommand(mock.AsyncMock(), "meow", "nyaa")], application=321)
+        )
+        rest.reset_mock()
+        command = tanjun.SlashCommand(mock.AsyncMock(), "meow", "nyaa")
+        client = tanjun.Client(rest).set_declaration_store(tanjun.dependencies.FileDeclarationStore(path))
+
+        result = await client.declare_application_commands([command], application=321, force=force)
+
+        rest.fetch_application_commands.assert_not_called()
+        rest.set_application_commands.assert_not_called()
+        assert len(result) == 1
+        assert result[0].id == 123
+        assert result[0].application_id == 321
+        assert result[0].version == 456
+        assert result[0].name == "meow"
+        assert result[0].description == "nyaa"
+        assert result[0].guild_id is None
+        assert command.tracked_command_id == 123
+
+    @pytest.mark.asyncio()
+    async def test_declare_application_commands_when_stored_declaration_changed(self, tmp_path: pathlib.Path):
+        entity_factory = hikari.impl.EntityFactoryImpl(mock.Mock())
+        rest = mock.AsyncMock(entity_factory=entity_factory)
+        rest.fetch_application_commands.return_value = []
+        rest.set_application_commands.return_value = []
+        store = tanjun.dependencies.FileDeclarationStore(tmp_path / "commands.json")
+        await (
+            tanjun.Client(rest)
+            .set_declaration_store(store)
+            .declare_application_commands(
+                [tanjun.SlashCommand(mock.AsyncMock(), "meow", "nyaa")], application=321, guild=654
+            )
+        )
+        rest.reset_mock()
+        client = tanjun.Client(rest).set_declaration_store(store)
+
+        await client.declare_application_commands(
+            [tanjun.SlashCommand(mock.AsyncMock(), "meow", "echo")], application=321, guild=654
+        )
+
+        rest.fetch_application_commands.assert_awaited_once_with(321, guild=654)
+        rest.set_application_commands.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_declare_guild_commands(self):
+        mock_command_1 = mock.Mock()
+        mock_command_1.name = "meow"
+        mock_command_2 = mock.Mock()
+        mock_command_2.name = "nyaa"
+        rest = mock.AsyncMock()
+        rest.fetch_application_commands.return_value = []
+        mock_response_1 = [mock.Mock()]
+        mock_response_2: list[typing.Any] = []
+        error = hikari.ForbiddenError(url="", headers={}, raw_body=b"")
+        rest.set_application_commands.side_effect = [mock_response_1, error, mock_response_2]
+        client = tanjun.Client(rest)
+
+        result = await client.declare_guild_commands(
+            {123: [mock_command_1], 456: [mock_command_1, mock_command_2], 789: []}, application=321, force=True
+        )
+
+        assert result == {123: mock_response_1, 456: error, 789: mock_response_2}
+        mock_command_1.build.assert_called_once_with()
+        mock_command_2.build.assert_called_once_with()
+        rest.fetch_application_commands.assert_not_called()
+        rest.set_application_commands.assert_has_awaits(
+            [
+                mock.call(321, [mock_command_1.build.return_value], guild=123),
+                mock.call(321, [mock_command_1.build.return_value, mock_command_2.build.return_value], guild=456),
+                mock.call(321, [], guild=789),
+            ]
+        )
+
+    @pytest.mark.asyncio()
+    async def test_declare_guild_commands_stores_records_once(self):
+        entity_factory = hikari.impl.EntityFactoryImpl(mock.Mock())
+        rest = mock.AsyncMock(entity_factory=entity_factory)
+        rest.set_application_commands.return_value = []
+        store = mock.AsyncMock(tanjun.dependencies.AbstractDeclarationStore)
+        store.get_record.return_value = None
+        client = tanjun.Client(rest).set_declaration_store(store)
+
+        await client.declare_guild_commands({123: [], 456: []}, application=321, force=True)
+
+        store.set_record.assert_not_called()
+        store.set_records.assert_awaited_once()
+        records = sorted(store.set_records.call_args.args[0], key=lambda entry: entry[1])
+        assert [(application_id, guild_id) for application_id, guild_id, _ in records] == [(321, 123), (321, 456)]
+        assert all(record.commands == {} for _, _, record in records)
+
+    @pytest.mark.asyncio()
+    async def test_declare_guild_commands_limits_concurrency(self):
+        running = 0
+        max_running = 0
+
+        async def set_application_commands(*args: typing.Any, **kwargs: typing.Any) -> list[typing.Any]:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            await asyncio.sleep(0)
+            running -= 1
+            return []
+
+        rest = mock.AsyncMock()
+        rest.set_application_commands = set_application_commands
+        client = tanjun.Client(rest)
+
+        result = await client.declare_guild_commands(
+            {guild_id: [] for guild_id in range(10)}, application=321, force=True, max_concurrency=3
+        )
+
+        assert result == {guild_id: [] for guild_id in range(10)}
+        assert max_running == 3
+
+    @pytest.mark.asyncio()
+    async def test_declare_guild_commands_when_conflicting_commands(self):
+        mock_command_1 = mock.Mock()
+        mock_command_1.name = "meow"
+        mock_command_2 = mock.Mock()
+        mock_command_2.name = "meow"
+        rest = mock.AsyncMock()
+        client = tanjun.Client(rest)
+
+        with pytest.raises(ValueError, match="Couldn't declare commands due to conflicts"):
+            await client.declare_guild_commands({123: [], 456: [mock_command_1, mock_command_2]}, application=321)
+
+        rest.set_application_commands.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_declare_guild_commands_when_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency must be greater than or equal to 1"):
+            await tanjun.Client(mock.AsyncMock()).declare_guild_commands({}, max_concurrency=0)
+
     @pytest.mark.skip(reason="TODO")
     def test_set_hikari_trait_injectors(self):
         ...
@@ -912,6 +1456,28 @@ class TestClient:
         with pytest.raises(ValueError, match=".+"):
             client.remove_prefix("lmao")
 
+    def test_remove_prefix_removes_from_trie(self):
+        client = tanjun.Client(mock.Mock()).add_prefix(["!", "!!"])
+
+        client.remove_prefix("!!")
+
+        assert client._prefix_trie.longest_match("!!help") == "!"
+
+    @pytest.mark.asyncio()
+    async def test__check_prefix_uses_longest_match(self):
+        client = tanjun.Client(mock.Mock()).add_prefix(["!", "!!"])
+        mock_ctx = mock.Mock(content="!!help")
+
+        assert await client._check_prefix(mock_ctx) == "!!"
+
+    @pytest.mark.asyncio()
+    async def test__check_prefix_merges_prefix_getter_results(self):
+        prefix_getter = mock.AsyncMock(return_value=["!!!", "?"])
+        client = tanjun.Client(mock.Mock()).add_prefix(["!", "!!"]).set_prefix_getter(prefix_getter)
+        mock_ctx = mock.Mock(content="!!!help")
+
+        assert await client._check_prefix(mock_ctx) == "!!!"
+
     def test_set_prefix_getter(self):
         mock_getter = mock.Mock()
         client = tanjun.Client(mock.Mock())
@@ -1028,6 +1594,28 @@ class TestClient:
     def test_check_message_name(self):
         ...
 
+    def test_check_message_name_uses_index(self):
+        command_1 = tanjun.MessageCommand(mock.AsyncMock(), "yeet")
+        command_2 = tanjun.MessageCommand(mock.AsyncMock(), "yeet", "yeeting")
+        mock_command = mock.Mock()
+        mock_component = mock.Mock(check_message_name=mock.Mock(side_effect=lambda _: iter([("yeet", mock_command)])))
+        mock_component.name = "mock"
+        last_component = tanjun.Component()
+        client = (
+            tanjun.Client(mock.Mock())
+            .add_component(tanjun.Component().add_command(command_1))
+            .add_component(mock_component)
+            .add_component(last_component)
+        )
+        assert list(client.check_message_name("yeet meow")) == [("yeet", command_1), ("yeet", mock_command)]
+        # This should invalidate the client's cached index.
+        last_component.add_command(command_2)
+
+        result = list(client.check_message_name("yeet meow"))
+
+        assert result == [("yeet", command_1), ("yeet", mock_command), ("yeet", command_2)]
+        mock_component.check_message_name.assert_called_with("yeet meow")
+
     @pytest.mark.skip(reason="TODO")
     def test_check_slash_name(self):
         ...
@@ -1055,6 +1643,8 @@ class TestClient:
 
         assert result is client
         assert client.hooks is mock_hooks
+        assert client._message_hook_chain == frozenset([mock_hooks])
+        assert client._slash_hook_chain == frozenset([mock_hooks])
 
     def test_set_hooks_when_none(self):
         client = tanjun.Client(mock.Mock()).set_hooks(mock.Mock())
@@ -1072,6 +1662,215 @@ class TestClient:
         assert result is client
         assert client.defaults_to_ephemeral is True
 
+    def test_set_fair_scheduling(self):
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_fair_scheduling(10, quantum=2)
+
+        assert result is client
+        assert client._fair_scheduler is not None
+
+    def test_set_fair_scheduling_when_none(self):
+        client = tanjun.Client(mock.Mock()).set_fair_scheduling(10)
+
+        result = client.set_fair_scheduling(None)
+
+        assert result is client
+        assert client._fair_scheduler is None
+
+    @pytest.mark.parametrize(("limit", "quantum"), [(0, 1), (1, 0)])
+    def test_set_fair_scheduling_when_invalid(self, limit: int, quantum: int):
+        with pytest.raises(ValueError, match="must be greater than or equal to 1"):
+            tanjun.Client(mock.Mock()).set_fair_scheduling(limit, quantum=quantum)
+
+    def test_set_declaration_store(self):
+        store = mock.Mock()
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_declaration_store(store)
+
+        assert result is client
+        assert client._declaration_store is store
+
+    def test_set_timing_collector(self):
+        collector = tanjun.dependencies.InMemoryTimingCollector()
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_timing_collector(collector)
+
+        assert result is client
+        assert client._timing_collector is collector
+        assert client.get_type_dependency(tanjun.dependencies.AbstractTimingCollector) is collector
+
+    def test_set_timing_collector_when_none(self):
+        client = tanjun.Client(mock.Mock()).set_timing_collector(tanjun.dependencies.InMemoryTimingCollector())
+
+        result = client.set_timing_collector(None)
+
+        assert result is client
+        assert client._timing_collector is None
+
+    def test_set_hot_reload(self):
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_hot_reload(2.5, debounce=1)
+
+        assert result is client
+        assert client._module_watcher is not None
+        assert client._module_watcher._interval == 2.5
+        assert client._module_watcher._debounce == 1.0
+        assert client._module_watcher._task is None
+
+    def test_set_hot_reload_when_none(self):
+        client = tanjun.Client(mock.Mock()).set_hot_reload(2.5)
+
+        result = client.set_hot_reload(None)
+
+        assert result is client
+        assert client._module_watcher is None
+
+    @pytest.mark.asyncio()
+    async def test_set_hot_reload_reloads_changed_modules(self, tmp_path: pathlib.Path):
+        module_path = tmp_path / "hot_module.py"
+        other_path = tmp_path / "cold_module.py"
+        template = textwrap.dedent(
+            """
+            import tanjun
+
+            @tanjun.as_loader
+            def load(client: tanjun.abc.Client) -> None:
+                client.metadata["{name}"] = {value}
+
+            @tanjun.as_unloader
+            def unload(client: tanjun.abc.Client) -> None:
+                del client.metadata["{name}"]
+            """
+        )
+        module_path.write_text(template.format(name="hot", value=1))
+        other_path.write_text(template.format(name="cold", value=1))
+        reloaded: asyncio.Queue[tuple[typing.Any, ...]] = asyncio.Queue()
+
+        async def on_reloaded(*args: typing.Any) -> None:
+            await reloaded.put(args)
+
+        client = (
+            tanjun.Client(mock.AsyncMock())
+            .load_modules(module_path, other_path)
+            .set_hot_reload(0.01, debounce=0.05)
+            .add_client_callback(tanjun.ClientCallbackNames.MODULES_RELOADED, on_reloaded)
+        )
+        await client.open(register_listeners=False)
+        try:
+            # Let the watcher record the initial modification times.
+            await asyncio.sleep(0.05)
+            module_path.write_text(template.format(name="hot", value=2))
+            stat = module_path.stat()
+            os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            durations, failures, latency = await asyncio.wait_for(reloaded.get(), timeout=5)
+
+        finally:
+            await client.close(deregister_listeners=False)
+
+        assert list(durations) == [module_path.absolute()]
+        assert failures == {}
+        assert latency >= durations[module_path.absolute()]
+        assert client.metadata == {"hot": 2, "cold": 1}
+        assert client._module_watcher
+        assert client._module_watcher._task is None
+
+    @pytest.mark.asyncio()
+    async def test_set_hot_reload_when_reload_fails(self, tmp_path: pathlib.Path):
+        module_path = tmp_path / "broken_module.py"
+        module_path.write_text(
+            textwrap.dedent(
+                """
+                import tanjun
+
+                load = tanjun.as_loader(lambda client: client.metadata.__setitem__("loaded", True))
+                unload = tanjun.as_unloader(lambda client: client.metadata.pop("loaded"))
+                """
+            )
+        )
+        reloaded: asyncio.Queue[tuple[typing.Any, ...]] = asyncio.Queue()
+
+        async def on_reloaded(*args: typing.Any) -> None:
+            await reloaded.put(args)
+
+        client = (
+            tanjun.Client(mock.AsyncMock())
+            .load_modules(module_path)
+            .set_hot_reload(0.01, debounce=0.05)
+            .add_client_callback(tanjun.ClientCallbackNames.MODULES_RELOADED, on_reloaded)
+        )
+        await client.open(register_listeners=False)
+        try:
+            await asyncio.sleep(0.05)
+            module_path.write_text("import tanjun\n\nraise RuntimeError('nyaa')\n")
+            stat = module_path.stat()
+            os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            durations, failures, _ = await asyncio.wait_for(reloaded.get(), timeout=5)
+
+        finally:
+            await client.close(deregister_listeners=False)
+
+        assert durations == {}
+        assert list(failures) == [module_path.absolute()]
+        assert isinstance(failures[module_path.absolute()], tanjun.FailedModuleLoad)
+        assert client.metadata == {"loaded": True}
+
+    @pytest.mark.asyncio()
+    async def test_set_hot_reload_keeps_polling_after_errors(self):
+        polled = asyncio.Event()
+        calls = 0
+
+        async def poll(self: typing.Any, loop: asyncio.AbstractEventLoop, /) -> list[typing.Any]:
+            nonlocal calls
+            calls += 1
+            if calls <= 2:
+                raise RuntimeError("meow")
+
+            polled.set()
+            return []
+
+        client = tanjun.Client(mock.AsyncMock()).set_hot_reload(0.01)
+
+        with mock.patch.object(tanjun.clients._ModuleWatcher, "_poll", new=poll):
+            await client.open(register_listeners=False)
+            try:
+                await asyncio.wait_for(polled.wait(), timeout=5)
+                assert client._module_watcher
+                assert client._module_watcher._task
+                assert not client._module_watcher._task.done()
+
+            finally:
+                await client.close(deregister_listeners=False)
+
+        assert calls >= 3
+
+    def test_set_message_admission(self):
+        client = tanjun.Client(mock.Mock())
+
+        result = client.set_message_admission(5, queue_size=10, policy=tanjun.ShedPolicyEnum.REJECT)
+
+        assert result is client
+        assert client._message_admission is not None
+        assert client._message_admission.should_reject is True
+
+    def test_set_message_admission_when_none(self):
+        client = tanjun.Client(mock.Mock()).set_message_admission(5)
+
+        result = client.set_message_admission(None)
+
+        assert result is client
+        assert client._message_admission is None
+
+    @pytest.mark.parametrize(("limit", "queue_size"), [(0, 0), (1, -1)])
+    def test_set_interaction_admission_when_invalid(self, limit: int, queue_size: int):
+        with pytest.raises(ValueError, match="must be greater than or equal to"):
+            tanjun.Client(mock.Mock()).set_interaction_admission(limit, queue_size=queue_size)
+
     def test_set_slash_hooks(self):
         mock_hooks = mock.Mock()
         client = tanjun.Client(mock.Mock())
@@ -1080,6 +1879,7 @@ class TestClient:
 
         assert result is client
         assert client.slash_hooks is mock_hooks
+        assert client._slash_hook_chain == frozenset([client.hooks, mock_hooks])
 
     def test_set_slash_hooks_when_none(self):
         client = tanjun.Client(mock.Mock()).set_slash_hooks(mock.Mock())
@@ -1097,6 +1897,7 @@ class TestClient:
 
         assert result is client
         assert client.message_hooks is mock_hooks
+        assert client._message_hook_chain == frozenset([client.hooks, mock_hooks])
 
     def test_set_message_hooks_when_none(self):
         client = tanjun.Client(mock.Mock()).set_message_hooks(mock.Mock())
@@ -1175,6 +1976,66 @@ class TestClient:
         add_component_.assert_has_calls([mock.call(5533), mock.call(123)])
         add_client_callback_.assert_has_calls([mock.call(554444), mock.call(4312)])
 
+    def test__load_modules_with_system_path_uses_registered_public_loaders(self, file: typing.IO[str]):
+        add_component_ = mock.Mock()
+        add_client_callback_ = mock.Mock()
+
+        class MockClient(tanjun.Client):
+            add_component = add_component_
+
+            add_client_callback = add_client_callback_
+
+        client = MockClient(mock.AsyncMock())
+        file.write(
+            textwrap.dedent(
+                """
+                import tanjun
+
+                component = tanjun.Component(name="registered")
+                loader = component.make_loader(copy=False)
+                _loader = tanjun.Component(name="private").make_loader(copy=False)
+
+                @tanjun.as_loader
+                def local_load(client: tanjun.abc.Client) -> None:
+                    client.add_client_callback(4312)
+
+                @tanjun.as_loader
+                def _load_module(client: tanjun.abc.Client) -> None:
+                    assert False
+
+                def _make_shared() -> tanjun.abc.ClientLoader:
+                    # Not made at the top level so this acts like an imported loader, which
+                    # isn't used when the module has registered loaders.
+                    @tanjun.as_loader
+                    def shared_load(client: tanjun.abc.Client) -> None:
+                        client.add_client_callback(1234)
+
+                    return shared_load
+
+                shared_load = _make_shared()
+                also_loader = loader
+                """
+            )
+        )
+        file.flush()
+
+        generator = client._load_module(pathlib.Path(file.name))
+        module = next(generator)()
+        with mock.patch.object(inspect, "getmembers") as getmembers:
+            try:
+                generator.send(module)
+
+            except StopIteration:
+                pass
+
+            else:
+                pytest.fail("Expected StopIteration")
+
+        getmembers.assert_not_called()
+        assert len(module.__tanjun_loaders__) == 4
+        add_component_.assert_called_once_with(module.component)
+        add_client_callback_.assert_called_once_with(4312)
+
     def test__load_modules_with_system_path_respects_all(self, file: typing.IO[str]):
         add_component_ = mock.Mock()
         add_client_callback_ = mock.Mock()
@@ -1572,28 +2433,281 @@ class TestClient:
             ]
         )
 
-    @mock.patch.object(asyncio, "get_running_loop")
+    @mock.patch.object(asyncio, "get_running_loop")
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_module_import_raises(self, get_running_loop: mock.Mock):
+        mock_exception = ValueError("aye")
+        mock_gen = mock.Mock(__next__=mock.Mock())
+        get_running_loop.return_value.run_in_executor = mock.AsyncMock(side_effect=mock_exception)
+        mock__load_module = mock.Mock(return_value=mock_gen)
+
+        class StubClient(tanjun.Client):
+            _load_module = mock__load_module
+
+        client = StubClient(mock.AsyncMock())
+
+        with pytest.raises(tanjun.FailedModuleLoad) as exc_info:
+            await client.load_modules_async("ok.no.u")
+
+        assert exc_info.value.__cause__ is mock_exception
+
+        mock__load_module.assert_called_once_with("ok.no.u")
+        mock_gen.__next__.assert_called_once_with()
+        get_running_loop.return_value.run_in_executor.assert_called_once_with(None, mock_gen.__next__.return_value)
+        mock_gen.send.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_parallel(self):
+        calls: list[str] = []
+        fast_imported = threading.Event()
+        modules: dict[str, mock.Mock] = {}
+
+        def import_module(name: str) -> mock.Mock:
+            if name == "slow":
+                # This would time out if the modules were imported one at a time.
+                assert fast_imported.wait(timeout=5)
+
+            elif name == "fast":
+                fast_imported.set()
+
+            loader = mock.Mock(tanjun.abc.ClientLoader)
+            loader.load.side_effect = lambda _: calls.append(name) or True
+            module = modules[name] = mock.Mock(__all__=["loader"], loader=loader)
+            return module
+
+        client = tanjun.Client(mock.AsyncMock())
+
+        with mock.patch.object(importlib, "import_module", side_effect=import_module):
+            await client.load_modules_async("slow", "fast", "other", parallel=True, dependencies={"slow": ["other"]})
+
+        assert calls == ["other", "slow", "fast"]
+        assert client._modules == modules
+
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_parallel_imports_after_dependencies(self):
+        imported: list[str] = []
+
+        def import_module(name: str) -> mock.Mock:
+            if name == "first":
+                time.sleep(0.05)
+
+            imported.append(name)
+            return mock.Mock(__all__=["loader"], loader=mock.Mock(tanjun.abc.ClientLoader))
+
+        client = tanjun.Client(mock.AsyncMock())
+
+        with mock.patch.object(importlib, "import_module", side_effect=import_module):
+            await client.load_modules_async("second", "first", parallel=True, dependencies={"second": ["first"]})
+
+        assert imported == ["first", "second"]
+
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_parallel_import_raises(self):
+        mock_exception = ValueError("aye")
+        loaders = {"first": mock.Mock(tanjun.abc.ClientLoader), "last": mock.Mock(tanjun.abc.ClientLoader)}
+
+        def import_module(name: str) -> mock.Mock:
+            if name == "broken":
+                raise mock_exception
+
+            return mock.Mock(__all__=["loader"], loader=loaders[name])
+
+        client = tanjun.Client(mock.AsyncMock())
+
+        with mock.patch.object(importlib, "import_module", side_effect=import_module), pytest.raises(
+            tanjun.FailedModuleLoad
+        ) as exc_info:
+            await client.load_modules_async("first", "broken", "last", parallel=True)
+
+        assert exc_info.value.__cause__ is mock_exception
+        loaders["first"].load.assert_called_once_with(client)
+        loaders["last"].load.assert_not_called()
+        assert list(client._modules) == ["first"]
+
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_parallel_and_already_loaded(self):
+        client = tanjun.Client(mock.AsyncMock())
+        client._modules["loaded"] = mock.Mock()
+
+        with mock.patch.object(importlib, "import_module") as import_module, pytest.raises(tanjun.ModuleStateConflict):
+            await client.load_modules_async("other", "loaded", parallel=True)
+
+        import_module.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("dependencies", "message"),
+        [
+            ({"a": ["c"]}, "Dependency module c isn't being loaded"),
+            ({"a": ["b"], "b": ["a"]}, "Module a has a circular dependency"),
+        ],
+    )
+    @pytest.mark.asyncio()
+    async def test_load_modules_async_when_parallel_and_invalid_dependencies(
+        self, dependencies: dict[str, list[str]], message: str
+    ):
+        client = tanjun.Client(mock.AsyncMock())
+
+        with mock.patch.object(importlib, "import_module") as import_module, pytest.raises(ValueError, match=message):
+            await client.load_modules_async("a", "b", parallel=True, dependencies=dependencies)
+
+        import_module.assert_not_called()
+
+    def test_generate_module_manifest(self):
+        entity_factory = hikari.impl.EntityFactoryImpl(mock.Mock())
+        component = (
+            tanjun.Component()
+            .add_command(tanjun.MessageCommand(mock.AsyncMock(), "meow", "nyaa"))
+            .add_command(tanjun.SlashCommand(mock.AsyncMock(), "purr", "a cat noise"))
+            .add_command(tanjun.SlashCommand(mock.AsyncMock(), "hiss", "another cat noise", default_to_ephemeral=True))
+        )
+        mock_module = mock.Mock(__all__=["loader"], loader=component.make_loader())
+        client = tanjun.Client(mock.Mock(entity_factory=entity_factory))
+
+        with mock.patch.object(importlib, "import_module", return_value=mock_module) as import_module:
+            result = client.generate_module_manifest("cat.noises")
+
+        import_module.assert_called_once_with("cat.noises")
+        assert result == {
+            "version": 1,
+            "modules": {
+                "cat.noises": {
+                    "message_commands": ["meow", "nyaa"],
+                    "slash_commands": [
+                        {
+                            "global": True,
+                            "payload": {"name": "purr", "description": "a cat noise", "options": []},
+                        },
+                        {
+                            "global": True,
+                            "payload": {"name": "hiss", "description": "another cat noise", "options": []},
+                        },
+                    ],
+                }
+            },
+        }
+        assert "cat.noises" not in client._modules
+        assert not client.components
+
+    @pytest.fixture()
+    def lazy_manifest(self) -> dict[str, typing.Any]:
+        return {
+            "version": 1,
+            "modules": {
+                "cat.noises": {
+                    "message_commands": ["meow", "Big Meow"],
+                    "slash_commands": [
+                        {"global": True, "payload": {"name": "purr", "description": "a cat noise"}},
+                        {"global": False, "payload": {"name": "hiss", "description": "another cat noise"}},
+                    ],
+                }
+            },
+        }
+
+    def test_add_lazy_modules(self, lazy_manifest: dict[str, typing.Any]):
+        client = tanjun.Client(mock.Mock())
+
+        result = client.add_lazy_modules(lazy_manifest)
+
+        assert result is client
+        module = client._lazy_modules["cat.noises"]
+        assert client._lazy_message_names == {"meow": [("meow", module)], "Big": [("Big Meow", module)]}
+        assert client._lazy_slash_names == {"purr": module, "hiss": module}
+        assert module.global_commands == [{"name": "purr", "description": "a cat noise"}]
+
+    def test_add_lazy_modules_from_file(self, lazy_manifest: dict[str, typing.Any], tmp_path: pathlib.Path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(lazy_manifest))
+        client = tanjun.Client(mock.Mock())
+
+        client.add_lazy_modules(path)
+
+        assert list(client._lazy_modules) == ["cat.noises"]
+
+    def test_add_lazy_modules_when_already_loaded(self, lazy_manifest: dict[str, typing.Any]):
+        client = tanjun.Client(mock.Mock())
+        client._modules["cat.noises"] = mock.Mock()
+
+        client.add_lazy_modules(lazy_manifest)
+
+        assert client._lazy_modules == {}
+        assert client._lazy_message_names == {}
+
+    def test_add_lazy_modules_when_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported module manifest version 2"):
+            tanjun.Client(mock.Mock()).add_lazy_modules({"version": 2, "modules": {}})
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("meow", True),
+            ("Big Meow me", True),
+            ("meowing", False),
+            ("Big", False),
+            # These are matched the same way as the real message command routing.
+            ("BIG meow me", False),
+            ("meow\nme", False),
+        ],
+    )
+    def test__find_lazy_message_module(self, lazy_manifest: dict[str, typing.Any], content: str, expected: bool):
+        client = tanjun.Client(mock.Mock()).add_lazy_modules(lazy_manifest)
+
+        result = client._find_lazy_message_module(content)
+
+        assert (result is client._lazy_modules["cat.noises"]) is expected
+
     @pytest.mark.asyncio()
-    async def test_load_modules_async_when_module_import_raises(self, get_running_loop: mock.Mock):
-        mock_exception = ValueError("aye")
-        mock_gen = mock.Mock(__next__=mock.Mock())
-        get_running_loop.return_value.run_in_executor = mock.AsyncMock(side_effect=mock_exception)
-        mock__load_module = mock.Mock(return_value=mock_gen)
+    async def test__load_lazy_module(self, lazy_manifest: dict[str, typing.Any]):
+        client = tanjun.Client(mock.Mock()).add_lazy_modules(lazy_manifest)
+        module = client._lazy_modules["cat.noises"]
 
-        class StubClient(tanjun.Client):
-            _load_module = mock__load_module
+        with mock.patch.object(tanjun.Client, "load_modules_async") as load_modules_async:
+            await asyncio.gather(client._load_lazy_module(module), client._load_lazy_module(module))
 
-        client = StubClient(mock.AsyncMock())
+        load_modules_async.assert_awaited_once_with("cat.noises")
+        assert client._lazy_modules == {}
+        assert client._lazy_message_names == {}
+        assert client._lazy_slash_names == {}
 
-        with pytest.raises(tanjun.FailedModuleLoad) as exc_info:
-            await client.load_modules_async("ok.no.u")
+    @pytest.mark.asyncio()
+    async def test__load_lazy_module_when_load_fails(self, lazy_manifest: dict[str, typing.Any]):
+        client = tanjun.Client(mock.Mock()).add_lazy_modules(lazy_manifest)
+        module = client._lazy_modules["cat.noises"]
 
-        assert exc_info.value.__cause__ is mock_exception
+        with mock.patch.object(
+            tanjun.Client, "load_modules_async", side_effect=tanjun.FailedModuleLoad()
+        ) as load_modules_async:
+            await client._load_lazy_module(module)
 
-        mock__load_module.assert_called_once_with("ok.no.u")
-        mock_gen.__next__.assert_called_once_with()
-        get_running_loop.return_value.run_in_executor.assert_called_once_with(None, mock_gen.__next__.return_value)
-        mock_gen.send.assert_not_called()
+        load_modules_async.assert_awaited_once_with("cat.noises")
+        assert client._lazy_modules == {}
+
+    def test_load_modules_removes_lazy_module(self, lazy_manifest: dict[str, typing.Any]):
+        client = tanjun.Client(mock.Mock()).add_lazy_modules(lazy_manifest)
+        mock_module = mock.Mock(__all__=["loader"], loader=mock.Mock(tanjun.abc.ClientLoader))
+
+        with mock.patch.object(importlib, "import_module", return_value=mock_module):
+            client.load_modules("cat.noises")
+
+        assert client._lazy_modules == {}
+        assert client._lazy_slash_names == {}
+
+    @pytest.mark.asyncio()
+    async def test_declare_global_commands_with_lazy_modules(self, lazy_manifest: dict[str, typing.Any]):
+        rest = mock.AsyncMock(entity_factory=hikari.impl.EntityFactoryImpl(mock.Mock()))
+        rest.set_application_commands.return_value = []
+        command = tanjun.SlashCommand(mock.AsyncMock(), "meow", "nyaa")
+        client = (
+            tanjun.Client(rest).add_component(tanjun.Component().add_command(command)).add_lazy_modules(lazy_manifest)
+        )
+
+        await client.declare_global_commands(application=123, force=True)
+
+        rest.set_application_commands.assert_awaited_once_with(123, mock.ANY, guild=hikari.UNDEFINED)
+        builders = rest.set_application_commands.call_args.args[1]
+        assert [(builder.name, builder.description) for builder in builders] == [
+            ("meow", "nyaa"),
+            ("purr", "a cat noise"),
+        ]
 
     def test_unload_modules_with_system_path(self):
         priv_unloader = mock.Mock(tanjun.abc.ClientLoader)
@@ -2029,6 +3143,40 @@ class TestClient:
         priv_loader.unload.assert_not_called()
         assert client._modules["waifus"] is new_module
 
+    def test__reload_modules_with_python_module_path_clears_registered_loaders(self):
+        old_loader = mock.Mock(tanjun.abc.ClientLoader, __name__="loader")
+        new_loader = mock.Mock(tanjun.abc.ClientLoader, __name__="loader")
+        module = types.ModuleType("waifus")
+        module.__tanjun_loaders__ = [old_loader]  # type: ignore
+        module.loader = old_loader  # type: ignore
+        client = tanjun.Client(mock.AsyncMock())
+
+        def reload(module_: types.ModuleType, /) -> types.ModuleType:
+            assert not hasattr(module_, "__tanjun_loaders__")
+            module_.__tanjun_loaders__ = [new_loader]  # type: ignore
+            module_.loader = new_loader  # type: ignore
+            return module_
+
+        with mock.patch.object(importlib, "import_module", return_value=module):
+            client.load_modules("waifus")
+
+        with mock.patch.object(importlib, "reload", side_effect=reload):
+            generator = client._reload_module("waifus")
+            module = next(generator)()
+            try:
+                generator.send(module)
+
+            except StopIteration:
+                pass
+
+            else:
+                pytest.fail("Expected StopIteration")
+
+        old_loader.load.assert_called_once_with(client)
+        old_loader.unload.assert_called_once_with(client)
+        new_loader.load.assert_called_once_with(client)
+        new_loader.unload.assert_not_called()
+
     def test__reload_modules_with_python_module_path_when_all_and_no_unloaders_found(self):
         priv_loader = mock.Mock(tanjun.abc.ClientLoader)
         old_module = mock.Mock(
@@ -2700,10 +3848,81 @@ class TestClient:
         mock_component_1.execute_message.assert_awaited_once_with(
             ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks}
         )
+        assert mock_component_1.execute_message.call_args.kwargs["hooks"] is command_dispatch_client._message_hook_chain
         mock_component_2.execute_message.assert_not_called()
         ctx_maker.return_value.respond.assert_not_called()
         command_dispatch_client.dispatch_client_callback.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_routes_through_index(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(content="!  meow nyaa", respond=mock.AsyncMock())
+        mock_ctx.set_content.side_effect = lambda content: setattr(mock_ctx, "content", content) or mock_ctx
+        ctx_maker = mock.Mock(return_value=mock_ctx)
+        command = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+        component_1 = tanjun.Component().add_command(tanjun.MessageCommand(mock.AsyncMock(), "woof"))
+        component_2 = tanjun.Component().add_command(command)
+        command_dispatch_client.add_component(component_1).add_component(component_2).add_prefix(
+            "!"
+        ).set_message_ctx_maker(ctx_maker)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        with mock.patch.object(
+            tanjun.Component, "execute_message_candidates", new=mock.AsyncMock(return_value=True)
+        ) as execute_message_candidates:
+            await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!  meow nyaa")))
+
+        execute_message_candidates.assert_awaited_once_with(
+            ctx_maker.return_value,
+            [("meow", command)],
+            hooks={command_dispatch_client.hooks, command_dispatch_client.message_hooks},
+        )
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_loads_lazy_module(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(content="!  meow nyaa", respond=mock.AsyncMock())
+        mock_ctx.set_content.side_effect = lambda content: setattr(mock_ctx, "content", content) or mock_ctx
+        command = tanjun.MessageCommand(mock.AsyncMock(), "meow")
+
+        async def load_modules_async(*args: typing.Any) -> None:
+            command_dispatch_client.add_component(tanjun.Component().add_command(command))
+
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(mock.Mock(return_value=mock_ctx))
+        command_dispatch_client.add_lazy_modules(
+            {"version": 1, "modules": {"cat.noises": {"message_commands": ["meow"], "slash_commands": []}}}
+        )
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        with mock.patch.object(
+            tanjun.Client, "load_modules_async", side_effect=load_modules_async
+        ) as load_modules_async_, mock.patch.object(
+            tanjun.Component, "execute_message_candidates", new=mock.AsyncMock(return_value=True)
+        ) as execute_message_candidates:
+            await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!  meow nyaa")))
+
+        load_modules_async_.assert_awaited_once_with("cat.noises")
+        execute_message_candidates.assert_awaited_once_with(mock_ctx, [("meow", command)], hooks=mock.ANY)
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_doesnt_load_lazy_module_when_checks_fail(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = mock.Mock(content="!meow", respond=mock.AsyncMock())
+        mock_ctx.set_content.side_effect = lambda content: setattr(mock_ctx, "content", content) or mock_ctx
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(mock.Mock(return_value=mock_ctx))
+        command_dispatch_client.add_lazy_modules(
+            {"version": 1, "modules": {"cat.noises": {"message_commands": ["meow"], "slash_commands": []}}}
+        )
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        with mock.patch.object(tanjun.Client, "load_modules_async") as load_modules_async:
+            await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow")))
+
+        load_modules_async.assert_not_called()
+        assert "meow" in command_dispatch_client._lazy_message_names
+
     @pytest.mark.asyncio()
     async def test_on_message_create_event_when_no_message_content(self, command_dispatch_client: tanjun.Client):
         ctx_maker = mock.Mock()
@@ -2743,6 +3962,129 @@ class TestClient:
         mock_component_2.execute_message.assert_not_called()
         command_dispatch_client.dispatch_client_callback.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_when_first_character_not_a_prefix(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        ctx_maker = mock.Mock()
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_prefix("gay").set_prefix_getter(None).set_message_ctx_maker(
+            ctx_maker
+        ).add_component(mock_component)
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="eye")))
+
+        ctx_maker.assert_not_called()
+        mock_component.execute_message.assert_not_called()
+        command_dispatch_client.dispatch_client_callback.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_when_bot_and_human_only(self, command_dispatch_client: tanjun.Client):
+        ctx_maker = mock.Mock()
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_prefix("!").set_human_only().set_message_ctx_maker(ctx_maker).add_component(
+            mock_component
+        )
+        mock_message = mock.Mock(content="!meow", author=mock.Mock(is_bot=True), webhook_id=None)
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock_message))
+
+        ctx_maker.assert_not_called()
+        mock_component.execute_message.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_when_webhook_and_human_only_with_not_found_callback(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        ctx_maker = mock.Mock(return_value=mock.Mock(content="!meow"))
+        command_dispatch_client.add_prefix("!").set_human_only().set_message_ctx_maker(ctx_maker).add_client_callback(
+            tanjun.ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, mock.AsyncMock()
+        )
+        mock_message = mock.Mock(content="!meow", author=mock.Mock(is_bot=False), webhook_id=123)
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock_message))
+
+        ctx_maker.assert_called_once_with(
+            client=command_dispatch_client,
+            injection_client=command_dispatch_client,
+            content="!meow",
+            message=mock_message,
+        )
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_when_shed(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(content="!meow", respond=mock.AsyncMock())
+        mock_ctx.set_content.return_value = mock_ctx
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_message_admission(1, policy=tanjun.ShedPolicyEnum.REJECT, reject_message="go away")
+        assert command_dispatch_client._message_admission
+        await command_dispatch_client._message_admission.acquire()
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow")))
+
+        mock_ctx.respond.assert_awaited_once_with("go away")
+        command_dispatch_client.dispatch_client_callback.assert_awaited_once_with(
+            tanjun.ClientCallbackNames.COMMAND_SHED, mock_ctx
+        )
+        command_dispatch_client.check.assert_not_called()
+        mock_component.execute_message.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_resets_active_collector(self, command_dispatch_client: tanjun.Client):
+        collector = tanjun.dependencies.InMemoryTimingCollector()
+        mock_ctx = mock.Mock(content="!meow", respond=mock.AsyncMock())
+        mock_ctx.set_content.return_value = mock_ctx
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        mock_component.execute_message.side_effect = lambda *_, **__: active.append(
+            tanjun.dependencies.metrics.get_active_collector()
+        )
+        active: list[typing.Optional[tanjun.dependencies.AbstractTimingCollector]] = []
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_timing_collector(collector)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow")))
+
+        assert active == [collector]
+        assert tanjun.dependencies.metrics.get_active_collector() is None
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_releases_admission(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(content="!meow", respond=mock.AsyncMock())
+        mock_ctx.set_content.return_value = mock_ctx
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(
+            mock.Mock(return_value=mock_ctx)
+        ).set_message_admission(1)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow")))
+
+        assert command_dispatch_client._message_admission
+        assert await command_dispatch_client._message_admission.acquire() is True
+
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_releases_fair_scheduling_slot(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(content="!meow", respond=mock.AsyncMock(), guild_id=hikari.Snowflake(123))
+        mock_ctx.set_content.return_value = mock_ctx
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(
+            mock.Mock(return_value=mock_ctx)
+        ).set_fair_scheduling(1)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="!meow")))
+
+        assert command_dispatch_client._fair_scheduler
+        await asyncio.wait_for(command_dispatch_client._fair_scheduler.acquire((None, None)), timeout=1)
+
     @pytest.mark.asyncio()
     async def test_on_message_create_event_when_custom_prefix_getter_not_found(
         self, command_dispatch_client: tanjun.Client
@@ -2964,6 +4306,18 @@ class TestClient:
             tanjun.ClientCallbackNames.MESSAGE_COMMAND_NOT_FOUND, ctx_maker.return_value
         )
 
+    @pytest.mark.asyncio()
+    async def test_on_message_create_event_releases_dependencies(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(tanjun.context.MessageContext, content="!  42")
+        mock_ctx.set_content.return_value = mock_ctx
+        command_dispatch_client.add_prefix("!").set_message_ctx_maker(mock.Mock(return_value=mock_ctx))
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        await command_dispatch_client.on_message_create_event(mock.Mock(message=mock.Mock(content="eye")))
+
+        mock_ctx.release_dependencies.assert_awaited_once_with()
+
     @pytest.mark.asyncio()
     async def test_on_message_create_event_when_component_raises_command_error(
         self, command_dispatch_client: tanjun.Client
@@ -3127,6 +4481,174 @@ class TestClient:
         ctx.create_initial_response.assert_not_called()
         dispatch_client_callback_.assert_awaited_once_with(tanjun.ClientCallbackNames.SLASH_COMMAND_NOT_FOUND, ctx)
 
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_loads_lazy_module(self, command_dispatch_client: tanjun.Client):
+        mock_ctx_maker = mock.Mock(return_value=mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock()))
+        command_dispatch_client.set_slash_ctx_maker(mock_ctx_maker).add_lazy_modules(
+            {
+                "version": 1,
+                "modules": {
+                    "cat.noises": {
+                        "message_commands": [],
+                        "slash_commands": [{"global": True, "payload": {"name": "purr", "description": "meow"}}],
+                    }
+                },
+            }
+        )
+        mock_ctx_maker.return_value.interaction.command_name = "purr"
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        with mock.patch.object(tanjun.Client, "load_modules_async") as load_modules_async:
+            await command_dispatch_client.on_interaction_create_event(
+                mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+            )
+
+        load_modules_async.assert_awaited_once_with("cat.noises")
+        assert command_dispatch_client._lazy_slash_names == {}
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_doesnt_load_lazy_module_when_shed(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx_maker = mock.Mock(return_value=mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock()))
+        command_dispatch_client.set_slash_ctx_maker(mock_ctx_maker).set_interaction_admission(1).add_lazy_modules(
+            {
+                "version": 1,
+                "modules": {
+                    "cat.noises": {
+                        "message_commands": [],
+                        "slash_commands": [{"global": True, "payload": {"name": "purr", "description": "meow"}}],
+                    }
+                },
+            }
+        )
+        mock_ctx_maker.return_value.interaction.command_name = "purr"
+        assert command_dispatch_client._interaction_admission
+        await command_dispatch_client._interaction_admission.acquire()
+
+        with mock.patch.object(tanjun.Client, "load_modules_async") as load_modules_async:
+            await command_dispatch_client.on_interaction_create_event(
+                mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+            )
+
+        load_modules_async.assert_not_called()
+        assert "purr" in command_dispatch_client._lazy_slash_names
+
+    @pytest.mark.parametrize(
+        ("policy", "response"), [(tanjun.ShedPolicyEnum.REJECT, "go away"), (tanjun.ShedPolicyEnum.DROP_NEWEST, None)]
+    )
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_when_shed(
+        self, command_dispatch_client: tanjun.Client, policy: tanjun.ShedPolicyEnum, response: typing.Optional[str]
+    ):
+        mock_ctx = mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock())
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_interaction_admission(1, queue_size=0, policy=policy, reject_message="go away")
+        assert command_dispatch_client._interaction_admission
+        await command_dispatch_client._interaction_admission.acquire()
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+
+        await command_dispatch_client.on_interaction_create_event(
+            mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+        )
+
+        mock_ctx.cancel_defer.assert_called_once_with()
+        if response:
+            mock_ctx.respond.assert_awaited_once_with(response)
+
+        else:
+            mock_ctx.respond.assert_not_called()
+
+        command_dispatch_client.dispatch_client_callback.assert_awaited_once_with(
+            tanjun.ClientCallbackNames.COMMAND_SHED, mock_ctx
+        )
+        command_dispatch_client.check.assert_not_called()
+        mock_component.execute_interaction.assert_not_called()
+        mock_ctx.mark_not_found.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_queues_when_admission_full(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock())
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).set_interaction_admission(
+            1, queue_size=1
+        )
+        admission = command_dispatch_client._interaction_admission
+        assert admission
+        await admission.acquire()
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        task = asyncio.get_running_loop().create_task(
+            command_dispatch_client.on_interaction_create_event(
+                mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+            )
+        )
+        await asyncio.sleep(0)
+
+        command_dispatch_client.check.assert_not_called()
+        admission.release()
+        await asyncio.wait_for(task, timeout=1)
+        command_dispatch_client.check.assert_awaited_once_with(mock_ctx)
+        mock_ctx.mark_not_found.assert_awaited_once_with()
+        assert await asyncio.wait_for(admission.acquire(), timeout=1) is True
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_releases_admission(self, command_dispatch_client: tanjun.Client):
+        mock_ctx = mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock())
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        mock_component.execute_interaction.side_effect = tanjun.CommandError("meow")
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_interaction_admission(1, queue_size=0)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        await command_dispatch_client.on_interaction_create_event(
+            mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+        )
+
+        mock_ctx.respond.assert_awaited_once_with("meow")
+        assert command_dispatch_client._interaction_admission
+        assert await command_dispatch_client._interaction_admission.acquire() is True
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_releases_fair_scheduling_slot(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock(), guild_id=hikari.Snowflake(123))
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).set_fair_scheduling(1)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        await command_dispatch_client.on_interaction_create_event(
+            mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+        )
+
+        assert command_dispatch_client._fair_scheduler
+        await asyncio.wait_for(command_dispatch_client._fair_scheduler.acquire((None, None)), timeout=1)
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_event_resets_active_collector(self, command_dispatch_client: tanjun.Client):
+        collector = tanjun.dependencies.InMemoryTimingCollector()
+        mock_ctx_maker = mock.Mock(return_value=mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock()))
+        command_dispatch_client.set_slash_ctx_maker(mock_ctx_maker).set_timing_collector(collector)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.side_effect = lambda *_: active.append(
+            tanjun.dependencies.metrics.get_active_collector()
+        )
+        active: list[typing.Optional[tanjun.dependencies.AbstractTimingCollector]] = []
+
+        await command_dispatch_client.on_interaction_create_event(
+            mock.Mock(interaction=mock.Mock(hikari.CommandInteraction))
+        )
+
+        assert active == [collector]
+        assert tanjun.dependencies.metrics.get_active_collector() is None
+
     @pytest.mark.asyncio()
     async def test_on_interaction_create_event(self, command_dispatch_client: tanjun.Client):
         mock_ctx_maker = mock.Mock(return_value=mock.Mock(respond=mock.AsyncMock(), mark_not_found=mock.AsyncMock()))
@@ -3158,6 +4680,9 @@ class TestClient:
         mock_component_2.execute_interaction.assert_awaited_once_with(
             mock_ctx_maker.return_value, hooks={command_dispatch_client.hooks, command_dispatch_client.slash_hooks}
         )
+        assert (
+            mock_component_2.execute_interaction.call_args.kwargs["hooks"] is command_dispatch_client._slash_hook_chain
+        )
         mock_future.assert_awaited_once()
         mock_ctx_maker.return_value.respond.assert_not_called()
         mock_ctx_maker.return_value.mark_not_found.assert_not_called()
@@ -3550,6 +5075,156 @@ class TestClient:
         mock_ctx_maker.return_value.respond.assert_not_called()
         mock_ctx_maker.return_value.mark_not_found.assert_awaited_once_with()
 
+    @staticmethod
+    def _make_request_ctx() -> mock.Mock:
+        future: asyncio.Future[typing.Any] = asyncio.get_running_loop().create_future()
+        mock_ctx = mock.Mock(get_response_future=mock.Mock(return_value=future))
+        mock_ctx.respond = mock.AsyncMock(side_effect=lambda *_: future.set_result("responded"))
+        mock_ctx.mark_not_found = mock.AsyncMock(side_effect=lambda: future.set_result("not found"))
+        return mock_ctx
+
+    @pytest.mark.parametrize("policy", [tanjun.ShedPolicyEnum.REJECT, tanjun.ShedPolicyEnum.DROP_NEWEST])
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_request_when_shed(
+        self, command_dispatch_client: tanjun.Client, policy: tanjun.ShedPolicyEnum
+    ):
+        mock_ctx = self._make_request_ctx()
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_interaction_admission(1, queue_size=0, policy=policy, reject_message="go away")
+        assert command_dispatch_client._interaction_admission
+        await command_dispatch_client._interaction_admission.acquire()
+        assert isinstance(command_dispatch_client.dispatch_client_callback, mock.AsyncMock)
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+
+        result = await asyncio.wait_for(
+            command_dispatch_client.on_interaction_create_request(mock.Mock(hikari.CommandInteraction)), timeout=1
+        )
+
+        # REST interactions are always responded to, even when the policy drops them silently.
+        assert result == "responded"
+        mock_ctx.cancel_defer.assert_called_once_with()
+        mock_ctx.respond.assert_awaited_once_with("go away")
+        command_dispatch_client.check.assert_not_called()
+        mock_component.execute_interaction.assert_not_called()
+        await asyncio.sleep(0)
+        command_dispatch_client.dispatch_client_callback.assert_awaited_once_with(
+            tanjun.ClientCallbackNames.COMMAND_SHED, mock_ctx
+        )
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_request_queues_when_admission_full(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = self._make_request_ctx()
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).set_interaction_admission(
+            1, queue_size=1
+        )
+        admission = command_dispatch_client._interaction_admission
+        assert admission
+        await admission.acquire()
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = False
+
+        task = asyncio.get_running_loop().create_task(
+            command_dispatch_client.on_interaction_create_request(mock.Mock(hikari.CommandInteraction))
+        )
+        await asyncio.sleep(0)
+
+        command_dispatch_client.check.assert_not_called()
+        admission.release()
+        assert await asyncio.wait_for(task, timeout=1) == "not found"
+        command_dispatch_client.check.assert_awaited_once_with(mock_ctx)
+        assert await asyncio.wait_for(admission.acquire(), timeout=1) is True
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_request_releases_admission_once_execution_finishes(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = self._make_request_ctx()
+        execution: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        async def execute_interaction(*args: typing.Any, **kwargs: typing.Any) -> asyncio.Future[None]:
+            mock_ctx.get_response_future.return_value.set_result("deferred")
+            return execution
+
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        mock_component.execute_interaction.side_effect = execute_interaction
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_interaction_admission(1, queue_size=1)
+        admission = command_dispatch_client._interaction_admission
+        assert admission
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        result = await asyncio.wait_for(
+            command_dispatch_client.on_interaction_create_request(mock.Mock(hikari.CommandInteraction)), timeout=1
+        )
+
+        assert result == "deferred"
+        # The initial response has been returned but the command's still executing.
+        waiter = asyncio.get_running_loop().create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        execution.set_result(None)
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_request_releases_admission_when_not_found(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = self._make_request_ctx()
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).set_interaction_admission(
+            1, queue_size=0
+        )
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        result = await asyncio.wait_for(
+            command_dispatch_client.on_interaction_create_request(mock.Mock(hikari.CommandInteraction)), timeout=1
+        )
+
+        assert result == "not found"
+        assert command_dispatch_client._interaction_admission
+        assert await command_dispatch_client._interaction_admission.acquire() is True
+
+    @pytest.mark.asyncio()
+    async def test_on_interaction_create_request_releases_fair_scheduling_slot_once_execution_finishes(
+        self, command_dispatch_client: tanjun.Client
+    ):
+        mock_ctx = self._make_request_ctx()
+        mock_ctx.guild_id = hikari.Snowflake(123)
+        execution: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        async def execute_interaction(*args: typing.Any, **kwargs: typing.Any) -> asyncio.Future[None]:
+            mock_ctx.get_response_future.return_value.set_result("deferred")
+            return execution
+
+        mock_component = mock.AsyncMock(bind_client=mock.Mock())
+        mock_component.execute_interaction.side_effect = execute_interaction
+        command_dispatch_client.set_slash_ctx_maker(mock.Mock(return_value=mock_ctx)).add_component(
+            mock_component
+        ).set_fair_scheduling(1)
+        scheduler = command_dispatch_client._fair_scheduler
+        assert scheduler
+        assert isinstance(command_dispatch_client.check, mock.AsyncMock)
+        command_dispatch_client.check.return_value = True
+
+        result = await asyncio.wait_for(
+            command_dispatch_client.on_interaction_create_request(mock.Mock(hikari.CommandInteraction)), timeout=1
+        )
+
+        assert result == "deferred"
+        waiter = asyncio.get_running_loop().create_task(scheduler.acquire((None, None)))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        execution.set_result(None)
+        await asyncio.wait_for(waiter, timeout=1)
+
     # Note, these will likely need to be more integrationy than the above tests to ensure there's no deadlocking
     # behaviour around ctx and its owned future.
     # Interaction create REST request
@@ -837,6 +837,25 @@ class TestSlashCommandGroup:
         mock_sub_command.set_parent.assert_called_once_with(command_group)
         assert mock_sub_command in command_group.commands
 
+    def test_add_command_invalidates_client_routing(self):
+        mock_client = mock.Mock(tanjun.components._RoutingCacheClient)
+        command_group = tanjun.SlashCommandGroup("yee", "nsoosos")
+        parent_group = tanjun.SlashCommandGroup("yeet", "nsoosos").add_command(command_group)
+        parent_group.bind_component(mock.Mock(client=mock_client))
+
+        command_group.add_command(tanjun.SlashCommand(mock.AsyncMock(), "sub", "description"))
+
+        mock_client._invalidate_routing.assert_called_once_with()
+
+    def test_add_command_when_client_doesnt_cache_routing(self):
+        command_group = tanjun.SlashCommandGroup("yee", "nsoosos")
+        command_group.bind_component(mock.Mock(client=mock.Mock(tanjun.abc.Client)))
+        command = tanjun.SlashCommand(mock.AsyncMock(), "sub", "description")
+
+        command_group.add_command(command)
+
+        assert command in command_group.commands
+
     def test_add_command_when_attempting_to_double_nest_groups(self):
         command_group = tanjun.SlashCommandGroup("yee", "nsoosos").set_parent(mock.Mock())
 
@@ -2069,6 +2088,35 @@ class TestSlashCommand:
     def test_copy(self):
         ...
 
+    @pytest.mark.asyncio()
+    async def test_execute_releases_dependencies_after_post_execution(self):
+        order: list[str] = []
+        mock_ctx = mock.Mock(tanjun.context.SlashContext, has_been_deferred=False, has_responded=False)
+        mock_ctx.set_command.return_value = mock_ctx
+        mock_ctx.release_dependencies.side_effect = lambda _: order.append("release")
+        mock_callback = mock.AsyncMock(side_effect=lambda *_, **__: order.append("callback"))
+        mock_post_execution = mock.AsyncMock(side_effect=lambda _: order.append("post_execution"))
+        command = tanjun.SlashCommand(mock_callback, "name", "description").set_hooks(
+            tanjun.AnyHooks().add_post_execution(mock_post_execution)
+        )
+
+        await command.execute(mock_ctx)
+
+        assert order == ["callback", "post_execution", "release"]
+        mock_ctx.release_dependencies.assert_awaited_once_with(None)
+
+    @pytest.mark.asyncio()
+    async def test_execute_passes_command_error_when_releasing_dependencies(self):
+        error = tanjun.CommandError("nyaa")
+        mock_ctx = mock.Mock(tanjun.context.SlashContext, has_been_deferred=False, has_responded=False)
+        mock_ctx.set_command.return_value = mock_ctx
+        command = tanjun.SlashCommand(mock.AsyncMock(side_effect=error), "name", "description")
+
+        await command.execute(mock_ctx)
+
+        mock_ctx.respond.assert_awaited_once_with("nyaa")
+        mock_ctx.release_dependencies.assert_awaited_once_with(error)
+
 
 def test_as_message_command():
     mock_callback = mock.Mock()
@@ -2251,6 +2299,46 @@ class TestMessageCommand:
     async def test_execute(self):
         ...
 
+    @pytest.mark.asyncio()
+    async def test_execute_releases_dependencies_after_post_execution(self):
+        order: list[str] = []
+        mock_ctx = mock.Mock(tanjun.context.MessageContext)
+        mock_ctx.set_command.return_value = mock_ctx
+        mock_ctx.release_dependencies.side_effect = lambda _: order.append("release")
+        mock_callback = mock.AsyncMock(side_effect=lambda *_, **__: order.append("callback"))
+        mock_post_execution = mock.AsyncMock(side_effect=lambda _: order.append("post_execution"))
+        command = tanjun.MessageCommand(mock_callback, "name").set_hooks(
+            tanjun.AnyHooks().add_post_execution(mock_post_execution)
+        )
+
+        await command.execute(mock_ctx)
+
+        assert order == ["callback", "post_execution", "release"]
+
+    @pytest.mark.asyncio()
+    async def test_execute_releases_dependencies_when_callback_raises(self):
+        error = KeyError("meow")
+        mock_ctx = mock.Mock(tanjun.context.MessageContext)
+        mock_ctx.set_command.return_value = mock_ctx
+        command = tanjun.MessageCommand(mock.AsyncMock(side_effect=error), "name")
+
+        with pytest.raises(KeyError):
+            await command.execute(mock_ctx)
+
+        mock_ctx.release_dependencies.assert_awaited_once_with(error)
+
+    @pytest.mark.asyncio()
+    async def test_execute_logs_errors_raised_while_releasing_dependencies(self):
+        mock_ctx = mock.Mock(tanjun.context.MessageContext)
+        mock_ctx.set_command.return_value = mock_ctx
+        mock_ctx.release_dependencies.side_effect = RuntimeError("teardown")
+        command = tanjun.MessageCommand(mock.AsyncMock(side_effect=KeyError("meow")), "name")
+
+        with mock.patch.object(tanjun.commands, "_LOGGER") as logger, pytest.raises(KeyError):
+            await command.execute(mock_ctx)
+
+        logger.exception.assert_called_once_with("Failed to release a command's dependencies")
+
     def test_load_into_component(self):
         mock_component = mock.Mock()
         command = tanjun.MessageCommand(mock.Mock(), "yee", "nsoosos")
@@ -2495,7 +2583,9 @@ class TestMessageCommandGroup:
             ),
         )(mock.AsyncMock(), "a", "b").set_hooks(mock_attached_hooks)
 
-        await command.execute(mock_context, hooks={typing.cast(tanjun.abc.MessageHooks, mock_hooks)})
+        hooks = frozenset((typing.cast(tanjun.abc.MessageHooks, mock_hooks),))
+
+        await command.execute(mock_context, hooks=hooks)
 
         mock_context.set_content.assert_called_once_with("desu-ga hi")
         mock_context.set_triggering_name.assert_called_once_with("go home baka")
@@ -2505,6 +2595,7 @@ class TestMessageCommandGroup:
         mock_command_1.execute.assert_not_called()
         mock_command_2.execute.assert_called_once_with(mock_context, hooks={mock_hooks, mock_attached_hooks})
         mock_command_3.execute.assert_not_called()
+        assert hooks == {mock_hooks}
 
     @pytest.mark.asyncio()
     async def test_execute_no_pass_through_hooks(self):
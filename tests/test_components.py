@@ -39,6 +39,7 @@ import asyncio
 import contextlib
 import inspect
 import types
+import typing
 from unittest import mock
 
 import hikari
@@ -527,6 +528,28 @@ class TestComponent:
         mock_command.bind_component.assert_called_once_with(component)
         mock_command.bind_client.assert_not_called()
 
+    def test_add_slash_command_invalidates_client_routing(self):
+        mock_client = mock.Mock(tanjun.components._RoutingCacheClient)
+        mock_command = mock.Mock()
+        mock_command.name = "gay"
+        component = tanjun.Component()
+        component._client = mock_client
+
+        component.add_slash_command(mock_command)
+
+        mock_client._invalidate_routing.assert_called_once_with()
+
+    def test_add_slash_command_when_client_doesnt_cache_routing(self):
+        mock_client = mock.Mock(tanjun.abc.Client)
+        mock_command = mock.Mock()
+        mock_command.name = "gay"
+        component = tanjun.Component()
+        component._client = mock_client
+
+        component.add_slash_command(mock_command)
+
+        assert mock_command in component.slash_commands
+
     def test_add_slash_command_when_already_present(self):
         mock_command = mock.Mock()
         mock_command.name = "gay"
@@ -1089,6 +1112,88 @@ class TestComponent:
     def test_execute_interaction(self):
         ...  # includes _execute_interaction, and _check_context
 
+    @pytest.mark.asyncio()
+    async def test_execute_interaction_route(self):
+        mock_group = mock.Mock(tanjun.abc.SlashCommandGroup, check_context=mock.AsyncMock(return_value=True))
+        mock_command = mock.Mock(
+            tanjun.abc.SlashCommand,
+            check_context=mock.AsyncMock(return_value=True),
+            execute=mock.AsyncMock(),
+            defaults_to_ephemeral=True,
+        )
+        mock_ctx = mock.Mock()
+        mock_option = mock.Mock()
+        mock_hooks = mock.Mock()
+        component = tanjun.Component(strict=True).set_slash_hooks(mock_hooks)
+
+        result = await component.execute_interaction_route(mock_ctx, (mock_group, mock_command), mock_option)
+
+        assert result is not None
+        await result
+        mock_ctx.set_ephemeral_default.assert_has_calls([mock.call(mock_group.defaults_to_ephemeral), mock.call(True)])
+        mock_group.check_context.assert_awaited_once_with(mock_ctx)
+        mock_command.check_context.assert_awaited_once_with(mock_ctx)
+        mock_command.execute.assert_awaited_once_with(mock_ctx, option=mock_option, hooks={mock_hooks})
+
+    @pytest.mark.asyncio()
+    async def test_execute_interaction_route_when_sub_command_checks_fail(self):
+        mock_group = mock.Mock(tanjun.abc.SlashCommandGroup, check_context=mock.AsyncMock(return_value=True))
+        mock_command = mock.Mock(
+            tanjun.abc.SlashCommand, check_context=mock.AsyncMock(return_value=False), execute=mock.AsyncMock()
+        )
+        mock_ctx = mock.AsyncMock()
+        mock_ctx.set_ephemeral_default = mock.Mock()
+        component = tanjun.Component(strict=True)
+
+        result = await component.execute_interaction_route(mock_ctx, (mock_group, mock_command), mock.Mock())
+
+        assert result is not None
+        await result
+        mock_command.execute.assert_not_called()
+        mock_ctx.mark_not_found.assert_awaited_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_execute_interaction_route_when_top_level_checks_fail(self):
+        mock_command = mock.Mock(
+            tanjun.abc.SlashCommand, check_context=mock.AsyncMock(return_value=False), execute=mock.AsyncMock()
+        )
+        component = tanjun.Component(strict=True)
+
+        result = await component.execute_interaction_route(mock.Mock(), (mock_command,), None)
+
+        assert result is None
+        mock_command.execute.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_execute_message_candidates_adds_compiled_hooks(self):
+        mock_hooks = mock.Mock()
+        mock_message_hooks = mock.Mock()
+        mock_client_hooks = mock.Mock()
+        mock_command = mock.Mock(check_context=mock.AsyncMock(return_value=True), execute=mock.AsyncMock())
+        mock_ctx = mock.Mock(content="name  meow")
+        component = tanjun.Component().set_hooks(mock_hooks).set_message_hooks(mock_message_hooks)
+
+        hooks = frozenset((mock_client_hooks,))
+
+        result = await component.execute_message_candidates(mock_ctx, [("name", mock_command)], hooks=hooks)
+
+        assert result is True
+        mock_command.execute.assert_awaited_once_with(
+            mock_ctx, hooks={mock_client_hooks, mock_hooks, mock_message_hooks}
+        )
+        assert hooks == {mock_client_hooks}
+
+    @pytest.mark.asyncio()
+    async def test_execute_message_candidates_when_hooks_unset(self):
+        mock_command = mock.Mock(check_context=mock.AsyncMock(return_value=True), execute=mock.AsyncMock())
+        mock_ctx = mock.Mock(content="name")
+        component = tanjun.Component().set_hooks(mock.Mock()).set_hooks(None)
+
+        result = await component.execute_message_candidates(mock_ctx, [("name", mock_command)])
+
+        assert result is True
+        mock_command.execute.assert_awaited_once_with(mock_ctx, hooks=None)
+
     @pytest.mark.skip(reason="TODO")
     def test_execute_message(self):
         ...  # Includes _check_message_context and _check_context
@@ -1310,6 +1415,20 @@ class TestComponent:
         mock_copy.assert_called_once_with()
         mock_client.add_component.assert_called_once_with(mock_copy.return_value)
 
+    def test_make_loader_registers_with_module(self):
+        namespace: dict[str, typing.Any] = {"tanjun": tanjun}
+
+        exec("loader = tanjun.Component().make_loader()", namespace)
+
+        assert namespace["__tanjun_loaders__"] == [namespace["loader"]]
+
+    def test_make_loader_doesnt_register_when_not_made_at_module_level(self):
+        namespace: dict[str, typing.Any] = {"tanjun": tanjun}
+
+        exec("def make():\n    return tanjun.Component().make_loader()\nloader = make()", namespace)
+
+        assert "__tanjun_loaders__" not in namespace
+
     def test_make_loader_unload(self):
         mock_client = mock.Mock()
         loader = tanjun.Component(name="trans catgirls").make_loader()
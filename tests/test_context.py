@@ -36,6 +36,7 @@
 
 import asyncio
 import datetime
+import functools
 import types
 import typing
 from unittest import mock
@@ -76,6 +77,15 @@ def mock_component() -> tanjun.abc.Component:
     return mock.MagicMock(tanjun.abc.Component)
 
 
+@pytest.mark.asyncio()
+async def test_abc_memoise_fetch_default():
+    mock_callback = mock.AsyncMock()
+
+    assert await tanjun.abc.Context.memoise_fetch(mock.Mock(), "key", mock_callback) is mock_callback.return_value
+    assert await tanjun.abc.Context.memoise_fetch(mock.Mock(), "key", mock_callback) is mock_callback.return_value
+    assert mock_callback.await_count == 2
+
+
 class TestBaseContext:
     @pytest.fixture()
     def context(
@@ -107,6 +117,14 @@ class TestBaseContext:
     def test_shards_property(self, context: tanjun.context.BaseContext, mock_client: mock.Mock):
         assert context.shards is mock_client.shards
 
+    def test__get_response_lock(self, context: tanjun.context.BaseContext):
+        assert context._response_lock is None
+
+        lock = context._get_response_lock()
+
+        assert isinstance(lock, asyncio.Lock)
+        assert context._get_response_lock() is lock
+
     def test_voice_property(self, context: tanjun.context.BaseContext, mock_client: mock.Mock):
         assert context.voice is mock_client.voice
 
@@ -224,6 +242,99 @@ class TestBaseContext:
         assert result is None
         mock_client.rest.fetch_guild.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_fetch_channel_isnt_memoised(self, context: tanjun.context.BaseContext, mock_client: mock.Mock):
+        mock_client.rest.fetch_channel.return_value = mock.Mock(hikari.TextableChannel)
+        mock_callback = mock.AsyncMock()
+        await context.memoise_fetch((hikari.PartialChannel, context.channel_id), mock_callback)
+
+        await context.fetch_channel()
+        await context.fetch_channel()
+
+        assert mock_client.rest.fetch_channel.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_fetch_guild_isnt_memoised(self, context: tanjun.context.BaseContext, mock_client: mock.Mock):
+        await context.fetch_guild()
+        await context.fetch_guild()
+
+        assert mock_client.rest.fetch_guild.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_memoise_fetch(self, context: tanjun.context.BaseContext):
+        mock_callback = mock.AsyncMock()
+        mock_other_callback = mock.AsyncMock()
+
+        result = await context.memoise_fetch(("meow", 123), mock_callback)
+
+        assert result is mock_callback.return_value
+        assert await context.memoise_fetch(("meow", 123), mock_callback) is result
+        assert await context.memoise_fetch(("meow", 321), mock_other_callback) is mock_other_callback.return_value
+        mock_callback.assert_awaited_once_with()
+        mock_other_callback.assert_awaited_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_memoise_fetch_shares_in_flight_fetch(self, context: tanjun.context.BaseContext):
+        event = asyncio.Event()
+        mock_result = mock.Mock()
+        mock_callback = mock.Mock()
+
+        async def callback() -> mock.Mock:
+            mock_callback()
+            await event.wait()
+            return mock_result
+
+        tasks = [asyncio.create_task(context.memoise_fetch("key", callback)) for _ in range(3)]
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await asyncio.gather(*tasks) == [mock_result, mock_result, mock_result]
+        mock_callback.assert_called_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_memoise_fetch_when_callback_raises(self, context: tanjun.context.BaseContext):
+        event = asyncio.Event()
+        error = hikari.NotFoundError(url="", headers={}, raw_body="")
+        mock_callback = mock.Mock()
+
+        async def callback() -> typing.NoReturn:
+            mock_callback()
+            await event.wait()
+            raise error
+
+        tasks = [asyncio.create_task(context.memoise_fetch("key", callback)) for _ in range(2)]
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await asyncio.gather(*tasks, return_exceptions=True) == [error, error]
+        mock_callback.assert_called_once_with()
+
+        # Errors aren't memoised.
+        mock_retry = mock.AsyncMock()
+        assert await context.memoise_fetch("key", mock_retry) is mock_retry.return_value
+        mock_retry.assert_awaited_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_memoise_fetch_when_fetching_call_cancelled(self, context: tanjun.context.BaseContext):
+        event = asyncio.Event()
+
+        async def callback() -> typing.NoReturn:
+            await event.wait()
+            raise NotImplementedError
+
+        mock_retry = mock.AsyncMock()
+        fetch_task = asyncio.create_task(context.memoise_fetch("key", callback))
+        await asyncio.sleep(0)
+        waiting_task = asyncio.create_task(context.memoise_fetch("key", mock_retry))
+        await asyncio.sleep(0)
+
+        fetch_task.cancel()
+
+        assert await waiting_task is mock_retry.return_value
+        mock_retry.assert_awaited_once_with()
+        with pytest.raises(asyncio.CancelledError):
+            await fetch_task
+
 
 class TestMessageContext:
     @pytest.fixture()
@@ -242,6 +353,23 @@ class TestMessageContext:
     def test___repr__(self, context: tanjun.context.MessageContext):
         assert repr(context) == f"MessageContext <{context.message!r}, {context.command!r}>"
 
+    @pytest.mark.parametrize(
+        "type_",
+        [
+            tanjun.injecting.AbstractInjectionContext,
+            tanjun.injecting.BasicInjectionContext,
+            tanjun.abc.Context,
+            tanjun.abc.MessageContext,
+            tanjun.context.BaseContext,
+            tanjun.context.MessageContext,
+        ],
+    )
+    def test_get_type_dependency_for_self_type(
+        self, context: tanjun.context.MessageContext, mock_injector_client: mock.Mock, type_: type[typing.Any]
+    ):
+        assert context.get_type_dependency(type_) is context
+        mock_injector_client.get_type_dependency.assert_not_called()
+
     def test_author_property(self, context: tanjun.context.MessageContext):
         assert context.author is context.message.author
 
@@ -479,17 +607,15 @@ class TestMessageContext:
         context: tanjun.context.MessageContext,
         mock_client: mock.Mock,
     ):
-        mock_delete_after = mock.Mock()
-        context = stub_class(tanjun.context.MessageContext, _delete_after=mock_delete_after)(
+        mock_schedule_delete = mock.Mock()
+        context = stub_class(tanjun.context.MessageContext, _schedule_delete=mock_schedule_delete)(
             mock_client, mock.Mock(), "e", mock.AsyncMock()
         )
         context._initial_response_id = hikari.Snowflake(32123)
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            await context.edit_initial_response("hi", delete_after=delete_after)
+        await context.edit_initial_response("hi", delete_after=delete_after)
 
-        create_task.assert_called_once_with(mock_delete_after.return_value)
-        mock_delete_after.assert_called_once_with(123.0, mock_client.rest.edit_message.return_value)
+        mock_schedule_delete.assert_called_once_with(123.0, mock_client.rest.edit_message.return_value)
 
     @pytest.mark.asyncio()
     async def test_edit_last_response(self, context: tanjun.context.MessageContext, mock_client: mock.Mock):
@@ -548,17 +674,15 @@ class TestMessageContext:
         mock_client: mock.Mock,
         delete_after: typing.Union[datetime.timedelta, int, float],
     ):
-        mock_delete_after = mock.Mock()
-        context = stub_class(tanjun.context.MessageContext, _delete_after=mock_delete_after)(
+        mock_schedule_delete = mock.Mock()
+        context = stub_class(tanjun.context.MessageContext, _schedule_delete=mock_schedule_delete)(
             mock_client, mock.Mock(), "e", mock.AsyncMock()
         )
         context._last_response_id = hikari.Snowflake(32123)
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            await context.edit_last_response("hi", delete_after=delete_after)
+        await context.edit_last_response("hi", delete_after=delete_after)
 
-        create_task.assert_called_once_with(mock_delete_after.return_value)
-        mock_delete_after.assert_called_once_with(654.0, mock_client.rest.edit_message.return_value)
+        mock_schedule_delete.assert_called_once_with(654.0, mock_client.rest.edit_message.return_value)
 
     @pytest.mark.asyncio()
     async def test_fetch_initial_response(self, context: tanjun.context.MessageContext, mock_client: mock.Mock):
@@ -597,6 +721,30 @@ class TestMessageContext:
 
         mock_client.rest.fetch_message.assert_not_called()
 
+    def test__schedule_delete(self, context: tanjun.context.MessageContext, mock_injector_client: mock.Mock):
+        mock_message = mock.Mock()
+
+        context._schedule_delete(123.0, mock_message)
+
+        mock_injector_client.get_type_dependency.assert_called_once_with(tanjun.dependencies.AbstractDeletionScheduler)
+        mock_injector_client.get_type_dependency.return_value.schedule_message.assert_called_once_with(
+            mock_message, 123.0, guild_id=context.guild_id
+        )
+
+    def test__schedule_delete_when_no_scheduler(self, mock_client: mock.Mock, mock_injector_client: mock.Mock):
+        mock_injector_client.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
+        mock_delete_after = mock.Mock()
+        mock_message = mock.Mock()
+        context = stub_class(tanjun.context.MessageContext, _delete_after=mock_delete_after)(
+            mock_client, mock_injector_client, "e", mock.AsyncMock()
+        )
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            context._schedule_delete(123.0, mock_message)
+
+        mock_delete_after.assert_called_once_with(123.0, mock_message)
+        create_task.assert_called_once_with(mock_delete_after.return_value)
+
     @pytest.mark.asyncio()
     async def test__delete_after(self, context: tanjun.context.MessageContext):
         mock_message = mock.AsyncMock()
@@ -677,17 +825,15 @@ class TestMessageContext:
     @pytest.mark.parametrize("delete_after", [datetime.timedelta(seconds=123), 123, 123.0])
     @pytest.mark.asyncio()
     async def test_respond_when_delete_after(self, delete_after: typing.Union[int, float, datetime.timedelta]):
-        mock_delete_after = mock.Mock()
-        context = stub_class(tanjun.context.MessageContext, _delete_after=mock_delete_after)(
+        mock_schedule_delete = mock.Mock()
+        context = stub_class(tanjun.context.MessageContext, _schedule_delete=mock_schedule_delete)(
             mock.Mock(), mock.Mock(), "e", mock.AsyncMock()
         )
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            await context.respond("hi", delete_after=delete_after)
+        await context.respond("hi", delete_after=delete_after)
 
         assert isinstance(context.message.respond, mock.Mock)
-        mock_delete_after.assert_called_once_with(123.0, context.message.respond.return_value)
-        create_task.assert_called_once_with(mock_delete_after.return_value)
+        mock_schedule_delete.assert_called_once_with(123.0, context.message.respond.return_value)
 
 
 class TestSlashOption:
@@ -1323,6 +1469,42 @@ class TestSlashContext:
 
         assert context.options == {}
 
+    def test_options_property_wraps_options_on_access(self, mock_client: mock.Mock):
+        mock_option = mock.Mock()
+        mock_option.name = "meow"
+        context = tanjun.context.SlashContext(
+            mock_client,
+            mock.Mock(),
+            mock.Mock(type=hikari.OptionType.SUB_COMMAND, options=[mock_option]),
+            command=mock.Mock(),
+            component=mock.Mock(),
+        )
+        assert context._options is None
+
+        options = context.options
+
+        assert context.options is options
+        assert list(options) == ["meow"]
+        assert options["meow"] is options["meow"]
+        assert options["meow"].value is mock_option.value
+        assert options.get("nyaa") is None
+
+    @pytest.mark.parametrize(
+        "type_",
+        [
+            tanjun.injecting.AbstractInjectionContext,
+            tanjun.abc.Context,
+            tanjun.abc.SlashContext,
+            tanjun.context.BaseContext,
+            tanjun.context.SlashContext,
+        ],
+    )
+    def test_get_type_dependency_for_self_type(
+        self, context: tanjun.context.SlashContext, mock_injector_client: mock.Mock, type_: type[typing.Any]
+    ):
+        assert context.get_type_dependency(type_) is context
+        mock_injector_client.get_type_dependency.assert_not_called()
+
     @pytest.mark.asyncio()
     async def test__auto_defer_property(self, mock_client: mock.Mock):
         defer = mock.AsyncMock()
@@ -1334,13 +1516,39 @@ class TestSlashContext:
             component=mock.Mock(),
         )
 
-        with mock.patch.object(asyncio, "sleep") as sleep:
-            await context._auto_defer(0.1)
+        await context._auto_defer()
 
-            sleep.assert_awaited_once_with(0.1)
-            defer.assert_awaited_once_with()
+        defer.assert_awaited_once_with()
+
+    def test__on_defer_timer(self, mock_client: mock.Mock):
+        auto_defer = mock.Mock()
+        context = stub_class(tanjun.context.SlashContext, _auto_defer=auto_defer)(
+            mock_client,
+            mock.AsyncMock(),
+            mock.Mock(options=None),
+            command=mock.Mock(),
+            component=mock.Mock(),
+        )
+        context._defer_handle = mock.Mock()
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            context._on_defer_timer()
+
+            auto_defer.assert_called_once_with()
+            create_task.assert_called_once_with(auto_defer.return_value)
+            assert context._defer_task is create_task.return_value
+            assert context._defer_handle is None
 
     def test_cancel_defer(self, context: tanjun.context.SlashContext):
+        mock_handle = mock.Mock()
+        context._defer_handle = mock_handle
+
+        context.cancel_defer()
+
+        mock_handle.cancel.assert_called_once_with()
+        assert context._defer_handle is None
+
+    def test_cancel_defer_when_task_active(self, context: tanjun.context.SlashContext):
         context._defer_task = mock.Mock()
 
         context.cancel_defer()
@@ -1348,6 +1556,7 @@ class TestSlashContext:
         context._defer_task.cancel.assert_called_once_with()
 
     def test_cancel_defer_when_no_active_task(self, context: tanjun.context.SlashContext):
+        context._defer_handle = None
         context._defer_task = None
         context.cancel_defer()
 
@@ -1420,9 +1629,19 @@ class TestSlashContext:
 
         on_not_found.assert_not_called()
 
-    def test_start_defer_timer(self, mock_client: mock.Mock):
-        auto_defer = mock.Mock()
-        context = stub_class(tanjun.context.SlashContext, _auto_defer=auto_defer)(
+    def test_start_defer_timer(self, context: tanjun.context.SlashContext):
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            context.start_defer_timer(534123)
+
+            get_running_loop.assert_called_once_with()
+            get_running_loop.return_value.call_later.assert_called_once_with(534123, context._on_defer_timer)
+            assert context._defer_handle is get_running_loop.return_value.call_later.return_value
+            assert context._defer_task is None
+
+    @pytest.mark.asyncio()
+    async def test_start_defer_timer_defers_after_count_down(self, mock_client: mock.Mock):
+        defer = mock.AsyncMock()
+        context = stub_class(tanjun.context.SlashContext, defer=defer)(
             mock_client,
             mock.AsyncMock(),
             mock.Mock(options=None),
@@ -1430,14 +1649,37 @@ class TestSlashContext:
             component=mock.Mock(),
         )
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            context.start_defer_timer(534123)
+        context.start_defer_timer(0.01)
+        await asyncio.sleep(0.05)
 
-            auto_defer.assert_called_once_with(534123)
-            create_task.assert_called_once_with(auto_defer.return_value)
-            assert context._defer_task is create_task.return_value
+        defer.assert_awaited_once_with()
+        assert context._defer_handle is None
+
+    @pytest.mark.asyncio()
+    async def test_start_defer_timer_when_cancelled(self, mock_client: mock.Mock):
+        defer = mock.AsyncMock()
+        context = stub_class(tanjun.context.SlashContext, defer=defer)(
+            mock_client,
+            mock.AsyncMock(),
+            mock.Mock(options=None),
+            command=mock.Mock(),
+            component=mock.Mock(),
+        )
+
+        context.start_defer_timer(0.01)
+        context.cancel_defer()
+        await asyncio.sleep(0.05)
+
+        defer.assert_not_called()
+        assert context._defer_task is None
 
     def test_start_defer_timer_when_already_started(self, context: tanjun.context.SlashContext):
+        context._defer_handle = mock.Mock()
+
+        with pytest.raises(RuntimeError):
+            context.start_defer_timer(321)
+
+    def test_start_defer_timer_when_deferral_running(self, context: tanjun.context.SlashContext):
         context._defer_task = mock.Mock()
 
         with pytest.raises(RuntimeError):
@@ -1512,6 +1754,58 @@ class TestSlashContext:
     async def test_defer_doesnt_cancel_defer_when_in_deffer_task(self, context: tanjun.context.SlashContext):
         ...
 
+    def test__schedule_followup_delete(self, context: tanjun.context.SlashContext, mock_injector_client: mock.Mock):
+        mock_message = mock.Mock()
+
+        context._schedule_followup_delete(123.0, mock_message)
+
+        mock_injector_client.get_type_dependency.assert_called_once_with(tanjun.dependencies.AbstractDeletionScheduler)
+        schedule_callback = mock_injector_client.get_type_dependency.return_value.schedule_callback
+        schedule_callback.assert_called_once_with(mock.ANY, 123.0)
+        callback = schedule_callback.call_args.args[0]
+        assert isinstance(callback, functools.partial)
+        assert callback.func is context.interaction.delete_message
+        assert callback.args == (mock_message,)
+
+    def test__schedule_followup_delete_when_no_scheduler(self, mock_client: mock.Mock, mock_injector_client: mock.Mock):
+        mock_injector_client.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
+        mock_delete_followup_after = mock.Mock()
+        mock_message = mock.Mock()
+        context = stub_class(tanjun.context.SlashContext, _delete_followup_after=mock_delete_followup_after)(
+            mock_client, mock_injector_client, mock.AsyncMock(options=None)
+        )
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            context._schedule_followup_delete(123.0, mock_message)
+
+        mock_delete_followup_after.assert_called_once_with(123.0, mock_message)
+        create_task.assert_called_once_with(mock_delete_followup_after.return_value)
+
+    def test__schedule_initial_response_delete(
+        self, context: tanjun.context.SlashContext, mock_injector_client: mock.Mock
+    ):
+        context._schedule_initial_response_delete(123.0)
+
+        mock_injector_client.get_type_dependency.assert_called_once_with(tanjun.dependencies.AbstractDeletionScheduler)
+        mock_injector_client.get_type_dependency.return_value.schedule_callback.assert_called_once_with(
+            context.delete_initial_response, 123.0
+        )
+
+    def test__schedule_initial_response_delete_when_no_scheduler(
+        self, mock_client: mock.Mock, mock_injector_client: mock.Mock
+    ):
+        mock_injector_client.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
+        mock_delete_initial_response_after = mock.Mock()
+        context = stub_class(
+            tanjun.context.SlashContext, _delete_initial_response_after=mock_delete_initial_response_after
+        )(mock_client, mock_injector_client, mock.AsyncMock(options=None))
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            context._schedule_initial_response_delete(123.0)
+
+        mock_delete_initial_response_after.assert_called_once_with(123.0)
+        create_task.assert_called_once_with(mock_delete_initial_response_after.return_value)
+
     @pytest.mark.asyncio()
     async def test__delete_followup_after(self, context: tanjun.context.SlashContext):
         mock_message = mock.Mock()
@@ -1668,18 +1962,16 @@ class TestSlashContext:
         mock_client: mock.Mock,
         delete_after: typing.Union[datetime.timedelta, int, float],
     ):
-        mock_delete_initial_response_after = mock.Mock()
+        mock_schedule_initial_response_delete = mock.Mock()
         mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.timezone.utc))
         mock_interaction.edit_initial_response.return_value.flags = hikari.MessageFlag.NONE
         context = stub_class(
-            tanjun.context.SlashContext, _delete_initial_response_after=mock_delete_initial_response_after
+            tanjun.context.SlashContext, _schedule_initial_response_delete=mock_schedule_initial_response_delete
         )(mock_client, mock.Mock(), mock_interaction)
 
-        with mock.patch.object(asyncio, "create_task") as create_task:
-            await context.edit_initial_response("bye", delete_after=delete_after)
+        await context.edit_initial_response("bye", delete_after=delete_after)
 
-        mock_delete_initial_response_after.assert_called_once_with(545)
-        create_task.assert_called_once_with(mock_delete_initial_response_after.return_value)
+        mock_schedule_initial_response_delete.assert_called_once_with(545)
 
     @pytest.mark.parametrize("delete_after", [datetime.timedelta(seconds=545), 545, 545.0])
     @pytest.mark.asyncio()
@@ -37,6 +37,7 @@
 import datetime
 import typing
 import urllib.parse
+from collections import abc as collections
 from unittest import mock
 
 import hikari
@@ -45,6 +46,12 @@ import pytest
 import tanjun
 
 
+async def _memoise_fetch(
+    _: typing.Any, callback: collections.Callable[[], collections.Awaitable[typing.Any]], /
+) -> typing.Any:
+    return await callback()
+
+
 class TestBaseConverter:
     @pytest.mark.skip(reason="Not finalised yet")
     def test_check_client(self):
@@ -125,6 +132,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_cached_and_no_async_cache(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
 
         result = await tanjun.to_channel("<#12222>", mock_context, cache=None, dm_cache=None)
@@ -136,6 +144,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_cacheless_and_no_async_cache(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache = None
 
         result = await tanjun.to_channel(222, mock_context, cache=None, dm_cache=None)
@@ -259,6 +268,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_cached_and_async_caches_both_raise_cache_miss_error(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_cache = mock.AsyncMock()
         mock_cache.get.side_effect = tanjun.dependencies.CacheMissError
@@ -276,6 +286,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_including_dms(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.GuildChannel)
         mock_context.cache.get_guild_channel.return_value = None
         mock_cache = mock.AsyncMock()
@@ -294,6 +305,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_including_dms_and_rest_returns_dm_channel(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.rest.fetch_channel.return_value = mock.Mock(hikari.DMChannel)
         mock_context.cache.get_guild_channel.return_value = None
         mock_cache = mock.AsyncMock()
@@ -312,6 +324,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_found_and_not_including_dms(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.side_effect = hikari.NotFoundError(url="gey", headers={}, raw_body="")
         mock_cache = mock.AsyncMock()
@@ -331,6 +344,7 @@ class TestChannelConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_found(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild_channel.return_value = None
         mock_context.rest.fetch_channel.side_effect = hikari.NotFoundError(url="gey", headers={}, raw_body="")
         mock_cache = mock.AsyncMock()
@@ -470,6 +484,7 @@ class TestGuildConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_cached(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild.return_value = None
         mock_cache = mock.AsyncMock()
         mock_cache.get.side_effect = tanjun.dependencies.CacheMissError
@@ -484,6 +499,7 @@ class TestGuildConverter:
     @pytest.mark.asyncio()
     async def test___call___when_cacheless(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache = None
 
         result = await tanjun.to_guild(2222, mock_context, cache=None)
@@ -494,6 +510,7 @@ class TestGuildConverter:
     @pytest.mark.asyncio()
     async def test___call___when_async_not_found(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild.return_value = None
         mock_context.rest.fetch_guild.side_effect = hikari.NotFoundError(url="grey", headers={}, raw_body="")
         mock_cache = mock.AsyncMock()
@@ -509,6 +526,7 @@ class TestGuildConverter:
     @pytest.mark.asyncio()
     async def test___call___when_rest_not_found(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_guild.return_value = None
         mock_context.rest.fetch_guild.side_effect = hikari.NotFoundError(url="grey", headers={}, raw_body="")
         mock_cache = mock.AsyncMock()
@@ -737,6 +755,7 @@ class TestMemberConverter:
     @pytest.mark.asyncio()
     async def test___call___when_not_cached(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_member.return_value = None
         mock_cache = mock.AsyncMock()
         mock_cache.get_from_guild.side_effect = tanjun.dependencies.CacheMissError
@@ -752,6 +771,7 @@ class TestMemberConverter:
     @pytest.mark.asyncio()
     async def test___call___when_cacheless(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache = None
 
         result = await tanjun.to_member("5123123", mock_context, cache=None)
@@ -778,6 +798,7 @@ class TestMemberConverter:
     @pytest.mark.asyncio()
     async def test___call___when_rest_raises_not_found(self):
         mock_context = mock.Mock(rest=mock.AsyncMock())
+        mock_context.memoise_fetch.side_effect = _memoise_fetch
         mock_context.cache.get_member.return_value = None
         mock_context.rest.fetch_member.side_effect = hikari.NotFoundError(url="grey", headers={}, raw_body="")
 
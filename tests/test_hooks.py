@@ -304,6 +304,26 @@ class TestHooks:
         mock_callback.assert_awaited_once_with(mock_context)
         mock_other_hook.trigger_pre_execution.assert_awaited_once_with(mock_context)
 
+    @pytest.mark.asyncio()
+    async def test_trigger_pre_execution_with_multiple_handlers(self):
+        mock_callback_1 = mock.AsyncMock()
+        mock_callback_2 = mock.AsyncMock()
+        mock_other_hook_1 = mock.Mock(trigger_pre_execution=mock.AsyncMock())
+        mock_other_hook_2 = mock.Mock(trigger_pre_execution=mock.AsyncMock())
+        mock_context = mock.Mock()
+
+        (
+            await tanjun.AnyHooks()
+            .add_pre_execution(mock_callback_1)
+            .add_pre_execution(mock_callback_2)
+            .trigger_pre_execution(mock_context, hooks={mock_other_hook_1, mock_other_hook_2})
+        )
+
+        mock_callback_1.assert_awaited_once_with(mock_context)
+        mock_callback_2.assert_awaited_once_with(mock_context)
+        mock_other_hook_1.trigger_pre_execution.assert_awaited_once_with(mock_context)
+        mock_other_hook_2.trigger_pre_execution.assert_awaited_once_with(mock_context)
+
     @pytest.mark.asyncio()
     async def test_trigger_pre_execution_without_handlers(self):
         await tanjun.AnyHooks().trigger_pre_execution(mock.Mock())
@@ -33,12 +33,20 @@
 # pyright: reportPrivateUsage=none
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
+import asyncio
+import contextlib
+import datetime
+import gc
 import inspect
 import sys
+import time
 import types
 import typing
+import weakref
+from collections import abc as collections
 from unittest import mock
 
+import hikari
 import pytest
 
 import tanjun
@@ -116,6 +124,48 @@ class TestBasicInjectionContext:
         assert result is mock_client.get_type_dependency.return_value
         mock_client.get_type_dependency.assert_called_once_with(mock_type)
 
+    @pytest.mark.parametrize(
+        "type_", [tanjun.injecting.AbstractInjectionContext, tanjun.injecting.BasicInjectionContext]
+    )
+    def test_get_type_dependency_for_self_type(self, type_: type[typing.Any]):
+        mock_client = mock.Mock()
+        ctx = tanjun.injecting.BasicInjectionContext(mock_client)
+
+        assert ctx.get_type_dependency(type_) is ctx
+        mock_client.get_type_dependency.assert_not_called()
+
+    def test_get_type_dependency_for_subclass_self_type(self):
+        class Context(tanjun.injecting.BasicInjectionContext):
+            ...
+
+        ctx = Context(mock.Mock())
+
+        assert ctx.get_type_dependency(Context) is ctx
+        assert ctx.get_type_dependency(tanjun.injecting.BasicInjectionContext) is ctx
+
+    def test_get_type_dependency_when_self_type_special_cased(self):
+        mock_value = mock.Mock()
+        ctx = tanjun.injecting.BasicInjectionContext(mock.Mock())
+        ctx._set_type_special_case(tanjun.injecting.AbstractInjectionContext, mock_value)
+
+        assert ctx.get_type_dependency(tanjun.injecting.AbstractInjectionContext) is mock_value
+
+    def test__remove_type_special_case(self):
+        mock_type: typing.Any = mock.Mock()
+        mock_client = mock.Mock()
+        ctx = tanjun.injecting.BasicInjectionContext(mock_client)
+        ctx._set_type_special_case(mock_type, mock.Mock())
+
+        ctx._remove_type_special_case(mock_type)
+
+        assert ctx.get_type_dependency(mock_type) is mock_client.get_type_dependency.return_value
+
+    def test__remove_type_special_case_when_none_set(self):
+        ctx = tanjun.injecting.BasicInjectionContext(mock.Mock())
+
+        with pytest.raises(KeyError):
+            ctx._remove_type_special_case(mock.Mock())
+
 
 # TODO: integration tests since we don't cover __init__'s normal behaviour since its kinda hard to
 # unit test
@@ -228,6 +278,74 @@ class TestCallbackDescriptor:
         with pytest.raises(ValueError, match="Injected positional only arguments are not supported"):
             descriptor.overwrite_callback(foo)
 
+    def test_parses_function_once(self):
+        def foo(bar: int = tanjun.inject(type=int)) -> None:
+            ...
+
+        descriptor = tanjun.injecting.CallbackDescriptor(foo)
+
+        with mock.patch.object(inspect, "signature", side_effect=NotImplementedError) as signature:
+            other_descriptor = tanjun.injecting.CallbackDescriptor(foo)
+            descriptor.overwrite_callback(foo)
+
+        signature.assert_not_called()
+        assert other_descriptor._descriptors is descriptor._descriptors
+        assert other_descriptor.needs_injector is True
+
+    def test_parses_bound_methods_once_per_function(self):
+        class StubClass:
+            def method(self, bar: int = tanjun.inject(type=int)) -> None:
+                ...
+
+        descriptor = tanjun.injecting.CallbackDescriptor(StubClass().method)
+
+        with mock.patch.object(inspect, "signature", side_effect=NotImplementedError) as signature:
+            other_descriptor = tanjun.injecting.CallbackDescriptor(StubClass().method)
+
+        signature.assert_not_called()
+        assert other_descriptor._descriptors is descriptor._descriptors
+        assert list(descriptor._descriptors) == ["bar"]
+
+    def test_parses_slotted_callable_instances_once_per_class(self):
+        class StubCallable:
+            __slots__ = ()
+
+            def __call__(self, bar: int = tanjun.inject(type=int)) -> None:
+                ...
+
+        descriptor = tanjun.injecting.CallbackDescriptor(StubCallable())
+
+        with mock.patch.object(inspect, "signature", side_effect=NotImplementedError) as signature:
+            other_descriptor = tanjun.injecting.CallbackDescriptor(StubCallable())
+
+        signature.assert_not_called()
+        assert other_descriptor._descriptors is descriptor._descriptors
+
+    def test_doesnt_cache_callable_instances_with_dict(self):
+        class StubCallable:
+            def __call__(self, bar: int = tanjun.inject(type=int)) -> None:
+                ...
+
+        tanjun.injecting.CallbackDescriptor(StubCallable())
+
+        with mock.patch.object(inspect, "signature", side_effect=inspect.signature) as signature:
+            tanjun.injecting.CallbackDescriptor(StubCallable())
+
+        signature.assert_called_once()
+
+    def test_parsed_function_isnt_kept_alive(self):
+        def foo(bar: int = tanjun.inject(type=int)) -> None:
+            ...
+
+        tanjun.injecting.CallbackDescriptor(foo)
+        assert foo in tanjun.injecting._DESCRIPTOR_CACHE
+        foo_ref = weakref.ref(foo)
+
+        del foo
+        gc.collect()
+
+        assert foo_ref() is None
+
     @pytest.mark.asyncio()
     async def test_resolve_with_command_context_when_needs_injector_and_is_injection_context(self):
         def foo(c: int = tanjun.inject(type=int)) -> None:
@@ -311,6 +429,7 @@ class TestCallbackDescriptor:
         mock_type: typing.Any = mock.Mock()
         mock_context = mock.Mock()
         mock_context.injection_client.get_callback_override.return_value = None
+        mock_context.injection_client._concurrent_resolution = False
         mock_context.get_cached_result.return_value = tanjun.injecting.UNDEFINED
 
         def sync_sub_callback() -> typing.Any:
@@ -366,20 +485,71 @@ class TestCallbackDescriptor:
     @pytest.mark.asyncio()
     async def test_resolve_when_overridden(self):
         mock_callback = mock.Mock()
+        mock_override = mock.Mock()
         descriptor = tanjun.injecting.CallbackDescriptor(mock_callback)
         mock_context = mock.Mock()
-        mock_context.injection_client.get_callback_override.return_value.resolve = mock.AsyncMock()
+        mock_context.injection_client = tanjun.injecting.InjectorClient().set_callback_override(
+            mock_callback, mock_override
+        )
+        mock_context.get_cached_result.return_value = tanjun.injecting.UNDEFINED
 
         result = await descriptor.resolve(mock_context, 123, b=333, c=222)
 
-        assert result is mock_context.injection_client.get_callback_override.return_value.resolve.return_value
-        mock_context.injection_client.get_callback_override.return_value.resolve.assert_awaited_once_with(
-            mock_context, 123, b=333, c=222
-        )
-        mock_context.injection_client.get_callback_override.assert_called_once_with(mock_callback)
-        mock_context.get_cached_result.assert_not_called()
+        assert result is mock_override.return_value
+        mock_override.assert_called_once_with(123, b=333, c=222)
+        mock_context.get_cached_result.assert_called_once_with(mock_override)
         mock_callback.assert_not_called()
-        mock_context.cache_result.assert_not_called()
+        mock_context.cache_result.assert_called_once_with(mock_override, mock_override.return_value)
+
+    @pytest.mark.asyncio()
+    async def test_resolve_reuses_compiled_callback(self):
+        mock_callback = mock.Mock()
+        descriptor = tanjun.injecting.CallbackDescriptor(mock_callback)
+        mock_client = mock.Mock(tanjun.injecting.InjectorClient, _compile_token=object(), _concurrent_resolution=False)
+        mock_client.get_callback_override.return_value = None
+        mock_context = mock.Mock(injection_client=mock_client)
+        mock_context.get_cached_result.return_value = tanjun.injecting.UNDEFINED
+
+        await descriptor.resolve(mock_context, 123)
+        await descriptor.resolve(mock_context, 321)
+
+        mock_client.get_callback_override.assert_called_once_with(mock_callback)
+        mock_callback.assert_has_calls([mock.call(123), mock.call(321)])
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_override_set_after_compiling(self):
+        mock_callback = mock.Mock()
+        mock_override = mock.Mock()
+        descriptor = tanjun.injecting.CallbackDescriptor(mock_callback)
+        client = tanjun.injecting.InjectorClient()
+
+        assert await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client)) is mock_callback.return_value
+
+        client.set_callback_override(mock_callback, mock_override)
+
+        assert await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client)) is mock_override.return_value
+        mock_callback.assert_called_once_with()
+        mock_override.assert_called_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_sub_dependency_override_removed_after_compiling(self):
+        mock_sub_callback = mock.Mock()
+        mock_override = mock.Mock()
+        mock_callback = mock.Mock()
+
+        def callback(value: typing.Any = tanjun.inject(callback=mock_sub_callback)) -> typing.Any:
+            return mock_callback(value)
+
+        descriptor = tanjun.injecting.CallbackDescriptor(callback)
+        client = tanjun.injecting.InjectorClient().set_callback_override(mock_sub_callback, mock_override)
+
+        await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client))
+        client.remove_callback_override(mock_sub_callback)
+        await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client))
+
+        mock_callback.assert_has_calls(
+            [mock.call(mock_override.return_value), mock.call(mock_sub_callback.return_value)]
+        )
 
     @pytest.mark.asyncio()
     async def test_resolve_when_cached(self):
@@ -396,6 +566,259 @@ class TestCallbackDescriptor:
         mock_callback.assert_not_called()
         mock_context.cache_result.assert_not_called()
 
+    @pytest.mark.asyncio()
+    async def test_resolve_when_concurrent(self):
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        def make_dependency(name: str) -> collections.Callable[[], collections.Awaitable[str]]:
+            async def dependency() -> str:
+                started.append(name)
+                if len(started) == 3:
+                    all_started.set()
+
+                await all_started.wait()
+                return name
+
+            return dependency
+
+        def callback(
+            a: str = tanjun.inject(callback=make_dependency("a")),
+            b: str = tanjun.inject(callback=make_dependency("b")),
+            c: str = tanjun.inject(callback=make_dependency("c")),
+            d: int = tanjun.inject(type=int),
+        ) -> tuple[str, str, str, int]:
+            return (a, b, c, d)
+
+        client = tanjun.injecting.InjectorClient().set_concurrent_resolution().set_type_dependency(int, 123)
+        descriptor = tanjun.injecting.CallbackDescriptor(callback)
+
+        result = await asyncio.wait_for(descriptor.resolve(tanjun.injecting.BasicInjectionContext(client)), 1)
+
+        assert result == ("a", "b", "c", 123)
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_concurrent_resolves_shared_dependency_once(self):
+        mock_shared = mock.Mock()
+
+        async def shared() -> mock.Mock:
+            await asyncio.sleep(0)
+            return mock_shared()
+
+        async def dependency_a(value: mock.Mock = tanjun.inject(callback=shared)) -> mock.Mock:
+            return value
+
+        async def dependency_b(value: mock.Mock = tanjun.inject(callback=shared)) -> mock.Mock:
+            await asyncio.sleep(0)
+            return value
+
+        def callback(
+            a: mock.Mock = tanjun.inject(callback=dependency_a),
+            b: mock.Mock = tanjun.inject(callback=dependency_b),
+            c: mock.Mock = tanjun.inject(callback=shared),
+        ) -> tuple[mock.Mock, mock.Mock, mock.Mock]:
+            return (a, b, c)
+
+        client = tanjun.injecting.InjectorClient().set_concurrent_resolution()
+        ctx = tanjun.injecting.BasicInjectionContext(client)
+
+        result = await tanjun.injecting.CallbackDescriptor(callback).resolve(ctx)
+
+        assert result == (mock_shared.return_value, mock_shared.return_value, mock_shared.return_value)
+        mock_shared.assert_called_once_with()
+        assert ctx.get_cached_result(shared) is mock_shared.return_value
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_concurrent_raises_first_parameters_error(self):
+        error_a = KeyError("a")
+        error_b = ValueError("b")
+
+        async def dependency_a() -> typing.NoReturn:
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            raise error_a
+
+        async def dependency_b() -> typing.NoReturn:
+            raise error_b
+
+        def callback(
+            a: typing.Any = tanjun.inject(callback=dependency_a), b: typing.Any = tanjun.inject(callback=dependency_b)
+        ) -> None:
+            raise NotImplementedError
+
+        client = tanjun.injecting.InjectorClient().set_concurrent_resolution()
+
+        with pytest.raises(KeyError) as exc_info:
+            await tanjun.injecting.CallbackDescriptor(callback).resolve(tanjun.injecting.BasicInjectionContext(client))
+
+        assert exc_info.value is error_a
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_concurrent_resolution_disabled_after_compiling(self):
+        calls: list[str] = []
+
+        async def dependency_a() -> None:
+            calls.append("a start")
+            await asyncio.sleep(0)
+            calls.append("a end")
+
+        async def dependency_b() -> None:
+            calls.append("b start")
+            await asyncio.sleep(0)
+            calls.append("b end")
+
+        def callback(
+            a: None = tanjun.inject(callback=dependency_a), b: None = tanjun.inject(callback=dependency_b)
+        ) -> None:
+            ...
+
+        client = tanjun.injecting.InjectorClient().set_concurrent_resolution()
+        descriptor = tanjun.injecting.CallbackDescriptor(callback)
+
+        await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client))
+        assert calls == ["a start", "b start", "a end", "b end"]
+
+        calls.clear()
+        client.set_concurrent_resolution(False)
+        await descriptor.resolve(tanjun.injecting.BasicInjectionContext(client))
+        assert calls == ["a start", "a end", "b start", "b end"]
+
+    def test_needs_injector_property_when_generator_dependency(self):
+        async def dependency() -> collections.AsyncIterator[int]:
+            yield 1
+
+        def callback(value: int = tanjun.inject(callback=dependency)) -> None:
+            raise NotImplementedError
+
+        assert tanjun.injecting.CallbackDescriptor(dependency).needs_injector is True
+        assert tanjun.injecting.CallbackDescriptor(callback).needs_injector is True
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_async_generator_dependency(self):
+        calls: list[str] = []
+
+        async def dependency() -> collections.AsyncIterator[mock.Mock]:
+            calls.append("acquire")
+            yield mock_value
+            calls.append("release")
+
+        def callback(a: mock.Mock = tanjun.inject(callback=dependency)) -> mock.Mock:
+            calls.append("callback")
+            return a
+
+        mock_value = mock.Mock()
+        ctx = tanjun.injecting.BasicInjectionContext(tanjun.injecting.InjectorClient())
+        descriptor = tanjun.injecting.CallbackDescriptor(callback)
+
+        assert await descriptor.resolve(ctx) is mock_value
+        assert await tanjun.injecting.CallbackDescriptor(dependency).resolve(ctx) is mock_value
+        assert calls == ["acquire", "callback"]
+
+        await ctx.release_dependencies()
+
+        assert calls == ["acquire", "callback", "release"]
+        assert ctx.get_cached_result(dependency) is tanjun.injecting.UNDEFINED
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_generator_dependency(self):
+        calls: list[str] = []
+
+        def dependency() -> collections.Iterator[int]:
+            calls.append("acquire")
+            yield 123
+            calls.append("release")
+
+        ctx = tanjun.injecting.BasicInjectionContext(tanjun.injecting.InjectorClient())
+
+        assert await tanjun.injecting.CallbackDescriptor(dependency).resolve(ctx) == 123
+        assert calls == ["acquire"]
+
+        await ctx.release_dependencies()
+
+        assert calls == ["acquire", "release"]
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_context_manager_dependency(self):
+        calls: list[str] = []
+
+        @contextlib.asynccontextmanager
+        async def dependency(value: int = tanjun.inject(type=int)) -> collections.AsyncIterator[int]:
+            calls.append("acquire")
+            try:
+                yield value
+
+            finally:
+                calls.append("release")
+
+        ctx = tanjun.injecting.BasicInjectionContext(tanjun.injecting.InjectorClient().set_type_dependency(int, 541))
+
+        assert await tanjun.injecting.CallbackDescriptor(dependency).resolve(ctx) == 541
+        assert calls == ["acquire"]
+
+        await ctx.release_dependencies()
+        await ctx.release_dependencies()
+
+        assert calls == ["acquire", "release"]
+
+    @pytest.mark.asyncio()
+    async def test_release_dependencies_with_exception(self):
+        calls: list[str] = []
+        error = KeyError("meow")
+
+        async def dependency() -> collections.AsyncIterator[None]:
+            try:
+                yield
+
+            except KeyError as exc:
+                assert exc is error
+                calls.append("rollback")
+                raise
+
+        @contextlib.contextmanager
+        def other_dependency() -> collections.Iterator[None]:
+            try:
+                yield
+
+            except KeyError:
+                calls.append("other rollback")
+                raise
+
+        ctx = tanjun.injecting.BasicInjectionContext(tanjun.injecting.InjectorClient())
+        await tanjun.injecting.CallbackDescriptor(dependency).resolve(ctx)
+        await tanjun.injecting.CallbackDescriptor(other_dependency).resolve(ctx)
+
+        await ctx.release_dependencies(error)
+
+        assert calls == ["other rollback", "rollback"]
+        assert ctx.get_cached_result(dependency) is tanjun.injecting.UNDEFINED
+
+    @pytest.mark.asyncio()
+    async def test_release_dependencies_releases_in_reverse_order(self):
+        calls: list[str] = []
+
+        async def dependency_a() -> collections.AsyncIterator[None]:
+            yield
+            calls.append("a")
+
+        async def dependency_b(_: None = tanjun.inject(callback=dependency_a)) -> collections.AsyncIterator[None]:
+            yield
+            calls.append("b")
+
+        ctx = tanjun.injecting.BasicInjectionContext(tanjun.injecting.InjectorClient())
+        await tanjun.injecting.CallbackDescriptor(dependency_b).resolve(ctx)
+
+        await ctx.release_dependencies()
+
+        assert calls == ["b", "a"]
+
+    @pytest.mark.asyncio()
+    async def test_resolve_when_generator_dependency_and_context_doesnt_support_releasing(self):
+        async def dependency() -> collections.AsyncIterator[int]:
+            yield 1
+
+        with pytest.raises(RuntimeError, match="_EmptyContext doesn't support dependencies which have to be released"):
+            await tanjun.injecting.CallbackDescriptor(dependency).resolve(tanjun.injecting._EmptyContext())
+
 
 class TestSelfInjectingCallback:
     @pytest.mark.asyncio()
@@ -595,6 +1018,7 @@ class TestTypeDescriptor:
     @pytest.mark.asyncio()
     async def test_resolve_when_not_found(self):
         ctx = mock.Mock()
+        ctx.injection_client._scoped_dependencies = {}
         ctx.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
         mock_type: typing.Any = mock.Mock()
 
@@ -618,6 +1042,7 @@ class TestTypeDescriptor:
                 ...
 
             ctx = mock.Mock()
+            ctx.injection_client._scoped_dependencies = {}
             mock_result = mock.Mock()
             ctx.get_type_dependency.side_effect = [
                 tanjun.injecting.UNDEFINED,
@@ -659,6 +1084,7 @@ class TestTypeDescriptor:
                 ...
 
             ctx = mock.Mock()
+            ctx.injection_client._scoped_dependencies = {}
             ctx.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
             with pytest.raises(tanjun.MissingDependencyError):
@@ -672,6 +1098,7 @@ class TestTypeDescriptor:
                 ...
 
             ctx = mock.Mock()
+            ctx.injection_client._scoped_dependencies = {}
             ctx.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
             result = await tanjun.injecting.TypeDescriptor(StubType | None).resolve(ctx)
@@ -691,6 +1118,7 @@ class TestTypeDescriptor:
             ...
 
         ctx = mock.Mock()
+        ctx.injection_client._scoped_dependencies = {}
         mock_result = mock.Mock()
         ctx.get_type_dependency.side_effect = [
             tanjun.injecting.UNDEFINED,
@@ -717,6 +1145,7 @@ class TestTypeDescriptor:
             ...
 
         ctx = mock.Mock()
+        ctx.injection_client._scoped_dependencies = {}
         ctx.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
         with pytest.raises(tanjun.MissingDependencyError):
@@ -730,6 +1159,7 @@ class TestTypeDescriptor:
             ...
 
         ctx = mock.Mock()
+        ctx.injection_client._scoped_dependencies = {}
         ctx.get_type_dependency.return_value = tanjun.injecting.UNDEFINED
 
         result = await tanjun.injecting.TypeDescriptor(typing.Optional[StubType]).resolve(ctx)
@@ -821,6 +1251,246 @@ class TestInjectorClient:
         assert result is client
         assert client.get_callback_override(mock_callback) is None
 
+    def test_set_scoped_dependency_when_expire_after_not_positive(self):
+        with pytest.raises(ValueError, match="expire_after must be more than 0 seconds"):
+            tanjun.injecting.InjectorClient().set_scoped_dependency(object, mock.Mock(), expire_after=0)
+
+    def test_set_scoped_dependency_when_max_size_not_positive(self):
+        with pytest.raises(ValueError, match="max_size must be greater than 0"):
+            tanjun.injecting.InjectorClient().set_scoped_dependency(object, mock.Mock(), max_size=0)
+
+    def test_set_scoped_dependency_when_generator(self):
+        async def callback() -> collections.AsyncIterator[int]:
+            yield 1
+
+        client = tanjun.injecting.InjectorClient()
+
+        with pytest.raises(
+            ValueError, match="Generator and context manager callbacks cannot be used as scoped dependencies"
+        ):
+            client.set_scoped_dependency(int, callback)
+
+        assert int not in client._scoped_dependencies
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_singleton(self):
+        mock_callback = mock.Mock()
+        client = tanjun.injecting.InjectorClient()
+
+        result = client.set_scoped_dependency(object, mock_callback)
+
+        assert result is client
+        assert await _resolve_type(client, object) is mock_callback.return_value
+        assert await _resolve_type(client, object) is mock_callback.return_value
+        mock_callback.assert_called_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_context_scope(self):
+        mock_callback = mock.Mock()
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.CONTEXT
+        )
+        ctx = tanjun.injecting.BasicInjectionContext(client)
+
+        await tanjun.injecting.TypeDescriptor(object).resolve(ctx)
+        await tanjun.injecting.TypeDescriptor(object).resolve(ctx)
+        await _resolve_type(client, object)
+
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_guild_scope(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.GUILD
+        )
+
+        result_1 = await _resolve_type(client, object, guild_id=hikari.Snowflake(123))
+        result_2 = await _resolve_type(client, object, guild_id=hikari.Snowflake(123))
+        result_3 = await _resolve_type(client, object, guild_id=hikari.Snowflake(321))
+
+        assert result_1 is result_2
+        assert result_3 is not result_1
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_guild_scope_and_not_in_guild(self):
+        mock_callback = mock.Mock()
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.GUILD
+        )
+
+        await _resolve_type(client, object, guild_id=None)
+        await _resolve_type(client, object, guild_id=None)
+
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_user_scope(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.USER
+        )
+
+        result_1 = await _resolve_type(client, object, author=mock.Mock(id=hikari.Snowflake(123)), guild_id=None)
+        result_2 = await _resolve_type(client, object, author=mock.Mock(id=hikari.Snowflake(123)), guild_id=1)
+        result_3 = await _resolve_type(client, object, author=mock.Mock(id=hikari.Snowflake(321)), guild_id=1)
+
+        assert result_1 is result_2
+        assert result_3 is not result_1
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_channel_scope(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.CHANNEL
+        )
+
+        result_1 = await _resolve_type(client, object, channel_id=hikari.Snowflake(123))
+        result_2 = await _resolve_type(client, object, channel_id=hikari.Snowflake(123))
+        result_3 = await _resolve_type(client, object, channel_id=hikari.Snowflake(321))
+
+        assert result_1 is result_2
+        assert result_3 is not result_1
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_evicts_least_recently_used(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.GUILD, max_size=2
+        )
+        result_1 = await _resolve_type(client, object, guild_id=1)
+        result_2 = await _resolve_type(client, object, guild_id=2)
+        await _resolve_type(client, object, guild_id=1)
+
+        await _resolve_type(client, object, guild_id=3)
+
+        assert await _resolve_type(client, object, guild_id=1) is result_1
+        assert await _resolve_type(client, object, guild_id=2) is not result_2
+        assert mock_callback.call_count == 4
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_expires(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, expire_after=datetime.timedelta(seconds=60)
+        )
+
+        with mock.patch.object(time, "monotonic", return_value=100.0) as monotonic:
+            result_1 = await _resolve_type(client, object)
+            monotonic.return_value = 159.0
+            result_2 = await _resolve_type(client, object)
+            monotonic.return_value = 160.0
+            result_3 = await _resolve_type(client, object)
+
+        assert result_1 is result_2
+        assert result_3 is not result_1
+        assert mock_callback.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_scoped_dependency(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.GUILD
+        )
+        result_1 = await _resolve_type(client, object, guild_id=hikari.Snowflake(1))
+        result_2 = await _resolve_type(client, object, guild_id=hikari.Snowflake(2))
+
+        result = client.invalidate_scoped_dependency(object, key=hikari.Snowflake(1))
+
+        assert result is client
+        assert await _resolve_type(client, object, guild_id=hikari.Snowflake(1)) is not result_1
+        assert await _resolve_type(client, object, guild_id=hikari.Snowflake(2)) is result_2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_scoped_dependency_when_no_key(self):
+        mock_callback = mock.Mock(side_effect=lambda: mock.Mock())
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(
+            object, mock_callback, scope=tanjun.injecting.DependencyScope.GUILD
+        )
+        result_1 = await _resolve_type(client, object, guild_id=hikari.Snowflake(1))
+        result_2 = await _resolve_type(client, object, guild_id=hikari.Snowflake(2))
+
+        client.invalidate_scoped_dependency(object)
+
+        assert await _resolve_type(client, object, guild_id=hikari.Snowflake(1)) is not result_1
+        assert await _resolve_type(client, object, guild_id=hikari.Snowflake(2)) is not result_2
+
+    def test_invalidate_scoped_dependency_when_not_found(self):
+        with pytest.raises(KeyError):
+            tanjun.injecting.InjectorClient().invalidate_scoped_dependency(object)
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_shares_in_flight_resolution(self):
+        mock_result = mock.Mock()
+        mock_callback = mock.Mock(return_value=mock_result)
+
+        async def callback() -> mock.Mock:
+            await asyncio.sleep(0)
+            return mock_callback()
+
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(object, callback)
+
+        results = await asyncio.gather(_resolve_type(client, object), _resolve_type(client, object))
+
+        assert results == [mock_result, mock_result]
+        mock_callback.assert_called_once_with()
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_doesnt_cache_errors(self):
+        mock_result = mock.Mock()
+        mock_callback = mock.Mock(side_effect=[KeyError("meow"), mock_result])
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(object, mock_callback)
+
+        with pytest.raises(KeyError):
+            await _resolve_type(client, object)
+
+        assert await _resolve_type(client, object) is mock_result
+
+    @pytest.mark.asyncio()
+    async def test_scoped_dependency_when_type_dependency_also_set(self):
+        mock_value = mock.Mock()
+        mock_callback = mock.Mock()
+        client = (
+            tanjun.injecting.InjectorClient()
+            .set_scoped_dependency(object, mock_callback)
+            .set_type_dependency(object, mock_value)
+        )
+
+        assert await _resolve_type(client, object) is mock_value
+        mock_callback.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_remove_scoped_dependency(self):
+        client = tanjun.injecting.InjectorClient().set_scoped_dependency(object, mock.Mock())
+
+        result = client.remove_scoped_dependency(object)
+
+        assert result is client
+        with pytest.raises(tanjun.MissingDependencyError):
+            await _resolve_type(client, object)
+
+    def test_remove_scoped_dependency_when_not_found(self):
+        with pytest.raises(KeyError):
+            tanjun.injecting.InjectorClient().remove_scoped_dependency(object)
+
+
+def _resolve_type(
+    client: tanjun.injecting.InjectorClient, type_: type[typing.Any], /, **kwargs: typing.Any
+) -> collections.Coroutine[typing.Any, typing.Any, typing.Any]:
+    ctx = mock.Mock(
+        tanjun.context.MessageContext,
+        author=kwargs.pop("author", mock.Mock(id=hikari.Snowflake(4321))),
+        channel_id=kwargs.pop("channel_id", hikari.Snowflake(1234)),
+        injection_client=client,
+        **kwargs,
+    )
+    ctx.get_cached_result.return_value = tanjun.injecting.UNDEFINED
+    ctx.get_type_dependency.side_effect = client.get_type_dependency
+    return tanjun.injecting.TypeDescriptor(type_).resolve(ctx)
+
 
 class Test_EmptyInjectorClient:
     def test_set_type_dependency(self):
@@ -867,6 +1537,25 @@ class Test_EmptyInjectorClient:
 
         assert exc_info.value.args[0] is mock_callback
 
+    def test_set_scoped_dependency(self):
+        result = tanjun.injecting._EMPTY_CLIENT.set_scoped_dependency(object, mock.Mock(), max_size=5)
+
+        assert result is tanjun.injecting._EMPTY_CLIENT
+
+    def test_invalidate_scoped_dependency(self):
+        with pytest.raises(KeyError) as exc_info:
+            tanjun.injecting._EMPTY_CLIENT.invalidate_scoped_dependency(object)
+
+        assert exc_info.value.args[0] is object
+
+    def test_remove_scoped_dependency(self):
+        tanjun.injecting._EMPTY_CLIENT.set_scoped_dependency(object, mock.Mock())
+
+        with pytest.raises(KeyError) as exc_info:
+            tanjun.injecting._EMPTY_CLIENT.remove_scoped_dependency(object)
+
+        assert exc_info.value.args[0] is object
+
 
 class Test_EmptyContext:
     def test_injection_client_property(self):
@@ -33,6 +33,7 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import typing
 from collections import abc as collections
 from unittest import mock
@@ -82,6 +83,28 @@ async def test_gather_checks():
     check_3.assert_awaited_once_with(mock_ctx)
 
 
+@pytest.mark.asyncio()
+async def test_gather_checks_with_single_check():
+    mock_ctx = mock.Mock()
+    check = mock.AsyncMock()
+
+    with mock.patch.object(asyncio, "gather") as gather:
+        assert await utilities.gather_checks(mock_ctx, [check]) is True
+
+    gather.assert_not_called()
+    check.assert_awaited_once_with(mock_ctx)
+
+
+@pytest.mark.asyncio()
+async def test_gather_checks_with_single_failed_check():
+    mock_ctx = mock.Mock()
+    check = mock.AsyncMock(side_effect=tanjun.FailedCheck)
+
+    assert await utilities.gather_checks(mock_ctx, iter([check])) is False
+
+    check.assert_awaited_once_with(mock_ctx)
+
+
 @pytest.mark.skip(reason="Not implemented")
 @pytest.mark.asyncio()
 async def test_fetch_resource():